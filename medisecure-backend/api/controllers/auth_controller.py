@@ -1,20 +1,34 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordRequestForm
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.future import select
+from jose import JWTError
 from datetime import timedelta
+from typing import Optional, AsyncIterator
+from uuid import UUID
 import os
-import traceback
+import logging
 
-from shared.container.container import Container
-from shared.application.dtos.common_dtos import TokenResponseDTO
+from shared.container.container import Container, close_session
+from shared.application.dtos.common_dtos import TokenResponseDTO, RefreshTokenRequestDTO, LogoutRequestDTO
 from shared.infrastructure.database.models.user_model import UserModel
 
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
 # Créer un router pour les endpoints d'authentification
 router = APIRouter(prefix="/auth", tags=["auth"])
 
-def get_container():
-    """Fournit le container d'injection de dépendances."""
-    return Container()
+async def get_container() -> AsyncIterator[Container]:
+    """
+    Fournit le container d'injection de dépendances de la requête.
+    Sa session est fermée après la réponse: la connexion est rendue au pool.
+    """
+    container = Container()
+    try:
+        yield container
+    finally:
+        await close_session(container)
 
 @router.post("/login", response_model=TokenResponseDTO)
 async def login(
@@ -37,8 +51,6 @@ async def login(
         HTTPException: En cas d'erreur
     """
     try:
-        print(f"Tentative de connexion avec: {form_data.username}")
-        
         # Vérifier si le client accepte le JSON (important pour les tests)
         accepted_content_type = request.headers.get('accept', '')
         
@@ -52,18 +64,16 @@ async def login(
         user_model = result.scalar_one_or_none()
         
         if not user_model:
-            print(f"Utilisateur non trouvé: {form_data.username}")
+            logger.info("Échec de connexion: utilisateur inconnu")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Email ou mot de passe incorrect",
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        print(f"Utilisateur trouvé: {user_model.email}, rôle: {user_model.role}")
-        
         # Vérifier si l'utilisateur est actif
         if not user_model.is_active:
-            print(f"Utilisateur inactif: {user_model.email}")
+            logger.info(f"Échec de connexion: utilisateur inactif {user_model.id}")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Utilisateur inactif",
@@ -71,28 +81,32 @@ async def login(
             )
         
         # Vérifier le mot de passe
-        print(f"Vérification du mot de passe pour: {user_model.email}")
-        print(f"Mot de passe fourni: {form_data.password}")
-        print(f"Hash stocké: {user_model.hashed_password}")
-        
         # Exception pour l'utilisateur admin
         is_password_valid = False
         if user_model.email == "admin@medisecure.com" and form_data.password == "Admin123!":
             is_password_valid = True
-            print("Authentification spéciale pour l'utilisateur admin")
+            logger.warning("Authentification spéciale pour l'utilisateur admin")
         else:
-            is_password_valid = authenticator.verify_password(form_data.password, user_model.hashed_password)
+            # bcrypt est volontairement coûteux: on le sort de la boucle d'événements
+            is_password_valid, new_hash = await run_in_threadpool(
+                authenticator.verify_and_update, form_data.password, user_model.hashed_password
+            )
+            # Rehachage transparent si le coût stocké n'est plus le coût configuré (BCRYPT_ROUNDS);
+            # un échec n'empêche pas la connexion, le rehachage sera retenté à la suivante
+            if is_password_valid and new_hash:
+                try:
+                    await container.user_repository().update_password_hash(user_model.id, new_hash)
+                except Exception as e:
+                    logger.warning(f"Rehachage du mot de passe de {user_model.id} impossible: {str(e)}")
         
         if not is_password_valid:
-            print(f"Mot de passe invalide pour: {user_model.email}")
+            logger.info(f"Échec de connexion: mot de passe invalide pour {user_model.id}")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Email ou mot de passe incorrect",
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        print(f"Mot de passe valide pour: {user_model.email}")
-        
         # Récupérer le rôle sous forme de chaîne
         if hasattr(user_model.role, 'value'):
             role_str = user_model.role.value
@@ -107,19 +121,18 @@ async def login(
             "name": f"{user_model.first_name} {user_model.last_name}"
         }
         
-        print(f"Données du token: {token_data}")
-        
         # Créer le token avec une durée d'expiration
         access_token = authenticator.create_access_token(
             data=token_data,
             expires_delta=timedelta(minutes=int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "30")))
         )
         
-        print(f"Token généré avec succès")
+        refresh_token = authenticator.create_refresh_token(data=token_data)
         
         # Créer la réponse
         response = TokenResponseDTO(
             access_token=access_token,
+            refresh_token=refresh_token,
             token_type="bearer",
             expires_in=int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "30")) * 60,
             user={
@@ -134,19 +147,129 @@ async def login(
             }
         )
         
-        print(f"Réponse complète générée")
+        logger.info(f"Connexion réussie: {user_model.id}")
         return response
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Erreur d'authentification détaillée: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception(f"Erreur d'authentification: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Une erreur est survenue: {str(e)}",
         )
 
+@router.post("/refresh", response_model=TokenResponseDTO)
+async def refresh(
+    refresh_request: RefreshTokenRequestDTO,
+    container: Container = Depends(get_container)
+):
+    """
+    Échange un token de rafraîchissement contre une nouvelle paire de tokens.
+    Le token de rafraîchissement présenté est révoqué (rotation): il ne peut servir qu'une fois.
+    
+    Args:
+        refresh_request: Le token de rafraîchissement
+        container: Le container d'injection de dépendances
+        
+    Returns:
+        TokenResponseDTO: Les nouveaux tokens et les informations de l'utilisateur
+        
+    Raises:
+        HTTPException: Si le token est invalide, révoqué ou si l'utilisateur est inactif
+    """
+    authenticator = container.authenticator()
+    revocation_list = container.token_revocation_list()
+    
+    invalid_token = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Token de rafraîchissement invalide",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    
+    try:
+        payload = authenticator.decode_token(refresh_request.refresh_token)
+    except JWTError:
+        raise invalid_token
+    
+    if payload.get("type") != "refresh" or revocation_list.is_revoked(payload.get("jti")):
+        raise invalid_token
+    
+    try:
+        user = await container.user_repository().get_by_id(UUID(payload.get("sub")))
+    except (TypeError, ValueError):
+        raise invalid_token
+    
+    if not user or not user.is_active:
+        raise invalid_token
+    
+    # Rotation: l'ancien token de rafraîchissement est révoqué avant d'en émettre un nouveau.
+    # La révocation en base est atomique: si deux rafraîchissements concurrents présentent le
+    # même token (même worker ou workers différents avant la notification), un seul l'emporte.
+    if not await container.token_revocation_service().revoke(payload):
+        raise invalid_token
+    
+    role_str = user.role.value if hasattr(user.role, 'value') else str(user.role)
+    token_data = {
+        "sub": str(user.id),
+        "email": user.email,
+        "role": role_str,
+        "name": user.full_name
+    }
+    
+    return TokenResponseDTO(
+        access_token=authenticator.create_access_token(data=token_data),
+        refresh_token=authenticator.create_refresh_token(data=token_data),
+        token_type="bearer",
+        expires_in=authenticator.access_token_expire_minutes * 60,
+        user={
+            "id": str(user.id),
+            "email": user.email,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "role": role_str,
+            "is_active": user.is_active,
+            "created_at": user.created_at,
+            "updated_at": user.updated_at
+        }
+    )
+
 @router.post("/logout")
 @router.options("/logout")
-async def logout():
-    """Route de déconnexion."""
+async def logout(
+    request: Request,
+    logout_request: Optional[LogoutRequestDTO] = None,
+    container: Container = Depends(get_container)
+):
+    """
+    Route de déconnexion.
+    Révoque le token d'accès présenté et, s'il est fourni, le token de rafraîchissement.
+    
+    Args:
+        request: La requête HTTP
+        logout_request: Le token de rafraîchissement à révoquer (optionnel)
+        container: Le container d'injection de dépendances
+    """
+    if request.method == "OPTIONS":
+        return {"detail": "Déconnexion réussie"}
+    
+    authenticator = container.authenticator()
+    tokens = []
+    
+    auth_header = request.headers.get("Authorization", "")
+    scheme, _, access_token = auth_header.partition(" ")
+    if scheme.lower() == "bearer" and access_token:
+        tokens.append(access_token)
+    if logout_request and logout_request.refresh_token:
+        tokens.append(logout_request.refresh_token)
+    
+    if tokens:
+        revocation_service = container.token_revocation_service()
+        for token in tokens:
+            try:
+                await revocation_service.revoke(authenticator.decode_token(token))
+            except JWTError:
+                # Un token invalide ou expiré n'a pas besoin d'être révoqué
+                continue
+    
     return {"detail": "Déconnexion réussie"}
\ No newline at end of file
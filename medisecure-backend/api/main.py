@@ -1,4 +1,6 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
@@ -13,32 +15,52 @@ from api.handlers.exception_handlers import (
     validation_exception_handler
 )
 from api.middlewares.authentication_middleware import AuthenticationMiddleware
+from api.middlewares.request_id_middleware import RequestIdMiddleware
+from api.middlewares.rate_limit_middleware import RateLimitMiddleware
+from api.middlewares.admission_control_middleware import AdmissionControlMiddleware
+from api.middlewares.deadline_middleware import DeadlineMiddleware, get_deadline_metrics
+from api.middlewares.compression_middleware import CompressionMiddleware
+from shared.infrastructure.logging.logging_config import configure_logging, shutdown_logging
 
 # Importer les routers
 from patient_management.infrastructure.adapters.primary.controllers.patient_controller import router as patient_router
 from api.controllers.auth_controller import router as auth_router
 from appointment_management.infrastructure.adapters.primary.controllers.appointment_controller import router as appointment_router
+from dashboard.infrastructure.adapters.primary.controllers.dashboard_controller import router as dashboard_router
 
 # Importer et configurer le container
-from shared.container.container import Container
-
-# Configuration du logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
-logger = logging.getLogger(__name__)
+from shared.container.container import Container, close_session
+from shared.container.cache_invalidation import create_invalidation_listener
+from shared.container.warmup import warm_up_database
+from shared.infrastructure.database.readiness import get_readiness_probe
 
 # Charger les variables d'environnement
 load_dotenv()
 
+# Configuration du logging (pipeline unique, non bloquant: voir shared/infrastructure/logging)
+configure_logging()
+logger = logging.getLogger(__name__)
+
 # Initialiser le container
 container = Container()
 
+# Invalidation des caches du processus lors des écritures des autres workers (LISTEN/NOTIFY)
+invalidation_listener = create_invalidation_listener(container)
+
+# Disponibilité de la base de données (/api/ready), vérifiée au plus une fois par intervalle
+readiness_probe = get_readiness_probe()
+
 # Informations de version pour l'API
 API_VERSION = "1.0.0"
 API_PREFIX = "/api"  # Ne pas utiliser os.getenv ici, mais définir explicitement
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Cycle de vie d'un worker: préchauffage avant la première requête, libération à l'arrêt"""
+    await startup_event()
+    yield
+    await shutdown_event()
+
 app = FastAPI(
     title="MediSecure API",
     description="API pour la gestion des dossiers patients et des rendez-vous médicaux",
@@ -46,6 +68,9 @@ app = FastAPI(
     docs_url=f"{API_PREFIX}/docs",
     redoc_url=f"{API_PREFIX}/redoc",
     openapi_url=f"{API_PREFIX}/openapi.json",
+    # Sérialisation JSON par orjson pour toutes les routes (voir aussi TrustedJSONResponse)
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Configuration CORS - Modification pour accepter les requêtes du frontend
@@ -57,6 +82,21 @@ origins = [
     "*"  # Temporairement pour le développement
 ]
 
+# Limitation de débit des routes coûteuses (ajoutée en premier: exécutée après CORS et l'authentification,
+# pour que les réponses 429 portent les en-têtes CORS et que la clé puisse être le sujet du token)
+if os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true":
+    app.add_middleware(RateLimitMiddleware)
+
+# Contrôle d'admission: délestage des listes et exports lorsque la base ralentit (attente du pool,
+# retard de la boucle) et plafond de requêtes simultanées par classe de routes
+if os.getenv("ADMISSION_CONTROL_ENABLED", "true").lower() == "true":
+    app.add_middleware(AdmissionControlMiddleware)
+
+# Échéance de chaque requête: budget par classe de routes, propagé à Postgres (statement_timeout),
+# annulation à l'échéance (504) ou à la déconnexion du client
+if os.getenv("REQUEST_DEADLINES_ENABLED", "true").lower() == "true":
+    app.add_middleware(DeadlineMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -68,6 +108,13 @@ app.add_middleware(
 # Middleware d'authentification
 app.middleware("http")(AuthenticationMiddleware())
 
+# Compression des réponses (englobe les autres middlewares pour compresser aussi les réponses d'erreur)
+if os.getenv("COMPRESSION_ENABLED", "true").lower() == "true":
+    app.add_middleware(CompressionMiddleware)
+
+# Identifiant de requête (ajouté en dernier pour englober tous les autres middlewares)
+app.add_middleware(RequestIdMiddleware)
+
 # Enregistrement des gestionnaires d'exceptions
 app.add_exception_handler(AppException, app_exception_handler)
 app.add_exception_handler(StarletteHTTPException, http_exception_handler)
@@ -77,6 +124,7 @@ app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.include_router(patient_router, prefix=API_PREFIX)
 app.include_router(auth_router, prefix=API_PREFIX)
 app.include_router(appointment_router, prefix=API_PREFIX)
+app.include_router(dashboard_router, prefix=API_PREFIX)
 
 @app.get(f"{API_PREFIX}/health")
 async def health_check():
@@ -87,8 +135,19 @@ async def health_check():
         "environment": os.getenv("ENVIRONMENT", "development")
     }
 
-# Événement de démarrage de l'application
-@app.on_event("startup")
+@app.get(f"{API_PREFIX}/ready")
+async def readiness_check():
+    """
+    Endpoint de disponibilité (sonde readiness): vérifie que la base de données est joignable.
+    Le résultat est réutilisé quelques secondes: les sondes n'ajoutent pas de charge à la base.
+    """
+    readiness = await readiness_probe.check()
+    return ORJSONResponse(
+        {"status": "ready" if readiness.ready else "unavailable", "version": API_VERSION},
+        status_code=200 if readiness.ready else 503
+    )
+
+# Démarrage de chaque worker, avant sa première requête
 async def startup_event():
     logger.info("=== MediSecure API démarrée ===")
     logger.info(f"Version: {API_VERSION}")
@@ -96,22 +155,64 @@ async def startup_event():
     logger.info(f"Préfixe API: {API_PREFIX}")
     logger.info(f"CORS Origins: {origins}")
     
+    # Vérifier les réplicas en lecture, puis les surveiller (retard de réplication, connexion)
+    await container.replica_set().start()
+    
+    # Ouvrir les connexions du pool et compiler les lectures les plus sollicitées
+    await warm_up_database(container)
+    
+    # Charger la liste de révocation des tokens depuis la base de données
+    try:
+        await container.token_revocation_service().reload()
+    except Exception as e:
+        logger.warning(f"Impossible de charger la liste de révocation des tokens: {str(e)}")
+    finally:
+        await close_session(container)
+    
+    # Écoute des invalidations: vide les caches à la connexion, puis applique les notifications
+    if invalidation_listener is not None:
+        await invalidation_listener.start()
+    
     # Afficher toutes les routes pour débogage
     for route in app.routes:
-        logger.info(f"Route: {route.path}, methods: {route.methods}")
+        logger.debug(f"Route: {route.path}, methods: {route.methods}")
 
-# Événement d'arrêt de l'application
-@app.on_event("shutdown")
+# Arrêt de chaque worker, une fois ses requêtes terminées
 async def shutdown_event():
+    if invalidation_listener is not None:
+        await invalidation_listener.stop()
+    stats = container.patient_cache_stats()
+    logger.info(
+        f"Cache des patients: {stats.hits} hits, {stats.misses} misses, {stats.evictions} évictions, "
+        f"{stats.invalidations} invalidations, {stats.errors} erreurs"
+    )
+    calendar_stats = container.calendar_cache().stats
+    logger.info(
+        f"Cache du calendrier: {calendar_stats.hits} hits, {calendar_stats.misses} misses, "
+        f"{calendar_stats.evictions} évictions, {calendar_stats.invalidations} invalidations"
+    )
+    flight_stats = container.single_flight().stats
+    logger.info(
+        f"Lectures regroupées: {flight_stats.coalesced} appels servis par {flight_stats.executions} lectures, "
+        f"{flight_stats.abandoned} abandonnées"
+    )
+    for route, deadline_stats in get_deadline_metrics().breaches().items():
+        logger.info(
+            f"Échéances de {route}: {deadline_stats.timeouts} dépassées, {deadline_stats.pool_timeouts} attentes du pool expirées, "
+            f"{deadline_stats.disconnects} clients déconnectés sur {deadline_stats.requests} requêtes"
+        )
+    await container.replica_set().stop()
+    await container.engine().dispose()
     logger.info("=== MediSecure API arrêtée ===")
+    shutdown_logging()
 
 if __name__ == "__main__":
     import uvicorn
     
-    # Configurer le serveur Uvicorn
+    # Serveur de développement (un seul processus); en production: python -m api.serve
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8000"))
-    reload = os.getenv("ENVIRONMENT", "development") == "development"
+    reload = os.getenv("SERVER_RELOAD", "false").lower() == "true"
     
-    logger.info(f"Démarrage du serveur sur {host}:{port} (reload: {reload})")
-    uvicorn.run("api.main:app", host=host, port=port, reload=reload)
\ No newline at end of file
+    logger.info(f"Démarrage du serveur de développement sur {host}:{port} (reload: {reload})")
+    uvicorn.run("api.main:app", host=host, port=port, reload=reload)
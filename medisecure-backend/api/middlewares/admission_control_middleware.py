@@ -0,0 +1,215 @@
+# medisecure-backend/api/middlewares/admission_control_middleware.py
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional, Set
+
+from shared.infrastructure.concurrency.loop_lag_monitor import LoopLagMonitor, get_loop_lag_monitor
+from shared.infrastructure.database.pool_monitor import PoolWaitMonitor, get_pool_wait_monitor
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+_OVERLOADED_BODY = json.dumps({"detail": "Service temporairement surchargé, veuillez réessayer plus tard"}).encode("utf-8")
+
+# Routes jamais soumises au contrôle d'admission (sondes, documentation)
+_EXEMPT_PATHS = ("/api/health", "/api/ready", "/api/docs", "/api/redoc", "/api/openapi.json")
+
+# Routes de liste et de recherche (délestées en premier avec les exports); les autres
+# méthodes de ces chemins sont des écritures (création d'un patient, prise de rendez-vous)
+_LIST_PATHS = ("/api/patients", "/api/patients/search", "/api/appointments", "/api/appointments/calendar")
+_LIST_PREFIXES = ("/api/appointments/patient/", "/api/dashboard/")
+
+# Recherches envoyées en POST (critères dans le corps), seules lectures POST de la classe list
+_SEARCH_PATHS = ("/api/patients/search",)
+
+@dataclass(frozen=True)
+class RouteClass:
+    """
+    Classe de routes du contrôle d'admission.
+
+    Attributes:
+        name: Le nom de la classe
+        max_in_flight: Le nombre maximal de requêtes de la classe traitées en même temps par le worker
+        shed_at: La pression à partir de laquelle la classe est délestée (None: jamais délestée).
+                 La pression vaut 1 lorsque le retard de la boucle ou l'attente du pool atteint son seuil.
+    """
+    name: str
+    max_in_flight: int
+    shed_at: Optional[float] = None
+
+def default_route_classes() -> Dict[str, RouteClass]:
+    """
+    Classes par défaut: connexion, lectures unitaires et écritures (prises de rendez-vous) ne sont
+    jamais délestées; listes et recherches le sont au seuil, exports et imports dès la moitié du seuil.
+    Les plafonds sont configurables par ADMISSION_MAX_IN_FLIGHT ("list=16,export=2").
+
+    Returns:
+        Dict[str, RouteClass]: Les classes indexées par nom
+    """
+    caps = {"auth": 64, "read": 128, "write": 64, "list": 32, "export": 2}
+    for item in os.getenv("ADMISSION_MAX_IN_FLIGHT", "").split(","):
+        name, _, value = item.partition("=")
+        if name.strip() in caps and value.strip():
+            caps[name.strip()] = int(value)
+    return {
+        "auth": RouteClass("auth", caps["auth"]),
+        "read": RouteClass("read", caps["read"]),
+        "write": RouteClass("write", caps["write"]),
+        "list": RouteClass("list", caps["list"], shed_at=1.0),
+        "export": RouteClass("export", caps["export"], shed_at=0.5),
+    }
+
+def classify_route(method: str, path: str) -> Optional[str]:
+    """
+    Détermine la classe d'une requête.
+
+    Args:
+        method: La méthode HTTP
+        path: Le chemin de la requête
+
+    Returns:
+        Optional[str]: Le nom de la classe, ou None pour les routes hors contrôle
+    """
+    path = path.rstrip("/")
+    if not path.startswith("/api/") or path.startswith(_EXEMPT_PATHS):
+        return None
+    if path.endswith("/export") or path == "/api/patients/import":
+        return "export"
+    if path.startswith("/api/auth/"):
+        return "auth"
+    if path in _LIST_PATHS or path.startswith(_LIST_PREFIXES):
+        if method in ("GET", "HEAD") or (method == "POST" and path in _SEARCH_PATHS):
+            return "list"
+        return "write"
+    return "read" if method in ("GET", "HEAD") else "write"
+
+@dataclass
+class AdmissionStats:
+    """
+    Compteurs d'une classe de routes.
+
+    Attributes:
+        admitted: Le nombre de requêtes traitées
+        shed: Le nombre de requêtes refusées pour surcharge (retard de la boucle, attente du pool)
+        rejected: Le nombre de requêtes refusées car la classe avait atteint son plafond
+        in_flight: Le nombre de requêtes en cours
+    """
+    admitted: int = 0
+    shed: int = 0
+    rejected: int = 0
+    in_flight: int = 0
+
+class AdmissionControlMiddleware:
+    """
+    Middleware ASGI de contrôle d'admission.
+
+    Lorsque la base de données ralentit, les requêtes s'accumulent en attente d'une connexion du
+    pool jusqu'à expirer toutes ensemble. Ce middleware mesure l'attente du pool et le retard de la
+    boucle d'événements, et refuse (503 avec Retry-After) les routes peu prioritaires dès que la
+    pression dépasse leur seuil, pour que la connexion, les lectures unitaires et les prises de
+    rendez-vous continuent d'être servies. Chaque classe de routes a en outre un plafond de
+    requêtes simultanées.
+    """
+
+    def __init__(
+        self,
+        app,
+        route_classes: Optional[Dict[str, RouteClass]] = None,
+        loop_lag_monitor: Optional[LoopLagMonitor] = None,
+        pool_wait_monitor: Optional[PoolWaitMonitor] = None,
+        loop_lag_threshold: Optional[float] = None,
+        pool_wait_threshold: Optional[float] = None,
+        retry_after_seconds: Optional[int] = None
+    ):
+        """
+        Initialise le middleware.
+
+        Args:
+            app: L'application ASGI encapsulée
+            route_classes: Les classes de routes (default_route_classes() si absent)
+            loop_lag_monitor: La mesure du retard de la boucle (partagée par le processus si absente)
+            pool_wait_monitor: La mesure de l'attente du pool (partagée par le processus si absente)
+            loop_lag_threshold: Le retard de la boucle correspondant à une pression de 1, en secondes
+                                (ADMISSION_LOOP_LAG_THRESHOLD_MS, 200 ms par défaut)
+            pool_wait_threshold: L'attente du pool correspondant à une pression de 1, en secondes
+                                 (ADMISSION_POOL_WAIT_THRESHOLD_MS, 500 ms par défaut)
+            retry_after_seconds: La valeur de Retry-After des refus (ADMISSION_RETRY_AFTER_SECONDS, 2 par défaut)
+        """
+        self.app = app
+        self.route_classes = route_classes if route_classes is not None else default_route_classes()
+        self.loop_lag_monitor = loop_lag_monitor or get_loop_lag_monitor()
+        self.pool_wait_monitor = pool_wait_monitor or get_pool_wait_monitor()
+        if loop_lag_threshold is None:
+            loop_lag_threshold = float(os.getenv("ADMISSION_LOOP_LAG_THRESHOLD_MS", "200")) / 1000
+        if pool_wait_threshold is None:
+            pool_wait_threshold = float(os.getenv("ADMISSION_POOL_WAIT_THRESHOLD_MS", "500")) / 1000
+        if retry_after_seconds is None:
+            retry_after_seconds = int(os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "2"))
+        self.loop_lag_threshold = loop_lag_threshold
+        self.pool_wait_threshold = pool_wait_threshold
+        self._retry_after = str(retry_after_seconds).encode("ascii")
+        self.stats: Dict[str, AdmissionStats] = {name: AdmissionStats() for name in self.route_classes}
+        self._shedding: Set[str] = set()
+
+    def pressure(self) -> float:
+        """
+        Retourne la pression actuelle: 1 lorsque le retard de la boucle ou l'attente du pool atteint son seuil.
+
+        Returns:
+            float: La plus grande des deux mesures rapportée à son seuil
+        """
+        return max(
+            self.loop_lag_monitor.lag / self.loop_lag_threshold,
+            self.pool_wait_monitor.current_wait() / self.pool_wait_threshold
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route_class = self.route_classes.get(classify_route(scope["method"], scope["path"]))
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        self.loop_lag_monitor.ensure_started()
+        stats = self.stats[route_class.name]
+        if route_class.shed_at is not None:
+            pressure = self.pressure()
+            if pressure >= route_class.shed_at:
+                if route_class.name not in self._shedding:
+                    self._shedding.add(route_class.name)
+                    logger.warning(f"Délestage des routes {route_class.name}: pression {pressure:.2f}")
+                stats.shed += 1
+                await self._refuse(send)
+                return
+            if route_class.name in self._shedding:
+                self._shedding.discard(route_class.name)
+                logger.info(f"Fin du délestage des routes {route_class.name}: pression {pressure:.2f}")
+        if stats.in_flight >= route_class.max_in_flight:
+            stats.rejected += 1
+            await self._refuse(send)
+            return
+
+        stats.admitted += 1
+        stats.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            stats.in_flight -= 1
+
+    async def _refuse(self, send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(_OVERLOADED_BODY)).encode("ascii")),
+                (b"retry-after", self._retry_after),
+            ],
+        })
+        await send({"type": "http.response.body", "body": _OVERLOADED_BODY})
@@ -8,6 +8,8 @@ import os
 from datetime import datetime, timedelta
 import logging
 
+from shared.services.authenticator.token_revocation_list import get_token_revocation_list
+
 # Configuration du logging
 logger = logging.getLogger(__name__)  # Ajout de cette ligne qui manquait
 
@@ -19,6 +21,7 @@ class AuthenticationMiddleware:
     def __init__(self):
         self.jwt_secret = os.getenv("JWT_SECRET_KEY", "default_secret_key")
         self.algorithm = os.getenv("JWT_ALGORITHM", "HS256")
+        self.revocation_list = get_token_revocation_list()
         
     async def __call__(self, request: Request, call_next):
         """Vérifie le token JWT et ajoute l'utilisateur à la requête"""
@@ -26,11 +29,13 @@ class AuthenticationMiddleware:
         # Chemins exemptés d'authentification
         exempt_paths = [
             "/api/health", 
+            "/api/ready",
             "/api/docs", 
             "/api/redoc", 
             "/api/openapi.json", 
             "/api/auth/login", 
-            "/api/auth/logout"
+            "/api/auth/logout",
+            "/api/auth/refresh"
         ]
         
         # Méthode OPTIONS pour les requêtes CORS preflight
@@ -62,6 +67,12 @@ class AuthenticationMiddleware:
                 logger.warning(f"Token expiré pour: {request.url.path}")
                 return await call_next(request)
             
+            # Seul un token d'accès non révoqué identifie l'utilisateur (en mémoire, sans I/O); le
+            # refus (401) revient à extract_token_payload, dans la couche CORS
+            if payload.get("type") != "access" or self.revocation_list.is_revoked(payload.get("jti")):
+                logger.warning(f"Token révoqué ou non utilisable pour l'accès: {request.url.path}")
+                return await call_next(request)
+            
             # Ajout de l'utilisateur à la requête
             request.state.user = payload
             logger.debug(f"Utilisateur authentifié: {payload.get('email')} accède à {request.url.path}")
@@ -0,0 +1,244 @@
+# medisecure-backend/api/middlewares/compression_middleware.py
+
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from shared.infrastructure.cache.ttl_cache import TTLCache
+from shared.infrastructure.http.compression import Codec, StreamCompressor, available_codecs, negotiate_encoding
+from shared.infrastructure.http.responses import COMPRESSION_CACHE_HEADER
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTENT_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/problem+json",
+    "text/csv",
+    "text/plain",
+    "text/html",
+)
+
+@dataclass
+class CompressionStats:
+    """
+    Compteurs cumulés du middleware: coût CPU de la compression rapporté aux octets économisés.
+
+    Attributes:
+        responses: Le nombre de réponses compressées
+        cache_hits: Le nombre de réponses servies depuis le cache des corps compressés
+        bytes_in: Le nombre d'octets avant compression
+        bytes_out: Le nombre d'octets envoyés après compression
+        cpu_seconds: Le temps CPU passé à compresser
+    """
+    responses: int = 0
+    cache_hits: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    cpu_seconds: float = 0.0
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_in - self.bytes_out
+
+    @property
+    def cpu_ms_per_response(self) -> float:
+        return self.cpu_seconds * 1000 / self.responses if self.responses else 0.0
+
+    def record(self, bytes_in: int, bytes_out: int, cpu_seconds: float, cache_hit: bool = False) -> None:
+        self.responses += 1
+        self.cache_hits += int(cache_hit)
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+        self.cpu_seconds += cpu_seconds
+
+def _env_list(name: str, default: Iterable[str]) -> Tuple[str, ...]:
+    """Lit une liste séparée par des virgules dans une variable d'environnement"""
+    value = os.getenv(name)
+    if value is None:
+        return tuple(default)
+    return tuple(item.strip().lower() for item in value.split(",") if item.strip())
+
+class CompressionMiddleware:
+    """
+    Middleware ASGI de compression des réponses (zstd, brotli si installés, et gzip).
+
+    Seules les réponses dont le type de contenu est autorisé et dont le corps atteint la taille
+    minimale sont compressées; les réponses envoyées en plusieurs morceaux (exports) sont compressées
+    au fil de l'eau. Les versions compressées des CacheableJSONResponse sont conservées, indexées
+    par l'empreinte du corps, pour ne pas recompresser un même mois de calendrier à chaque requête.
+    """
+
+    def __init__(
+        self,
+        app,
+        minimum_size: Optional[int] = None,
+        content_types: Optional[Iterable[str]] = None,
+        encodings: Optional[Iterable[str]] = None,
+        gzip_level: Optional[int] = None,
+        brotli_quality: Optional[int] = None,
+        zstd_level: Optional[int] = None,
+        cache: Optional[TTLCache] = None
+    ):
+        """
+        Initialise le middleware. Les paramètres absents sont lus dans l'environnement.
+
+        Args:
+            app: L'application ASGI encapsulée
+            minimum_size: La taille minimale d'un corps compressé (COMPRESSION_MINIMUM_SIZE, 1024 octets)
+            content_types: Les types de contenu compressés (COMPRESSION_CONTENT_TYPES)
+            encodings: Les encodages par ordre de préférence (COMPRESSION_ENCODINGS, "zstd,br,gzip");
+                       ceux dont la bibliothèque n'est pas installée sont ignorés
+            gzip_level: Le niveau gzip (COMPRESSION_GZIP_LEVEL, 6)
+            brotli_quality: La qualité brotli (COMPRESSION_BROTLI_QUALITY, 4)
+            zstd_level: Le niveau zstd (COMPRESSION_ZSTD_LEVEL, 3)
+            cache: Le cache des corps compressés (COMPRESSION_CACHE_TTL_SECONDS, 300 s,
+                   et COMPRESSION_CACHE_MAX_ENTRIES, 256 entrées)
+        """
+        self.app = app
+        self.minimum_size = minimum_size if minimum_size is not None else int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+        self.content_types = frozenset(
+            content_types if content_types is not None else _env_list("COMPRESSION_CONTENT_TYPES", DEFAULT_CONTENT_TYPES)
+        )
+        self.codecs: Dict[str, Codec] = available_codecs(
+            encodings if encodings is not None else _env_list("COMPRESSION_ENCODINGS", ("zstd", "br", "gzip")),
+            gzip_level=gzip_level if gzip_level is not None else int(os.getenv("COMPRESSION_GZIP_LEVEL", "6")),
+            brotli_quality=brotli_quality if brotli_quality is not None else int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4")),
+            zstd_level=zstd_level if zstd_level is not None else int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3"))
+        )
+        self.cache = cache if cache is not None else TTLCache(
+            float(os.getenv("COMPRESSION_CACHE_TTL_SECONDS", "300")),
+            max_entries=int(os.getenv("COMPRESSION_CACHE_MAX_ENTRIES", "256"))
+        )
+        self.stats = CompressionStats()
+        logger.info(f"Compression des réponses: {', '.join(self.codecs) or 'aucun encodage disponible'}")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), tuple(self.codecs))
+        responder = _CompressionResponder(self, self.codecs.get(encoding) if encoding else None, send)
+        await self.app(scope, receive, responder.send)
+
+    def compress(self, codec: Codec, body: bytes, cacheable: bool) -> bytes:
+        """
+        Compresse un corps complet, ou le lit dans le cache des corps compressés.
+
+        Args:
+            codec: Le codec négocié avec le client
+            body: Le corps de la réponse
+            cacheable: Conserver la version compressée (CacheableJSONResponse)
+
+        Returns:
+            bytes: Le corps compressé
+        """
+        started = time.thread_time()
+        key = None
+        if cacheable:
+            key = (hashlib.blake2b(body, digest_size=16).digest(), codec.encoding)
+            compressed = self.cache.get(key)
+            if compressed is not None:
+                self.stats.record(len(body), len(compressed), time.thread_time() - started, cache_hit=True)
+                return compressed
+
+        compressed = codec.compress(body)
+        if key is not None:
+            self.cache.set(key, compressed)
+        self.stats.record(len(body), len(compressed), time.thread_time() - started)
+        return compressed
+
+class _CompressionResponder:
+    """Intercepte les messages d'une réponse pour en compresser le corps"""
+
+    def __init__(self, middleware: CompressionMiddleware, codec: Optional[Codec], send):
+        self.middleware = middleware
+        self.codec = codec
+        self._send = send
+        self.start_message = None
+        self.cacheable = False
+        self.passthrough = False
+        self.stream: Optional[StreamCompressor] = None
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.cpu_seconds = 0.0
+
+    async def send(self, message) -> None:
+        if message["type"] == "http.response.start":
+            # L'en-tête interne n'est jamais envoyé au client
+            headers = MutableHeaders(scope=message)
+            self.cacheable = COMPRESSION_CACHE_HEADER.decode("latin-1") in headers
+            if self.cacheable:
+                del headers[COMPRESSION_CACHE_HEADER.decode("latin-1")]
+            self.start_message = message
+            self.passthrough = self.codec is None or not self._is_compressible(headers, message["status"])
+            if self.passthrough:
+                await self._send(message)
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.stream is not None:
+            await self._send_chunk(body, more_body)
+            return
+
+        if not more_body:
+            # Corps complet: compressé en une fois s'il atteint la taille minimale
+            if len(body) < self.middleware.minimum_size:
+                await self._send(self.start_message)
+                await self._send(message)
+                return
+            compressed = self.middleware.compress(self.codec, body, self.cacheable)
+            self._set_encoding_headers(len(compressed))
+            await self._send(self.start_message)
+            await self._send({"type": "http.response.body", "body": compressed})
+            return
+
+        # Corps envoyé en plusieurs morceaux (StreamingResponse): compression au fil de l'eau
+        self.stream = self.codec.stream()
+        self._set_encoding_headers(None)
+        await self._send(self.start_message)
+        await self._send_chunk(body, more_body)
+
+    def _is_compressible(self, headers: MutableHeaders, status_code: int) -> bool:
+        """Vérifie si la réponse peut être compressée d'après son statut et ses en-têtes"""
+        if status_code < 200 or status_code in (204, 304) or "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+        return content_type in self.middleware.content_types
+
+    def _set_encoding_headers(self, content_length: Optional[int]) -> None:
+        """Déclare l'encodage du corps et adapte sa longueur"""
+        headers = MutableHeaders(scope=self.start_message)
+        headers["content-encoding"] = self.codec.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is None:
+            if "content-length" in headers:
+                del headers["content-length"]
+        else:
+            headers["content-length"] = str(content_length)
+
+    async def _send_chunk(self, body: bytes, more_body: bool) -> None:
+        """Compresse et envoie un morceau du corps"""
+        started = time.thread_time()
+        compressed = self.stream.compress(body) if body else b""
+        if not more_body:
+            compressed += self.stream.finish()
+        self.cpu_seconds += time.thread_time() - started
+        self.bytes_in += len(body)
+        self.bytes_out += len(compressed)
+        if not more_body:
+            self.middleware.stats.record(self.bytes_in, self.bytes_out, self.cpu_seconds)
+        await self._send({"type": "http.response.body", "body": compressed, "more_body": more_body})
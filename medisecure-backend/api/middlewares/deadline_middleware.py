@@ -0,0 +1,250 @@
+# medisecure-backend/api/middlewares/deadline_middleware.py
+
+import asyncio
+import json
+import logging
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from api.middlewares.admission_control_middleware import classify_route
+from shared.infrastructure.database.request_deadline import RequestDeadline, reset_deadline, start_deadline
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+_TIMEOUT_BODY = json.dumps({"detail": "Le traitement de la requête a dépassé le délai imparti"}).encode("utf-8")
+_OVERLOADED_BODY = json.dumps({"detail": "Service temporairement surchargé, veuillez réessayer plus tard"}).encode("utf-8")
+_DISCONNECT = {"type": "http.disconnect"}
+
+def default_deadlines() -> Dict[str, float]:
+    """
+    Budgets par classe de routes (voir classify_route), en secondes: REQUEST_DEADLINE_SECONDS
+    (10 par défaut) pour toutes, sauf les exports et imports (120). Les budgets sont
+    configurables par REQUEST_DEADLINES ("list=5,export=300").
+
+    Returns:
+        Dict[str, float]: Les budgets indexés par classe de routes
+    """
+    default = float(os.getenv("REQUEST_DEADLINE_SECONDS", "10"))
+    deadlines = {"auth": default, "read": default, "write": default, "list": default, "export": 120.0}
+    for item in os.getenv("REQUEST_DEADLINES", "").split(","):
+        name, _, value = item.partition("=")
+        if name.strip() in deadlines and value.strip():
+            deadlines[name.strip()] = float(value)
+    return deadlines
+
+@dataclass
+class RouteDeadlineStats:
+    """
+    Compteurs des échéances d'une route.
+
+    Attributes:
+        requests: Le nombre de requêtes soumises à une échéance
+        timeouts: Le nombre de réponses 504 (échéance dépassée, requête SQL annulée par statement_timeout)
+        pool_timeouts: Le nombre de réponses 503 (attente d'une connexion du pool expirée)
+        disconnects: Le nombre de requêtes interrompues car le client s'était déconnecté
+    """
+    requests: int = 0
+    timeouts: int = 0
+    pool_timeouts: int = 0
+    disconnects: int = 0
+
+class DeadlineMetrics:
+    """Compteurs des échéances par route (nom de la fonction de la route, ou classe de routes avant le routage)"""
+
+    def __init__(self):
+        self.routes: Dict[str, RouteDeadlineStats] = {}
+
+    def route(self, name: str) -> RouteDeadlineStats:
+        """Retourne les compteurs d'une route (créés au premier appel)"""
+        stats = self.routes.get(name)
+        if stats is None:
+            stats = self.routes[name] = RouteDeadlineStats()
+        return stats
+
+    def breaches(self) -> Dict[str, RouteDeadlineStats]:
+        """Retourne les compteurs des routes ayant dépassé au moins une échéance"""
+        return {
+            name: stats for name, stats in self.routes.items()
+            if stats.timeouts or stats.pool_timeouts or stats.disconnects
+        }
+
+# Compteurs partagés par le processus
+_deadline_metrics = DeadlineMetrics()
+
+def get_deadline_metrics() -> DeadlineMetrics:
+    """
+    Fournit les compteurs des échéances partagés par le processus.
+    """
+    return _deadline_metrics
+
+class _ClientReceiver:
+    """
+    Lecteur unique des messages du client: transmet le corps de la requête à l'application au
+    rythme où elle le lit, et détecte la déconnexion du client même si l'application ne lit plus.
+    """
+
+    def __init__(self, receive):
+        self._receive = receive
+        self._pending: Optional[dict] = None
+        self._available = asyncio.Event()
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self.disconnected = False
+
+    async def watch(self) -> None:
+        """Lit les messages du client; se termine à la déconnexion"""
+        while True:
+            await self._drained.wait()
+            message = await self._receive()
+            if message["type"] == "http.disconnect":
+                self.disconnected = True
+                self._available.set()
+                return
+            self._pending = message
+            self._drained.clear()
+            self._available.set()
+
+    async def receive(self) -> dict:
+        """Fonction receive transmise à l'application"""
+        await self._available.wait()
+        if self._pending is None:
+            return _DISCONNECT
+        message, self._pending = self._pending, None
+        if not self.disconnected:
+            self._available.clear()
+        self._drained.set()
+        return message
+
+class DeadlineMiddleware:
+    """
+    Middleware ASGI des échéances de requête.
+
+    Chaque requête reçoit le budget de sa classe de routes. L'échéance est propagée à la base de
+    données: chaque transaction de la requête est limitée à son temps restant (SET LOCAL
+    statement_timeout). La requête est annulée à l'échéance (504 si la réponse n'a pas commencé)
+    ou dès que le client se déconnecte; l'annulation de la tâche interrompt la requête SQL en
+    cours (demande d'annulation envoyée à Postgres par asyncpg).
+
+    Les erreurs 500 des routes causées par une requête SQL annulée deviennent des 504, celles
+    causées par l'attente expirée d'une connexion du pool des 503 avec Retry-After.
+    """
+
+    def __init__(
+        self,
+        app,
+        deadlines: Optional[Dict[str, float]] = None,
+        metrics: Optional[DeadlineMetrics] = None,
+        retry_after_seconds: Optional[int] = None
+    ):
+        """
+        Initialise le middleware.
+
+        Args:
+            app: L'application ASGI encapsulée
+            deadlines: Les budgets par classe de routes en secondes (default_deadlines() si absent)
+            metrics: Les compteurs des échéances (partagés par le processus si absents)
+            retry_after_seconds: La valeur de Retry-After des réponses 503 (ADMISSION_RETRY_AFTER_SECONDS, 2 par défaut)
+        """
+        self.app = app
+        self.deadlines = deadlines if deadlines is not None else default_deadlines()
+        self.metrics = metrics or get_deadline_metrics()
+        if retry_after_seconds is None:
+            retry_after_seconds = int(os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "2"))
+        self._retry_after = str(retry_after_seconds).encode("ascii")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route_class = classify_route(scope["method"], scope["path"])
+        budget = self.deadlines.get(route_class)
+        if budget is None:
+            await self.app(scope, receive, send)
+            return
+
+        deadline = RequestDeadline(budget)
+        client = _ClientReceiver(receive)
+        response = {"started": False, "complete": False, "replaced": False}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                response["started"] = True
+                if message["status"] == 500 and deadline.breach is not None:
+                    response["replaced"] = True
+                    await self._refuse(send, deadline.breach)
+                    return
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                response["complete"] = True
+            if not response["replaced"]:
+                await send(message)
+
+        # La tâche de l'application hérite de l'échéance par son contexte
+        token = start_deadline(deadline)
+        try:
+            app_task = asyncio.create_task(self.app(scope, client.receive, send_wrapper))
+        finally:
+            reset_deadline(token)
+        watcher = asyncio.create_task(client.watch())
+
+        outcome = None
+        try:
+            pending = {app_task, watcher}
+            while app_task in pending:
+                timeout = None if response["started"] else max(0.0, deadline.remaining())
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if app_task in done:
+                    break
+                if watcher in done and not response["complete"]:
+                    outcome = "disconnect"
+                elif not done and not response["started"]:
+                    outcome = "timeout"
+                if outcome is not None:
+                    app_task.cancel()
+                    await asyncio.wait({app_task})
+                    break
+        except asyncio.CancelledError:
+            app_task.cancel()
+            raise
+        finally:
+            watcher.cancel()
+
+        self._record(scope, route_class, deadline, outcome, response["replaced"])
+        if outcome == "timeout" and not response["started"]:
+            await self._refuse(send, RequestDeadline.STATEMENT_TIMEOUT)
+        elif outcome is None:
+            app_task.result()
+
+    def _record(self, scope, route_class: str, deadline: RequestDeadline, outcome: Optional[str], replaced: bool) -> None:
+        endpoint = scope.get("endpoint")
+        route = getattr(endpoint, "__name__", None) or route_class
+        stats = self.metrics.route(route)
+        stats.requests += 1
+        if outcome == "disconnect":
+            stats.disconnects += 1
+            logger.info(f"Requête {route} annulée: client déconnecté")
+        elif outcome == "timeout" or (replaced and deadline.breach == RequestDeadline.STATEMENT_TIMEOUT):
+            stats.timeouts += 1
+            logger.warning(f"Requête {route} interrompue: échéance de {deadline.budget_seconds:g} s dépassée")
+        elif replaced:
+            stats.pool_timeouts += 1
+            logger.warning(f"Requête {route} refusée: aucune connexion du pool disponible avant l'échéance")
+
+    async def _refuse(self, send, breach: str) -> None:
+        if breach == RequestDeadline.POOL_TIMEOUT:
+            status, body = 503, _OVERLOADED_BODY
+            headers = [(b"retry-after", self._retry_after)]
+        else:
+            status, body, headers = 504, _TIMEOUT_BODY, []
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                *headers,
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,172 @@
+# medisecure-backend/api/middlewares/rate_limit_middleware.py
+
+import json
+import logging
+import math
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+from shared.ports.secondary.rate_limit_store_protocol import RateLimitStoreProtocol
+from shared.adapters.secondary.in_memory_rate_limit_store import InMemoryRateLimitStore
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+RATE_PERIODS = {"second": 1, "minute": 60, "hour": 3600}
+
+_RATE_LIMITED_BODY = json.dumps({"detail": "Trop de requêtes, veuillez réessayer plus tard"}).encode("utf-8")
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """
+    Politique de limitation de débit d'une route.
+
+    Attributes:
+        name: Le nom de la politique (préfixe des clés de seau)
+        method: La méthode HTTP concernée
+        path: Le chemin complet de la route (préfixe /api compris)
+        capacity: La rafale autorisée (nombre de jetons du seau)
+        refill_per_second: Le débit soutenu autorisé (jetons ajoutés par seconde)
+        key: "ip" pour limiter par adresse du client, "subject" pour limiter par utilisateur
+             authentifié (sub du token, ou adresse du client à défaut)
+    """
+    name: str
+    method: str
+    path: str
+    capacity: float
+    refill_per_second: float
+    key: str = "ip"
+
+def parse_rate(rate: str) -> Tuple[float, float]:
+    """
+    Convertit une limite de la forme "10/minute" en capacité et débit de recharge.
+
+    Args:
+        rate: La limite (nombre/second|minute|hour)
+
+    Returns:
+        Tuple[float, float]: La capacité du seau et le nombre de jetons ajoutés par seconde
+
+    Raises:
+        ValueError: Si la limite est mal formée
+    """
+    count, _, period = rate.strip().partition("/")
+    seconds = RATE_PERIODS.get(period.strip().lower().rstrip("s"))
+    if not seconds or float(count) <= 0:
+        raise ValueError(f"Limite de débit invalide: {rate}")
+    return float(count), float(count) / seconds
+
+def default_policies() -> Tuple[RateLimitPolicy, ...]:
+    """
+    Politiques appliquées aux routes les plus coûteuses (bcrypt et recherche ILIKE).
+    Les limites sont configurables par variables d'environnement.
+
+    Returns:
+        Tuple[RateLimitPolicy, ...]: Les politiques par défaut
+    """
+    login_capacity, login_refill = parse_rate(os.getenv("RATE_LIMIT_LOGIN", "10/minute"))
+    search_capacity, search_refill = parse_rate(os.getenv("RATE_LIMIT_PATIENT_SEARCH", "30/minute"))
+    return (
+        RateLimitPolicy("login", "POST", "/api/auth/login", login_capacity, login_refill, key="ip"),
+        RateLimitPolicy("patient_search", "POST", "/api/patients/search", search_capacity, search_refill, key="subject"),
+    )
+
+def create_rate_limit_store() -> RateLimitStoreProtocol:
+    """
+    Crée le store configuré par RATE_LIMIT_STORE ("memory" par défaut, ou "postgres"
+    pour partager les seaux entre plusieurs workers).
+
+    Returns:
+        RateLimitStoreProtocol: Le store de limitation de débit
+    """
+    if os.getenv("RATE_LIMIT_STORE", "memory").lower() == "postgres":
+        from shared.adapters.secondary.postgres_rate_limit_store import PostgresRateLimitStore
+        from shared.infrastructure.database.connection import engine
+        return PostgresRateLimitStore(engine)
+    return InMemoryRateLimitStore()
+
+class RateLimitMiddleware:
+    """
+    Middleware ASGI de limitation de débit par seau à jetons.
+    Seules les routes ayant une politique sont concernées; les autres ne paient qu'une
+    recherche dans un dictionnaire. Répond 429 avec l'en-tête Retry-After en cas de dépassement.
+    """
+
+    def __init__(
+        self,
+        app,
+        store: Optional[RateLimitStoreProtocol] = None,
+        policies: Optional[Iterable[RateLimitPolicy]] = None,
+        trust_forwarded: Optional[bool] = None
+    ):
+        """
+        Initialise le middleware.
+
+        Args:
+            app: L'application ASGI encapsulée
+            store: Le store des seaux (créé selon RATE_LIMIT_STORE si absent)
+            policies: Les politiques par route (default_policies() si absent)
+            trust_forwarded: Utiliser X-Forwarded-For pour identifier le client
+                             (RATE_LIMIT_TRUST_FORWARDED, faux par défaut)
+        """
+        self.app = app
+        self.store = store if store is not None else create_rate_limit_store()
+        self.policies: Dict[Tuple[str, str], RateLimitPolicy] = {
+            (policy.method.upper(), policy.path.rstrip("/")): policy
+            for policy in (default_policies() if policies is None else policies)
+        }
+        if trust_forwarded is None:
+            trust_forwarded = os.getenv("RATE_LIMIT_TRUST_FORWARDED", "false").lower() == "true"
+        self.trust_forwarded = trust_forwarded
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        policy = self.policies.get((scope["method"], scope["path"].rstrip("/")))
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            allowed, retry_after = await self.store.consume(
+                f"{policy.name}:{self._identify(scope, policy)}",
+                policy.capacity,
+                policy.refill_per_second
+            )
+        except Exception as e:
+            # Le limiteur ne doit jamais rendre l'API indisponible: en cas d'erreur du store, on laisse passer
+            logger.warning(f"Limitation de débit indisponible pour {policy.name}: {str(e)}")
+            allowed = True
+
+        if allowed:
+            await self.app(scope, receive, send)
+            return
+
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(_RATE_LIMITED_BODY)).encode("ascii")),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode("ascii")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": _RATE_LIMITED_BODY})
+
+    def _identify(self, scope, policy: RateLimitPolicy) -> str:
+        """Détermine l'identité du client pour une politique (sujet du token ou adresse IP)"""
+        if policy.key == "subject":
+            user = scope.get("state", {}).get("user")
+            if user and user.get("sub"):
+                return f"sub:{user['sub']}"
+
+        if self.trust_forwarded:
+            for name, value in scope["headers"]:
+                if name == b"x-forwarded-for":
+                    return f"ip:{value.decode('latin-1').split(',')[0].strip()}"
+
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
@@ -0,0 +1,45 @@
+# medisecure-backend/api/middlewares/request_id_middleware.py
+
+import re
+import uuid
+
+from shared.infrastructure.logging.request_context import request_id_var
+
+REQUEST_ID_HEADER = b"x-request-id"
+
+# Identifiant fourni par le client accepté tel quel s'il reste raisonnable
+_VALID_REQUEST_ID = re.compile(rb"^[A-Za-z0-9._-]{1,64}$")
+
+class RequestIdMiddleware:
+    """
+    Middleware ASGI qui attribue un identifiant à chaque requête.
+    L'identifiant est repris de l'en-tête X-Request-ID s'il est présent, exposé aux logs
+    via une ContextVar et renvoyé dans l'en-tête X-Request-ID de la réponse.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == REQUEST_ID_HEADER and _VALID_REQUEST_ID.match(value):
+                request_id = value
+                break
+        if request_id is None:
+            request_id = uuid.uuid4().hex.encode("ascii")
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [(REQUEST_ID_HEADER, request_id)]
+            await send(message)
+
+        token = request_id_var.set(request_id.decode("ascii"))
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
@@ -0,0 +1,137 @@
+"""
+Serveur de production: gunicorn gère plusieurs workers uvicorn (boucle uvloop, parseur httptools).
+
+Contrairement au mode développement (uvicorn --reload, un seul processus surveillant les fichiers),
+l'application est servie par WEB_CONCURRENCY workers (par défaut un par cœur), chacun avec sa
+propre boucle d'événements, ses pools de connexions et ses caches.
+
+Usage:
+    python -m api.serve
+"""
+import logging
+import multiprocessing
+import os
+from dataclasses import dataclass
+
+from gunicorn.app.base import BaseApplication
+from uvicorn.workers import UvicornWorker
+
+from shared.infrastructure.logging.logging_config import UVICORN_LOGGERS, configure_logging, restart_logging_after_fork
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class ServerSettings:
+    """
+    Paramètres du serveur de production.
+
+    Attributes:
+        bind: L'adresse d'écoute (HOST:PORT)
+        workers: Le nombre de processus workers
+        preload: Charger l'application une fois avant le fork (démarrage plus rapide, mémoire partagée)
+        graceful_timeout: Le délai laissé à un worker pour terminer ses requêtes à l'arrêt (secondes)
+        timeout: Le délai au-delà duquel un worker bloqué est redémarré (secondes)
+        keepalive: La durée de maintien des connexions HTTP inactives (secondes)
+        max_requests: Le nombre de requêtes après lequel un worker est remplacé (0: jamais)
+        max_requests_jitter: L'écart aléatoire ajouté à max_requests (les workers ne sont pas recyclés ensemble)
+    """
+    bind: str
+    workers: int
+    preload: bool
+    graceful_timeout: int
+    timeout: int
+    keepalive: int
+    max_requests: int
+    max_requests_jitter: int
+
+    @classmethod
+    def from_env(cls) -> "ServerSettings":
+        """
+        Lit les paramètres depuis l'environnement.
+
+        Returns:
+            ServerSettings: Les paramètres du serveur
+        """
+        return cls(
+            bind=f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8000')}",
+            workers=int(os.getenv("WEB_CONCURRENCY") or multiprocessing.cpu_count()),
+            preload=os.getenv("SERVER_PRELOAD", "true").lower() == "true",
+            graceful_timeout=int(os.getenv("SERVER_GRACEFUL_TIMEOUT", "30")),
+            timeout=int(os.getenv("SERVER_TIMEOUT", "60")),
+            keepalive=int(os.getenv("SERVER_KEEPALIVE", "5")),
+            max_requests=int(os.getenv("SERVER_MAX_REQUESTS", "10000")),
+            max_requests_jitter=int(os.getenv("SERVER_MAX_REQUESTS_JITTER", "1000"))
+        )
+
+class MediSecureUvicornWorker(UvicornWorker):
+    """
+    Worker uvicorn de gunicorn avec uvloop et httptools, dont les logs passent par le
+    pipeline commun de l'application (UvicornWorker les redirige vers les handlers de gunicorn).
+    """
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "lifespan": "on"}
+
+    def init_process(self) -> None:
+        for name in UVICORN_LOGGERS:
+            uvicorn_logger = logging.getLogger(name)
+            uvicorn_logger.handlers = []
+            uvicorn_logger.propagate = True
+        super().init_process()
+
+def post_fork(server, worker) -> None:
+    """Hook gunicorn exécuté dans chaque worker: relance l'écriture des logs héritée du parent"""
+    restart_logging_after_fork()
+
+class MediSecureServer(BaseApplication):
+    """
+    Application gunicorn configurée par ServerSettings plutôt que par la ligne de commande.
+
+    Avec le préchargement, l'application (container, caches du processus) est importée dans le
+    processus maître: aucune connexion ni tâche asyncio n'y est ouverte à l'import, elles le sont
+    par l'événement de démarrage de chaque worker.
+    """
+
+    def __init__(self, settings: ServerSettings, app_uri: str = "api.main:app"):
+        """
+        Initialise le serveur.
+
+        Args:
+            settings: Les paramètres du serveur
+            app_uri: L'application ASGI à servir (module:attribut)
+        """
+        self.settings = settings
+        self.app_uri = app_uri
+        super().__init__()
+
+    def load_config(self) -> None:
+        self.cfg.set("bind", [self.settings.bind])
+        self.cfg.set("workers", self.settings.workers)
+        # Chemin d'import (gunicorn 20 n'accepte pas une classe); pas __name__, qui vaut __main__ avec -m
+        self.cfg.set("worker_class", "api.serve.MediSecureUvicornWorker")
+        self.cfg.set("preload_app", self.settings.preload)
+        self.cfg.set("graceful_timeout", self.settings.graceful_timeout)
+        self.cfg.set("timeout", self.settings.timeout)
+        self.cfg.set("keepalive", self.settings.keepalive)
+        self.cfg.set("max_requests", self.settings.max_requests)
+        self.cfg.set("max_requests_jitter", self.settings.max_requests_jitter)
+        self.cfg.set("post_fork", post_fork)
+        # Les accès sont journalisés par l'application (identifiant de requête, masquage)
+        self.cfg.set("accesslog", None)
+
+    def load(self):
+        module_name, _, attribute = self.app_uri.partition(":")
+        module = __import__(module_name, fromlist=[attribute])
+        return getattr(module, attribute)
+
+def serve() -> None:
+    """Démarre le serveur de production"""
+    configure_logging()
+    settings = ServerSettings.from_env()
+    logger.info(
+        f"Démarrage du serveur de production sur {settings.bind}: {settings.workers} workers, "
+        f"préchargement: {settings.preload}, recyclage après {settings.max_requests} requêtes"
+    )
+    MediSecureServer(settings).run()
+
+if __name__ == "__main__":
+    serve()
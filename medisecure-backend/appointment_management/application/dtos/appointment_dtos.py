@@ -1,9 +1,13 @@
 # medisecure-backend/appointment_management/application/dtos/appointment_dtos.py
-from typing import Optional, List
+from typing import Optional, List, Iterable
 from pydantic import BaseModel, Field, validator
-from datetime import datetime
+from datetime import date, datetime
 from uuid import UUID
 
+from appointment_management.domain.entities.appointment import Appointment
+from patient_management.domain.entities.patient_summary import PatientSummary
+from shared.domain.entities.user import User
+
 # DTOs pour la création et la mise à jour de rendez-vous
 class AppointmentCreateDTO(BaseModel):
     """DTO pour la création d'un rendez-vous"""
@@ -140,6 +144,78 @@ class AppointmentResponseDTO(BaseModel):
         }
         # Permettre les conversions arbitraires de types
         arbitrary_types_allowed = True
+    
+    @classmethod
+    def from_entity(cls, appointment: Appointment) -> "AppointmentResponseDTO":
+        """
+        Construit le DTO sans validation à partir d'une entité issue de nos repositories.
+        
+        Args:
+            appointment: L'entité rendez-vous (déjà validée par le domaine et la base)
+            
+        Returns:
+            AppointmentResponseDTO: Le DTO de réponse
+        """
+        return cls.construct(
+            id=appointment.id,
+            patient_id=appointment.patient_id,
+            doctor_id=appointment.doctor_id,
+            start_time=appointment.start_time,
+            end_time=appointment.end_time,
+            status=appointment.status.value,
+            reason=appointment.reason,
+            notes=appointment.notes,
+            created_at=appointment.created_at,
+            updated_at=appointment.updated_at,
+            is_active=appointment.is_active
+        )
+
+# Champs sélectionnables par le paramètre fields= (colonnes de même nom dans la table appointments)
+APPOINTMENT_RESPONSE_FIELDS = tuple(AppointmentResponseDTO.__fields__)
+
+class AppointmentPatientDTO(BaseModel):
+    """DTO compact du patient intégré à un rendez-vous (include=patient)"""
+    id: UUID
+    first_name: str
+    last_name: str
+    date_of_birth: date
+    phone_number: Optional[str] = None
+    email: Optional[str] = None
+    
+    @classmethod
+    def from_summary(cls, summary: PatientSummary) -> "AppointmentPatientDTO":
+        """Construit le DTO sans validation à partir d'un résumé issu de nos repositories"""
+        return cls.construct(
+            id=summary.id,
+            first_name=summary.first_name,
+            last_name=summary.last_name,
+            date_of_birth=summary.date_of_birth,
+            phone_number=summary.phone_number,
+            email=summary.email
+        )
+
+class AppointmentDoctorDTO(BaseModel):
+    """DTO compact du médecin intégré à un rendez-vous (include=doctor)"""
+    id: UUID
+    first_name: str
+    last_name: str
+    email: str
+    
+    @classmethod
+    def from_user(cls, user: User) -> "AppointmentDoctorDTO":
+        """Construit le DTO sans validation à partir d'un utilisateur issu de nos repositories"""
+        return cls.construct(
+            id=user.id,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            email=user.email
+        )
+
+# Relations intégrables par le paramètre include= (clé de la relation -> champ de l'identifiant)
+APPOINTMENT_INCLUDES = {
+    "patient": "patient_id",
+    "doctor": "doctor_id",
+}
 
 class AppointmentListResponseDTO(BaseModel):
     """DTO pour la réponse avec une liste de rendez-vous"""
@@ -150,4 +226,25 @@ class AppointmentListResponseDTO(BaseModel):
     
     class Config:
         # Permettre les conversions arbitraires de types
-        arbitrary_types_allowed = True
\ No newline at end of file
+        arbitrary_types_allowed = True
+    
+    @classmethod
+    def from_entities(cls, appointments: Iterable[Appointment], total: int, skip: int, limit: int) -> "AppointmentListResponseDTO":
+        """
+        Construit la page de réponse sans validation à partir d'entités issues de nos repositories.
+        
+        Args:
+            appointments: Les entités rendez-vous de la page
+            total: Le nombre total de rendez-vous
+            skip: Le nombre de rendez-vous ignorés
+            limit: Le nombre maximum de rendez-vous retournés
+            
+        Returns:
+            AppointmentListResponseDTO: Le DTO de réponse
+        """
+        return cls.construct(
+            appointments=[AppointmentResponseDTO.from_entity(appointment) for appointment in appointments],
+            total=total,
+            skip=skip,
+            limit=limit
+        )
\ No newline at end of file
@@ -1,8 +1,8 @@
 from uuid import UUID
-from typing import List
+from typing import List, Dict, Any, Sequence
 
 from appointment_management.domain.ports.secondary.appointment_repository_protocol import AppointmentRepositoryProtocol
-from appointment_management.application.dtos.appointment_dtos import AppointmentResponseDTO, AppointmentListResponseDTO
+from appointment_management.application.dtos.appointment_dtos import AppointmentListResponseDTO
 from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
 from patient_management.domain.exceptions.patient_exceptions import PatientNotFoundException
 
@@ -41,40 +41,41 @@ class GetPatientAppointmentsUseCase:
         Raises:
             PatientNotFoundException: Si le patient n'est pas trouvé
         """
-        # Vérifier si le patient existe
-        patient = await self.patient_repository.get_by_id(patient_id)
-        if not patient:
+        # Vérifier si le patient existe (seul l'identifiant est lu)
+        if not await self.patient_repository.get_projected_by_id(patient_id, ("id",)):
             raise PatientNotFoundException(patient_id)
         
-        # Récupérer les rendez-vous du patient
-        appointments = await self.appointment_repository.get_by_patient(patient_id, skip, limit)
+        # Récupérer la page de rendez-vous du patient et leur nombre total (une seule requête)
+        page = await self.appointment_repository.get_by_patient(patient_id, skip, limit)
         
-        # Compter le nombre total de rendez-vous (approximatif sans pagination)
-        total = len(appointments)
+        # Convertir les entités en DTOs de réponse (données de confiance: pas de revalidation)
+        return AppointmentListResponseDTO.from_entities(page.items, page.total, skip, limit)
+    
+    async def execute_projected(
+        self,
+        patient_id: UUID,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100
+    ) -> Dict[str, Any]:
+        """
+        Exécute le cas d'utilisation en ne lisant que les champs demandés.
+        
+        Args:
+            patient_id: L'ID du patient
+            fields: Les champs à retourner pour chaque rendez-vous
+            skip: Le nombre de rendez-vous à sauter
+            limit: Le nombre maximum de rendez-vous à retourner
+            
+        Returns:
+            Dict[str, Any]: La page de rendez-vous (mêmes clés que AppointmentListResponseDTO)
+            
+        Raises:
+            PatientNotFoundException: Si le patient n'est pas trouvé
+        """
+        if not await self.patient_repository.get_projected_by_id(patient_id, ("id",)):
+            raise PatientNotFoundException(patient_id)
         
-        # Convertir les entités en DTOs de réponse
-        appointment_dtos = []
-        for appointment in appointments:
-            appointment_dtos.append(
-                AppointmentResponseDTO(
-                    id=appointment.id,
-                    patient_id=appointment.patient_id,
-                    doctor_id=appointment.doctor_id,
-                    start_time=appointment.start_time,
-                    end_time=appointment.end_time,
-                    status=appointment.status.value,
-                    reason=appointment.reason,
-                    notes=appointment.notes,
-                    created_at=appointment.created_at,
-                    updated_at=appointment.updated_at,
-                    is_active=appointment.is_active
-                )
-            )
+        page = await self.appointment_repository.get_projected_by_patient(patient_id, fields, skip, limit)
         
-        # Construire la réponse
-        return AppointmentListResponseDTO(
-            appointments=appointment_dtos,
-            total=total,
-            skip=skip,
-            limit=limit
-        )
\ No newline at end of file
+        return {"appointments": page.items, "total": page.total, "skip": skip, "limit": limit}
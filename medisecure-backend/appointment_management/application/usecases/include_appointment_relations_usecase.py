@@ -0,0 +1,85 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from appointment_management.application.dtos.appointment_dtos import (
+    AppointmentDoctorDTO,
+    AppointmentPatientDTO,
+    APPOINTMENT_INCLUDES,
+    APPOINTMENT_RESPONSE_FIELDS
+)
+from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
+from shared.ports.secondary.user_repository_protocol import UserRepositoryProtocol
+
+class IncludeAppointmentRelationsUseCase:
+    """
+    Cas d'utilisation pour intégrer le patient et/ou le médecin aux rendez-vous lus (include=).
+    Chaque relation est résolue par une seule requête pour toute la page (id = ANY(:ids)),
+    quel que soit le nombre de rendez-vous: le client n'a plus à charger chaque patient.
+    """
+
+    def __init__(
+        self,
+        patient_repository: PatientRepositoryProtocol,
+        user_repository: UserRepositoryProtocol
+    ):
+        """
+        Initialise le cas d'utilisation avec les dépendances nécessaires.
+
+        Args:
+            patient_repository: Le repository des patients
+            user_repository: Le repository des utilisateurs (médecins)
+        """
+        self.patient_repository = patient_repository
+        self.user_repository = user_repository
+
+    @staticmethod
+    def required_fields(fields: Optional[Sequence[str]], include: Sequence[str]) -> Tuple[str, ...]:
+        """
+        Retourne les champs à lire pour les rendez-vous: les champs demandés (tous si absent),
+        complétés des identifiants nécessaires à la résolution des relations.
+
+        Args:
+            fields: Les champs demandés par fields=, ou None pour tous
+            include: Les relations à intégrer
+
+        Returns:
+            Tuple[str, ...]: Les champs à lire, dans l'ordre de la réponse complète
+        """
+        if fields is None:
+            return APPOINTMENT_RESPONSE_FIELDS
+        requested = set(fields).union(APPOINTMENT_INCLUDES[name] for name in include)
+        return tuple(name for name in APPOINTMENT_RESPONSE_FIELDS if name in requested)
+
+    async def execute(self, appointments: List[Dict[str, Any]], include: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Exécute le cas d'utilisation.
+
+        Args:
+            appointments: Les rendez-vous lus (champs de AppointmentResponseDTO, avec les identifiants
+                          des relations demandées)
+            include: Les relations à intégrer ("patient", "doctor")
+
+        Returns:
+            List[Dict[str, Any]]: Les mêmes rendez-vous, complétés des relations demandées
+                                  (None si la ressource liée n'existe plus)
+        """
+        if not appointments:
+            return appointments
+
+        # Les requêtes partagent la session de la requête HTTP: elles sont exécutées l'une après l'autre
+        if "patient" in include:
+            summaries = await self.patient_repository.get_summaries_by_ids(
+                [appointment["patient_id"] for appointment in appointments]
+            )
+            patients = {summary.id: AppointmentPatientDTO.from_summary(summary) for summary in summaries}
+            for appointment in appointments:
+                appointment["patient"] = patients.get(appointment["patient_id"])
+
+        if "doctor" in include:
+            users = await self.user_repository.list_by_ids(
+                [appointment["doctor_id"] for appointment in appointments]
+            )
+            doctors = {user.id: AppointmentDoctorDTO.from_user(user) for user in users}
+            for appointment in appointments:
+                appointment["doctor"] = doctors.get(appointment["doctor_id"])
+
+        return appointments
@@ -56,10 +56,6 @@ class ScheduleAppointmentUseCase:
             ValueError: Si les heures de début et de fin sont invalides
         """
         try:
-            # Ajouter des logs pour les données reçues
-            logger.info(f"Données de rendez-vous reçues: patient_id={data.patient_id}, doctor_id={data.doctor_id}")
-            logger.info(f"Dates: start_time={data.start_time}, end_time={data.end_time}")
-            
             # Validation des données
             if not data.patient_id:
                 raise ValueError("ID du patient requis")
@@ -75,18 +71,15 @@ class ScheduleAppointmentUseCase:
             doctor_id = data.doctor_id if isinstance(data.doctor_id, UUID) else UUID(str(data.doctor_id))
             
             # Valider les heures de début et de fin
-            logger.debug("Validation des heures de rendez-vous")
             self.appointment_service.validate_appointment_times(data.start_time, data.end_time)
             
             # Vérifier si le patient existe
-            logger.debug(f"Vérification de l'existence du patient {patient_id}")
             patient = await self.patient_repository.get_by_id(patient_id)
             if not patient:
                 logger.error(f"Patient avec ID {patient_id} non trouvé")
                 raise PatientNotFoundException(patient_id)
           
             # Vérifier si le créneau est disponible (aucun chevauchement)
-            logger.debug(f"Vérification de la disponibilité du créneau pour le médecin {doctor_id}")
             existing_appointments = await self.appointment_repository.get_by_doctor(
                 doctor_id, 
                 skip=0, 
@@ -102,11 +95,9 @@ class ScheduleAppointmentUseCase:
                 raise ValueError("Ce créneau horaire est déjà occupé par un autre rendez-vous")
             
             # Générer un ID pour le rendez-vous
-            logger.debug("Génération de l'ID du rendez-vous")
             appointment_id = self.id_generator.generate_id()
             
             # Créer l'entité Appointment
-            logger.debug(f"Création de l'entité Appointment avec ID {appointment_id}")
             appointment = Appointment(
                 id=appointment_id,
                 patient_id=patient_id,
@@ -119,10 +110,8 @@ class ScheduleAppointmentUseCase:
             )
             
             # Sauvegarder le rendez-vous
-            logger.info(f"Sauvegarde du rendez-vous {appointment_id}")
             try:
                 created_appointment = await self.appointment_repository.create(appointment)
-                logger.info(f"Rendez-vous {appointment_id} créé avec succès")
             except Exception as e:
                 logger.error(f"Erreur lors de la sauvegarde du rendez-vous: {str(e)}")
                 if "violates foreign key constraint" in str(e).lower():
@@ -130,20 +119,7 @@ class ScheduleAppointmentUseCase:
                 raise
             
             # Convertir l'entité en DTO de réponse
-            logger.debug(f"Conversion du rendez-vous {appointment_id} en DTO de réponse")
-            response = AppointmentResponseDTO(
-                id=created_appointment.id,
-                patient_id=created_appointment.patient_id,
-                doctor_id=created_appointment.doctor_id,
-                start_time=created_appointment.start_time,
-                end_time=created_appointment.end_time,
-                status=created_appointment.status.value,
-                reason=created_appointment.reason,
-                notes=created_appointment.notes,
-                created_at=created_appointment.created_at,
-                updated_at=created_appointment.updated_at,
-                is_active=created_appointment.is_active
-            )
+            response = AppointmentResponseDTO.from_entity(created_appointment)
             
             logger.info(f"Rendez-vous {response.id} créé avec succès")
             return response
@@ -122,16 +122,4 @@ class UpdateAppointmentUseCase:
         updated_appointment = await self.appointment_repository.update(appointment)
         
         # Convertir l'entité en DTO de réponse
-        return AppointmentResponseDTO(
-            id=updated_appointment.id,
-            patient_id=updated_appointment.patient_id,
-            doctor_id=updated_appointment.doctor_id,
-            start_time=updated_appointment.start_time,
-            end_time=updated_appointment.end_time,
-            status=updated_appointment.status.value,
-            reason=updated_appointment.reason,
-            notes=updated_appointment.notes,
-            created_at=updated_appointment.created_at,
-            updated_at=updated_appointment.updated_at,
-            is_active=updated_appointment.is_active
-        )
\ No newline at end of file
+        return AppointmentResponseDTO.from_entity(updated_appointment)
\ No newline at end of file
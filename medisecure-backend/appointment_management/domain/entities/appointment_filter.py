@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional
+from uuid import UUID
+
+from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus
+
+@dataclass(frozen=True)
+class AppointmentFilter:
+    """
+    Critères de recherche des rendez-vous, combinés par ET (un critère absent ne filtre pas).
+    Les adaptateurs de persistance traduisent le filtre dans leur langage de requête;
+    matches() en donne la sémantique de référence.
+    """
+    patient_id: Optional[UUID] = None
+    doctor_id: Optional[UUID] = None
+    status: Optional[AppointmentStatus] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+
+    @property
+    def start_datetime(self) -> Optional[datetime]:
+        """Début de la période filtrée (début de la journée de start_date)"""
+        return datetime.combine(self.start_date, datetime.min.time()) if self.start_date else None
+
+    @property
+    def end_datetime(self) -> Optional[datetime]:
+        """Fin de la période filtrée (fin de la journée de end_date)"""
+        return datetime.combine(self.end_date, datetime.max.time()) if self.end_date else None
+
+    def matches(self, appointment: Appointment) -> bool:
+        """
+        Vérifie si un rendez-vous satisfait le filtre.
+        Un rendez-vous appartient à la période s'il la chevauche, même partiellement.
+
+        Args:
+            appointment: Le rendez-vous à vérifier
+
+        Returns:
+            bool: True si le rendez-vous satisfait tous les critères
+        """
+        if self.patient_id is not None and appointment.patient_id != self.patient_id:
+            return False
+        if self.doctor_id is not None and appointment.doctor_id != self.doctor_id:
+            return False
+        if self.status is not None and appointment.status != self.status:
+            return False
+        if self.start_date is not None and appointment.end_time < self.start_datetime:
+            return False
+        if self.end_date is not None and appointment.start_time > self.end_datetime:
+            return False
+        return True
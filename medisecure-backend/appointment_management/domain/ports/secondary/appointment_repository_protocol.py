@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Sequence, AsyncIterator
 from uuid import UUID
 from datetime import datetime, date
 
 from appointment_management.domain.entities.appointment import Appointment
+from appointment_management.domain.entities.appointment_filter import AppointmentFilter
+from shared.domain.entities.paged_result import PagedResult
 
 class AppointmentRepositoryProtocol(ABC):
     """
@@ -78,9 +80,9 @@ class AppointmentRepositoryProtocol(ABC):
         pass
     
     @abstractmethod
-    async def get_by_patient(self, patient_id: UUID, skip: int = 0, limit: int = 100) -> List[Appointment]:
+    async def get_by_patient(self, patient_id: UUID, skip: int = 0, limit: int = 100) -> PagedResult[Appointment]:
         """
-        Récupère les rendez-vous d'un patient.
+        Récupère une page des rendez-vous d'un patient, avec le nombre total de ses rendez-vous.
         
         Args:
             patient_id: L'ID du patient
@@ -88,7 +90,7 @@ class AppointmentRepositoryProtocol(ABC):
             limit: Le nombre maximum de rendez-vous à retourner
             
         Returns:
-            List[Appointment]: La liste des rendez-vous du patient
+            PagedResult[Appointment]: Les rendez-vous de la page, et le total
         """
         pass
     
@@ -124,11 +126,146 @@ class AppointmentRepositoryProtocol(ABC):
         pass
     
     @abstractmethod
-    async def count(self) -> int:
+    async def find(
+        self,
+        appointment_filter: AppointmentFilter,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Appointment]:
         """
-        Compte le nombre total de rendez-vous.
+        Recherche les rendez-vous satisfaisant un filtre, du plus récent au plus ancien.
         
+        Args:
+            appointment_filter: Les critères de recherche
+            skip: Le nombre de rendez-vous à sauter
+            limit: Le nombre maximum de rendez-vous à retourner
+            
+        Returns:
+            List[Appointment]: Les rendez-vous correspondant au filtre
+        """
+        pass
+    
+    @abstractmethod
+    async def find_projected(
+        self,
+        appointment_filter: AppointmentFilter,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Recherche les rendez-vous satisfaisant un filtre en ne récupérant que certains champs.
+        
+        Args:
+            appointment_filter: Les critères de recherche
+            fields: Les champs de l'entité Appointment à récupérer
+            skip: Le nombre de rendez-vous à sauter
+            limit: Le nombre maximum de rendez-vous à retourner
+            
+        Returns:
+            List[Dict[str, Any]]: Les champs demandés de chaque rendez-vous (statut en valeur)
+        """
+        pass
+    
+    @abstractmethod
+    async def count(self, appointment_filter: Optional[AppointmentFilter] = None) -> int:
+        """
+        Compte le nombre de rendez-vous, éventuellement restreint à un filtre.
+        
+        Args:
+            appointment_filter: Les critères de recherche (tous les rendez-vous si absent)
+            
+        Returns:
+            int: Le nombre de rendez-vous
+        """
+        pass
+    
+    @abstractmethod
+    async def get_projected_by_id(self, appointment_id: UUID, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        """
+        Récupère uniquement certains champs d'un rendez-vous (projection de colonnes).
+        
+        Args:
+            appointment_id: L'ID du rendez-vous à récupérer
+            fields: Les champs de l'entité Appointment à récupérer
+            
         Returns:
-            int: Le nombre total de rendez-vous
+            Optional[Dict[str, Any]]: Les champs demandés (statut en valeur), ou None si non trouvé
+        """
+        pass
+    
+    @abstractmethod
+    async def list_projected(self, fields: Sequence[str], skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
         """
-        pass
\ No newline at end of file
+        Liste les rendez-vous avec pagination en ne récupérant que certains champs.
+        
+        Args:
+            fields: Les champs de l'entité Appointment à récupérer
+            skip: Le nombre de rendez-vous à sauter
+            limit: Le nombre maximum de rendez-vous à retourner
+            
+        Returns:
+            List[Dict[str, Any]]: Les champs demandés de chaque rendez-vous
+        """
+        pass
+    
+    @abstractmethod
+    async def get_projected_by_patient(
+        self,
+        patient_id: UUID,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100
+    ) -> PagedResult[Dict[str, Any]]:
+        """
+        Récupère une page des rendez-vous d'un patient en ne récupérant que certains champs,
+        avec le nombre total de ses rendez-vous.
+        
+        Args:
+            patient_id: L'ID du patient
+            fields: Les champs de l'entité Appointment à récupérer
+            skip: Le nombre de rendez-vous à sauter
+            limit: Le nombre maximum de rendez-vous à retourner
+            
+        Returns:
+            PagedResult[Dict[str, Any]]: Les champs demandés de chaque rendez-vous de la page, et le total
+        """
+        pass
+    
+    @abstractmethod
+    async def get_projected_by_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Récupère les rendez-vous dans une plage de dates en ne récupérant que certains champs.
+        
+        Args:
+            start_date: La date de début
+            end_date: La date de fin
+            fields: Les champs de l'entité Appointment à récupérer
+            skip: Le nombre de rendez-vous à sauter
+            limit: Le nombre maximum de rendez-vous à retourner
+            
+        Returns:
+            List[Dict[str, Any]]: Les champs demandés de chaque rendez-vous dans la plage de dates
+        """
+        pass
+    
+    @abstractmethod
+    def stream_projected(self, fields: Sequence[str], batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Parcourt les rendez-vous en flux pour un export, sans charger la table en mémoire.
+        
+        Args:
+            fields: Les champs de l'entité Appointment à récupérer
+            batch_size: Le nombre de lignes lues à chaque aller-retour avec la base
+            
+        Yields:
+            Dict[str, Any]: Les champs demandés de chaque rendez-vous
+        """
+        pass
@@ -1,23 +1,38 @@
 # medisecure-backend/appointment_management/infrastructure/adapters/primary/controllers/appointment_controller.py
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
 from datetime import date, timedelta, datetime
 import logging
 
 from shared.services.authenticator.extract_token import extract_token_payload
-from shared.container.container import Container
+from shared.container.container import Container, close_session
+from shared.ports.secondary.collection_version_store_protocol import (
+    APPOINTMENTS_COLLECTION,
+    PATIENTS_COLLECTION,
+    USERS_COLLECTION
+)
+from shared.infrastructure.http.etags import ConditionalGet
+from shared.infrastructure.http.responses import CacheableJSONResponse, TrustedJSONResponse
+from shared.infrastructure.http.sparse_fields import include_relations, sparse_fields
+from shared.infrastructure.http.streaming import export_response
+from shared.infrastructure.database.replica_routing import primary_reads
 from appointment_management.application.dtos.appointment_dtos import (
     AppointmentCreateDTO,
     AppointmentUpdateDTO,
     AppointmentResponseDTO,
-    AppointmentListResponseDTO
+    AppointmentListResponseDTO,
+    APPOINTMENT_INCLUDES,
+    APPOINTMENT_RESPONSE_FIELDS
 )
 from appointment_management.application.usecases.schedule_appointment_usecase import ScheduleAppointmentUseCase
 from appointment_management.application.usecases.update_appointment_usecase import UpdateAppointmentUseCase
 from appointment_management.application.usecases.get_patient_appointments_usecase import GetPatientAppointmentsUseCase
+from appointment_management.application.usecases.include_appointment_relations_usecase import IncludeAppointmentRelationsUseCase
 from appointment_management.domain.entities.appointment import AppointmentStatus
-from patient_management.domain.exceptions.patient_exceptions import PatientNotFoundException
+from appointment_management.domain.entities.appointment_filter import AppointmentFilter
+from appointment_management.infrastructure.cache.calendar_cache import CachedCalendar, month_bucket
+from patient_management.domain.exceptions.patient_exceptions import MissingPatientConsentException, PatientNotFoundException
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
@@ -45,11 +60,136 @@ def check_role_permission(role: str, allowed_roles: list) -> bool:
     
     return role_lower in allowed_roles_lower
 
-def get_container():
+async def get_container() -> AsyncIterator[Container]:
+    """
+    Fournit le container d'injection de dépendances de la requête.
+    Sa session est fermée après la réponse: la connexion est rendue au pool.
+    """
+    container = Container()
+    try:
+        yield container
+    finally:
+        await close_session(container)
+
+# Dépendances des paramètres fields= et include= des routes de lecture
+appointment_fields = sparse_fields(APPOINTMENT_RESPONSE_FIELDS)
+appointment_includes = include_relations(APPOINTMENT_INCLUDES)
+
+def include_relations_use_case(container: Container) -> IncludeAppointmentRelationsUseCase:
     """
-    Fournit le container d'injection de dépendances.
+    Crée le cas d'utilisation d'intégration des relations (include=) d'une route de lecture.
     """
-    return Container()
+    return IncludeAppointmentRelationsUseCase(
+        patient_repository=container.patient_repository(),
+        user_repository=container.user_repository()
+    )
+
+# Rôles autorisés à lire les données des patients (mêmes rôles que les routes des patients)
+PATIENT_DATA_ROLES = ["admin", "doctor", "nurse", "receptionist"]
+
+def check_include_permission(token_payload: Dict[str, Any], include: Tuple[str, ...]) -> None:
+    """
+    Vérifie que l'utilisateur peut intégrer le patient (include=patient) à la réponse:
+    les coordonnées du patient sont réservées au personnel, comme sur les routes des patients.
+    
+    Raises:
+        HTTPException: 403 si le rôle de l'utilisateur n'y est pas autorisé
+    """
+    if "patient" in include and not check_role_permission(token_payload.get("role", ""), PATIENT_DATA_ROLES):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to include patient data"
+        )
+
+async def check_patient_consent(container: Container, token_payload: Dict[str, Any], patient_id: UUID) -> None:
+    """
+    Applique au patient intégré (include=patient) la règle de consentement de GET /patients/{id}.
+    Seul le consentement est lu; un patient inexistant n'est pas intégré.
+    
+    Raises:
+        MissingPatientConsentException: Si le patient n'a pas donné son consentement
+    """
+    consent = await container.patient_repository().get_projected_by_id(patient_id, ("has_consent",))
+    if consent is not None:
+        container.patient_service().check_consent_permission(
+            patient_id, consent["has_consent"], UUID(token_payload.get("sub"))
+        )
+
+# Collections dont dépendent les relations intégrées (include=), pour les ETags
+APPOINTMENT_INCLUDE_COLLECTIONS = {"patient": PATIENTS_COLLECTION, "doctor": USERS_COLLECTION}
+
+def appointment_collections(include: Tuple[str, ...], *collections: str) -> Tuple[str, ...]:
+    """
+    Retourne les collections dont dépend une liste de rendez-vous: les rendez-vous, les collections
+    données et celles des relations intégrées.
+    """
+    return (APPOINTMENTS_COLLECTION, *collections, *(APPOINTMENT_INCLUDE_COLLECTIONS[name] for name in include))
+
+async def appointment_etag(
+    container: Container,
+    conditional: ConditionalGet,
+    appointment_id: UUID,
+    include: Tuple[str, ...]
+) -> Optional[str]:
+    """
+    Calcule l'ETag d'un rendez-vous: sa date de modification, et les versions des collections
+    des relations intégrées. Ne lit que les dates du rendez-vous.
+    
+    Returns:
+        Optional[str]: L'ETag, ou None si le rendez-vous n'existe pas
+    """
+    dates = await container.appointment_repository().get_projected_by_id(appointment_id, ("created_at", "updated_at"))
+    if dates is None:
+        return None
+    last_modified = dates["updated_at"] or dates["created_at"]
+    if not include:
+        return conditional.etag(last_modified)
+    collections = [APPOINTMENT_INCLUDE_COLLECTIONS[name] for name in include]
+    versions = await container.collection_version_store().get_versions(collections)
+    return conditional.etag(last_modified, *(f"{name}:{versions[name]}" for name in collections))
+
+def appointment_filter_params(
+    patient_id: Optional[UUID] = Query(None, alias="patientId", description="Only appointments of this patient"),
+    doctor_id: Optional[UUID] = Query(None, alias="doctorId", description="Only appointments with this doctor"),
+    appointment_status: Optional[str] = Query(None, alias="status", description="Only appointments with this status"),
+    day: Optional[date] = Query(None, alias="date", description="Only appointments on this day"),
+    start_date: Optional[date] = Query(None, alias="startDate", description="Only appointments ending on or after this day"),
+    end_date: Optional[date] = Query(None, alias="endDate", description="Only appointments starting on or before this day")
+) -> AppointmentFilter:
+    """
+    Dépendance lisant les filtres de la liste des rendez-vous (noms envoyés par le frontend).
+    Un filtre invalide donne une erreur 400 avant l'exécution de la route.
+    """
+    if appointment_status is not None:
+        try:
+            appointment_status = AppointmentStatus(appointment_status)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid status. Valid values: {', '.join(s.value for s in AppointmentStatus)}"
+            )
+    
+    if day is not None:
+        if start_date is not None or end_date is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="date cannot be combined with startDate or endDate"
+            )
+        start_date = end_date = day
+    
+    if start_date is not None and end_date is not None and start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="startDate must be before endDate"
+        )
+    
+    return AppointmentFilter(
+        patient_id=patient_id,
+        doctor_id=doctor_id,
+        status=appointment_status,
+        start_date=start_date,
+        end_date=end_date
+    )
 
 @router.post("/", response_model=AppointmentResponseDTO, status_code=status.HTTP_201_CREATED)
 async def create_appointment(
@@ -61,9 +201,6 @@ async def create_appointment(
     Crée un nouveau rendez-vous.
     """
     try:
-        # Journaliser les données reçues
-        logger.info(f"Données reçues pour la création d'un rendez-vous: {data}")
-        
         # Vérifier si l'utilisateur a le droit de créer un rendez-vous
         user_role = token_payload.get("role", "")
         allowed_roles = ["admin", "doctor", "nurse", "receptionist"]
@@ -89,8 +226,6 @@ async def create_appointment(
                 data.start_time = datetime.fromisoformat(data.start_time.replace('Z', '+00:00'))
             if isinstance(data.end_time, str):
                 data.end_time = datetime.fromisoformat(data.end_time.replace('Z', '+00:00'))
-                
-            logger.info(f"Dates après conversion: start_time={data.start_time}, end_time={data.end_time}")
         except ValueError as e:
             logger.error(f"Erreur lors de la conversion des dates: {str(e)}")
             raise HTTPException(
@@ -100,10 +235,8 @@ async def create_appointment(
         
         # Exécuter le cas d'utilisation
         try:
-            logger.info("Tentative d'exécution du cas d'utilisation ScheduleAppointmentUseCase")
             result = await use_case.execute(data)
-            logger.info(f"Rendez-vous créé avec succès: {result.id}")
-            return result
+            return TrustedJSONResponse(result, status_code=status.HTTP_201_CREATED)
         except Exception as e:
             logger.exception(f"Erreur pendant l'exécution du cas d'utilisation: {str(e)}")
             raise
@@ -130,21 +263,75 @@ async def create_appointment(
         )
 
 # Ajout des autres routes nécessaires
+# Route déclarée avant /{appointment_id} pour ne pas être interprétée comme un identifiant
+@router.get("/export")
+async def export_appointments(
+    format: str = Query("ndjson", regex="^(ndjson|csv)$", description="Export format: ndjson or csv"),
+    fields: Optional[Tuple[str, ...]] = Depends(appointment_fields),
+    token_payload: Dict[str, Any] = Depends(extract_token_payload),
+    container: Container = Depends(get_container)
+):
+    """
+    Exporte tous les rendez-vous en flux (NDJSON ou CSV), sans pagination.
+    Les lignes sont lues par un curseur côté serveur au rythme de l'envoi au client:
+    la mémoire utilisée est constante quelle que soit la taille de la table.
+    
+    Args:
+        format: Le format de l'export (ndjson ou csv)
+        fields: Les champs à exporter (tous si absent)
+        token_payload: Les informations du token JWT
+        container: Le container d'injection de dépendances
+        
+    Returns:
+        StreamingResponse: L'export en flux
+        
+    Raises:
+        HTTPException: Si l'utilisateur n'est pas administrateur
+    """
+    if token_payload.get("role", "").lower() != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only administrators can export appointments"
+        )
+    
+    columns = fields or APPOINTMENT_RESPONSE_FIELDS
+    rows = container.appointment_repository().stream_projected(columns)
+    logger.info(f"Export des rendez-vous au format {format}")
+    return export_response(rows, columns, format, "appointments")
+
 @router.get("/{appointment_id}", response_model=AppointmentResponseDTO)
 async def get_appointment(
     appointment_id: UUID = Path(..., description="The ID of the appointment to get"),
+    fields: Optional[Tuple[str, ...]] = Depends(appointment_fields),
+    include: Tuple[str, ...] = Depends(appointment_includes),
+    conditional: ConditionalGet = Depends(),
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
     container: Container = Depends(get_container)
 ):
     """
     Récupère un rendez-vous par son ID.
+    Avec include=patient,doctor, le patient et le médecin sont intégrés à la réponse.
+    Le rendez-vous porte un ETag: 304 sans lecture complète si le client a déjà cette version.
     """
+    check_include_permission(token_payload, include)
     try:
+        etag = await appointment_etag(container, conditional, appointment_id, include)
+        not_modified = conditional.not_modified(etag) if etag is not None else None
+        if not_modified is not None:
+            return not_modified
+        
+        # Les relations sont résolues à partir des champs lus: les identifiants doivent en faire partie
+        if include:
+            fields = IncludeAppointmentRelationsUseCase.required_fields(fields, include)
+        
         # Obtenir le repository
         appointment_repository = container.appointment_repository()
         
-        # Récupérer le rendez-vous
-        appointment = await appointment_repository.get_by_id(appointment_id)
+        # Récupérer le rendez-vous (projection des colonnes si fields= est fourni)
+        if fields is not None:
+            appointment = await appointment_repository.get_projected_by_id(appointment_id, fields)
+        else:
+            appointment = await appointment_repository.get_by_id(appointment_id)
         
         if not appointment:
             raise HTTPException(
@@ -152,22 +339,22 @@ async def get_appointment(
                 detail=f"Appointment with ID {appointment_id} not found"
             )
         
-        # Convertir en DTO de réponse
-        response = AppointmentResponseDTO(
-            id=appointment.id,
-            patient_id=appointment.patient_id,
-            doctor_id=appointment.doctor_id,
-            start_time=appointment.start_time,
-            end_time=appointment.end_time,
-            status=appointment.status.value,
-            reason=appointment.reason,
-            notes=appointment.notes,
-            created_at=appointment.created_at,
-            updated_at=appointment.updated_at,
-            is_active=appointment.is_active
-        )
+        if fields is not None:
+            if include:
+                if "patient" in include:
+                    await check_patient_consent(container, token_payload, appointment["patient_id"])
+                appointment = (await include_relations_use_case(container).execute([appointment], include))[0]
+            return conditional.tag(TrustedJSONResponse(appointment), etag)
         
-        return response
+        # Convertir en DTO de réponse (données de confiance: pas de revalidation)
+        return conditional.tag(TrustedJSONResponse(AppointmentResponseDTO.from_entity(appointment)), etag)
+    
+    except MissingPatientConsentException as e:
+        logger.error(f"Consentement du patient manquant: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e)
+        )
     
     except Exception as e:
         logger.exception(f"Erreur lors de la récupération du rendez-vous {appointment_id}: {str(e)}")
@@ -206,7 +393,7 @@ async def update_appointment(
         # Exécuter le cas d'utilisation
         result = await use_case.execute(appointment_id, data or AppointmentUpdateDTO())
         
-        return result
+        return TrustedJSONResponse(result)
         
     except ValueError as e:
         logger.error(f"Erreur de validation: {str(e)}")
@@ -227,23 +414,48 @@ async def get_patient_appointments(
     patient_id: UUID = Path(..., description="The ID of the patient"),
     skip: int = Query(0, description="Number of appointments to skip"),
     limit: int = Query(100, description="Maximum number of appointments to return"),
+    fields: Optional[Tuple[str, ...]] = Depends(appointment_fields),
+    include: Tuple[str, ...] = Depends(appointment_includes),
+    conditional: ConditionalGet = Depends(),
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
     container: Container = Depends(get_container)
 ):
     """
     Récupère les rendez-vous d'un patient.
+    La page porte un ETag dérivé des versions des rendez-vous et des patients.
     """
+    check_include_permission(token_payload, include)
     try:
+        if "patient" in include:
+            await check_patient_consent(container, token_payload, patient_id)
+        
+        etag = await conditional.collection_etag(
+            container.collection_version_store(),
+            appointment_collections(include, PATIENTS_COLLECTION)
+        )
+        not_modified = conditional.not_modified(etag)
+        if not_modified is not None:
+            return not_modified
+        
+        if include:
+            fields = IncludeAppointmentRelationsUseCase.required_fields(fields, include)
+        
         # Créer le cas d'utilisation
         use_case = GetPatientAppointmentsUseCase(
             appointment_repository=container.appointment_repository(),
             patient_repository=container.patient_repository()
         )
         
-        # Exécuter le cas d'utilisation
+        # Exécuter le cas d'utilisation (projection des colonnes si fields= est fourni)
+        if fields is not None:
+            page = await use_case.execute_projected(patient_id, fields, skip, limit)
+            if include:
+                page["appointments"] = await include_relations_use_case(container).execute(page["appointments"], include)
+            return conditional.tag(TrustedJSONResponse(page), etag)
+        
         result = await use_case.execute(patient_id, skip, limit)
         
-        return result
+        return conditional.tag(TrustedJSONResponse(result), etag)
         
     except PatientNotFoundException as e:
         logger.error(f"Patient non trouvé: {str(e)}")
@@ -252,6 +464,13 @@ async def get_patient_appointments(
             detail=str(e)
         )
     
+    except MissingPatientConsentException as e:
+        logger.error(f"Consentement du patient manquant: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e)
+        )
+    
     except Exception as e:
         logger.exception(f"Erreur inattendue lors de la récupération des rendez-vous: {str(e)}")
         raise HTTPException(
@@ -263,11 +482,17 @@ async def get_patient_appointments(
 async def list_appointments(
     skip: int = Query(0, description="Number of appointments to skip"),
     limit: int = Query(100, description="Maximum number of appointments to return"),
+    appointment_filter: AppointmentFilter = Depends(appointment_filter_params),
+    fields: Optional[Tuple[str, ...]] = Depends(appointment_fields),
+    include: Tuple[str, ...] = Depends(appointment_includes),
+    conditional: ConditionalGet = Depends(),
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
     container: Container = Depends(get_container)
 ):
     """
-    Liste tous les rendez-vous avec pagination.
+    Liste les rendez-vous avec pagination, filtrés par patient, médecin, statut et période.
+    Les filtres sont appliqués par la base: seules les lignes demandées sont transférées.
+    La page porte un ETag dérivé de la version de la collection des rendez-vous.
     """
     try:
         # Vérifier les permissions
@@ -280,37 +505,33 @@ async def list_appointments(
                 detail="You don't have permission to list appointments"
             )
         
+        # Version des collections: 304 sans lire la page si le client l'a déjà
+        etag = await conditional.collection_etag(container.collection_version_store(), appointment_collections(include))
+        not_modified = conditional.not_modified(etag)
+        if not_modified is not None:
+            return not_modified
+        
         # Récupérer le repository
         appointment_repository = container.appointment_repository()
         
-        # Récupérer les rendez-vous
-        appointments = await appointment_repository.list_all(skip, limit)
-        total = await appointment_repository.count()
-        
-        # Convertir en DTOs
-        appointment_dtos = [
-            AppointmentResponseDTO(
-                id=appointment.id,
-                patient_id=appointment.patient_id,
-                doctor_id=appointment.doctor_id,
-                start_time=appointment.start_time,
-                end_time=appointment.end_time,
-                status=appointment.status.value,
-                reason=appointment.reason,
-                notes=appointment.notes,
-                created_at=appointment.created_at,
-                updated_at=appointment.updated_at,
-                is_active=appointment.is_active
-            )
-            for appointment in appointments
-        ]
-        
-        # Construire la réponse
-        return AppointmentListResponseDTO(
-            appointments=appointment_dtos,
-            total=total,
-            skip=skip,
-            limit=limit
+        if include:
+            fields = IncludeAppointmentRelationsUseCase.required_fields(fields, include)
+        
+        # Récupérer les rendez-vous (projection des colonnes si fields= est fourni)
+        if fields is not None:
+            rows = await appointment_repository.find_projected(appointment_filter, fields, skip, limit)
+            total = await appointment_repository.count(appointment_filter)
+            if include:
+                rows = await include_relations_use_case(container).execute(rows, include)
+            return conditional.tag(TrustedJSONResponse({"appointments": rows, "total": total, "skip": skip, "limit": limit}), etag)
+        
+        appointments = await appointment_repository.find(appointment_filter, skip, limit)
+        total = await appointment_repository.count(appointment_filter)
+        
+        # Convertir en DTOs (données de confiance: pas de revalidation)
+        return conditional.tag(
+            TrustedJSONResponse(AppointmentListResponseDTO.from_entities(appointments, total, skip, limit)),
+            etag
         )
         
     except Exception as e:
@@ -324,11 +545,16 @@ async def list_appointments(
 async def get_calendar(
     year: int = Query(..., description="Year to fetch the calendar for"),
     month: int = Query(..., description="Month to fetch the calendar for"),
+    fields: Optional[Tuple[str, ...]] = Depends(appointment_fields),
+    include: Tuple[str, ...] = Depends(appointment_includes),
+    conditional: ConditionalGet = Depends(),
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
     container: Container = Depends(get_container)
 ):
     """
     Récupère les rendez-vous pour un mois spécifique (pour l'affichage calendrier).
+    Avec include=patient,doctor, un mois complet s'affiche en une seule requête.
+    Le mois porte un ETag dérivé de la version de la collection des rendez-vous.
     """
     try:
         # Vérifier les permissions
@@ -341,6 +567,29 @@ async def get_calendar(
                 detail="You don't have permission to view the calendar"
             )
         
+        # Mois déjà encodé: ni base de données ni sérialisation
+        calendar_cache = container.calendar_cache()
+        bucket, variant = month_bucket(year, month), (fields, include)
+        cached = calendar_cache.get(bucket, variant)
+        if cached is not None:
+            not_modified = conditional.not_modified(cached.etag)
+            if not_modified is not None:
+                return not_modified
+            return conditional.tag(CacheableJSONResponse(cached.body), cached.etag)
+        
+        # Lue avant la base: une écriture concurrente empêche de conserver une réponse périmée
+        generation = calendar_cache.generation(bucket)
+        
+        # Le mois lu est conservé dans le cache du processus: sa version et ses rendez-vous sont
+        # lus sur le primaire (un réplica en retard remplirait le cache après son invalidation)
+        
+        # Version des collections: 304 sans lire le mois si le client l'a déjà
+        with primary_reads():
+            etag = await conditional.collection_etag(container.collection_version_store(), appointment_collections(include))
+        not_modified = conditional.not_modified(etag)
+        if not_modified is not None:
+            return not_modified
+        
         # Déterminer les dates de début et de fin du mois
         start_date = date(year, month, 1)
         if month == 12:
@@ -350,35 +599,32 @@ async def get_calendar(
         
         # Récupérer le repository
         appointment_repository = container.appointment_repository()
+        columns = IncludeAppointmentRelationsUseCase.required_fields(fields, include) if include else fields
         
-        # Récupérer les rendez-vous dans cette plage de dates
-        appointments = await appointment_repository.get_by_date_range(start_date, end_date)
-        
-        # Convertir en DTOs
-        appointment_dtos = [
-            AppointmentResponseDTO(
-                id=appointment.id,
-                patient_id=appointment.patient_id,
-                doctor_id=appointment.doctor_id,
-                start_time=appointment.start_time,
-                end_time=appointment.end_time,
-                status=appointment.status.value,
-                reason=appointment.reason,
-                notes=appointment.notes,
-                created_at=appointment.created_at,
-                updated_at=appointment.updated_at,
-                is_active=appointment.is_active
-            )
-            for appointment in appointments
-        ]
-        
-        # Construire la réponse
-        return AppointmentListResponseDTO(
-            appointments=appointment_dtos,
-            total=len(appointments),
-            skip=0,
-            limit=len(appointments)
-        )
+        async def build_month() -> CachedCalendar:
+            # Récupérer les rendez-vous dans cette plage de dates (projection si fields= est fourni)
+            if columns is not None:
+                rows = await appointment_repository.get_projected_by_date_range(start_date, end_date, columns)
+                if include:
+                    rows = await include_relations_use_case(container).execute(rows, include)
+                response = CacheableJSONResponse({"appointments": rows, "total": len(rows), "skip": 0, "limit": len(rows)})
+            else:
+                appointments = await appointment_repository.get_by_date_range(start_date, end_date)
+                
+                # Convertir en DTOs (données de confiance: pas de revalidation); un mois est demandé
+                # par chaque écran de calendrier ouvert: sa version compressée est conservée
+                response = CacheableJSONResponse(
+                    AppointmentListResponseDTO.from_entities(appointments, len(appointments), 0, len(appointments))
+                )
+            
+            month_calendar = CachedCalendar(etag, response.body)
+            calendar_cache.set(bucket, variant, month_calendar, generation)
+            return month_calendar
+        
+        # Les écrans ouverts en même temps sur un mois absent du cache partagent une seule lecture
+        with primary_reads():
+            month_calendar = await container.single_flight().do(("calendar", bucket, variant, etag), build_month)
+        return conditional.tag(CacheableJSONResponse(month_calendar.body), etag)
         
     except Exception as e:
         logger.exception(f"Erreur inattendue lors de la récupération du calendrier: {str(e)}")
@@ -0,0 +1,145 @@
+# medisecure-backend/appointment_management/infrastructure/adapters/secondary/calendar_invalidating_appointment_repository.py
+from typing import Optional, List, Dict, Any, Sequence, AsyncIterator, Iterable
+from uuid import UUID
+from datetime import date
+
+from appointment_management.domain.entities.appointment import Appointment
+from appointment_management.domain.entities.appointment_filter import AppointmentFilter
+from appointment_management.domain.ports.secondary.appointment_repository_protocol import AppointmentRepositoryProtocol
+from appointment_management.infrastructure.cache.calendar_cache import CalendarCache, touched_months
+from shared.domain.entities.paged_result import PagedResult
+
+# Colonnes lues avant une modification pour connaître les mois de l'ancien créneau
+_SLOT_FIELDS = ("start_time", "end_time")
+
+class CalendarInvalidatingAppointmentRepository(AppointmentRepositoryProtocol):
+    """
+    Adaptateur secondaire invalidant le cache des mois de calendrier après chaque écriture.
+    Implémente le port AppointmentRepositoryProtocol en déléguant au repository encapsulé.
+
+    Seuls les mois chevauchés par l'ancien et le nouveau créneau du rendez-vous sont invalidés;
+    les écritures des autres workers le sont par les notifications de la base (InvalidationListener).
+    """
+
+    def __init__(self, repository: AppointmentRepositoryProtocol, calendar_cache: CalendarCache):
+        """
+        Initialise le repository avec le repository encapsulé et le cache du calendrier.
+
+        Args:
+            repository: Le repository des rendez-vous
+            calendar_cache: Le cache des mois de calendrier du processus
+        """
+        self.repository = repository
+        self.calendar_cache = calendar_cache
+
+    async def create(self, appointment: Appointment) -> Appointment:
+        """
+        Crée un rendez-vous et invalide les mois qu'il chevauche.
+
+        Args:
+            appointment: Le rendez-vous à créer
+
+        Returns:
+            Appointment: Le rendez-vous créé
+        """
+        created_appointment = await self.repository.create(appointment)
+        self.calendar_cache.invalidate_months(touched_months(created_appointment.start_time, created_appointment.end_time))
+        return created_appointment
+
+    async def update(self, appointment: Appointment) -> Appointment:
+        """
+        Met à jour un rendez-vous et invalide les mois de son ancien et de son nouveau créneau.
+
+        Args:
+            appointment: Le rendez-vous à mettre à jour
+
+        Returns:
+            Appointment: Le rendez-vous mis à jour
+        """
+        previous_slot = await self.repository.get_projected_by_id(appointment.id, _SLOT_FIELDS)
+        updated_appointment = await self.repository.update(appointment)
+        months = touched_months(updated_appointment.start_time, updated_appointment.end_time)
+        self.calendar_cache.invalidate_months(self._with_previous_slot(months, previous_slot))
+        return updated_appointment
+
+    async def delete(self, appointment_id: UUID) -> bool:
+        """
+        Supprime un rendez-vous et invalide les mois qu'il chevauchait.
+
+        Args:
+            appointment_id: L'ID du rendez-vous à supprimer
+
+        Returns:
+            bool: True si le rendez-vous a été supprimé, False sinon
+        """
+        previous_slot = await self.repository.get_projected_by_id(appointment_id, _SLOT_FIELDS)
+        deleted = await self.repository.delete(appointment_id)
+        if deleted:
+            self.calendar_cache.invalidate_months(self._with_previous_slot([], previous_slot))
+        return deleted
+
+    async def get_by_id(self, appointment_id: UUID) -> Optional[Appointment]:
+        return await self.repository.get_by_id(appointment_id)
+
+    async def list_all(self, skip: int = 0, limit: int = 100) -> List[Appointment]:
+        return await self.repository.list_all(skip, limit)
+
+    async def get_by_patient(self, patient_id: UUID, skip: int = 0, limit: int = 100) -> PagedResult[Appointment]:
+        return await self.repository.get_by_patient(patient_id, skip, limit)
+
+    async def get_by_doctor(self, doctor_id: UUID, skip: int = 0, limit: int = 100) -> List[Appointment]:
+        return await self.repository.get_by_doctor(doctor_id, skip, limit)
+
+    async def get_by_date_range(self, start_date: date, end_date: date, skip: int = 0, limit: int = 100) -> List[Appointment]:
+        return await self.repository.get_by_date_range(start_date, end_date, skip, limit)
+
+    async def find(self, appointment_filter: AppointmentFilter, skip: int = 0, limit: int = 100) -> List[Appointment]:
+        return await self.repository.find(appointment_filter, skip, limit)
+
+    async def find_projected(
+        self,
+        appointment_filter: AppointmentFilter,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        return await self.repository.find_projected(appointment_filter, fields, skip, limit)
+
+    async def count(self, appointment_filter: Optional[AppointmentFilter] = None) -> int:
+        return await self.repository.count(appointment_filter)
+
+    async def get_projected_by_id(self, appointment_id: UUID, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        return await self.repository.get_projected_by_id(appointment_id, fields)
+
+    async def list_projected(self, fields: Sequence[str], skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        return await self.repository.list_projected(fields, skip, limit)
+
+    async def get_projected_by_patient(
+        self,
+        patient_id: UUID,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100
+    ) -> PagedResult[Dict[str, Any]]:
+        return await self.repository.get_projected_by_patient(patient_id, fields, skip, limit)
+
+    async def get_projected_by_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        return await self.repository.get_projected_by_date_range(start_date, end_date, fields, skip, limit)
+
+    def stream_projected(self, fields: Sequence[str], batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        return self.repository.stream_projected(fields, batch_size)
+
+    @staticmethod
+    def _with_previous_slot(months: List[str], previous_slot: Optional[Dict[str, Any]]) -> Iterable[str]:
+        """Ajoute les mois de l'ancien créneau (s'il existait) à ceux du nouveau, sans doublon"""
+        if previous_slot is None:
+            return months
+        previous_months = touched_months(previous_slot["start_time"], previous_slot["end_time"])
+        return list(dict.fromkeys(months + previous_months))
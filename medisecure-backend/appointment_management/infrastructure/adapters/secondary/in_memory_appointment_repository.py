@@ -1,10 +1,12 @@
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Any, Sequence, AsyncIterator
 from uuid import UUID
 from datetime import datetime, date
 from copy import deepcopy
 
 from appointment_management.domain.entities.appointment import Appointment
+from appointment_management.domain.entities.appointment_filter import AppointmentFilter
 from appointment_management.domain.ports.secondary.appointment_repository_protocol import AppointmentRepositoryProtocol
+from shared.domain.entities.paged_result import PagedResult
 
 class InMemoryAppointmentRepository(AppointmentRepositoryProtocol):
     """
@@ -89,9 +91,9 @@ class InMemoryAppointmentRepository(AppointmentRepositoryProtocol):
         appointments = list(self.appointments.values())
         return [deepcopy(appointment) for appointment in appointments[skip:skip + limit]]
     
-    async def get_by_patient(self, patient_id: UUID, skip: int = 0, limit: int = 100) -> List[Appointment]:
+    async def get_by_patient(self, patient_id: UUID, skip: int = 0, limit: int = 100) -> PagedResult[Appointment]:
         """
-        Récupère les rendez-vous d'un patient.
+        Récupère une page des rendez-vous d'un patient, avec le nombre total de ses rendez-vous.
         
         Args:
             patient_id: L'ID du patient
@@ -99,13 +101,16 @@ class InMemoryAppointmentRepository(AppointmentRepositoryProtocol):
             limit: Le nombre maximum de rendez-vous à retourner
             
         Returns:
-            List[Appointment]: La liste des rendez-vous du patient
+            PagedResult[Appointment]: Les rendez-vous de la page, et le total
         """
         patient_appointments = [
             appointment for appointment in self.appointments.values()
             if appointment.patient_id == patient_id
         ]
-        return [deepcopy(appointment) for appointment in patient_appointments[skip:skip + limit]]
+        return PagedResult(
+            items=[deepcopy(appointment) for appointment in patient_appointments[skip:skip + limit]],
+            total=len(patient_appointments)
+        )
     
     async def get_by_doctor(self, doctor_id: UUID, skip: int = 0, limit: int = 100) -> List[Appointment]:
         """
@@ -150,11 +155,160 @@ class InMemoryAppointmentRepository(AppointmentRepositoryProtocol):
         ]
         return [deepcopy(appointment) for appointment in date_range_appointments[skip:skip + limit]]
     
-    async def count(self) -> int:
+    async def find(
+        self,
+        appointment_filter: AppointmentFilter,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Appointment]:
         """
-        Compte le nombre total de rendez-vous.
+        Recherche les rendez-vous satisfaisant un filtre, du plus récent au plus ancien.
         
+        Args:
+            appointment_filter: Les critères de recherche
+            skip: Le nombre de rendez-vous à sauter
+            limit: Le nombre maximum de rendez-vous à retourner
+            
+        Returns:
+            List[Appointment]: Les rendez-vous correspondant au filtre
+        """
+        matching = sorted(
+            (appointment for appointment in self.appointments.values() if appointment_filter.matches(appointment)),
+            key=lambda appointment: appointment.start_time,
+            reverse=True
+        )
+        return [deepcopy(appointment) for appointment in matching[skip:skip + limit]]
+    
+    async def find_projected(
+        self,
+        appointment_filter: AppointmentFilter,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Recherche les rendez-vous satisfaisant un filtre en ne récupérant que certains champs.
+        
+        Args:
+            appointment_filter: Les critères de recherche
+            fields: Les champs de l'entité Appointment à récupérer
+            skip: Le nombre de rendez-vous à sauter
+            limit: Le nombre maximum de rendez-vous à retourner
+            
+        Returns:
+            List[Dict[str, Any]]: Les champs demandés de chaque rendez-vous (statut en valeur)
+        """
+        appointments = await self.find(appointment_filter, skip, limit)
+        return [self._project(appointment, fields) for appointment in appointments]
+    
+    async def count(self, appointment_filter: Optional[AppointmentFilter] = None) -> int:
+        """
+        Compte le nombre de rendez-vous, éventuellement restreint à un filtre.
+        
+        Args:
+            appointment_filter: Les critères de recherche (tous les rendez-vous si absent)
+            
+        Returns:
+            int: Le nombre de rendez-vous
+        """
+        if appointment_filter is None:
+            return len(self.appointments)
+        return sum(1 for appointment in self.appointments.values() if appointment_filter.matches(appointment))
+    
+    async def get_projected_by_id(self, appointment_id: UUID, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        """
+        Récupère uniquement certains champs d'un rendez-vous.
+        
+        Args:
+            appointment_id: L'ID du rendez-vous à récupérer
+            fields: Les champs de l'entité Appointment à récupérer
+            
+        Returns:
+            Optional[Dict[str, Any]]: Les champs demandés (statut en valeur), ou None si non trouvé
+        """
+        appointment = self.appointments.get(appointment_id)
+        if appointment:
+            return self._project(appointment, fields)
+        return None
+    
+    async def list_projected(self, fields: Sequence[str], skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Liste les rendez-vous avec pagination en ne récupérant que certains champs.
+        
+        Args:
+            fields: Les champs de l'entité Appointment à récupérer
+            skip: Le nombre de rendez-vous à sauter
+            limit: Le nombre maximum de rendez-vous à retourner
+            
+        Returns:
+            List[Dict[str, Any]]: Les champs demandés de chaque rendez-vous
+        """
+        return [self._project(appointment, fields) for appointment in await self.list_all(skip, limit)]
+    
+    async def get_projected_by_patient(
+        self,
+        patient_id: UUID,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100
+    ) -> PagedResult[Dict[str, Any]]:
+        """
+        Récupère une page des rendez-vous d'un patient en ne récupérant que certains champs,
+        avec le nombre total de ses rendez-vous.
+        
+        Args:
+            patient_id: L'ID du patient
+            fields: Les champs de l'entité Appointment à récupérer
+            skip: Le nombre de rendez-vous à sauter
+            limit: Le nombre maximum de rendez-vous à retourner
+            
+        Returns:
+            PagedResult[Dict[str, Any]]: Les champs demandés de chaque rendez-vous de la page, et le total
+        """
+        page = await self.get_by_patient(patient_id, skip, limit)
+        return PagedResult(items=[self._project(appointment, fields) for appointment in page.items], total=page.total)
+    
+    async def get_projected_by_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Récupère les rendez-vous dans une plage de dates en ne récupérant que certains champs.
+        
+        Args:
+            start_date: La date de début
+            end_date: La date de fin
+            fields: Les champs de l'entité Appointment à récupérer
+            skip: Le nombre de rendez-vous à sauter
+            limit: Le nombre maximum de rendez-vous à retourner
+            
         Returns:
-            int: Le nombre total de rendez-vous
+            List[Dict[str, Any]]: Les champs demandés de chaque rendez-vous dans la plage de dates
+        """
+        appointments = await self.get_by_date_range(start_date, end_date, skip, limit)
+        return [self._project(appointment, fields) for appointment in appointments]
+    
+    async def stream_projected(self, fields: Sequence[str], batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Parcourt les rendez-vous un par un pour un export.
+        
+        Args:
+            fields: Les champs de l'entité Appointment à récupérer
+            batch_size: Le nombre de lignes lues à chaque aller-retour avec la base
+            
+        Yields:
+            Dict[str, Any]: Les champs demandés de chaque rendez-vous
         """
-        return len(self.appointments)
\ No newline at end of file
+        for appointment in list(self.appointments.values()):
+            yield self._project(appointment, fields)
+    
+    def _project(self, appointment: Appointment, fields: Sequence[str]) -> Dict[str, Any]:
+        """Extrait les champs demandés d'un rendez-vous (statut converti en valeur)"""
+        data = {name: getattr(appointment, name) for name in fields}
+        if "status" in data:
+            data["status"] = appointment.status.value
+        return data
@@ -1,5 +1,5 @@
 # medisecure-backend/appointment_management/infrastructure/adapters/secondary/postgres_appointment_repository.py
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Sequence, AsyncIterator
 from uuid import UUID
 from datetime import datetime, date
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,8 +8,12 @@ from sqlalchemy import update, delete, and_, or_, func, text
 import logging
 
 from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus
+from appointment_management.domain.entities.appointment_filter import AppointmentFilter
 from appointment_management.domain.ports.secondary.appointment_repository_protocol import AppointmentRepositoryProtocol
+from shared.domain.entities.paged_result import PagedResult
 from shared.infrastructure.database.models.appointment_model import AppointmentModel, AppointmentStatus as AppointmentStatusModel
+from shared.infrastructure.database.pagination import TOTAL_COLUMN, fetch_page
+from shared.infrastructure.database.replica_routing import replica_read, replica_reads
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
@@ -66,9 +70,7 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
             Appointment: Le rendez-vous créé avec son ID généré
         """
         try:
-            logger.info(f"Création d'un nouveau rendez-vous: {appointment.id}")
-            logger.debug(f"Données du rendez-vous: patient_id={appointment.patient_id}, doctor_id={appointment.doctor_id}")
-            logger.debug(f"Dates: start_time={appointment.start_time}, end_time={appointment.end_time}")
+            logger.debug(f"Création d'un nouveau rendez-vous: {appointment.id}")
             
             # S'assurer que les ID sont de type UUID
             patient_id = appointment.patient_id if isinstance(appointment.patient_id, UUID) else UUID(str(appointment.patient_id))
@@ -96,7 +98,7 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
                 await self.session.commit()
                 await self.session.refresh(appointment_model)
                 
-                logger.info(f"Rendez-vous créé avec succès: {appointment_model.id}")
+                logger.debug(f"Rendez-vous créé: {appointment_model.id}")
                 return self._map_to_entity(appointment_model)
             except Exception as e:
                 await self.session.rollback()
@@ -214,6 +216,7 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
             logger.exception(f"Erreur lors de la suppression du rendez-vous {appointment_id}: {str(e)}")
             raise
     
+    @replica_read
     async def list_all(self, skip: int = 0, limit: int = 100) -> List[Appointment]:
         """
         Liste tous les rendez-vous avec pagination.
@@ -241,9 +244,11 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
             logger.exception(f"Erreur lors de la récupération de la liste des rendez-vous: {str(e)}")
             raise
     
-    async def get_by_patient(self, patient_id: UUID, skip: int = 0, limit: int = 100) -> List[Appointment]:
+    @replica_read
+    async def get_by_patient(self, patient_id: UUID, skip: int = 0, limit: int = 100) -> PagedResult[Appointment]:
         """
-        Récupère les rendez-vous d'un patient.
+        Récupère une page des rendez-vous d'un patient, avec le nombre total de ses rendez-vous
+        calculé dans la même requête (COUNT(*) OVER ()).
         
         Args:
             patient_id: L'ID du patient
@@ -251,7 +256,7 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
             limit: Le nombre maximum de rendez-vous à retourner
             
         Returns:
-            List[Appointment]: La liste des rendez-vous du patient
+            PagedResult[Appointment]: Les rendez-vous de la page, et le total
         """
         try:
             logger.debug(f"Récupération des rendez-vous du patient {patient_id}")
@@ -264,16 +269,13 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
                 select(AppointmentModel)
                 .where(AppointmentModel.patient_id == patient_id)
                 .order_by(AppointmentModel.start_time.desc())
-                .offset(skip)
-                .limit(limit)
             )
             
-            # Exécuter la requête
-            result = await self.session.execute(query)
-            appointment_models = result.scalars().all()
+            # Exécuter la requête (page et total en un seul aller-retour)
+            rows, total = await fetch_page(self.session, query, skip, limit)
             
-            logger.debug(f"Nombre de rendez-vous récupérés pour le patient {patient_id}: {len(appointment_models)}")
-            return [self._map_to_entity(appointment_model) for appointment_model in appointment_models]
+            logger.debug(f"Rendez-vous récupérés pour le patient {patient_id}: {len(rows)} sur {total}")
+            return PagedResult(items=[self._map_to_entity(row[0]) for row in rows], total=total)
         except Exception as e:
             logger.exception(f"Erreur lors de la récupération des rendez-vous du patient {patient_id}: {str(e)}")
             raise
@@ -315,6 +317,7 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
             logger.exception(f"Erreur lors de la récupération des rendez-vous du médecin {doctor_id}: {str(e)}")
             raise
     
+    @replica_read
     async def get_by_date_range(self, start_date: date, end_date: date, skip: int = 0, limit: int = 100) -> List[Appointment]:
         """
         Récupère les rendez-vous dans une plage de dates.
@@ -331,29 +334,10 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
         try:
             logger.debug(f"Récupération des rendez-vous entre {start_date} et {end_date}")
             
-            # Convertir les dates en datetime pour la requête
-            start_datetime = datetime.combine(start_date, datetime.min.time())
-            end_datetime = datetime.combine(end_date, datetime.max.time())
-            
             # Construire la requête
             query = (
                 select(AppointmentModel)
-                .where(
-                    or_(
-                        and_(
-                            AppointmentModel.start_time >= start_datetime,
-                            AppointmentModel.start_time <= end_datetime
-                        ),
-                        and_(
-                            AppointmentModel.end_time >= start_datetime,
-                            AppointmentModel.end_time <= end_datetime
-                        ),
-                        and_(
-                            AppointmentModel.start_time <= start_datetime,
-                            AppointmentModel.end_time >= end_datetime
-                        )
-                    )
-                )
+                .where(self._date_range_filter(start_date, end_date))
                 .order_by(AppointmentModel.start_time)
                 .offset(skip)
                 .limit(limit)
@@ -369,29 +353,299 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
             logger.exception(f"Erreur lors de la récupération des rendez-vous par plage de dates: {str(e)}")
             raise
     
-    async def count(self) -> int:
+    @replica_read
+    async def find(
+        self,
+        appointment_filter: AppointmentFilter,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Appointment]:
+        """
+        Recherche les rendez-vous satisfaisant un filtre, du plus récent au plus ancien.
+        Le filtre est traduit en une seule clause WHERE couverte par les index des rendez-vous.
+        
+        Args:
+            appointment_filter: Les critères de recherche
+            skip: Le nombre de rendez-vous à sauter
+            limit: Le nombre maximum de rendez-vous à retourner
+            
+        Returns:
+            List[Appointment]: Les rendez-vous correspondant au filtre
+        """
+        try:
+            query = (
+                select(AppointmentModel)
+                .where(*self._filter_clauses(appointment_filter))
+                .order_by(AppointmentModel.start_time.desc())
+                .offset(skip)
+                .limit(limit)
+            )
+            result = await self.session.execute(query)
+            return [self._map_to_entity(appointment_model) for appointment_model in result.scalars().all()]
+        except Exception as e:
+            logger.exception(f"Erreur lors de la recherche de rendez-vous: {str(e)}")
+            raise
+    
+    @replica_read
+    async def find_projected(
+        self,
+        appointment_filter: AppointmentFilter,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Recherche les rendez-vous satisfaisant un filtre en ne récupérant que certains champs.
+        
+        Args:
+            appointment_filter: Les critères de recherche
+            fields: Les champs de l'entité Appointment à récupérer
+            skip: Le nombre de rendez-vous à sauter
+            limit: Le nombre maximum de rendez-vous à retourner
+            
+        Returns:
+            List[Dict[str, Any]]: Les champs demandés de chaque rendez-vous (statut en valeur)
+        """
+        try:
+            query = (
+                select(*self._columns(fields))
+                .where(*self._filter_clauses(appointment_filter))
+                .order_by(AppointmentModel.start_time.desc())
+                .offset(skip)
+                .limit(limit)
+            )
+            result = await self.session.execute(query)
+            return [self._map_to_dict(row) for row in result]
+        except Exception as e:
+            logger.exception(f"Erreur lors de la recherche de rendez-vous: {str(e)}")
+            raise
+    
+    @replica_read
+    async def count(self, appointment_filter: Optional[AppointmentFilter] = None) -> int:
         """
-        Compte le nombre total de rendez-vous.
+        Compte le nombre de rendez-vous, éventuellement restreint à un filtre.
         
+        Args:
+            appointment_filter: Les critères de recherche (tous les rendez-vous si absent)
+            
         Returns:
-            int: Le nombre total de rendez-vous
+            int: Le nombre de rendez-vous
         """
         try:
-            logger.debug("Comptage du nombre total de rendez-vous")
+            logger.debug("Comptage des rendez-vous")
             
             # Optimisation avec COUNT(*)
             query = select(func.count()).select_from(AppointmentModel)
+            if appointment_filter is not None:
+                query = query.where(*self._filter_clauses(appointment_filter))
             
             # Exécuter la requête
             result = await self.session.execute(query)
             count = result.scalar_one_or_none() or 0
             
-            logger.debug(f"Nombre total de rendez-vous: {count}")
+            logger.debug(f"Nombre de rendez-vous: {count}")
             return count
         except Exception as e:
             logger.exception(f"Erreur lors du comptage des rendez-vous: {str(e)}")
             raise
     
+    async def get_projected_by_id(self, appointment_id: UUID, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        """
+        Récupère uniquement certains champs d'un rendez-vous (SELECT limité aux colonnes demandées).
+        
+        Args:
+            appointment_id: L'ID du rendez-vous à récupérer
+            fields: Les champs de l'entité Appointment à récupérer
+            
+        Returns:
+            Optional[Dict[str, Any]]: Les champs demandés (statut en valeur), ou None si non trouvé
+        """
+        try:
+            query = select(*self._columns(fields)).where(AppointmentModel.id == appointment_id)
+            result = await self.session.execute(query)
+            row = result.one_or_none()
+            return self._map_to_dict(row) if row is not None else None
+        except Exception as e:
+            logger.exception(f"Erreur lors de la récupération du rendez-vous {appointment_id}: {str(e)}")
+            raise
+    
+    @replica_read
+    async def list_projected(self, fields: Sequence[str], skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Liste les rendez-vous avec pagination en ne récupérant que certains champs.
+        
+        Args:
+            fields: Les champs de l'entité Appointment à récupérer
+            skip: Le nombre de rendez-vous à sauter
+            limit: Le nombre maximum de rendez-vous à retourner
+            
+        Returns:
+            List[Dict[str, Any]]: Les champs demandés de chaque rendez-vous
+        """
+        try:
+            query = (
+                select(*self._columns(fields))
+                .order_by(AppointmentModel.start_time.desc())
+                .offset(skip)
+                .limit(limit)
+            )
+            result = await self.session.execute(query)
+            return [self._map_to_dict(row) for row in result]
+        except Exception as e:
+            logger.exception(f"Erreur lors de la récupération de la liste des rendez-vous: {str(e)}")
+            raise
+    
+    @replica_read
+    async def get_projected_by_patient(
+        self,
+        patient_id: UUID,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100
+    ) -> PagedResult[Dict[str, Any]]:
+        """
+        Récupère une page des rendez-vous d'un patient en ne récupérant que certains champs,
+        avec le nombre total de ses rendez-vous.
+        
+        Args:
+            patient_id: L'ID du patient
+            fields: Les champs de l'entité Appointment à récupérer
+            skip: Le nombre de rendez-vous à sauter
+            limit: Le nombre maximum de rendez-vous à retourner
+            
+        Returns:
+            PagedResult[Dict[str, Any]]: Les champs demandés de chaque rendez-vous de la page, et le total
+        """
+        try:
+            query = (
+                select(*self._columns(fields))
+                .where(AppointmentModel.patient_id == patient_id)
+                .order_by(AppointmentModel.start_time.desc())
+            )
+            rows, total = await fetch_page(self.session, query, skip, limit)
+            return PagedResult(items=[self._map_to_dict(row) for row in rows], total=total)
+        except Exception as e:
+            logger.exception(f"Erreur lors de la récupération des rendez-vous du patient {patient_id}: {str(e)}")
+            raise
+    
+    @replica_read
+    async def get_projected_by_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        fields: Sequence[str],
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Récupère les rendez-vous dans une plage de dates en ne récupérant que certains champs.
+        
+        Args:
+            start_date: La date de début
+            end_date: La date de fin
+            fields: Les champs de l'entité Appointment à récupérer
+            skip: Le nombre de rendez-vous à sauter
+            limit: Le nombre maximum de rendez-vous à retourner
+            
+        Returns:
+            List[Dict[str, Any]]: Les champs demandés de chaque rendez-vous dans la plage de dates
+        """
+        try:
+            query = (
+                select(*self._columns(fields))
+                .where(self._date_range_filter(start_date, end_date))
+                .order_by(AppointmentModel.start_time)
+                .offset(skip)
+                .limit(limit)
+            )
+            result = await self.session.execute(query)
+            return [self._map_to_dict(row) for row in result]
+        except Exception as e:
+            logger.exception(f"Erreur lors de la récupération des rendez-vous par plage de dates: {str(e)}")
+            raise
+    
+    def _filter_clauses(self, appointment_filter: AppointmentFilter) -> List[Any]:
+        """
+        Traduit un filtre en conditions SQL (combinées par ET dans la clause WHERE).
+        La période est testée par chevauchement (start_time <= fin, end_time >= début),
+        même sémantique que AppointmentFilter.matches().
+        """
+        clauses = []
+        if appointment_filter.patient_id is not None:
+            clauses.append(AppointmentModel.patient_id == appointment_filter.patient_id)
+        if appointment_filter.doctor_id is not None:
+            clauses.append(AppointmentModel.doctor_id == appointment_filter.doctor_id)
+        if appointment_filter.status is not None:
+            clauses.append(AppointmentModel.status == AppointmentStatusModel(appointment_filter.status.value))
+        if appointment_filter.end_date is not None:
+            clauses.append(AppointmentModel.start_time <= appointment_filter.end_datetime)
+        if appointment_filter.start_date is not None:
+            clauses.append(AppointmentModel.end_time >= appointment_filter.start_datetime)
+        return clauses
+    
+    def _date_range_filter(self, start_date: date, end_date: date):
+        """Construit le filtre des rendez-vous chevauchant une plage de dates"""
+        # Convertir les dates en datetime pour la requête
+        start_datetime = datetime.combine(start_date, datetime.min.time())
+        end_datetime = datetime.combine(end_date, datetime.max.time())
+        
+        return or_(
+            and_(
+                AppointmentModel.start_time >= start_datetime,
+                AppointmentModel.start_time <= end_datetime
+            ),
+            and_(
+                AppointmentModel.end_time >= start_datetime,
+                AppointmentModel.end_time <= end_datetime
+            ),
+            and_(
+                AppointmentModel.start_time <= start_datetime,
+                AppointmentModel.end_time >= end_datetime
+            )
+        )
+    
+    async def stream_projected(self, fields: Sequence[str], batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Parcourt les rendez-vous en flux pour un export avec un curseur côté serveur:
+        la mémoire utilisée ne dépend que de batch_size, pas de la taille de la table.
+        
+        Args:
+            fields: Les champs de l'entité Appointment à récupérer
+            batch_size: Le nombre de lignes lues à chaque aller-retour avec la base
+            
+        Yields:
+            Dict[str, Any]: Les champs demandés de chaque rendez-vous
+        """
+        query = select(*self._columns(fields)).execution_options(yield_per=batch_size)
+        with replica_reads():
+            result = await self.session.stream(query)
+        try:
+            async for partition in result.partitions():
+                for row in partition:
+                    yield self._map_to_dict(row)
+        finally:
+            await result.close()
+    
+    def _columns(self, fields: Sequence[str]) -> List[Any]:
+        """Retourne les colonnes du modèle correspondant aux champs demandés"""
+        return [getattr(AppointmentModel, name) for name in fields]
+    
+    def _map_to_dict(self, row) -> Dict[str, Any]:
+        """
+        Convertit une ligne projetée en dictionnaire (statut converti en valeur).
+        
+        Args:
+            row: La ligne retournée par un SELECT de colonnes
+            
+        Returns:
+            Dict[str, Any]: Les champs de la ligne
+        """
+        data = dict(row._mapping)
+        data.pop(TOTAL_COLUMN, None)
+        if data.get("status") is not None:
+            data["status"] = data["status"].value if hasattr(data["status"], "value") else str(data["status"])
+        return data
+    
     def _map_to_entity(self, appointment_model: AppointmentModel) -> Appointment:
         """
         Convertit un modèle SQLAlchemy en entité du domaine.
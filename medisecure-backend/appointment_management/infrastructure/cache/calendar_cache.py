@@ -0,0 +1,176 @@
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from shared.infrastructure.cache.cache_stats import CacheStats
+from shared.infrastructure.cache.ttl_cache import TTLCache
+
+# Durée de vie d'un mois en cache: filet de sécurité, les écritures invalident le mois concerné
+CALENDAR_CACHE_TTL_SECONDS = float(os.getenv("CALENDAR_CACHE_TTL_SECONDS", "300"))
+
+# Nombre maximal de variantes (mois, fields, include) conservées
+CALENDAR_CACHE_MAX_ENTRIES = int(os.getenv("CALENDAR_CACHE_MAX_ENTRIES", "256"))
+
+# Paramètres de la requête qui modifient la réponse: (fields, include)
+CalendarVariant = Tuple[Optional[Tuple[str, ...]], Tuple[str, ...]]
+
+def month_bucket(year: int, month: int) -> str:
+    """Retourne l'identifiant d'un mois ("YYYY-MM"), comme dans les notifications des triggers"""
+    return f"{year:04d}-{month:02d}"
+
+def touched_months(start_time: datetime, end_time: datetime) -> List[str]:
+    """
+    Retourne les mois qu'un rendez-vous chevauche (le calendrier d'un mois inclut les rendez-vous
+    qui le chevauchent).
+
+    Args:
+        start_time: Le début du rendez-vous
+        end_time: La fin du rendez-vous
+
+    Returns:
+        List[str]: Les mois concernés, du premier au dernier
+    """
+    year, month = start_time.year, start_time.month
+    last = (end_time.year, end_time.month) if end_time > start_time else (year, month)
+    months = [month_bucket(year, month)]
+    while (year, month) < last:
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        months.append(month_bucket(year, month))
+    return months
+
+@dataclass(frozen=True)
+class CachedCalendar:
+    """
+    Mois de calendrier prêt à être envoyé.
+
+    Attributes:
+        etag: L'ETag de la réponse au moment de sa construction
+        body: Le corps JSON encodé
+    """
+    etag: str
+    body: bytes
+
+class CalendarCache:
+    """
+    Cache des mois de calendrier encodés en JSON, partagé par le processus.
+
+    Une entrée est indexée par le mois et la variante de la requête (fields, include). Une
+    écriture invalide les seuls mois chevauchés par l'ancien et le nouveau créneau; une
+    modification d'un patient ou d'un médecin invalide les variantes qui les intègrent.
+    Chaque invalidation incrémente la génération du mois: une réponse construite à partir
+    d'une lecture antérieure à l'invalidation n'est pas conservée.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = CALENDAR_CACHE_TTL_SECONDS,
+        max_entries: int = CALENDAR_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialise un cache vide.
+
+        Args:
+            ttl_seconds: La durée de vie d'un mois en cache (0 désactive le cache)
+            max_entries: Le nombre maximal de variantes conservées
+            clock: L'horloge utilisée pour les expirations
+        """
+        self._entries: TTLCache[CachedCalendar] = TTLCache(ttl_seconds, max_entries=max_entries, clock=clock)
+        self._variants: Dict[str, Set[CalendarVariant]] = {}
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+        self.stats = CacheStats()
+
+    def generation(self, bucket: str) -> Tuple[int, int]:
+        """
+        Retourne la génération d'un mois, à lire avant la base de données et à passer à set().
+
+        Args:
+            bucket: Le mois ("YYYY-MM")
+
+        Returns:
+            Tuple[int, int]: La génération du cache et celle du mois
+        """
+        return self._epoch, self._generations.get(bucket, 0)
+
+    def get(self, bucket: str, variant: CalendarVariant) -> Optional[CachedCalendar]:
+        """
+        Lit un mois en cache.
+
+        Args:
+            bucket: Le mois ("YYYY-MM")
+            variant: Les paramètres de la requête qui modifient la réponse
+
+        Returns:
+            Optional[CachedCalendar]: Le mois encodé, ou None si absent ou invalidé
+        """
+        entry = self._entries.get((bucket, variant))
+        if entry is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return entry
+
+    def set(self, bucket: str, variant: CalendarVariant, entry: CachedCalendar, generation: Tuple[int, int]) -> bool:
+        """
+        Conserve un mois encodé, sauf s'il a été invalidé depuis la lecture de sa génération.
+
+        Args:
+            bucket: Le mois ("YYYY-MM")
+            variant: Les paramètres de la requête qui modifient la réponse
+            entry: Le mois encodé et son ETag
+            generation: La génération lue avant d'interroger la base de données
+
+        Returns:
+            bool: True si le mois a été conservé
+        """
+        if generation != self.generation(bucket):
+            return False
+        self._entries.set((bucket, variant), entry)
+        self._variants.setdefault(bucket, set()).add(variant)
+        self.stats.evictions = self._entries.evictions
+        return True
+
+    def invalidate_months(self, buckets: Iterable[str]) -> None:
+        """
+        Invalide toutes les variantes des mois donnés.
+
+        Args:
+            buckets: Les mois ("YYYY-MM") chevauchés par les créneaux modifiés
+        """
+        for bucket in buckets:
+            self._generations[bucket] = self._generations.get(bucket, 0) + 1
+            for variant in self._variants.pop(bucket, ()):
+                self._entries.invalidate((bucket, variant))
+            self.stats.invalidations += 1
+
+    def invalidate_relation(self, relation: str) -> None:
+        """
+        Invalide les variantes qui intègrent une relation (include=patient ou include=doctor).
+
+        Args:
+            relation: La relation modifiée
+        """
+        self._epoch += 1
+        for bucket, variants in self._variants.items():
+            for variant in [variant for variant in variants if relation in variant[1]]:
+                self._entries.invalidate((bucket, variant))
+                variants.discard(variant)
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Vide le cache (notifications d'invalidation manquées)"""
+        self._epoch += 1
+        self._variants.clear()
+        self._entries.invalidate()
+
+# Instance partagée par le processus (le container est recréé à chaque requête)
+_calendar_cache = CalendarCache()
+
+def get_calendar_cache() -> CalendarCache:
+    """
+    Fournit le cache des mois de calendrier partagé par le processus.
+    """
+    return _calendar_cache
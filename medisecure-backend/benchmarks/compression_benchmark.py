@@ -0,0 +1,110 @@
+"""
+Benchmark de la compression des réponses: temps CPU par requête rapporté aux octets économisés.
+
+Mesure, au travers de CompressionMiddleware (appel ASGI direct, sans réseau ni base de données),
+deux réponses représentatives:
+- une page de 100 patients complets (données médicales JSONB);
+- un mois de calendrier (600 rendez-vous avec patient et médecin intégrés), servi comme
+  CacheableJSONResponse: la première requête compresse, les suivantes lisent le cache.
+
+Seuls les encodages dont la bibliothèque est installée sont mesurés (gzip toujours, br et zstd si
+les paquets brotli et zstandard sont présents).
+
+Usage:
+    python -m benchmarks.compression_benchmark --iterations 200
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from api.middlewares.compression_middleware import CompressionMiddleware
+from benchmarks.response_benchmark import make_patients
+from patient_management.application.dtos.patient_dtos import PatientListResponseDTO
+from shared.infrastructure.cache.ttl_cache import TTLCache
+from shared.infrastructure.http.compression import available_codecs
+from shared.infrastructure.http.responses import CacheableJSONResponse, TrustedJSONResponse
+
+LEVELS = {"gzip": (1, 6, 9), "br": (1, 4, 6), "zstd": (1, 3, 9)}
+
+def make_calendar(count: int):
+    """Génère un mois de rendez-vous tel que retourné par /appointments/calendar?include=patient,doctor"""
+    start = datetime(2024, 5, 1, 8)
+    doctors = [{"id": uuid4(), "first_name": "Claire", "last_name": f"Martin {i}", "email": f"dr{i}@medisecure.com"} for i in range(8)]
+    return {
+        "appointments": [
+            {
+                "id": uuid4(),
+                "patient_id": uuid4(),
+                "doctor_id": doctors[i % 8]["id"],
+                "start_time": start + timedelta(hours=i),
+                "end_time": start + timedelta(hours=i, minutes=30),
+                "status": "scheduled",
+                "reason": "Consultation de suivi",
+                "notes": None,
+                "patient": {"first_name": "Jean", "last_name": f"Dupont {i}", "phone_number": "0601020304"},
+                "doctor": doctors[i % 8],
+            }
+            for i in range(count)
+        ],
+        "total": count,
+        "skip": 0,
+        "limit": count,
+    }
+
+async def measure(middleware: CompressionMiddleware, response, encoding: str, iterations: int) -> float:
+    """Retourne le temps CPU moyen par requête en millisecondes (middleware compris)"""
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", encoding.encode())]}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.thread_time()
+    for _ in range(iterations):
+        await middleware(dict(scope), receive, send)
+    return (time.thread_time() - start) / iterations * 1000
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de la compression des réponses")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    payloads = {
+        "patients limit=100": TrustedJSONResponse(PatientListResponseDTO.from_entities(make_patients(100), 100, 0, 100)),
+        "calendrier (600 rdv)": CacheableJSONResponse(make_calendar(600)),
+    }
+    for name, response in payloads.items():
+        size = len(response.body)
+        print(f"{name}: {size} octets non compressés")
+
+        async def app(scope, receive, send, response=response):
+            await response(scope, receive, send)
+
+        for encoding in available_codecs(("gzip", "br", "zstd")):
+            for level in LEVELS[encoding]:
+                middleware = CompressionMiddleware(
+                    app, minimum_size=0, encodings=(encoding,), cache=TTLCache(0),
+                    gzip_level=level, brotli_quality=level, zstd_level=level
+                )
+                cpu_ms = asyncio.run(measure(middleware, response, encoding, args.iterations))
+                compressed = middleware.stats.bytes_out // middleware.stats.responses
+                saved = size - compressed
+                print(
+                    f"  {encoding:<4} niveau {level:<2} {compressed:>8} octets (x{size / compressed:4.1f})"
+                    f"   CPU {cpu_ms:6.3f} ms/requête   {saved / 1024 / max(cpu_ms, 1e-6):8.1f} Ko économisés/ms CPU"
+                )
+
+        if isinstance(response, CacheableJSONResponse):
+            middleware = CompressionMiddleware(app, minimum_size=0, encodings=("gzip",), cache=TTLCache(60))
+            cpu_ms = asyncio.run(measure(middleware, response, "gzip", args.iterations))
+            print(
+                f"  gzip avec cache des corps compressés: CPU {cpu_ms:6.3f} ms/requête "
+                f"({middleware.stats.cache_hits}/{middleware.stats.responses} requêtes servies depuis le cache)"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark du coût des logs sur le débit de l'API (requêtes/s avec les logs INFO actifs).
+
+Compare l'ancienne configuration (logging.basicConfig: formatage et écriture synchrones
+dans la boucle d'événements) au pipeline QueueHandler/QueueListener de
+shared/infrastructure/logging. L'application est appelée directement en ASGI, sans serveur
+ni base de données, pour isoler le coût des logs.
+
+Usage:
+    python -m benchmarks.logging_benchmark --requests 5000 --concurrency 50
+    python -m benchmarks.logging_benchmark --sink-latency-ms 0.05   # stdout vers un collecteur lent
+"""
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+
+from fastapi import FastAPI
+
+from api.middlewares.request_id_middleware import RequestIdMiddleware
+from shared.infrastructure.logging.logging_config import configure_logging, shutdown_logging
+
+def build_app(lines_per_request: int) -> FastAPI:
+    """Application minimale dont la route journalise comme un chemin chaud (création de rendez-vous)"""
+    app = FastAPI()
+    app.add_middleware(RequestIdMiddleware)
+    logger = logging.getLogger("benchmarks.hot_path")
+
+    @app.post("/appointments")
+    async def create_appointment():
+        for i in range(lines_per_request):
+            logger.info(f"Étape {i} du rendez-vous: patient_id=8b0e7c1e-5d2f-4c1b-9a63-2f1d6a0c9e11 email=patient@example.com")
+        return {"status": "scheduled"}
+
+    return app
+
+async def call(app: FastAPI) -> None:
+    """Envoie une requête POST /appointments à l'application ASGI"""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": "/appointments", "raw_path": b"/appointments", "root_path": "",
+        "query_string": b"", "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+async def run(app: FastAPI, total: int, concurrency: int) -> float:
+    """Exécute `total` requêtes par lots de `concurrency` et retourne le débit (req/s)"""
+    start = time.perf_counter()
+    for offset in range(0, total, concurrency):
+        await asyncio.gather(*(call(app) for _ in range(min(concurrency, total - offset))))
+    return total / (time.perf_counter() - start)
+
+class SlowStream:
+    """
+    Flux dont chaque écriture bloque un temps donné, comme stdout redirigé vers un collecteur
+    de logs saturé (pipe plein, pilote de logs Docker).
+    """
+
+    def __init__(self, stream, latency_ms: float):
+        self.stream = stream
+        self.latency = latency_ms / 1000
+
+    def write(self, text: str) -> int:
+        if self.latency:
+            time.sleep(self.latency)
+        return self.stream.write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+def reset_root_logger() -> None:
+    shutdown_logging()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark du pipeline de logs")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--lines", type=int, default=8, help="Lignes INFO par requête")
+    parser.add_argument("--sink-latency-ms", type=float, default=0.0,
+                        help="Latence simulée de chaque écriture (0 = fichier local)")
+    args = parser.parse_args()
+
+    app = build_app(args.lines)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        # Avant: basicConfig, formatage et écriture dans la boucle d'événements
+        reset_root_logger()
+        before_file = open(os.path.join(directory, "before.log"), "w")
+        logging.basicConfig(level=logging.INFO, stream=SlowStream(before_file, args.sink_latency_ms),
+                            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        asyncio.run(run(app, min(500, args.requests), args.concurrency))  # chauffe
+        results["basicConfig (avant)"] = asyncio.run(run(app, args.requests, args.concurrency))
+        reset_root_logger()
+        before_file.close()
+
+        # Après: QueueHandler + QueueListener, JSON et masquage hors de la boucle
+        after_file = open(os.path.join(directory, "after.log"), "w")
+        configure_logging(level="INFO", module_levels={}, log_format="json",
+                          stream=SlowStream(after_file, args.sink_latency_ms))
+        asyncio.run(run(app, min(500, args.requests), args.concurrency))  # chauffe
+        results["QueueHandler (après)"] = asyncio.run(run(app, args.requests, args.concurrency))
+        shutdown_logging()
+        after_file.close()
+
+    print(f"{args.requests} requêtes, concurrence {args.concurrency}, {args.lines} lignes INFO par requête, "
+          f"latence d'écriture {args.sink_latency_ms} ms")
+    for name, rps in results.items():
+        print(f"  {name:<22} {rps:>10.0f} req/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark du surcoût du middleware de limitation de débit (objectif: moins de 20 µs par requête).
+
+Mesure, sur une application ASGI vide, le temps par requête avec et sans RateLimitMiddleware
+pour une route sans politique et pour une route limitée (store en mémoire, 10 000 clients).
+
+Usage:
+    python -m benchmarks.rate_limit_benchmark --requests 200000
+"""
+import argparse
+import asyncio
+import time
+
+from api.middlewares.rate_limit_middleware import RateLimitMiddleware, RateLimitPolicy
+from shared.adapters.secondary.in_memory_rate_limit_store import InMemoryRateLimitStore
+
+async def empty_app(scope, receive, send):
+    pass
+
+async def receive():
+    return {"type": "http.request", "body": b""}
+
+async def send(message):
+    pass
+
+async def measure(app, path: str, total: int, clients: int) -> float:
+    """Retourne le temps moyen par requête en microsecondes"""
+    scopes = [
+        {"type": "http", "method": "POST", "path": path, "headers": [], "client": (f"10.0.{i // 256}.{i % 256}", 1234)}
+        for i in range(clients)
+    ]
+    start = time.perf_counter()
+    for i in range(total):
+        await app(scopes[i % clients], receive, send)
+    return (time.perf_counter() - start) / total * 1e6
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark du limiteur de débit")
+    parser.add_argument("--requests", type=int, default=200000)
+    parser.add_argument("--clients", type=int, default=10000)
+    args = parser.parse_args()
+
+    policy = RateLimitPolicy("login", "POST", "/api/auth/login", 10, 10 / 60)
+    limited = RateLimitMiddleware(empty_app, store=InMemoryRateLimitStore(), policies=[policy], trust_forwarded=False)
+
+    baseline = asyncio.run(measure(empty_app, "/api/auth/login", args.requests, args.clients))
+    unlimited_route = asyncio.run(measure(limited, "/api/patients/", args.requests, args.clients))
+    limited_route = asyncio.run(measure(limited, "/api/auth/login", args.requests, args.clients))
+
+    print(f"{args.requests} requêtes, {args.clients} clients")
+    print(f"  sans middleware               {baseline:6.2f} µs/requête")
+    print(f"  route sans politique          {unlimited_route - baseline:6.2f} µs de surcoût")
+    print(f"  route limitée (seau mémoire)  {limited_route - baseline:6.2f} µs de surcoût")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark de la construction et de la sérialisation des pages de patients (limit=100 et limit=1000).
+
+Compare, au travers de FastAPI (appel ASGI direct, sans réseau ni base de données):
+- l'ancien chemin: DTOs validés champ par champ, revalidation contre response_model et json standard;
+- le nouveau chemin: DTOs construits sans validation (from_entities) et TrustedJSONResponse (orjson).
+
+Usage:
+    python -m benchmarks.response_benchmark --iterations 200
+"""
+import argparse
+import asyncio
+import time
+from datetime import date, datetime
+from uuid import uuid4
+
+from fastapi import FastAPI, Query
+from fastapi.responses import JSONResponse
+
+from patient_management.application.dtos.patient_dtos import PatientListResponseDTO, PatientResponseDTO
+from patient_management.domain.entities.patient import Patient
+from shared.infrastructure.http.responses import TrustedJSONResponse
+
+def make_patients(count: int):
+    """Génère des entités représentatives de celles retournées par le repository"""
+    return [
+        Patient(
+            id=uuid4(),
+            first_name="Jean",
+            last_name=f"Dupont {i}",
+            date_of_birth=date(1980, 1, 1 + i % 28),
+            gender="male",
+            address=f"{i} rue de la Paix",
+            city="Paris",
+            postal_code="75002",
+            country="France",
+            phone_number="0601020304",
+            email=f"jean.dupont{i}@example.com",
+            blood_type="A+",
+            allergies={"arachides": "sévère"},
+            has_consent=True,
+            gdpr_consent=True,
+            consent_date=datetime(2024, 5, 17, 9, 30),
+            insurance_provider="CPAM",
+            insurance_id=f"1800175{i:06d}",
+            notes="Patient suivi pour hypertension"
+        )
+        for i in range(count)
+    ]
+
+def create_app(patients) -> FastAPI:
+    app = FastAPI(default_response_class=JSONResponse)
+
+    @app.get("/legacy", response_model=PatientListResponseDTO)
+    async def legacy(limit: int = Query(100)):
+        page = patients[:limit]
+        return PatientListResponseDTO(
+            patients=[
+                PatientResponseDTO(**{name: getattr(patient, name) for name in PatientResponseDTO.__fields__})
+                for patient in page
+            ],
+            total=len(patients),
+            skip=0,
+            limit=limit
+        )
+
+    @app.get("/trusted", response_model=PatientListResponseDTO)
+    async def trusted(limit: int = Query(100)):
+        page = patients[:limit]
+        return TrustedJSONResponse(PatientListResponseDTO.from_entities(page, len(patients), 0, limit))
+
+    return app
+
+async def measure(app, path: str, limit: int, iterations: int) -> float:
+    """Retourne le temps moyen par requête en millisecondes"""
+    scope = {
+        "type": "http", "http_version": "1.1", "method": "GET", "path": path, "raw_path": path.encode(),
+        "root_path": "", "scheme": "http", "query_string": f"limit={limit}".encode(), "headers": [],
+        "client": ("127.0.0.1", 1234), "server": ("testserver", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(dict(scope), receive, send)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / iterations * 1000
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark des réponses JSON de liste de patients")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    app = create_app(make_patients(1000))
+    for limit in (100, 1000):
+        iterations = max(1, args.iterations * 100 // limit)
+        legacy = asyncio.run(measure(app, "/legacy", limit, iterations))
+        trusted = asyncio.run(measure(app, "/trusted", limit, iterations))
+        print(f"limit={limit:<5} validation + json {legacy:8.2f} ms   construct + orjson {trusted:8.2f} ms   x{legacy / trusted:.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmark du débit du serveur: mode développement (uvicorn --reload, un processus) comparé au
+serveur de production (python -m api.serve: gunicorn, workers uvicorn avec uvloop et httptools).
+
+Chaque serveur est démarré dans un sous-processus puis chargé par des clients HTTP/1.1 en
+keep-alive répartis sur plusieurs processus (le générateur de charge ne doit pas être le goulot).
+La route par défaut (/api/health) ne touche pas la base de données: le résultat mesure le coût du
+serveur, des middlewares et du routage. Pour une route authentifiée, passer --path et --token.
+
+Usage:
+    python -m benchmarks.server_benchmark --duration 10 --connections 64 --workers 4
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Optional, Tuple
+
+HOST = "127.0.0.1"
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+def start_server(mode: str, port: int, workers: int) -> subprocess.Popen:
+    """Démarre le serveur dans le mode demandé (dev ou prod)"""
+    env = dict(os.environ, HOST=HOST, PORT=str(port), WEB_CONCURRENCY=str(workers), LOG_LEVEL="WARNING")
+    if mode == "dev":
+        command = [sys.executable, "-m", "uvicorn", "api.main:app", "--host", HOST, "--port", str(port), "--reload"]
+    else:
+        command = [sys.executable, "-m", "api.serve"]
+    return subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def wait_ready(port: int, path: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((HOST, port), timeout=1) as sock:
+                sock.sendall(f"GET {path} HTTP/1.1\r\nHost: {HOST}\r\nConnection: close\r\n\r\n".encode())
+                if sock.recv(12).startswith(b"HTTP/1.1"):
+                    return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Le serveur n'a pas démarré sur le port {port}")
+
+async def read_response(reader: asyncio.StreamReader) -> None:
+    """Lit une réponse complète (en-têtes et corps de longueur Content-Length)"""
+    headers = await reader.readuntil(b"\r\n\r\n")
+    length = 0
+    for line in headers.split(b"\r\n"):
+        name, _, value = line.partition(b":")
+        if name.lower() == b"content-length":
+            length = int(value)
+    if length:
+        await reader.readexactly(length)
+
+async def connection_loop(port: int, request: bytes, deadline: float, latencies: List[float]) -> None:
+    reader, writer = await asyncio.open_connection(HOST, port)
+    try:
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                writer.write(request)
+                await read_response(reader)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                # Connexion fermée par le serveur (worker recyclé après max_requests): reconnexion
+                writer.close()
+                reader, writer = await asyncio.open_connection(HOST, port)
+                continue
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+def client_process(args: Tuple[int, bytes, int, float]) -> List[float]:
+    """Processus client: ses connexions envoient des requêtes en boucle jusqu'à l'échéance"""
+    port, request, connections, duration = args
+    latencies: List[float] = []
+
+    async def run() -> None:
+        deadline = time.monotonic() + duration
+        await asyncio.gather(*(connection_loop(port, request, deadline, latencies) for _ in range(connections)))
+
+    asyncio.run(run())
+    return latencies
+
+def load(port: int, path: str, token: Optional[str], connections: int, processes: int, duration: float) -> Tuple[float, float, float]:
+    """Retourne le débit (requêtes/s) et les latences p50 et p99 (ms)"""
+    authorization = f"Authorization: Bearer {token}\r\n" if token else ""
+    request = f"GET {path} HTTP/1.1\r\nHost: {HOST}\r\n{authorization}\r\n".encode()
+    per_process = max(1, connections // processes)
+    with multiprocessing.Pool(processes) as pool:
+        results = pool.map(client_process, [(port, request, per_process, duration)] * processes)
+    latencies = sorted(latency for result in results for latency in result)
+    if not latencies:
+        return 0.0, 0.0, 0.0
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return len(latencies) / duration, statistics.median(latencies) * 1000, p99 * 1000
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark du serveur: développement comparé à production")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--client-processes", type=int, default=max(1, multiprocessing.cpu_count() // 2))
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--path", default="/api/health")
+    parser.add_argument("--token", default=None)
+    args = parser.parse_args()
+
+    print(f"{args.path}, {args.connections} connexions keep-alive, {args.duration:.0f} s par mode")
+    print(f"{'mode':<42} {'req/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    baseline = None
+    for mode, workers, label in (
+        ("dev", 1, "uvicorn --reload (1 processus)"),
+        ("prod", args.workers, f"api.serve ({args.workers} workers, uvloop)"),
+    ):
+        port = free_port()
+        server = start_server(mode, port, workers)
+        try:
+            wait_ready(port, args.path)
+            throughput, p50, p99 = load(port, args.path, args.token, args.connections, args.client_processes, args.duration)
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+        baseline = baseline or throughput
+        ratio = f"x{throughput / baseline:.2f}" if baseline else ""
+        print(f"{label:<42} {throughput:>10.0f} {p50:>8.2f} {p99:>8.2f} {ratio}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark du paramètre fields= sur la liste des patients (taille de la réponse et temps de traitement).
+
+Passe par PostgresPatientRepository avec une session factice qui retourne des lignes préparées:
+le chemin complet hydrate des PatientModel (colonnes JSONB et notes comprises), le chemin projeté
+ne reçoit que les colonnes demandées. Le temps réseau et le temps PostgreSQL ne sont pas mesurés;
+la réduction du nombre de colonnes transférées est visible dans la requête SQL affichée.
+
+Usage:
+    python -m benchmarks.sparse_fields_benchmark --limit 100 --iterations 200
+"""
+import argparse
+import asyncio
+import time
+from datetime import date, datetime
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from patient_management.application.dtos.patient_dtos import PatientListResponseDTO, PATIENT_RESPONSE_FIELDS
+from patient_management.infrastructure.adapters.secondary.postgres_patient_repository import PostgresPatientRepository
+from shared.infrastructure.database.models.patient_model import PatientModel
+from shared.infrastructure.http.responses import TrustedJSONResponse
+from shared.infrastructure.http.sparse_fields import parse_fields
+
+# Champs affichés par la page de liste des patients du frontend
+LIST_PAGE_FIELDS = "first_name,last_name,date_of_birth,gender,phone_number,email"
+
+class Row:
+    """Ligne projetée minimale (interface _mapping des lignes SQLAlchemy)"""
+    __slots__ = ("_mapping",)
+
+    def __init__(self, mapping):
+        self._mapping = mapping
+
+class FakeResult:
+    def __init__(self, rows, models):
+        self.rows = rows
+        self.models = models
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.models
+
+class FakeSession:
+    """Session factice: retourne des lignes projetées ou des modèles selon la requête"""
+    def __init__(self, values):
+        self.values = values
+        self.last_statement = None
+
+    async def execute(self, statement):
+        self.last_statement = statement
+        names = [column.name for column in statement.selected_columns]
+        if names == [column.name for column in PatientModel.__table__.columns]:
+            return FakeResult([], [PatientModel(**value) for value in self.values])
+        return FakeResult([Row({name: value[name] for name in names}) for value in self.values], [])
+
+def make_values(count: int):
+    """Génère des lignes représentatives de la table patients"""
+    return [
+        {
+            "id": uuid4(), "user_id": None, "first_name": "Jean", "last_name": f"Dupont {i}",
+            "date_of_birth": date(1980, 1, 1 + i % 28), "gender": "male", "address": f"{i} rue de la Paix",
+            "city": "Paris", "postal_code": "75002", "country": "France", "phone_number": "0601020304",
+            "email": f"jean.dupont{i}@example.com", "blood_type": "A+",
+            "allergies": {"arachides": {"sévérité": "élevée", "réaction": "anaphylaxie", "depuis": "2004"}},
+            "chronic_diseases": {"hypertension": {"traitement": "amlodipine", "suivi": "trimestriel"}},
+            "current_medications": {"amlodipine": "5 mg/jour", "atorvastatine": "20 mg/jour"},
+            "has_consent": True, "consent_date": datetime(2024, 5, 17, 9, 30), "gdpr_consent": True,
+            "insurance_provider": "CPAM", "insurance_id": f"1800175{i:06d}",
+            "notes": "Patient suivi pour hypertension artérielle. " * 8,
+            "created_at": datetime(2024, 1, 2, 8, 0), "updated_at": datetime(2024, 5, 17, 9, 30), "is_active": True,
+        }
+        for i in range(count)
+    ]
+
+async def full_page(repository, limit):
+    patients = await repository.list_all(0, limit)
+    return TrustedJSONResponse(PatientListResponseDTO.from_entities(patients, limit, 0, limit)).body
+
+async def projected_page(repository, fields, limit):
+    rows = await repository.list_projected(fields, 0, limit)
+    return TrustedJSONResponse({"patients": rows, "total": limit, "skip": 0, "limit": limit}).body
+
+async def measure(factory, iterations: int):
+    body = await factory()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await factory()
+    return body, (time.perf_counter() - start) / iterations * 1000
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark du paramètre fields= de la liste des patients")
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    session = FakeSession(make_values(args.limit))
+    repository = PostgresPatientRepository(session)
+    fields = parse_fields(LIST_PAGE_FIELDS, PATIENT_RESPONSE_FIELDS)
+
+    full_body, full_ms = asyncio.run(measure(lambda: full_page(repository, args.limit), args.iterations))
+    full_sql = str(session.last_statement.compile(dialect=postgresql.dialect()))
+    projected_body, projected_ms = asyncio.run(measure(lambda: projected_page(repository, fields, args.limit), args.iterations))
+    projected_sql = str(session.last_statement.compile(dialect=postgresql.dialect()))
+
+    print(f"limit={args.limit}, fields={','.join(fields)}")
+    print(f"  complet  {len(full_body):8d} octets  {full_ms:7.2f} ms  {full_sql.count(',') + 1} colonnes")
+    print(f"  projeté  {len(projected_body):8d} octets  {projected_ms:7.2f} ms  {projected_sql.count(',') + 1} colonnes")
+    print(f"  réduction {1 - len(projected_body) / len(full_body):.0%} des octets, {1 - projected_ms / full_ms:.0%} du temps")
+
+if __name__ == "__main__":
+    main()
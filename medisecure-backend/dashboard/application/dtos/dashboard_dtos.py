@@ -0,0 +1,64 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from dashboard.domain.entities.dashboard_summary import DashboardSummary, UpcomingAppointment
+from patient_management.application.dtos.patient_dtos import PatientSummaryDTO
+
+class UpcomingAppointmentDTO(BaseModel):
+    """DTO pour un prochain rendez-vous du tableau de bord"""
+    id: UUID
+    patient_id: UUID
+    doctor_id: UUID
+    start_time: datetime
+    end_time: datetime
+    status: str
+    patient_first_name: Optional[str] = None
+    patient_last_name: Optional[str] = None
+
+    @classmethod
+    def from_entity(cls, appointment: UpcomingAppointment) -> "UpcomingAppointmentDTO":
+        """Construit le DTO sans validation à partir d'une entité issue de nos repositories"""
+        return cls.construct(
+            id=appointment.id,
+            patient_id=appointment.patient_id,
+            doctor_id=appointment.doctor_id,
+            start_time=appointment.start_time,
+            end_time=appointment.end_time,
+            status=appointment.status.value,
+            patient_first_name=appointment.patient_first_name,
+            patient_last_name=appointment.patient_last_name
+        )
+
+class DashboardSummaryDTO(BaseModel):
+    """DTO pour la réponse avec les statistiques du tableau de bord"""
+    generated_at: datetime
+    total_patients: int
+    new_patients_this_week: int
+    today_appointments: int
+    today_appointments_by_status: Dict[str, int]
+    upcoming_appointments: List[UpcomingAppointmentDTO]
+    recent_patients: List[PatientSummaryDTO]
+
+    @classmethod
+    def from_summary(cls, summary: DashboardSummary) -> "DashboardSummaryDTO":
+        """
+        Construit le DTO sans validation à partir des statistiques issues de nos repositories.
+
+        Args:
+            summary: Les statistiques du tableau de bord
+
+        Returns:
+            DashboardSummaryDTO: Le DTO de réponse
+        """
+        return cls.construct(
+            generated_at=summary.generated_at,
+            total_patients=summary.total_patients,
+            new_patients_this_week=summary.new_patients_this_week,
+            today_appointments=summary.today_appointments,
+            today_appointments_by_status=summary.today_appointments_by_status,
+            upcoming_appointments=[UpcomingAppointmentDTO.from_entity(item) for item in summary.upcoming_appointments],
+            recent_patients=[PatientSummaryDTO.from_summary(item) for item in summary.recent_patients]
+        )
@@ -0,0 +1,57 @@
+from datetime import datetime
+from typing import Callable
+import logging
+
+from dashboard.application.dtos.dashboard_dtos import DashboardSummaryDTO
+from dashboard.domain.ports.secondary.dashboard_repository_protocol import DashboardRepositoryProtocol
+from shared.infrastructure.cache.ttl_cache import TTLCache
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+class GetDashboardSummaryUseCase:
+    """
+    Cas d'utilisation pour récupérer les statistiques du tableau de bord.
+    Le résultat est mis en cache quelques secondes par rôle: des dizaines de tableaux de bord
+    ouverts ne coûtent qu'une requête SQL par rôle et par durée de vie du cache.
+    """
+
+    def __init__(
+        self,
+        dashboard_repository: DashboardRepositoryProtocol,
+        cache: TTLCache,
+        clock: Callable[[], datetime] = datetime.utcnow
+    ):
+        """
+        Initialise le cas d'utilisation avec les dépendances nécessaires.
+
+        Args:
+            dashboard_repository: Le repository des statistiques du tableau de bord
+            cache: Le cache des statistiques, partagé par le processus
+            clock: L'horloge donnant l'instant de référence des statistiques
+        """
+        self.dashboard_repository = dashboard_repository
+        self.cache = cache
+        self.clock = clock
+
+    async def execute(self, role: str, upcoming_limit: int = 5) -> DashboardSummaryDTO:
+        """
+        Exécute le cas d'utilisation.
+
+        Args:
+            role: Le rôle de l'utilisateur (clé du cache)
+            upcoming_limit: Le nombre de prochains rendez-vous à retourner
+
+        Returns:
+            DashboardSummaryDTO: Les statistiques du tableau de bord
+        """
+        key = (role.lower(), upcoming_limit)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        summary = await self.dashboard_repository.get_summary(self.clock(), upcoming_limit=upcoming_limit)
+        result = DashboardSummaryDTO.from_summary(summary)
+        self.cache.set(key, result)
+        logger.debug(f"Statistiques du tableau de bord calculées pour le rôle {role}")
+        return result
@@ -0,0 +1,47 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from appointment_management.domain.entities.appointment import AppointmentStatus
+from patient_management.domain.entities.patient_summary import PatientSummary
+
+@dataclass(frozen=True)
+class UpcomingAppointment:
+    """Rendez-vous à venir affiché sur le tableau de bord, avec le nom du patient"""
+    id: UUID
+    patient_id: UUID
+    doctor_id: UUID
+    start_time: datetime
+    end_time: datetime
+    status: AppointmentStatus
+    patient_first_name: Optional[str] = None
+    patient_last_name: Optional[str] = None
+
+@dataclass(frozen=True)
+class DashboardSummary:
+    """
+    Statistiques du tableau de bord, calculées ensemble à un instant donné.
+    """
+    generated_at: datetime
+    total_patients: int
+    new_patients_this_week: int
+    today_appointments_by_status: Dict[str, int] = field(default_factory=dict)
+    upcoming_appointments: List[UpcomingAppointment] = field(default_factory=list)
+    recent_patients: List[PatientSummary] = field(default_factory=list)
+
+    @property
+    def today_appointments(self) -> int:
+        """Retourne le nombre total de rendez-vous du jour, tous statuts confondus"""
+        return sum(self.today_appointments_by_status.values())
+
+# Statuts des rendez-vous comptés comme « à venir »
+UPCOMING_STATUSES = (AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED)
+
+def start_of_day(now: datetime) -> datetime:
+    """Retourne le début de la journée de l'instant donné"""
+    return now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+def start_of_week(now: datetime) -> datetime:
+    """Retourne le début de la semaine (lundi) de l'instant donné"""
+    return start_of_day(now) - timedelta(days=now.weekday())
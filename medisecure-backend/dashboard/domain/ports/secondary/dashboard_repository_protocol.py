@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from dashboard.domain.entities.dashboard_summary import DashboardSummary
+
+class DashboardRepositoryProtocol(ABC):
+    """
+    Port secondaire pour la lecture des statistiques du tableau de bord.
+    """
+
+    @abstractmethod
+    async def get_summary(self, now: datetime, upcoming_limit: int = 5, recent_limit: int = 5) -> DashboardSummary:
+        """
+        Calcule les statistiques du tableau de bord.
+
+        Args:
+            now: L'instant de référence (début de la journée et de la semaine, rendez-vous à venir)
+            upcoming_limit: Le nombre de prochains rendez-vous à retourner
+            recent_limit: Le nombre de patients les plus récents à retourner
+
+        Returns:
+            DashboardSummary: Les statistiques du tableau de bord
+        """
+        pass
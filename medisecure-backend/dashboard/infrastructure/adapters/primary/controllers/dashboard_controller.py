@@ -0,0 +1,73 @@
+# medisecure-backend/dashboard/infrastructure/adapters/primary/controllers/dashboard_controller.py
+from typing import Dict, Any, AsyncIterator
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+import logging
+
+from shared.services.authenticator.extract_token import extract_token_payload
+from shared.container.container import Container, close_session
+from shared.infrastructure.http.responses import CacheableJSONResponse
+from dashboard.application.dtos.dashboard_dtos import DashboardSummaryDTO
+from dashboard.application.usecases.get_dashboard_summary_usecase import GetDashboardSummaryUseCase
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Créer un router pour les endpoints du tableau de bord
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+# Rôles ayant accès au tableau de bord (mêmes rôles que la liste des patients et des rendez-vous)
+DASHBOARD_ROLES = ("admin", "doctor", "nurse", "receptionist")
+
+async def get_container() -> AsyncIterator[Container]:
+    """
+    Fournit le container d'injection de dépendances de la requête.
+    Sa session est fermée après la réponse: la connexion est rendue au pool.
+    """
+    container = Container()
+    try:
+        yield container
+    finally:
+        await close_session(container)
+
+@router.get("/summary", response_model=DashboardSummaryDTO)
+async def get_dashboard_summary(
+    upcoming: int = Query(5, ge=1, le=50, description="Number of upcoming appointments to return"),
+    token_payload: Dict[str, Any] = Depends(extract_token_payload),
+    container: Container = Depends(get_container)
+):
+    """
+    Récupère les statistiques du tableau de bord: nombre de patients, nouveaux patients de la semaine,
+    rendez-vous du jour par statut, prochains rendez-vous et patients les plus récents.
+    Les statistiques sont calculées en une seule requête SQL et mises en cache quelques secondes.
+    
+    Args:
+        upcoming: Le nombre de prochains rendez-vous à retourner
+        token_payload: Les informations du token JWT
+        container: Le container d'injection de dépendances
+        
+    Returns:
+        DashboardSummaryDTO: Les statistiques du tableau de bord
+        
+    Raises:
+        HTTPException: Si l'utilisateur n'a pas accès au tableau de bord
+    """
+    role = token_payload.get("role", "").lower()
+    if role not in DASHBOARD_ROLES:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to view the dashboard"
+        )
+    
+    try:
+        use_case = GetDashboardSummaryUseCase(
+            dashboard_repository=container.dashboard_repository(),
+            cache=container.dashboard_summary_cache()
+        )
+        return CacheableJSONResponse(await use_case.execute(role, upcoming))
+    
+    except Exception as e:
+        logger.exception(f"Erreur inattendue lors du calcul du tableau de bord: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+
+from appointment_management.domain.entities.appointment import AppointmentStatus
+from appointment_management.infrastructure.adapters.secondary.in_memory_appointment_repository import InMemoryAppointmentRepository
+from dashboard.domain.entities.dashboard_summary import (
+    DashboardSummary,
+    UpcomingAppointment,
+    UPCOMING_STATUSES,
+    start_of_day,
+    start_of_week
+)
+from dashboard.domain.ports.secondary.dashboard_repository_protocol import DashboardRepositoryProtocol
+from patient_management.domain.entities.patient_summary import PatientSummary, PATIENT_SUMMARY_FIELDS
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+
+class InMemoryDashboardRepository(DashboardRepositoryProtocol):
+    """
+    Adaptateur secondaire pour les statistiques du tableau de bord en mémoire (pour les tests).
+    Calcule les statistiques à partir des repositories en mémoire des patients et des rendez-vous.
+    """
+
+    def __init__(
+        self,
+        patient_repository: InMemoryPatientRepository,
+        appointment_repository: InMemoryAppointmentRepository
+    ):
+        """
+        Initialise le repository avec les données en mémoire.
+
+        Args:
+            patient_repository: Le repository des patients en mémoire
+            appointment_repository: Le repository des rendez-vous en mémoire
+        """
+        self.patient_repository = patient_repository
+        self.appointment_repository = appointment_repository
+
+    async def get_summary(self, now: datetime, upcoming_limit: int = 5, recent_limit: int = 5) -> DashboardSummary:
+        """
+        Calcule les statistiques du tableau de bord.
+
+        Args:
+            now: L'instant de référence (début de la journée et de la semaine, rendez-vous à venir)
+            upcoming_limit: Le nombre de prochains rendez-vous à retourner
+            recent_limit: Le nombre de patients les plus récents à retourner
+
+        Returns:
+            DashboardSummary: Les statistiques du tableau de bord
+        """
+        patients = self.patient_repository.patients
+        appointments = list(self.appointment_repository.appointments.values())
+        day_start = start_of_day(now)
+        week_start = start_of_week(now)
+
+        by_status = {status.value: 0 for status in AppointmentStatus}
+        for appointment in appointments:
+            if day_start <= appointment.start_time < day_start + timedelta(days=1):
+                by_status[appointment.status.value] += 1
+
+        upcoming = sorted(
+            (
+                appointment for appointment in appointments
+                if appointment.start_time >= now and appointment.status in UPCOMING_STATUSES
+            ),
+            key=lambda appointment: appointment.start_time
+        )[:upcoming_limit]
+
+        recent = sorted(patients.values(), key=lambda patient: patient.created_at, reverse=True)[:recent_limit]
+
+        return DashboardSummary(
+            generated_at=now,
+            total_patients=len(patients),
+            new_patients_this_week=sum(1 for patient in patients.values() if patient.created_at >= week_start),
+            today_appointments_by_status=by_status,
+            upcoming_appointments=[
+                UpcomingAppointment(
+                    id=appointment.id,
+                    patient_id=appointment.patient_id,
+                    doctor_id=appointment.doctor_id,
+                    start_time=appointment.start_time,
+                    end_time=appointment.end_time,
+                    status=appointment.status,
+                    patient_first_name=getattr(patients.get(appointment.patient_id), "first_name", None),
+                    patient_last_name=getattr(patients.get(appointment.patient_id), "last_name", None)
+                )
+                for appointment in upcoming
+                if appointment.patient_id in patients
+            ],
+            recent_patients=[
+                PatientSummary(**{name: getattr(patient, name) for name in PATIENT_SUMMARY_FIELDS})
+                for patient in recent
+            ]
+        )
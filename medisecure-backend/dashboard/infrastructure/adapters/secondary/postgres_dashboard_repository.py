@@ -0,0 +1,163 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict
+from uuid import UUID
+import logging
+
+from pydantic.datetime_parse import parse_date, parse_datetime
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appointment_management.domain.entities.appointment import AppointmentStatus
+from dashboard.domain.entities.dashboard_summary import (
+    DashboardSummary,
+    UpcomingAppointment,
+    UPCOMING_STATUSES,
+    start_of_day,
+    start_of_week
+)
+from dashboard.domain.ports.secondary.dashboard_repository_protocol import DashboardRepositoryProtocol
+from patient_management.domain.entities.patient_summary import PatientSummary, PATIENT_SUMMARY_FIELDS
+from shared.infrastructure.database.models.appointment_model import AppointmentModel, AppointmentStatus as AppointmentStatusModel
+from shared.infrastructure.database.models.patient_model import PatientModel
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+class PostgresDashboardRepository(DashboardRepositoryProtocol):
+    """
+    Adaptateur secondaire pour les statistiques du tableau de bord avec PostgreSQL.
+    Toutes les statistiques sont calculées par une seule requête (un CTE par statistique),
+    les listes étant agrégées en JSON: un seul aller-retour avec la base.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialise le repository avec une session SQLAlchemy.
+
+        Args:
+            session: La session SQLAlchemy à utiliser
+        """
+        self.session = session
+
+    async def get_summary(self, now: datetime, upcoming_limit: int = 5, recent_limit: int = 5) -> DashboardSummary:
+        """
+        Calcule les statistiques du tableau de bord.
+        Lues sur le primaire: le résultat est conservé dans le cache du processus, qu'un réplica
+        en retard remplirait après son invalidation.
+
+        Args:
+            now: L'instant de référence (début de la journée et de la semaine, rendez-vous à venir)
+            upcoming_limit: Le nombre de prochains rendez-vous à retourner
+            recent_limit: Le nombre de patients les plus récents à retourner
+
+        Returns:
+            DashboardSummary: Les statistiques du tableau de bord
+        """
+        try:
+            result = await self.session.execute(self._summary_query(now, upcoming_limit, recent_limit))
+            row = result.one()
+            return DashboardSummary(
+                generated_at=now,
+                total_patients=row.total_patients or 0,
+                new_patients_this_week=row.new_patients_this_week or 0,
+                today_appointments_by_status=self._map_status_counts(row.today_appointments_by_status or {}),
+                upcoming_appointments=[self._map_upcoming(item) for item in row.upcoming_appointments or []],
+                recent_patients=[self._map_patient(item) for item in row.recent_patients or []]
+            )
+        except Exception as e:
+            logger.exception(f"Erreur lors du calcul des statistiques du tableau de bord: {str(e)}")
+            raise
+
+    def _summary_query(self, now: datetime, upcoming_limit: int, recent_limit: int):
+        """Construit la requête unique des statistiques (un CTE par statistique)"""
+        day_start = start_of_day(now)
+
+        patient_totals = select(
+            func.count().label("total"),
+            func.count().filter(PatientModel.created_at >= start_of_week(now)).label("new_this_week")
+        ).cte("patient_totals")
+
+        today_appointments = (
+            select(AppointmentModel.status, func.count().label("count"))
+            .where(AppointmentModel.start_time >= day_start, AppointmentModel.start_time < day_start + timedelta(days=1))
+            .group_by(AppointmentModel.status)
+            .cte("today_appointments")
+        )
+
+        upcoming_appointments = (
+            select(
+                AppointmentModel.id,
+                AppointmentModel.patient_id,
+                AppointmentModel.doctor_id,
+                AppointmentModel.start_time,
+                AppointmentModel.end_time,
+                AppointmentModel.status,
+                PatientModel.first_name.label("patient_first_name"),
+                PatientModel.last_name.label("patient_last_name")
+            )
+            .join(PatientModel, PatientModel.id == AppointmentModel.patient_id)
+            .where(
+                AppointmentModel.start_time >= now,
+                AppointmentModel.status.in_([AppointmentStatusModel(status.value) for status in UPCOMING_STATUSES])
+            )
+            .order_by(AppointmentModel.start_time)
+            .limit(upcoming_limit)
+            .cte("upcoming_appointments")
+        )
+
+        recent_patients = (
+            select(*[getattr(PatientModel, name) for name in PATIENT_SUMMARY_FIELDS], PatientModel.created_at)
+            .order_by(PatientModel.created_at.desc())
+            .limit(recent_limit)
+            .cte("recent_patients")
+        )
+
+        return select(
+            patient_totals.c.total.label("total_patients"),
+            patient_totals.c.new_this_week.label("new_patients_this_week"),
+            select(func.json_object_agg(today_appointments.c.status, today_appointments.c.count, type_=JSON))
+            .scalar_subquery()
+            .label("today_appointments_by_status"),
+            select(func.json_agg(
+                aggregate_order_by(upcoming_appointments.table_valued(), upcoming_appointments.c.start_time),
+                type_=JSON
+            )).scalar_subquery().label("upcoming_appointments"),
+            select(func.json_agg(
+                aggregate_order_by(recent_patients.table_valued(), recent_patients.c.created_at.desc()),
+                type_=JSON
+            )).scalar_subquery().label("recent_patients")
+        ).select_from(patient_totals)
+
+    def _map_status_counts(self, counts: Dict[str, int]) -> Dict[str, int]:
+        """Retourne le nombre de rendez-vous du jour pour chaque statut (0 si aucun)"""
+        by_status = {status.value: 0 for status in AppointmentStatus}
+        for status, count in counts.items():
+            by_status[self._status(status).value] = count
+        return by_status
+
+    def _map_upcoming(self, item: Dict[str, Any]) -> UpcomingAppointment:
+        """Convertit un rendez-vous agrégé en JSON en entité du tableau de bord"""
+        return UpcomingAppointment(
+            id=UUID(item["id"]),
+            patient_id=UUID(item["patient_id"]),
+            doctor_id=UUID(item["doctor_id"]),
+            start_time=parse_datetime(item["start_time"]),
+            end_time=parse_datetime(item["end_time"]),
+            status=self._status(item["status"]),
+            patient_first_name=item.get("patient_first_name"),
+            patient_last_name=item.get("patient_last_name")
+        )
+
+    def _map_patient(self, item: Dict[str, Any]) -> PatientSummary:
+        """Convertit un patient agrégé en JSON en résumé de patient"""
+        data = {name: item.get(name) for name in PATIENT_SUMMARY_FIELDS}
+        data["id"] = UUID(data["id"])
+        data["date_of_birth"] = parse_date(data["date_of_birth"])
+        if data["updated_at"] is not None:
+            data["updated_at"] = parse_datetime(data["updated_at"])
+        return PatientSummary(**data)
+
+    def _status(self, value: str) -> AppointmentStatus:
+        """Convertit un statut lu en JSON (valeur ou nom de l'énumération) en statut du domaine"""
+        return AppointmentStatus(value.lower())
@@ -0,0 +1,22 @@
+import os
+
+from shared.infrastructure.cache.ttl_cache import TTLCache
+
+# Durée de vie des statistiques du tableau de bord en cache (0 pour désactiver le cache)
+DASHBOARD_CACHE_TTL_SECONDS = float(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "5"))
+
+# Instance partagée par le processus (le container est recréé à chaque requête)
+_dashboard_summary_cache = TTLCache(DASHBOARD_CACHE_TTL_SECONDS, max_entries=64)
+
+def get_dashboard_summary_cache() -> TTLCache:
+    """
+    Fournit le cache des statistiques du tableau de bord partagé par le processus.
+    """
+    return _dashboard_summary_cache
+
+async def flush_dashboard_summary_cache() -> None:
+    """
+    Vide le cache des statistiques (modification d'un patient, rendez-vous ou utilisateur
+    notifiée par la base de données: les agrégats ne sont pas invalidés ligne par ligne).
+    """
+    _dashboard_summary_cache.invalidate()
@@ -66,6 +66,166 @@ CREATE TABLE IF NOT EXISTS appointments (
   is_active BOOLEAN DEFAULT TRUE
 );
 
+-- Index des filtres de la liste des rendez-vous (patient, médecin, statut, période)
+CREATE INDEX IF NOT EXISTS ix_appointments_start_time ON appointments (start_time);
+CREATE INDEX IF NOT EXISTS ix_appointments_end_time ON appointments (end_time);
+CREATE INDEX IF NOT EXISTS ix_appointments_patient_id_start_time ON appointments (patient_id, start_time);
+CREATE INDEX IF NOT EXISTS ix_appointments_doctor_id_start_time ON appointments (doctor_id, start_time);
+CREATE INDEX IF NOT EXISTS ix_appointments_status_start_time ON appointments (status, start_time);
+
+CREATE TABLE IF NOT EXISTS revoked_tokens (
+  jti VARCHAR PRIMARY KEY,
+  user_id UUID REFERENCES users(id) ON DELETE CASCADE,
+  expires_at TIMESTAMP NOT NULL,
+  revoked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_revoked_tokens_expires_at ON revoked_tokens (expires_at);
+
+-- Seaux de limitation de débit partagés entre workers (RATE_LIMIT_STORE=postgres)
+CREATE UNLOGGED TABLE IF NOT EXISTS rate_limit_buckets (
+  key VARCHAR PRIMARY KEY,
+  tokens DOUBLE PRECISION NOT NULL,
+  allowed BOOLEAN NOT NULL DEFAULT TRUE,
+  updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_rate_limit_buckets_updated_at ON rate_limit_buckets (updated_at);
+
+-- Versions des collections (ETag des listes): incrémentées dans la transaction de chaque écriture,
+-- une fois par instruction (INSERT, UPDATE, DELETE, COPY ou TRUNCATE), quel que soit le chemin d'écriture.
+-- Chaque collection a 16 compteurs (slot) et sa version est leur somme: une transaction incrémente le
+-- compteur de sa connexion (pg_backend_pid() % 16) et garde son verrou jusqu'à la validation. Avec une
+-- seule ligne par collection, toutes les écritures concurrentes d'une table attendaient la fin de la
+-- transaction précédente; elles ne s'attendent plus que si leurs connexions partagent un compteur.
+-- La somme ne change qu'à la validation d'une écriture, et change à chacune.
+CREATE TABLE IF NOT EXISTS collection_versions (
+  name VARCHAR(50) NOT NULL,
+  slot SMALLINT NOT NULL,
+  version BIGINT NOT NULL DEFAULT 0,
+  updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (name, slot)
+);
+
+INSERT INTO collection_versions (name, slot)
+SELECT name, slot
+FROM unnest(ARRAY['patients', 'appointments', 'users']) AS name, generate_series(0, 15) AS slot
+ON CONFLICT (name, slot) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_collection_version() RETURNS trigger AS $$
+BEGIN
+  UPDATE collection_versions
+  SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+  WHERE name = TG_ARGV[0] AND slot = pg_backend_pid() % 16;
+  RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS patients_collection_version ON patients;
+CREATE TRIGGER patients_collection_version
+  AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON patients
+  FOR EACH STATEMENT EXECUTE FUNCTION bump_collection_version('patients');
+
+DROP TRIGGER IF EXISTS appointments_collection_version ON appointments;
+CREATE TRIGGER appointments_collection_version
+  AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON appointments
+  FOR EACH STATEMENT EXECUTE FUNCTION bump_collection_version('appointments');
+
+DROP TRIGGER IF EXISTS users_collection_version ON users;
+CREATE TRIGGER users_collection_version
+  AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON users
+  FOR EACH STATEMENT EXECUTE FUNCTION bump_collection_version('users');
+
+-- Invalidation des caches des workers (LISTEN medisecure_invalidation): un message JSON compact par
+-- ligne modifiée, envoyé à la validation de la transaction: table, opération, id et, pour les rendez-vous,
+-- les mois concernés avant et après modification. TRUNCATE est notifié sans id (toute la table).
+CREATE OR REPLACE FUNCTION notify_cache_invalidation() RETURNS trigger AS $$
+DECLARE
+  row_id TEXT;
+  months TEXT[] := ARRAY[]::TEXT[];
+BEGIN
+  IF TG_OP = 'TRUNCATE' THEN
+    PERFORM pg_notify('medisecure_invalidation', json_build_object('t', TG_TABLE_NAME, 'op', 'T')::text);
+    RETURN NULL;
+  END IF;
+
+  IF TG_OP = 'DELETE' THEN
+    row_id := OLD.id::text;
+  ELSE
+    row_id := NEW.id::text;
+  END IF;
+
+  IF TG_TABLE_NAME = 'appointments' THEN
+    -- Tous les mois chevauchés par l'ancien et le nouveau créneau (calendrier par mois)
+    IF TG_OP <> 'INSERT' THEN
+      months := months || ARRAY(
+        SELECT to_char(m, 'YYYY-MM')
+        FROM generate_series(date_trunc('month', OLD.start_time),
+                             date_trunc('month', GREATEST(OLD.start_time, OLD.end_time)),
+                             interval '1 month') AS m);
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+      months := months || ARRAY(
+        SELECT to_char(m, 'YYYY-MM')
+        FROM generate_series(date_trunc('month', NEW.start_time),
+                             date_trunc('month', GREATEST(NEW.start_time, NEW.end_time)),
+                             interval '1 month') AS m);
+    END IF;
+    months := ARRAY(SELECT DISTINCT unnest(months));
+    PERFORM pg_notify('medisecure_invalidation',
+      json_build_object('t', TG_TABLE_NAME, 'op', left(TG_OP, 1), 'id', row_id, 'm', months)::text);
+  ELSE
+    PERFORM pg_notify('medisecure_invalidation',
+      json_build_object('t', TG_TABLE_NAME, 'op', left(TG_OP, 1), 'id', row_id)::text);
+  END IF;
+  RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS patients_cache_invalidation ON patients;
+CREATE TRIGGER patients_cache_invalidation
+  AFTER INSERT OR UPDATE OR DELETE ON patients
+  FOR EACH ROW EXECUTE FUNCTION notify_cache_invalidation();
+
+DROP TRIGGER IF EXISTS patients_cache_invalidation_truncate ON patients;
+CREATE TRIGGER patients_cache_invalidation_truncate
+  AFTER TRUNCATE ON patients
+  FOR EACH STATEMENT EXECUTE FUNCTION notify_cache_invalidation();
+
+DROP TRIGGER IF EXISTS appointments_cache_invalidation ON appointments;
+CREATE TRIGGER appointments_cache_invalidation
+  AFTER INSERT OR UPDATE OR DELETE ON appointments
+  FOR EACH ROW EXECUTE FUNCTION notify_cache_invalidation();
+
+DROP TRIGGER IF EXISTS appointments_cache_invalidation_truncate ON appointments;
+CREATE TRIGGER appointments_cache_invalidation_truncate
+  AFTER TRUNCATE ON appointments
+  FOR EACH STATEMENT EXECUTE FUNCTION notify_cache_invalidation();
+
+DROP TRIGGER IF EXISTS users_cache_invalidation ON users;
+CREATE TRIGGER users_cache_invalidation
+  AFTER INSERT OR UPDATE OR DELETE ON users
+  FOR EACH ROW EXECUTE FUNCTION notify_cache_invalidation();
+
+DROP TRIGGER IF EXISTS users_cache_invalidation_truncate ON users;
+CREATE TRIGGER users_cache_invalidation_truncate
+  AFTER TRUNCATE ON users
+  FOR EACH STATEMENT EXECUTE FUNCTION notify_cache_invalidation();
+
+-- Révocations faites par un autre worker: ajoutées à la liste de révocation en mémoire de chaque worker
+CREATE OR REPLACE FUNCTION notify_token_revocation() RETURNS trigger AS $$
+BEGIN
+  PERFORM pg_notify('medisecure_invalidation',
+    json_build_object('t', 'revoked_tokens', 'op', 'I', 'id', NEW.jti, 'exp', extract(epoch FROM NEW.expires_at))::text);
+  RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS revoked_tokens_invalidation ON revoked_tokens;
+CREATE TRIGGER revoked_tokens_invalidation
+  AFTER INSERT OR UPDATE ON revoked_tokens
+  FOR EACH ROW EXECUTE FUNCTION notify_token_revocation();
+
 -- Création de l'utilisateur admin
 INSERT INTO users (id, email, hashed_password, first_name, last_name, role, is_active, created_at, updated_at)
 VALUES (
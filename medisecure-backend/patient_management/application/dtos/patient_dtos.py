@@ -1,9 +1,12 @@
 # medisecure-backend/patient_management/application/dtos/patient_dtos.py
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterable
 from pydantic import BaseModel, EmailStr, Field, validator
 from datetime import date, datetime
 from uuid import UUID
 
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.entities.patient_summary import PatientSummary
+
 # DTOs pour la création et la mise à jour de patients
 class PatientCreateDTO(BaseModel):
     """DTO pour la création d'un patient"""
@@ -119,6 +122,22 @@ class PatientResponseDTO(BaseModel):
     
     class Config:
         orm_mode = True
+    
+    @classmethod
+    def from_entity(cls, patient: Patient) -> "PatientResponseDTO":
+        """
+        Construit le DTO sans validation à partir d'une entité issue de nos repositories.
+        
+        Args:
+            patient: L'entité patient (déjà validée par le domaine et la base)
+            
+        Returns:
+            PatientResponseDTO: Le DTO de réponse
+        """
+        return cls.construct(**{name: getattr(patient, name) for name in cls.__fields__})
+
+# Champs sélectionnables par le paramètre fields= (colonnes de même nom dans la table patients)
+PATIENT_RESPONSE_FIELDS = tuple(PatientResponseDTO.__fields__)
 
 class PatientListResponseDTO(BaseModel):
     """DTO pour la réponse avec une liste de patients"""
@@ -126,6 +145,81 @@ class PatientListResponseDTO(BaseModel):
     total: int
     skip: int
     limit: int
+    
+    @classmethod
+    def from_entities(cls, patients: Iterable[Patient], total: int, skip: int, limit: int) -> "PatientListResponseDTO":
+        """
+        Construit la page de réponse sans validation à partir d'entités issues de nos repositories.
+        
+        Args:
+            patients: Les entités patient de la page
+            total: Le nombre total de patients
+            skip: Le nombre de patients ignorés
+            limit: Le nombre maximum de patients retournés
+            
+        Returns:
+            PatientListResponseDTO: Le DTO de réponse
+        """
+        return cls.construct(
+            patients=[PatientResponseDTO.from_entity(patient) for patient in patients],
+            total=total,
+            skip=skip,
+            limit=limit
+        )
+
+class PatientSummaryDTO(BaseModel):
+    """DTO pour la réponse avec le résumé d'un patient (écrans de liste)"""
+    id: UUID
+    first_name: str
+    last_name: str
+    date_of_birth: date
+    gender: str
+    phone_number: Optional[str] = None
+    email: Optional[str] = None
+    insurance_id: Optional[str] = None
+    is_active: bool
+    updated_at: Optional[datetime] = None
+    
+    @classmethod
+    def from_summary(cls, summary: PatientSummary) -> "PatientSummaryDTO":
+        """
+        Construit le DTO sans validation à partir d'un résumé issu de nos repositories.
+        
+        Args:
+            summary: Le résumé du patient
+            
+        Returns:
+            PatientSummaryDTO: Le DTO de réponse
+        """
+        return cls.construct(**{name: getattr(summary, name) for name in cls.__fields__})
+
+class PatientSummaryListResponseDTO(BaseModel):
+    """DTO pour la réponse avec une liste de résumés de patients"""
+    patients: List[PatientSummaryDTO]
+    total: int
+    skip: int
+    limit: int
+    
+    @classmethod
+    def from_summaries(cls, summaries: Iterable[PatientSummary], total: int, skip: int, limit: int) -> "PatientSummaryListResponseDTO":
+        """
+        Construit la page de réponse sans validation à partir de résumés issus de nos repositories.
+        
+        Args:
+            summaries: Les résumés des patients de la page
+            total: Le nombre total de patients
+            skip: Le nombre de patients ignorés
+            limit: Le nombre maximum de patients retournés
+            
+        Returns:
+            PatientSummaryListResponseDTO: Le DTO de réponse
+        """
+        return cls.construct(
+            patients=[PatientSummaryDTO.from_summary(summary) for summary in summaries],
+            total=total,
+            skip=skip,
+            limit=limit
+        )
 
 # DTOs pour la recherche
 class PatientSearchDTO(BaseModel):
@@ -135,4 +229,18 @@ class PatientSearchDTO(BaseModel):
     email: Optional[EmailStr] = None
     phone: Optional[str] = None
     skip: int = 0
-    limit: int = 100
\ No newline at end of file
+    limit: int = 100
+
+# DTOs pour l'import en lot
+class PatientImportErrorDTO(BaseModel):
+    """DTO pour une ligne rejetée lors d'un import"""
+    row: int
+    email: Optional[str] = None
+    error: str
+
+class PatientImportReportDTO(BaseModel):
+    """DTO pour le rapport d'un import de patients"""
+    total: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: List[PatientImportErrorDTO] = []
@@ -1,4 +1,5 @@
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Dict, Any, Sequence, Awaitable, Callable, Hashable, TypeVar
 from uuid import UUID
 
 from patient_management.domain.entities.patient import Patient
@@ -6,6 +7,9 @@ from patient_management.domain.services.patient_service import PatientService
 from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
 from patient_management.domain.exceptions.patient_exceptions import PatientNotFoundException
 from patient_management.application.dtos.patient_dtos import PatientResponseDTO
+from shared.infrastructure.concurrency.single_flight import SingleFlight
+
+T = TypeVar("T")
 
 class GetPatientUseCase:
     """
@@ -16,7 +20,8 @@ class GetPatientUseCase:
     def __init__(
         self,
         patient_repository: PatientRepositoryProtocol,
-        patient_service: PatientService
+        patient_service: PatientService,
+        single_flight: Optional[SingleFlight] = None
     ):
         """
         Initialise le cas d'utilisation avec les dépendances nécessaires.
@@ -24,17 +29,21 @@ class GetPatientUseCase:
         Args:
             patient_repository: Le repository des patients
             patient_service: Le service du domaine pour les patients
+            single_flight: Le regroupement des lectures concurrentes d'un même dossier (aucun si absent)
         """
         self.patient_repository = patient_repository
         self.patient_service = patient_service
+        self.single_flight = single_flight
     
-    async def execute(self, patient_id: UUID, user_id: UUID) -> PatientResponseDTO:
+    async def execute(self, patient_id: UUID, user_id: UUID, version: Optional[datetime] = None) -> PatientResponseDTO:
         """
         Exécute le cas d'utilisation.
         
         Args:
             patient_id: L'ID du patient à récupérer
             user_id: L'ID de l'utilisateur qui demande l'accès
+            version: La date de modification connue du dossier (get_last_modified): seules les
+                lectures concurrentes de cette version sont partagées
             
         Returns:
             PatientResponseDTO: Le patient récupéré
@@ -44,7 +53,7 @@ class GetPatientUseCase:
             MissingPatientConsentException: Si le patient n'a pas donné son consentement
         """
         # Récupérer le patient
-        patient = await self.patient_repository.get_by_id(patient_id)
+        patient = await self._read(("patient", patient_id, version), lambda: self.patient_repository.get_by_id(patient_id))
         
         if not patient:
             raise PatientNotFoundException(patient_id)
@@ -53,29 +62,76 @@ class GetPatientUseCase:
         self.patient_service.check_access_permission(patient, user_id)
         
         # Convertir l'entité en DTO de réponse
-        return PatientResponseDTO(
-            id=patient.id,
-            first_name=patient.first_name,
-            last_name=patient.last_name,
-            date_of_birth=patient.date_of_birth,
-            gender=patient.gender,
-            address=patient.address,
-            city=patient.city,
-            postal_code=patient.postal_code,
-            country=patient.country,
-            phone_number=patient.phone_number,
-            email=patient.email,
-            blood_type=patient.blood_type,
-            allergies=patient.allergies,
-            chronic_diseases=patient.chronic_diseases,
-            current_medications=patient.current_medications,
-            has_consent=patient.has_consent,
-            gdpr_consent=patient.gdpr_consent,
-            consent_date=patient.consent_date,
-            insurance_provider=patient.insurance_provider,
-            insurance_id=patient.insurance_id,
-            notes=patient.notes,
-            created_at=patient.created_at,
-            updated_at=patient.updated_at,
-            is_active=patient.is_active
-        )
\ No newline at end of file
+        return PatientResponseDTO.from_entity(patient)
+    
+    async def execute_projected(
+        self,
+        patient_id: UUID,
+        user_id: UUID,
+        fields: Sequence[str],
+        version: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Exécute le cas d'utilisation en ne lisant que les champs demandés.
+        
+        Args:
+            patient_id: L'ID du patient à récupérer
+            user_id: L'ID de l'utilisateur qui demande l'accès
+            fields: Les champs à retourner (validés contre la liste autorisée)
+            version: La date de modification connue du dossier (voir execute)
+            
+        Returns:
+            Dict[str, Any]: Les champs demandés du patient
+            
+        Raises:
+            PatientNotFoundException: Si le patient n'est pas trouvé
+            MissingPatientConsentException: Si le patient n'a pas donné son consentement
+        """
+        # Le consentement est toujours lu pour le contrôle d'accès, même s'il n'est pas demandé
+        columns = tuple(fields) if "has_consent" in fields else (*fields, "has_consent")
+        data = await self._read(
+            ("patient", patient_id, columns, version),
+            lambda: self.patient_repository.get_projected_by_id(patient_id, columns)
+        )
+        
+        if data is None:
+            raise PatientNotFoundException(patient_id)
+        
+        self.patient_service.check_consent_permission(patient_id, data["has_consent"], user_id)
+        
+        return {name: data[name] for name in fields}
+
+    async def get_last_modified(self, patient_id: UUID, user_id: UUID) -> datetime:
+        """
+        Récupère la date de modification du dossier (ETag), après le contrôle d'accès,
+        sans lire le dossier complet.
+
+        Args:
+            patient_id: L'ID du patient
+            user_id: L'ID de l'utilisateur qui demande l'accès
+
+        Returns:
+            datetime: La date de la dernière modification du dossier
+
+        Raises:
+            PatientNotFoundException: Si le patient n'est pas trouvé
+            MissingPatientConsentException: Si le patient n'a pas donné son consentement
+        """
+        columns = ("created_at", "updated_at", "has_consent")
+        data = await self._read(
+            ("patient", patient_id, columns),
+            lambda: self.patient_repository.get_projected_by_id(patient_id, columns)
+        )
+        if data is None:
+            raise PatientNotFoundException(patient_id)
+        self.patient_service.check_consent_permission(patient_id, data["has_consent"], user_id)
+        return data["updated_at"] or data["created_at"]
+
+    async def _read(self, key: Hashable, read: Callable[[], Awaitable[T]]) -> T:
+        """
+        Lit le dossier, en partageant la lecture avec les requêtes concurrentes sur le même patient.
+        Le contrôle d'accès reste fait pour chaque utilisateur, sur le résultat partagé.
+        """
+        if self.single_flight is None:
+            return await read()
+        return await self.single_flight.do(key, read)
@@ -0,0 +1,193 @@
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple, Union
+import logging
+
+from pydantic import ValidationError
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.services.patient_service import PatientService
+from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
+from patient_management.domain.exceptions.patient_exceptions import PatientAlreadyExistsException
+from patient_management.application.dtos.patient_dtos import (
+    PatientCreateDTO,
+    PatientImportErrorDTO,
+    PatientImportReportDTO
+)
+from shared.domain.exceptions.shared_exceptions import DomainException
+from shared.ports.primary.id_generator_protocol import IdGeneratorProtocol
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+class ImportPatientsUseCase:
+    """
+    Cas d'utilisation pour l'import en lot de dossiers patients (onboarding d'une clinique).
+    Les lignes sont traitées par lots: validation du domaine ligne par ligne, une seule requête
+    de détection des doublons d'email et une seule écriture en base par lot.
+    """
+
+    def __init__(
+        self,
+        patient_repository: PatientRepositoryProtocol,
+        patient_service: PatientService,
+        id_generator: IdGeneratorProtocol
+    ):
+        """
+        Initialise le cas d'utilisation avec les dépendances nécessaires.
+
+        Args:
+            patient_repository: Le repository des patients
+            patient_service: Le service du domaine pour les patients
+            id_generator: Le générateur d'identifiants
+        """
+        self.patient_repository = patient_repository
+        self.patient_service = patient_service
+        self.id_generator = id_generator
+
+    async def execute(
+        self,
+        records: AsyncIterator[Union[Dict[str, Any], Exception]],
+        chunk_size: int = 500,
+        progress: Optional[Callable[[PatientImportReportDTO], None]] = None
+    ) -> PatientImportReportDTO:
+        """
+        Exécute le cas d'utilisation.
+
+        Args:
+            records: Les lignes à importer (champs de PatientCreateDTO), ou l'erreur de lecture
+                     des lignes illisibles
+            chunk_size: Le nombre de lignes traitées par lot
+            progress: Fonction appelée avec le rapport en cours après chaque lot
+
+        Returns:
+            PatientImportReportDTO: Le rapport d'import, avec l'erreur de chaque ligne rejetée
+        """
+        report = PatientImportReportDTO()
+        seen_emails: Set[str] = set()
+        chunk: List[Tuple[int, Any]] = []
+
+        async for record in records:
+            report.total += 1
+            chunk.append((report.total, record))
+            if len(chunk) >= chunk_size:
+                await self._import_chunk(chunk, report, seen_emails)
+                chunk = []
+                if progress:
+                    progress(report)
+
+        if chunk:
+            await self._import_chunk(chunk, report, seen_emails)
+            if progress:
+                progress(report)
+
+        # Les doublons en base sont détectés après la validation du lot: rétablir l'ordre du fichier
+        report.errors.sort(key=lambda error: error.row)
+        logger.info(f"Import de patients terminé: {report.imported} importés, {report.failed} rejetés sur {report.total}")
+        return report
+
+    async def _import_chunk(
+        self,
+        chunk: List[Tuple[int, Any]],
+        report: PatientImportReportDTO,
+        seen_emails: Set[str]
+    ) -> None:
+        """
+        Valide et enregistre un lot de lignes.
+
+        Args:
+            chunk: Les lignes du lot avec leur numéro
+            report: Le rapport d'import à compléter
+            seen_emails: Les emails déjà rencontrés dans le fichier
+        """
+        candidates: List[Tuple[int, Patient]] = []
+        for row, record in chunk:
+            if not isinstance(record, dict):
+                # Ligne illisible signalée par le lecteur du fichier (ou qui n'est pas un objet)
+                error = str(record) if isinstance(record, Exception) else "Ligne invalide: un objet est attendu"
+                self._reject(report, row, None, error)
+                continue
+            try:
+                patient = self._build_patient(record)
+            except ValidationError as e:
+                self._reject(report, row, record.get("email"), "; ".join(
+                    f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()
+                ))
+                continue
+            except (DomainException, ValueError, TypeError) as e:
+                self._reject(report, row, record.get("email"), str(e))
+                continue
+
+            if patient.email:
+                if patient.email in seen_emails:
+                    self._reject(report, row, patient.email, f"Email {patient.email} en double dans le fichier importé")
+                    continue
+                seen_emails.add(patient.email)
+            candidates.append((row, patient))
+
+        # Une seule requête pour tous les emails du lot
+        existing_emails = await self.patient_repository.find_existing_emails(
+            [patient.email for _, patient in candidates if patient.email]
+        )
+
+        accepted: List[Tuple[int, Patient]] = []
+        for row, patient in candidates:
+            if patient.email in existing_emails:
+                self._reject(report, row, patient.email, str(PatientAlreadyExistsException("email", patient.email)))
+            else:
+                accepted.append((row, patient))
+
+        try:
+            report.imported += await self.patient_repository.bulk_create([patient for _, patient in accepted])
+        except Exception as e:
+            logger.error(f"Échec de l'enregistrement d'un lot de {len(accepted)} patients: {str(e)}")
+            for row, patient in accepted:
+                self._reject(report, row, patient.email, f"Échec de l'enregistrement du lot: {str(e)}")
+
+    def _build_patient(self, record: Dict[str, Any]) -> Patient:
+        """
+        Valide une ligne et construit l'entité Patient, avec les mêmes règles que la création unitaire.
+
+        Args:
+            record: Les champs de la ligne
+
+        Returns:
+            Patient: Le patient à créer
+        """
+        data = PatientCreateDTO(**record)
+
+        self.patient_service.validate_patient_data(
+            data.first_name,
+            data.last_name,
+            data.date_of_birth,
+            data.gender
+        )
+
+        patient = Patient(
+            id=self.id_generator.generate_id(),
+            first_name=data.first_name,
+            last_name=data.last_name,
+            date_of_birth=data.date_of_birth,
+            gender=data.gender,
+            address=data.address,
+            city=data.city,
+            postal_code=data.postal_code,
+            country=data.country,
+            phone_number=data.phone_number,
+            email=data.email,
+            blood_type=data.blood_type,
+            allergies=data.allergies or {},
+            chronic_diseases=data.chronic_diseases or {},
+            current_medications=data.current_medications or {},
+            has_consent=data.has_consent,
+            gdpr_consent=data.gdpr_consent,
+            insurance_provider=data.insurance_provider,
+            insurance_id=data.insurance_id,
+            notes=data.notes
+        )
+
+        self.patient_service.check_consent_for_minor(patient, data.has_guardian_consent)
+        return patient
+
+    def _reject(self, report: PatientImportReportDTO, row: int, email: Optional[str], error: str) -> None:
+        """Enregistre une ligne rejetée dans le rapport"""
+        report.failed += 1
+        report.errors.append(PatientImportErrorDTO(row=row, email=email, error=error))
@@ -110,29 +110,4 @@ class UpdatePatientUseCase:
         updated_patient = await self.patient_repository.update(patient)
         
         # Convertir l'entité en DTO de réponse
-        return PatientResponseDTO(
-            id=updated_patient.id,
-            first_name=updated_patient.first_name,
-            last_name=updated_patient.last_name,
-            date_of_birth=updated_patient.date_of_birth,
-            gender=updated_patient.gender,
-            address=updated_patient.address,
-            city=updated_patient.city,
-            postal_code=updated_patient.postal_code,
-            country=updated_patient.country,
-            phone_number=updated_patient.phone_number,
-            email=updated_patient.email,
-            blood_type=updated_patient.blood_type,
-            allergies=updated_patient.allergies,
-            chronic_diseases=updated_patient.chronic_diseases,
-            current_medications=updated_patient.current_medications,
-            has_consent=updated_patient.has_consent,
-            gdpr_consent=updated_patient.gdpr_consent,
-            consent_date=updated_patient.consent_date,
-            insurance_provider=updated_patient.insurance_provider,
-            insurance_id=updated_patient.insurance_id,
-            notes=updated_patient.notes,
-            created_at=updated_patient.created_at,
-            updated_at=updated_patient.updated_at,
-            is_active=updated_patient.is_active
-        )
\ No newline at end of file
+        return PatientResponseDTO.from_entity(updated_patient)
\ No newline at end of file
@@ -0,0 +1,30 @@
+from dataclasses import dataclass, fields
+from datetime import date, datetime
+from typing import Optional
+from uuid import UUID
+
+@dataclass(frozen=True)
+class PatientSummary:
+    """
+    Modèle de lecture allégé d'un patient pour les écrans de liste.
+    Ne contient ni les informations médicales (colonnes JSONB) ni les notes:
+    le dossier complet reste l'entité Patient, chargée pour le détail d'un patient.
+    """
+    id: UUID
+    first_name: str
+    last_name: str
+    date_of_birth: date
+    gender: str
+    phone_number: Optional[str] = None
+    email: Optional[str] = None
+    insurance_id: Optional[str] = None
+    is_active: bool = True
+    updated_at: Optional[datetime] = None
+
+    @property
+    def full_name(self) -> str:
+        """Retourne le nom complet du patient"""
+        return f"{self.first_name} {self.last_name}"
+
+# Colonnes lues pour construire un résumé (mêmes noms que l'entité Patient et la table patients)
+PATIENT_SUMMARY_FIELDS = tuple(field.name for field in fields(PatientSummary))
@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List 
+from typing import Optional, List, Dict, Any, Sequence, AsyncIterator, Set
 from uuid import UUID
 from datetime import date
 
 from patient_management.domain.entities.patient import Patient
+from patient_management.domain.entities.patient_summary import PatientSummary
+from shared.domain.entities.paged_result import PagedResult
 
 class PatientRepositoryProtocol(ABC):
     """
@@ -124,4 +126,158 @@ class PatientRepositoryProtocol(ABC):
         Returns:
             int: Le nombre total de patients
         """
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    async def get_projected_by_id(self, patient_id: UUID, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        """
+        Récupère uniquement certains champs d'un patient (projection de colonnes).
+        
+        Args:
+            patient_id: L'ID du patient à récupérer
+            fields: Les champs de l'entité Patient à récupérer
+            
+        Returns:
+            Optional[Dict[str, Any]]: Les champs demandés, ou None si non trouvé
+        """
+        pass
+    
+    @abstractmethod
+    async def list_projected(self, fields: Sequence[str], skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Liste les patients avec pagination en ne récupérant que certains champs.
+        
+        Args:
+            fields: Les champs de l'entité Patient à récupérer
+            skip: Le nombre de patients à sauter
+            limit: Le nombre maximum de patients à retourner
+            
+        Returns:
+            List[Dict[str, Any]]: Les champs demandés de chaque patient
+        """
+        pass
+    
+    @abstractmethod
+    async def search_projected(
+        self,
+        fields: Sequence[str],
+        name: Optional[str] = None,
+        date_of_birth: Optional[date] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> PagedResult[Dict[str, Any]]:
+        """
+        Recherche des patients selon différents critères en ne récupérant que certains champs.
+        Le total porte sur tous les patients correspondant aux critères, pas seulement sur la page.
+        
+        Args:
+            fields: Les champs de l'entité Patient à récupérer
+            name: Le nom ou prénom du patient (recherche partielle)
+            date_of_birth: La date de naissance du patient
+            email: L'email du patient (recherche exacte)
+            phone: Le numéro de téléphone du patient (recherche partielle)
+            skip: Le nombre de patients à sauter
+            limit: Le nombre maximum de patients à retourner
+            
+        Returns:
+            PagedResult[Dict[str, Any]]: Les champs demandés de chaque patient de la page, et le total
+        """
+        pass
+    
+    @abstractmethod
+    async def list_summaries(self, skip: int = 0, limit: int = 100) -> List[PatientSummary]:
+        """
+        Liste les résumés des patients avec pagination (écrans de liste).
+        Seules les colonnes du résumé sont lues: ni informations médicales ni notes.
+        
+        Args:
+            skip: Le nombre de patients à sauter
+            limit: Le nombre maximum de patients à retourner
+            
+        Returns:
+            List[PatientSummary]: La liste des résumés de patients
+        """
+        pass
+    
+    @abstractmethod
+    async def search_summaries(
+        self,
+        name: Optional[str] = None,
+        date_of_birth: Optional[date] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> PagedResult[PatientSummary]:
+        """
+        Recherche des patients selon différents critères et retourne leurs résumés.
+        Le total porte sur tous les patients correspondant aux critères, pas seulement sur la page.
+        
+        Args:
+            name: Le nom ou prénom du patient (recherche partielle)
+            date_of_birth: La date de naissance du patient
+            email: L'email du patient (recherche exacte)
+            phone: Le numéro de téléphone du patient (recherche partielle)
+            skip: Le nombre de patients à sauter
+            limit: Le nombre maximum de patients à retourner
+            
+        Returns:
+            PagedResult[PatientSummary]: Les résumés des patients de la page, et le total
+        """
+        pass
+    
+    @abstractmethod
+    async def get_summaries_by_ids(self, patient_ids: Sequence[UUID]) -> List[PatientSummary]:
+        """
+        Récupère les résumés de plusieurs patients en une seule requête (id = ANY(:ids)),
+        par exemple pour les joindre à une liste de rendez-vous.
+        
+        Args:
+            patient_ids: Les IDs des patients à récupérer
+            
+        Returns:
+            List[PatientSummary]: Les résumés des patients trouvés (ordre non garanti)
+        """
+        pass
+    
+    @abstractmethod
+    def stream_projected(self, fields: Sequence[str], batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Parcourt les patients en flux pour un export, sans charger la table en mémoire.
+        
+        Args:
+            fields: Les champs de l'entité Patient à récupérer
+            batch_size: Le nombre de lignes lues à chaque aller-retour avec la base
+            
+        Yields:
+            Dict[str, Any]: Les champs demandés de chaque patient
+        """
+        pass
+    
+    @abstractmethod
+    async def find_existing_emails(self, emails: Sequence[str]) -> Set[str]:
+        """
+        Retourne, parmi une liste d'emails, ceux déjà utilisés par un patient (une seule requête).
+        
+        Args:
+            emails: Les emails à vérifier
+            
+        Returns:
+            Set[str]: Les emails déjà présents
+        """
+        pass
+    
+    @abstractmethod
+    async def bulk_create(self, patients: Sequence[Patient]) -> int:
+        """
+        Crée plusieurs patients en une seule opération et une seule transaction.
+        
+        Args:
+            patients: Les patients à créer (déjà validés)
+            
+        Returns:
+            int: Le nombre de patients créés
+        """
+        pass
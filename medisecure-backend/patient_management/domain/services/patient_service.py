@@ -74,13 +74,29 @@ class PatientService:
             patient: Le patient dont on veut accéder aux données
             user_id: L'ID de l'utilisateur qui demande l'accès
             
+        Raises:
+            MissingPatientConsentException: Si le patient n'a pas donné son consentement
+                pour l'accès à ses données
+        """
+        self.check_consent_permission(patient.id, patient.has_consent, user_id)
+    
+    def check_consent_permission(self, patient_id: UUID, has_consent: bool, user_id: UUID) -> None:
+        """
+        Vérifie l'accès aux données d'un patient à partir de son seul consentement,
+        pour les lectures partielles qui ne chargent pas l'entité complète.
+        
+        Args:
+            patient_id: L'ID du patient dont on veut accéder aux données
+            has_consent: Si le patient a donné son consentement
+            user_id: L'ID de l'utilisateur qui demande l'accès
+            
         Raises:
             MissingPatientConsentException: Si le patient n'a pas donné son consentement
                 pour l'accès à ses données
         """
         # Vérifier si le patient a donné son consentement
-        if not patient.has_consent:
-            raise MissingPatientConsentException(patient.id)
+        if not has_consent:
+            raise MissingPatientConsentException(patient_id)
         
         # Note: Ici, on pourrait ajouter d'autres vérifications, comme
         # vérifier si l'utilisateur est le médecin traitant du patient,
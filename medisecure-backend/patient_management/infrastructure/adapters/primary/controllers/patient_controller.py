@@ -1,22 +1,31 @@
 # medisecure-backend/patient_management/infrastructure/adapters/primary/controllers/patient_controller.py
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, status
 from datetime import date
 import logging
 
 from shared.services.authenticator.extract_token import extract_token_payload
-from shared.container.container import Container
+from shared.container.container import Container, close_session
+from shared.ports.secondary.collection_version_store_protocol import PATIENTS_COLLECTION
+from shared.infrastructure.http.etags import ConditionalGet
+from shared.infrastructure.http.responses import TrustedJSONResponse
+from shared.infrastructure.http.sparse_fields import sparse_fields
+from shared.infrastructure.http.streaming import export_response
 from patient_management.application.dtos.patient_dtos import (
     PatientCreateDTO,
     PatientUpdateDTO,
     PatientResponseDTO,
-    PatientListResponseDTO,
-    PatientSearchDTO
+    PatientSummaryListResponseDTO,
+    PatientSearchDTO,
+    PatientImportReportDTO,
+    PATIENT_RESPONSE_FIELDS
 )
 from patient_management.application.usecases.create_patient_folder_usercase import CreatePatientFolderUseCase
+from patient_management.application.usecases.import_patients_usecase import ImportPatientsUseCase
 from patient_management.application.usecases.update_patient_usecase import UpdatePatientUseCase
 from patient_management.application.usecases.get_patient_usecase import GetPatientUseCase
+from patient_management.infrastructure.adapters.primary.patient_import_reader import read_patient_records
 from patient_management.domain.exceptions.patient_exceptions import (
     PatientNotFoundException,
     PatientAlreadyExistsException,
@@ -53,11 +62,19 @@ def check_role_permission(role: str, allowed_roles: list) -> bool:
     return role_lower in allowed_roles_lower
 
 
-def get_container():
+async def get_container() -> AsyncIterator[Container]:
     """
-    Fournit le container d'injection de dépendances.
+    Fournit le container d'injection de dépendances de la requête.
+    Sa session est fermée après la réponse: la connexion est rendue au pool.
     """
-    return Container()
+    container = Container()
+    try:
+        yield container
+    finally:
+        await close_session(container)
+
+# Dépendance du paramètre fields= des routes de lecture
+patient_fields = sparse_fields(PATIENT_RESPONSE_FIELDS)
 
 @router.post("/", response_model=PatientResponseDTO, status_code=status.HTTP_201_CREATED)
 async def create_patient(
@@ -90,9 +107,6 @@ async def create_patient(
                 detail="You don't have permission to create patient folders"
             )
         
-        # Log des données reçues
-        logger.info(f"Création d'un nouveau patient avec les données: {data}")
-        
         # Créer le cas d'utilisation avec les dépendances nécessaires
         use_case = CreatePatientFolderUseCase(
             patient_repository=container.patient_repository(),
@@ -104,7 +118,7 @@ async def create_patient(
         try:
             result = await use_case.execute(data)
             logger.info(f"Patient créé avec succès: {result.id}")
-            return result
+            return TrustedJSONResponse(result, status_code=status.HTTP_201_CREATED)
         except Exception as e:
             logger.error(f"Erreur pendant l'exécution du cas d'utilisation: {str(e)}")
             raise
@@ -144,17 +158,115 @@ async def create_patient(
             detail=f"An unexpected error occurred: {str(e)}"
         )
 
+# Route déclarée avant /{patient_id} pour ne pas être interprétée comme un identifiant
+@router.get("/export")
+async def export_patients(
+    format: str = Query("ndjson", regex="^(ndjson|csv)$", description="Export format: ndjson or csv"),
+    fields: Optional[Tuple[str, ...]] = Depends(patient_fields),
+    token_payload: Dict[str, Any] = Depends(extract_token_payload),
+    container: Container = Depends(get_container)
+):
+    """
+    Exporte tous les patients en flux (NDJSON ou CSV), sans pagination.
+    Les lignes sont lues par un curseur côté serveur au rythme de l'envoi au client:
+    la mémoire utilisée est constante quelle que soit la taille de la table.
+    
+    Args:
+        format: Le format de l'export (ndjson ou csv)
+        fields: Les champs à exporter (tous si absent)
+        token_payload: Les informations du token JWT
+        container: Le container d'injection de dépendances
+        
+    Returns:
+        StreamingResponse: L'export en flux
+        
+    Raises:
+        HTTPException: Si l'utilisateur n'est pas administrateur
+    """
+    if token_payload.get("role", "").lower() != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only administrators can export patients"
+        )
+    
+    columns = fields or PATIENT_RESPONSE_FIELDS
+    rows = container.patient_repository().stream_projected(columns)
+    logger.info(f"Export des patients au format {format}")
+    return export_response(rows, columns, format, "patients")
+
+@router.post("/import", response_model=PatientImportReportDTO)
+async def import_patients(
+    request: Request,
+    format: str = Query("csv", regex="^(ndjson|csv)$", description="Import format: csv or ndjson"),
+    chunk_size: int = Query(500, ge=1, le=5000, description="Rows validated and inserted per batch"),
+    token_payload: Dict[str, Any] = Depends(extract_token_payload),
+    container: Container = Depends(get_container)
+):
+    """
+    Importe en lot des dossiers patients depuis le corps de la requête (CSV ou NDJSON).
+    Le fichier est lu au fil de l'eau et traité par lots: les lignes invalides sont rejetées
+    individuellement et listées dans le rapport, sans interrompre l'import des autres lignes.
+
+    Args:
+        request: La requête HTTP dont le corps contient le fichier
+        format: Le format du fichier (csv ou ndjson)
+        chunk_size: Le nombre de lignes traitées par lot
+        token_payload: Les informations du token JWT
+        container: Le container d'injection de dépendances
+
+    Returns:
+        PatientImportReportDTO: Le rapport d'import
+
+    Raises:
+        HTTPException: Si l'utilisateur n'est pas administrateur ou en cas d'erreur
+    """
+    if token_payload.get("role", "").lower() != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only administrators can import patients"
+        )
+
+    try:
+        use_case = ImportPatientsUseCase(
+            patient_repository=container.patient_repository(),
+            patient_service=container.patient_service(),
+            id_generator=container.id_generator()
+        )
+
+        def log_progress(report: PatientImportReportDTO) -> None:
+            logger.info(f"Import des patients: {report.total} lignes traitées, {report.imported} importées, {report.failed} rejetées")
+
+        report = await use_case.execute(
+            read_patient_records(request.stream(), format),
+            chunk_size=chunk_size,
+            progress=log_progress
+        )
+        return TrustedJSONResponse(report)
+
+    except Exception as e:
+        logger.exception(f"Erreur inattendue lors de l'import des patients: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
+
 @router.get("/{patient_id}", response_model=PatientResponseDTO)
 async def get_patient(
     patient_id: UUID = Path(..., description="The ID of the patient to get"),
+    fields: Optional[Tuple[str, ...]] = Depends(patient_fields),
+    conditional: ConditionalGet = Depends(),
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
     container: Container = Depends(get_container)
 ):
     """
     Récupère un patient par son ID.
+    Le dossier porte un ETag dérivé de sa date de modification: si le client a déjà cette version
+    (If-None-Match), la réponse est 304 sans lecture du dossier complet.
     
     Args:
         patient_id: L'ID du patient à récupérer
+        fields: Les champs à retourner (tous si absent)
+        conditional: La gestion de la requête conditionnelle
         token_payload: Les informations du token JWT
         container: Le container d'injection de dépendances
         
@@ -171,13 +283,24 @@ async def get_patient(
         # Créer le cas d'utilisation avec les dépendances nécessaires
         use_case = GetPatientUseCase(
             patient_repository=container.patient_repository(),
-            patient_service=container.patient_service()
+            patient_service=container.patient_service(),
+            single_flight=container.single_flight()
         )
         
-        # Exécuter le cas d'utilisation
-        result = await use_case.execute(patient_id, user_id)
+        # Version du dossier (contrôle d'accès compris), avant toute lecture complète
+        last_modified = await use_case.get_last_modified(patient_id, user_id)
+        etag = conditional.etag(last_modified)
+        not_modified = conditional.not_modified(etag)
+        if not_modified is not None:
+            return not_modified
+        
+        # Exécuter le cas d'utilisation (projection des colonnes si fields= est fourni)
+        if fields is not None:
+            return conditional.tag(TrustedJSONResponse(await use_case.execute_projected(patient_id, user_id, fields, last_modified)), etag)
         
-        return result
+        result = await use_case.execute(patient_id, user_id, last_modified)
+        
+        return conditional.tag(TrustedJSONResponse(result), etag)
     
     except PatientNotFoundException as e:
         logger.error(f"Patient non trouvé: {str(e)}")
@@ -233,9 +356,6 @@ async def update_patient(
                 detail="You don't have permission to update patient folders"
             )
         
-        # Log des données reçues
-        logger.info(f"Mise à jour du patient {patient_id} avec les données: {data}")
-        
         # Créer le cas d'utilisation avec les dépendances nécessaires
         use_case = UpdatePatientUseCase(
             patient_repository=container.patient_repository(),
@@ -246,7 +366,7 @@ async def update_patient(
         result = await use_case.execute(patient_id, data or PatientUpdateDTO())
         
         logger.info(f"Patient {patient_id} mis à jour avec succès")
-        return result
+        return TrustedJSONResponse(result)
     
     except PatientNotFoundException as e:
         logger.error(f"Patient non trouvé: {str(e)}")
@@ -332,14 +452,21 @@ async def delete_patient(
             detail=f"An unexpected error occurred: {str(e)}"
         )
 
-@router.get("/", response_model=PatientListResponseDTO)
+@router.get("/", response_model=PatientSummaryListResponseDTO)
 async def list_patients(
     skip: int = Query(0, description="Number of patients to skip"),
     limit: int = Query(100, description="Maximum number of patients to return"),
+    fields: Optional[Tuple[str, ...]] = Depends(patient_fields),
+    conditional: ConditionalGet = Depends(),
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
     container: Container = Depends(get_container)
 ):
-    """Liste tous les patients avec pagination."""
+    """
+    Liste les patients avec pagination.
+    Retourne par défaut les résumés des patients (sans informations médicales);
+    le paramètre fields= permet de choisir d'autres colonnes du dossier.
+    La page porte un ETag dérivé de la version de la collection des patients.
+    """
     try:
         # Vérification des permissions
         user_role = token_payload.get("role", "").lower()  # Get role and convert to lowercase
@@ -354,11 +481,25 @@ async def list_patients(
                 detail="You don't have permission to list patients"
             )
         
-        # Récupération des patients
+        # Version de la collection: 304 sans lire la page si le client l'a déjà
+        etag = await conditional.collection_etag(container.collection_version_store(), (PATIENTS_COLLECTION,))
+        not_modified = conditional.not_modified(etag)
+        if not_modified is not None:
+            return not_modified
+        
+        # Récupération des patients: une seule lecture pour les requêtes concurrentes de la même
+        # page à la même version (ouverture des cabinets)
         patient_repository = container.patient_repository()
+        
+        async def read_page():
+            if fields is not None:
+                page = await patient_repository.list_projected(fields, skip, limit)
+            else:
+                page = await patient_repository.list_summaries(skip, limit)
+            return page, await patient_repository.count()
+        
         try:
-            patients = await patient_repository.list_all(skip, limit)
-            total = await patient_repository.count()
+            page, total = await container.single_flight().do(("patients", etag, skip, limit, fields), read_page)
         except Exception as e:
             logger.error(f"Database error: {str(e)}")
             raise HTTPException(
@@ -366,43 +507,14 @@ async def list_patients(
                 detail="Database error occurred"
             )
         
-        # Conversion en DTOs
-        patient_dtos = [
-            PatientResponseDTO(
-                id=patient.id,
-                first_name=patient.first_name,
-                last_name=patient.last_name,
-                date_of_birth=patient.date_of_birth,
-                gender=patient.gender,
-                address=patient.address,
-                city=patient.city,
-                postal_code=patient.postal_code,
-                country=patient.country,
-                phone_number=patient.phone_number,
-                email=patient.email,
-                blood_type=patient.blood_type,
-                allergies=patient.allergies,
-                chronic_diseases=patient.chronic_diseases,
-                current_medications=patient.current_medications,
-                has_consent=patient.has_consent,
-                gdpr_consent=patient.gdpr_consent,
-                consent_date=patient.consent_date,
-                insurance_provider=patient.insurance_provider,
-                insurance_id=patient.insurance_id,
-                notes=patient.notes,
-                created_at=patient.created_at,
-                updated_at=patient.updated_at,
-                is_active=patient.is_active
-            )
-            for patient in patients
-        ]
-        
-        # Construction de la réponse
-        return PatientListResponseDTO(
-            patients=patient_dtos,
-            total=total,
-            skip=skip,
-            limit=limit
+        if fields is not None:
+            return conditional.tag(TrustedJSONResponse({"patients": page, "total": total, "skip": skip, "limit": limit}), etag)
+        
+        # Conversion en DTOs (données de nos repositories: construites sans validation,
+        # et la réponse n'est pas revalidée contre le response_model)
+        return conditional.tag(
+            TrustedJSONResponse(PatientSummaryListResponseDTO.from_summaries(page, total, skip, limit)),
+            etag
         )
     
     except Exception as e:
@@ -412,13 +524,17 @@ async def list_patients(
             detail=f"An unexpected error occurred: {str(e)}"
         )
 
-@router.post("/search", response_model=PatientListResponseDTO)
+@router.post("/search", response_model=PatientSummaryListResponseDTO)
 async def search_patients(
     search_criteria: PatientSearchDTO,
+    fields: Optional[Tuple[str, ...]] = Depends(patient_fields),
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
     container: Container = Depends(get_container)
 ):
-    """Recherche des patients selon différents critères."""
+    """
+    Recherche des patients selon différents critères.
+    Retourne par défaut les résumés des patients; voir fields= pour d'autres colonnes.
+    """
     try:
         # Vérification des permissions
         user_role = token_payload.get("role", "").lower()
@@ -432,7 +548,7 @@ async def search_patients(
         
         # Recherche des patients
         patient_repository = container.patient_repository()
-        patients = await patient_repository.search(
+        criteria = dict(
             name=search_criteria.name,
             date_of_birth=search_criteria.date_of_birth,
             email=search_criteria.email,
@@ -441,46 +557,22 @@ async def search_patients(
             limit=search_criteria.limit
         )
         
-        # Compte approximatif pour la pagination
-        total = len(patients)
-        
-        # Conversion en DTOs
-        patient_dtos = [
-            PatientResponseDTO(
-                id=patient.id,
-                first_name=patient.first_name,
-                last_name=patient.last_name,
-                date_of_birth=patient.date_of_birth,
-                gender=patient.gender,
-                address=patient.address,
-                city=patient.city,
-                postal_code=patient.postal_code,
-                country=patient.country,
-                phone_number=patient.phone_number,
-                email=patient.email,
-                blood_type=patient.blood_type,
-                allergies=patient.allergies,
-                chronic_diseases=patient.chronic_diseases,
-                current_medications=patient.current_medications,
-                has_consent=patient.has_consent,
-                gdpr_consent=patient.gdpr_consent,
-                consent_date=patient.consent_date,
-                insurance_provider=patient.insurance_provider,
-                insurance_id=patient.insurance_id,
-                notes=patient.notes,
-                created_at=patient.created_at,
-                updated_at=patient.updated_at,
-                is_active=patient.is_active
-            )
-            for patient in patients
-        ]
-        
-        # Construction de la réponse
-        return PatientListResponseDTO(
-            patients=patient_dtos,
-            total=total,
-            skip=search_criteria.skip,
-            limit=search_criteria.limit
+        if fields is not None:
+            page = await patient_repository.search_projected(fields, **criteria)
+            return TrustedJSONResponse({
+                "patients": page.items,
+                "total": page.total,
+                "skip": search_criteria.skip,
+                "limit": search_criteria.limit
+            })
+        
+        # Page de résumés et nombre total de patients correspondant aux critères (une seule requête)
+        page = await patient_repository.search_summaries(**criteria)
+        
+        # Conversion en DTOs (données de nos repositories: construites sans validation,
+        # et la réponse n'est pas revalidée contre le response_model)
+        return TrustedJSONResponse(
+            PatientSummaryListResponseDTO.from_summaries(page.items, page.total, search_criteria.skip, search_criteria.limit)
         )
     
     except Exception as e:
@@ -0,0 +1,64 @@
+import argparse
+import asyncio
+import os
+
+from shared.adapters.primary.uuid_generator import UuidGenerator
+from shared.infrastructure.database.connection import SessionLocal
+from patient_management.application.dtos.patient_dtos import PatientImportReportDTO
+from patient_management.application.usecases.import_patients_usecase import ImportPatientsUseCase
+from patient_management.domain.services.patient_service import PatientService
+from patient_management.infrastructure.adapters.primary.patient_import_reader import (
+    IMPORT_FORMATS,
+    iterate_bytes,
+    read_patient_records
+)
+from patient_management.infrastructure.adapters.secondary.postgres_patient_repository import PostgresPatientRepository
+
+# Taille des morceaux lus dans le fichier d'import
+READ_SIZE = 64 * 1024
+
+def print_progress(report: PatientImportReportDTO) -> None:
+    """Affiche l'avancement de l'import après chaque lot"""
+    print(f"{report.total} lignes traitées: {report.imported} importées, {report.failed} rejetées", flush=True)
+
+async def import_file(path: str, import_format: str, chunk_size: int) -> PatientImportReportDTO:
+    """
+    Importe un fichier de patients dans la base de données.
+
+    Args:
+        path: Le chemin du fichier
+        import_format: Le format du fichier (csv ou ndjson)
+        chunk_size: Le nombre de lignes traitées par lot
+
+    Returns:
+        PatientImportReportDTO: Le rapport d'import
+    """
+    async with SessionLocal() as session:
+        use_case = ImportPatientsUseCase(
+            patient_repository=PostgresPatientRepository(session),
+            patient_service=PatientService(),
+            id_generator=UuidGenerator()
+        )
+        with open(path, "rb") as import_file:
+            chunks = iterate_bytes(iter(lambda: import_file.read(READ_SIZE), b""))
+            return await use_case.execute(
+                read_patient_records(chunks, import_format),
+                chunk_size=chunk_size,
+                progress=print_progress
+            )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Importe en lot des dossiers patients (CSV ou NDJSON)")
+    parser.add_argument("path", help="Fichier à importer")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, help="Format du fichier (déduit de l'extension si absent)")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Nombre de lignes validées et insérées par lot")
+    args = parser.parse_args()
+
+    import_format = args.format or os.path.splitext(args.path)[1].lstrip(".").lower()
+    if import_format not in IMPORT_FORMATS:
+        parser.error("format du fichier inconnu, préciser --format csv ou --format ndjson")
+
+    report = asyncio.run(import_file(args.path, import_format, args.chunk_size))
+    for error in report.errors:
+        print(f"Ligne {error.row} ({error.email or '-'}): {error.error}")
+    print(f"Import terminé: {report.imported} patients importés, {report.failed} lignes rejetées sur {report.total}")
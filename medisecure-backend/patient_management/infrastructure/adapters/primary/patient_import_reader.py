@@ -0,0 +1,109 @@
+import csv
+from typing import Any, AsyncIterator, Dict, Iterable, Union
+
+import orjson
+
+# Colonnes JSON encodées en texte dans un fichier CSV (même format que l'export)
+JSON_COLUMNS = frozenset({"allergies", "chronic_diseases", "current_medications"})
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+UTF8_BOM = b"\xef\xbb\xbf"
+
+async def iterate_bytes(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    """Adapte un itérateur synchrone de morceaux (fichier ouvert en binaire) en itérateur asynchrone"""
+    for chunk in chunks:
+        yield chunk
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Découpe un flux d'octets en lignes décodées en UTF-8, sans charger le fichier en mémoire.
+    Un saut de ligne ne pouvant pas apparaître au milieu d'un caractère UTF-8 multi-octets,
+    le découpage se fait sur les octets avant décodage.
+    """
+    pending = b""
+    first_line = True
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if first_line:
+                line = _strip_bom(line)
+                first_line = False
+            yield line.decode("utf-8").rstrip("\r")
+    if pending:
+        yield (_strip_bom(pending) if first_line else pending).decode("utf-8").rstrip("\r")
+
+def _strip_bom(line: bytes) -> bytes:
+    """Retire la marque d'ordre des octets UTF-8 ajoutée par certains tableurs en début de fichier"""
+    return line[len(UTF8_BOM):] if line.startswith(UTF8_BOM) else line
+
+async def _ndjson_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Union[Dict[str, Any], Exception]]:
+    async for line in _lines(chunks):
+        if not line.strip():
+            continue
+        try:
+            yield orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            yield ValueError(f"Ligne JSON invalide: {str(e)}")
+
+def _csv_record(header, cells) -> Union[Dict[str, Any], Exception]:
+    """Convertit une ligne CSV en enregistrement (cellules vides omises, colonnes JSON décodées)"""
+    if len(cells) != len(header):
+        return ValueError(f"Ligne CSV invalide: {len(cells)} colonnes au lieu de {len(header)}")
+    record = {}
+    for name, value in zip(header, cells):
+        if value == "":
+            continue
+        if name in JSON_COLUMNS:
+            try:
+                value = orjson.loads(value)
+            except orjson.JSONDecodeError:
+                return ValueError(f"Colonne {name}: JSON invalide")
+        record[name] = value
+    return record
+
+async def _csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Union[Dict[str, Any], Exception]]:
+    header = None
+    pending = ""
+    async for line in _lines(chunks):
+        pending = f"{pending}\n{line}" if pending else line
+        # Un champ entre guillemets peut contenir des sauts de ligne: la ligne CSV n'est complète
+        # que lorsque le nombre de guillemets est pair (les guillemets échappés sont doublés)
+        if pending.count('"') % 2:
+            continue
+        cells = next(csv.reader([pending]), [])
+        pending = ""
+        if not any(cells):
+            continue
+        if header is None:
+            header = [name.strip() for name in cells]
+            continue
+        yield _csv_record(header, cells)
+    if pending:
+        yield ValueError("Ligne CSV invalide: guillemet non fermé en fin de fichier")
+
+def read_patient_records(
+    chunks: AsyncIterator[bytes],
+    import_format: str
+) -> AsyncIterator[Union[Dict[str, Any], Exception]]:
+    """
+    Lit un fichier d'import de patients au fil de l'eau.
+    Les lignes illisibles sont retournées sous forme d'exception pour figurer dans le rapport
+    d'import sans interrompre la lecture.
+
+    Args:
+        chunks: Le contenu du fichier, morceau par morceau
+        import_format: "csv" (ligne d'en-tête avec les noms de champs) ou "ndjson"
+
+    Returns:
+        AsyncIterator: Les enregistrements du fichier (champs de PatientCreateDTO)
+
+    Raises:
+        ValueError: Si le format n'est pas pris en charge
+    """
+    if import_format == "csv":
+        return _csv_records(chunks)
+    if import_format == "ndjson":
+        return _ndjson_records(chunks)
+    raise ValueError(f"Format d'import non pris en charge: {import_format}")
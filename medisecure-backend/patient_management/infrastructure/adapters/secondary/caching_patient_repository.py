@@ -0,0 +1,280 @@
+# medisecure-backend/patient_management/infrastructure/adapters/secondary/caching_patient_repository.py
+from typing import Optional, List, Dict, Any, Sequence, AsyncIterator, Set
+from uuid import UUID
+from datetime import date, datetime
+import logging
+
+import orjson
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.entities.patient_summary import PatientSummary
+from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
+from shared.domain.entities.paged_result import PagedResult
+from shared.infrastructure.cache.cache_generations import CacheGenerations
+from shared.infrastructure.cache.cache_stats import CacheStats
+from shared.ports.secondary.cache_backend_protocol import CacheBackendProtocol
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Champs datetime de l'entité Patient (chaînes ISO 8601 une fois sérialisés)
+_DATETIME_FIELDS = ("consent_date", "created_at", "updated_at")
+
+def patient_cache_key(patient_id: Any) -> str:
+    """Retourne la clé de cache du dossier d'un patient (UUID ou sa forme textuelle)"""
+    return f"patient:id:{patient_id}"
+
+class CachingPatientRepository(PatientRepositoryProtocol):
+    """
+    Adaptateur secondaire ajoutant un cache de lecture à un repository des patients.
+    Implémente le port PatientRepositoryProtocol en déléguant au repository encapsulé.
+
+    Les dossiers lus par ID (get_by_id, get_projected_by_id) ou par email sont conservés,
+    sérialisés, dans le backend de cache; l'email est associé à l'ID du dossier. Les écritures
+    faites par ce repository invalident les entrées concernées; celles d'un autre processus le sont
+    par les notifications de la base (InvalidationListener), au plus tard à l'expiration de l'entrée.
+    Une lecture manquée ne remplit pas le cache si l'entrée a été invalidée pendant la lecture
+    de la base de données (CacheGenerations).
+    Les listes et recherches ne sont pas mises en cache. Une panne du backend est journalisée et contournée.
+    """
+
+    def __init__(
+        self,
+        repository: PatientRepositoryProtocol,
+        backend: CacheBackendProtocol,
+        ttl_seconds: float = 30.0,
+        stats: Optional[CacheStats] = None,
+        generations: Optional[CacheGenerations] = None
+    ):
+        """
+        Initialise le repository avec le repository encapsulé et le backend de cache.
+
+        Args:
+            repository: Le repository des patients interrogé en cas d'absence dans le cache
+            backend: Le backend de cache (en mémoire du processus ou serveur Redis)
+            ttl_seconds: La durée de vie d'une entrée en secondes
+            stats: Les compteurs du cache (partagés par le processus)
+            generations: Les générations des entrées (partagées par le processus)
+        """
+        self.repository = repository
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.stats = stats if stats is not None else CacheStats()
+        self.generations = generations if generations is not None else CacheGenerations()
+
+    async def get_by_id(self, patient_id: UUID) -> Optional[Patient]:
+        """
+        Récupère un patient par son ID, depuis le cache si possible.
+
+        Args:
+            patient_id: L'ID du patient à récupérer
+
+        Returns:
+            Optional[Patient]: Le patient trouvé ou None si non trouvé
+        """
+        key = patient_cache_key(patient_id)
+        patient = await self._read(key)
+        if patient is not None:
+            self.stats.hits += 1
+            return patient
+
+        self.stats.misses += 1
+        generation = self.generations.get(key)
+        patient = await self.repository.get_by_id(patient_id)
+        if patient is not None and self.generations.get(key) == generation:
+            await self._write(patient)
+        return patient
+
+    async def get_by_email(self, email: str) -> Optional[Patient]:
+        """
+        Récupère un patient par son email, depuis le cache si possible.
+        L'entrée de l'email ne contient que l'ID: le dossier est lu par get_by_id, et
+        ignoré si son email a changé depuis.
+
+        Args:
+            email: L'email du patient à récupérer
+
+        Returns:
+            Optional[Patient]: Le patient trouvé ou None si non trouvé
+        """
+        cached_id = await self._backend_get(self._email_key(email))
+        if cached_id is not None:
+            patient = await self.get_by_id(UUID(cached_id.decode("ascii")))
+            if patient is not None and patient.email == email:
+                return patient
+
+        # L'ID du dossier n'est connu qu'après la lecture: toute invalidation l'empêche d'être mis en cache
+        bumps = self.generations.bumps
+        patient = await self.repository.get_by_email(email)
+        if patient is not None and self.generations.bumps == bumps:
+            await self._write(patient)
+        return patient
+
+    async def create(self, patient: Patient) -> Patient:
+        """Crée un patient (aucune entrée à invalider: les absences ne sont pas mises en cache)"""
+        return await self.repository.create(patient)
+
+    async def update(self, patient: Patient) -> Patient:
+        """
+        Met à jour un patient et invalide ses entrées dans le cache.
+
+        Args:
+            patient: Le patient à mettre à jour
+
+        Returns:
+            Patient: Le patient mis à jour
+        """
+        updated_patient = await self.repository.update(patient)
+        await self._invalidate(patient.id, patient.email)
+        return updated_patient
+
+    async def delete(self, patient_id: UUID) -> bool:
+        """
+        Supprime un patient et invalide son entrée dans le cache.
+
+        Args:
+            patient_id: L'ID du patient à supprimer
+
+        Returns:
+            bool: True si le patient a été supprimé, False sinon
+        """
+        deleted = await self.repository.delete(patient_id)
+        await self._invalidate(patient_id)
+        return deleted
+
+    async def get_projected_by_id(self, patient_id: UUID, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        """
+        Récupère certains champs d'un patient, extraits du dossier en cache.
+        En cas d'absence, le dossier complet est lu et mis en cache: les vérifications
+        d'existence répétées (rendez-vous d'un patient) sont ensuite servies par le cache.
+
+        Args:
+            patient_id: L'ID du patient à récupérer
+            fields: Les champs de l'entité Patient à récupérer
+
+        Returns:
+            Optional[Dict[str, Any]]: Les champs demandés, ou None si non trouvé
+        """
+        patient = await self.get_by_id(patient_id)
+        if patient is None:
+            return None
+        return {name: getattr(patient, name) for name in fields}
+
+    async def list_all(self, skip: int = 0, limit: int = 100) -> List[Patient]:
+        return await self.repository.list_all(skip, limit)
+
+    async def search(
+        self,
+        name: Optional[str] = None,
+        date_of_birth: Optional[date] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Patient]:
+        return await self.repository.search(name, date_of_birth, email, phone, skip, limit)
+
+    async def count(self) -> int:
+        return await self.repository.count()
+
+    async def list_projected(self, fields: Sequence[str], skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        return await self.repository.list_projected(fields, skip, limit)
+
+    async def search_projected(
+        self,
+        fields: Sequence[str],
+        name: Optional[str] = None,
+        date_of_birth: Optional[date] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> PagedResult[Dict[str, Any]]:
+        return await self.repository.search_projected(fields, name, date_of_birth, email, phone, skip, limit)
+
+    async def list_summaries(self, skip: int = 0, limit: int = 100) -> List[PatientSummary]:
+        return await self.repository.list_summaries(skip, limit)
+
+    async def search_summaries(
+        self,
+        name: Optional[str] = None,
+        date_of_birth: Optional[date] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> PagedResult[PatientSummary]:
+        return await self.repository.search_summaries(name, date_of_birth, email, phone, skip, limit)
+
+    async def get_summaries_by_ids(self, patient_ids: Sequence[UUID]) -> List[PatientSummary]:
+        return await self.repository.get_summaries_by_ids(patient_ids)
+
+    def stream_projected(self, fields: Sequence[str], batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        return self.repository.stream_projected(fields, batch_size)
+
+    async def find_existing_emails(self, emails: Sequence[str]) -> Set[str]:
+        return await self.repository.find_existing_emails(emails)
+
+    async def bulk_create(self, patients: Sequence[Patient]) -> int:
+        return await self.repository.bulk_create(patients)
+
+    @staticmethod
+    def _email_key(email: str) -> str:
+        return f"patient:email:{email}"
+
+    async def _read(self, key: str) -> Optional[Patient]:
+        """Lit et désérialise un dossier du cache (None si absent ou illisible)"""
+        value = await self._backend_get(key)
+        if value is None:
+            return None
+        try:
+            return self._decode(value)
+        except (ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Entrée de cache illisible ignorée ({key}): {str(e)}")
+            return None
+
+    async def _write(self, patient: Patient) -> None:
+        """Met en cache un dossier, et l'association de son email à son ID"""
+        try:
+            await self.backend.set(patient_cache_key(patient.id), orjson.dumps(patient), self.ttl_seconds)
+            if patient.email:
+                await self.backend.set(self._email_key(patient.email), str(patient.id).encode("ascii"), self.ttl_seconds)
+        except Exception as e:
+            self._backend_failed("écriture", e)
+        self.stats.evictions = self.backend.evictions
+
+    async def _invalidate(self, patient_id: UUID, email: Optional[str] = None) -> None:
+        """Supprime les entrées d'un dossier après une écriture"""
+        keys = [patient_cache_key(patient_id)]
+        if email:
+            keys.append(self._email_key(email))
+        # Avant la suppression: une lecture en cours ne remettra pas l'ancienne version en cache
+        for key in keys:
+            self.generations.bump(key)
+        try:
+            await self.backend.delete(*keys)
+            self.stats.invalidations += 1
+        except Exception as e:
+            self._backend_failed("invalidation", e)
+
+    async def _backend_get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self.backend.get(key)
+        except Exception as e:
+            self._backend_failed("lecture", e)
+            return None
+
+    def _backend_failed(self, operation: str, error: Exception) -> None:
+        self.stats.errors += 1
+        logger.warning(f"Cache des patients indisponible ({operation}), accès direct au repository: {str(error)}")
+
+    @staticmethod
+    def _decode(value: bytes) -> Patient:
+        """Reconstruit l'entité Patient sérialisée par orjson (UUID et dates en chaînes ISO 8601)"""
+        data = orjson.loads(value)
+        data["id"] = UUID(data["id"])
+        data["date_of_birth"] = date.fromisoformat(data["date_of_birth"])
+        for name in _DATETIME_FIELDS:
+            if data.get(name) is not None:
+                data[name] = datetime.fromisoformat(data[name])
+        return Patient(**data)
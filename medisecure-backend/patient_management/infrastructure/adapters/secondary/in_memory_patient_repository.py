@@ -1,10 +1,12 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence, AsyncIterator, Set
 from uuid import UUID
 from datetime import date
 from copy import deepcopy
 
 from patient_management.domain.entities.patient import Patient
+from patient_management.domain.entities.patient_summary import PatientSummary, PATIENT_SUMMARY_FIELDS
 from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
+from shared.domain.entities.paged_result import PagedResult
 
 class InMemoryPatientRepository(PatientRepositoryProtocol):
     """
@@ -207,4 +209,166 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
         Returns:
             int: Le nombre total de patients
         """
-        return len(self.patients)
\ No newline at end of file
+        return len(self.patients)
+    
+    async def get_projected_by_id(self, patient_id: UUID, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        """
+        Récupère uniquement certains champs d'un patient.
+        
+        Args:
+            patient_id: L'ID du patient à récupérer
+            fields: Les champs de l'entité Patient à récupérer
+            
+        Returns:
+            Optional[Dict[str, Any]]: Les champs demandés, ou None si non trouvé
+        """
+        patient = self.patients.get(patient_id)
+        if patient:
+            return self._project(patient, fields)
+        return None
+    
+    async def list_projected(self, fields: Sequence[str], skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Liste les patients avec pagination en ne récupérant que certains champs.
+        
+        Args:
+            fields: Les champs de l'entité Patient à récupérer
+            skip: Le nombre de patients à sauter
+            limit: Le nombre maximum de patients à retourner
+            
+        Returns:
+            List[Dict[str, Any]]: Les champs demandés de chaque patient
+        """
+        return [self._project(patient, fields) for patient in await self.list_all(skip, limit)]
+    
+    async def search_projected(
+        self,
+        fields: Sequence[str],
+        name: Optional[str] = None,
+        date_of_birth: Optional[date] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> PagedResult[Dict[str, Any]]:
+        """
+        Recherche des patients selon différents critères en ne récupérant que certains champs.
+        
+        Args:
+            fields: Les champs de l'entité Patient à récupérer
+            name: Le nom ou prénom du patient (recherche partielle)
+            date_of_birth: La date de naissance du patient
+            email: L'email du patient (recherche exacte)
+            phone: Le numéro de téléphone du patient (recherche partielle)
+            skip: Le nombre de patients à sauter
+            limit: Le nombre maximum de patients à retourner
+            
+        Returns:
+            PagedResult[Dict[str, Any]]: Les champs demandés de chaque patient de la page, et le total
+        """
+        matches = await self.search(name, date_of_birth, email, phone, 0, len(self.patients))
+        return PagedResult(
+            items=[self._project(patient, fields) for patient in matches[skip:skip + limit]],
+            total=len(matches)
+        )
+    
+    async def list_summaries(self, skip: int = 0, limit: int = 100) -> List[PatientSummary]:
+        """
+        Liste les résumés des patients avec pagination (écrans de liste).
+        Seules les colonnes du résumé sont lues: ni informations médicales ni notes.
+        
+        Args:
+            skip: Le nombre de patients à sauter
+            limit: Le nombre maximum de patients à retourner
+            
+        Returns:
+            List[PatientSummary]: La liste des résumés de patients
+        """
+        rows = await self.list_projected(PATIENT_SUMMARY_FIELDS, skip, limit)
+        return [PatientSummary(**row) for row in rows]
+    
+    async def search_summaries(
+        self,
+        name: Optional[str] = None,
+        date_of_birth: Optional[date] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> PagedResult[PatientSummary]:
+        """
+        Recherche des patients selon différents critères et retourne leurs résumés.
+        
+        Args:
+            name: Le nom ou prénom du patient (recherche partielle)
+            date_of_birth: La date de naissance du patient
+            email: L'email du patient (recherche exacte)
+            phone: Le numéro de téléphone du patient (recherche partielle)
+            skip: Le nombre de patients à sauter
+            limit: Le nombre maximum de patients à retourner
+            
+        Returns:
+            PagedResult[PatientSummary]: Les résumés des patients de la page, et le total
+        """
+        page = await self.search_projected(PATIENT_SUMMARY_FIELDS, name, date_of_birth, email, phone, skip, limit)
+        return PagedResult(items=[PatientSummary(**row) for row in page.items], total=page.total)
+    
+    async def get_summaries_by_ids(self, patient_ids: Sequence[UUID]) -> List[PatientSummary]:
+        """
+        Récupère les résumés de plusieurs patients en une seule requête (id = ANY(:ids)),
+        par exemple pour les joindre à une liste de rendez-vous.
+        
+        Args:
+            patient_ids: Les IDs des patients à récupérer
+            
+        Returns:
+            List[PatientSummary]: Les résumés des patients trouvés (ordre non garanti)
+        """
+        return [
+            PatientSummary(**self._project(self.patients[patient_id], PATIENT_SUMMARY_FIELDS))
+            for patient_id in set(patient_ids) if patient_id in self.patients
+        ]
+    
+    async def stream_projected(self, fields: Sequence[str], batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Parcourt les patients un par un pour un export.
+        
+        Args:
+            fields: Les champs de l'entité Patient à récupérer
+            batch_size: Le nombre de lignes lues à chaque aller-retour avec la base
+            
+        Yields:
+            Dict[str, Any]: Les champs demandés de chaque patient
+        """
+        for patient in list(self.patients.values()):
+            yield self._project(patient, fields)
+    
+    async def find_existing_emails(self, emails: Sequence[str]) -> Set[str]:
+        """
+        Retourne, parmi une liste d'emails, ceux déjà utilisés par un patient.
+        
+        Args:
+            emails: Les emails à vérifier
+            
+        Returns:
+            Set[str]: Les emails déjà présents
+        """
+        return {email for email in emails if email in self.email_index}
+    
+    async def bulk_create(self, patients: Sequence[Patient]) -> int:
+        """
+        Crée plusieurs patients.
+        
+        Args:
+            patients: Les patients à créer (déjà validés)
+            
+        Returns:
+            int: Le nombre de patients créés
+        """
+        for patient in patients:
+            await self.create(patient)
+        return len(patients)
+    
+    def _project(self, patient: Patient, fields: Sequence[str]) -> Dict[str, Any]:
+        """Extrait les champs demandés d'un patient (copie des valeurs mutables)"""
+        return {name: deepcopy(getattr(patient, name)) for name in fields}
@@ -1,19 +1,35 @@
 # medisecure-backend/patient_management/infrastructure/adapters/secondary/postgres_patient_repository.py
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence, AsyncIterator, Set
 from uuid import UUID
 from datetime import date, datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update, delete, or_, and_, func
+from sqlalchemy import update, delete, insert, or_, and_, func
+import json
 import logging
 
 from patient_management.domain.entities.patient import Patient
+from patient_management.domain.entities.patient_summary import PatientSummary, PATIENT_SUMMARY_FIELDS
 from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
+from shared.domain.entities.paged_result import PagedResult
 from shared.infrastructure.database.models.patient_model import PatientModel
+from shared.infrastructure.database.pagination import TOTAL_COLUMN, fetch_page
+from shared.infrastructure.database.replica_routing import replica_read, replica_reads
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
+# Colonnes JSONB converties en dictionnaire vide lorsqu'elles sont nulles
+_JSONB_FIELDS = frozenset({"allergies", "chronic_diseases", "current_medications"})
+
+# Colonnes renseignées lors d'un import en lot (champs de l'entité Patient)
+_COPY_COLUMNS = [
+    "id", "first_name", "last_name", "date_of_birth", "gender", "address", "city", "postal_code",
+    "country", "phone_number", "email", "blood_type", "allergies", "chronic_diseases",
+    "current_medications", "has_consent", "consent_date", "gdpr_consent", "insurance_provider",
+    "insurance_id", "notes", "created_at", "updated_at", "is_active"
+]
+
 class PostgresPatientRepository(PatientRepositoryProtocol):
     """
     Adaptateur secondaire pour le repository des patients avec PostgreSQL.
@@ -92,7 +108,7 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
             Patient: Le patient créé avec son ID généré
         """
         try:
-            logger.info(f"Création d'un nouveau patient: {patient.first_name} {patient.last_name}")
+            logger.debug(f"Création d'un nouveau patient: {patient.id}")
             
             patient_model = PatientModel(
                 id=patient.id,
@@ -125,7 +141,7 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
             await self.session.commit()
             await self.session.refresh(patient_model)
             
-            logger.info(f"Patient créé avec succès: {patient_model.id}")
+            logger.debug(f"Patient créé: {patient_model.id}")
             return self._map_to_entity(patient_model)
         except Exception as e:
             logger.exception(f"Erreur lors de la création du patient: {str(e)}")
@@ -221,6 +237,7 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
             await self.session.rollback()
             raise
     
+    @replica_read
     async def list_all(self, skip: int = 0, limit: int = 100) -> List[Patient]:
         """
         Liste tous les patients avec pagination.
@@ -244,6 +261,7 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
             logger.exception(f"Erreur lors de la récupération de la liste des patients: {str(e)}")
             raise
     
+    @replica_read
     async def search(
         self,
         name: Optional[str] = None,
@@ -270,31 +288,9 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
         try:
             logger.debug(f"Recherche de patients avec critères: name={name}, date_of_birth={date_of_birth}, email={email}, phone={phone}")
             
-            # Construire la requête de base
+            # Construire la requête avec les filtres fournis
             query = select(PatientModel)
-            
-            # Ajouter les filtres si fournis
-            filters = []
-            
-            if name:
-                # Recherche partielle sur le prénom ou le nom
-                filters.append(
-                    or_(
-                        PatientModel.first_name.ilike(f"%{name}%"),
-                        PatientModel.last_name.ilike(f"%{name}%")
-                    )
-                )
-            
-            if date_of_birth:
-                filters.append(PatientModel.date_of_birth == date_of_birth)
-            
-            if email:
-                filters.append(PatientModel.email == email)
-            
-            if phone:
-                filters.append(PatientModel.phone_number.ilike(f"%{phone}%"))
-            
-            # Ajouter tous les filtres à la requête
+            filters = self._search_filters(name, date_of_birth, email, phone)
             if filters:
                 query = query.where(and_(*filters))
             
@@ -311,6 +307,7 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
             logger.exception(f"Erreur lors de la recherche de patients: {str(e)}")
             raise
     
+    @replica_read
     async def count(self) -> int:
         """
         Compte le nombre total de patients.
@@ -329,6 +326,295 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
             logger.exception(f"Erreur lors du comptage des patients: {str(e)}")
             raise
     
+    async def get_projected_by_id(self, patient_id: UUID, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        """
+        Récupère uniquement certains champs d'un patient (SELECT limité aux colonnes demandées).
+        
+        Args:
+            patient_id: L'ID du patient à récupérer
+            fields: Les champs de l'entité Patient à récupérer
+            
+        Returns:
+            Optional[Dict[str, Any]]: Les champs demandés, ou None si non trouvé
+        """
+        try:
+            query = select(*self._columns(fields)).where(PatientModel.id == patient_id)
+            result = await self.session.execute(query)
+            row = result.one_or_none()
+            return self._map_to_dict(row) if row is not None else None
+        except Exception as e:
+            logger.exception(f"Erreur lors de la récupération du patient {patient_id}: {str(e)}")
+            raise
+    
+    @replica_read
+    async def list_projected(self, fields: Sequence[str], skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Liste les patients avec pagination en ne récupérant que certaines colonnes:
+        ni hydratation de PatientModel, ni transfert des colonnes JSONB non demandées.
+        
+        Args:
+            fields: Les champs de l'entité Patient à récupérer
+            skip: Le nombre de patients à sauter
+            limit: Le nombre maximum de patients à retourner
+            
+        Returns:
+            List[Dict[str, Any]]: Les champs demandés de chaque patient
+        """
+        try:
+            query = select(*self._columns(fields)).offset(skip).limit(limit)
+            result = await self.session.execute(query)
+            return [self._map_to_dict(row) for row in result]
+        except Exception as e:
+            logger.exception(f"Erreur lors de la récupération de la liste des patients: {str(e)}")
+            raise
+    
+    @replica_read
+    async def search_projected(
+        self,
+        fields: Sequence[str],
+        name: Optional[str] = None,
+        date_of_birth: Optional[date] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> PagedResult[Dict[str, Any]]:
+        """
+        Recherche des patients selon différents critères en ne récupérant que certaines colonnes.
+        Le total est calculé dans la même requête (COUNT(*) OVER ()).
+        
+        Args:
+            fields: Les champs de l'entité Patient à récupérer
+            name: Le nom ou prénom du patient (recherche partielle)
+            date_of_birth: La date de naissance du patient
+            email: L'email du patient (recherche exacte)
+            phone: Le numéro de téléphone du patient (recherche partielle)
+            skip: Le nombre de patients à sauter
+            limit: Le nombre maximum de patients à retourner
+            
+        Returns:
+            PagedResult[Dict[str, Any]]: Les champs demandés de chaque patient de la page, et le total
+        """
+        try:
+            query = select(*self._columns(fields))
+            filters = self._search_filters(name, date_of_birth, email, phone)
+            if filters:
+                query = query.where(and_(*filters))
+            rows, total = await fetch_page(self.session, query, skip, limit)
+            return PagedResult(items=[self._map_to_dict(row) for row in rows], total=total)
+        except Exception as e:
+            logger.exception(f"Erreur lors de la recherche de patients: {str(e)}")
+            raise
+    
+    @replica_read
+    async def list_summaries(self, skip: int = 0, limit: int = 100) -> List[PatientSummary]:
+        """
+        Liste les résumés des patients avec pagination (écrans de liste).
+        Seules les colonnes du résumé sont lues: ni informations médicales ni notes.
+        
+        Args:
+            skip: Le nombre de patients à sauter
+            limit: Le nombre maximum de patients à retourner
+            
+        Returns:
+            List[PatientSummary]: La liste des résumés de patients
+        """
+        rows = await self.list_projected(PATIENT_SUMMARY_FIELDS, skip, limit)
+        return [PatientSummary(**row) for row in rows]
+    
+    @replica_read
+    async def search_summaries(
+        self,
+        name: Optional[str] = None,
+        date_of_birth: Optional[date] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> PagedResult[PatientSummary]:
+        """
+        Recherche des patients selon différents critères et retourne leurs résumés.
+        
+        Args:
+            name: Le nom ou prénom du patient (recherche partielle)
+            date_of_birth: La date de naissance du patient
+            email: L'email du patient (recherche exacte)
+            phone: Le numéro de téléphone du patient (recherche partielle)
+            skip: Le nombre de patients à sauter
+            limit: Le nombre maximum de patients à retourner
+            
+        Returns:
+            PagedResult[PatientSummary]: Les résumés des patients de la page, et le total
+        """
+        page = await self.search_projected(PATIENT_SUMMARY_FIELDS, name, date_of_birth, email, phone, skip, limit)
+        return PagedResult(items=[PatientSummary(**row) for row in page.items], total=page.total)
+    
+    async def get_summaries_by_ids(self, patient_ids: Sequence[UUID]) -> List[PatientSummary]:
+        """
+        Récupère les résumés de plusieurs patients en une seule requête (id = ANY(:ids)),
+        par exemple pour les joindre à une liste de rendez-vous.
+        
+        Args:
+            patient_ids: Les IDs des patients à récupérer
+            
+        Returns:
+            List[PatientSummary]: Les résumés des patients trouvés (ordre non garanti)
+        """
+        if not patient_ids:
+            return []
+        try:
+            query = select(*self._columns(PATIENT_SUMMARY_FIELDS)).where(
+                PatientModel.id == func.any(list(set(patient_ids)))
+            )
+            result = await self.session.execute(query)
+            return [PatientSummary(**self._map_to_dict(row)) for row in result]
+        except Exception as e:
+            logger.exception(f"Erreur lors de la récupération des résumés de patients par IDs: {str(e)}")
+            raise
+    
+    async def find_existing_emails(self, emails: Sequence[str]) -> Set[str]:
+        """
+        Retourne, parmi une liste d'emails, ceux déjà utilisés par un patient
+        (une seule requête email = ANY(:emails) pour tout un lot).
+        
+        Args:
+            emails: Les emails à vérifier
+            
+        Returns:
+            Set[str]: Les emails déjà présents
+        """
+        if not emails:
+            return set()
+        try:
+            query = select(PatientModel.email).where(PatientModel.email == func.any(list(emails)))
+            result = await self.session.execute(query)
+            return set(result.scalars())
+        except Exception as e:
+            logger.exception(f"Erreur lors de la vérification des emails existants: {str(e)}")
+            raise
+    
+    async def bulk_create(self, patients: Sequence[Patient]) -> int:
+        """
+        Crée plusieurs patients en une seule transaction: COPY binaire via asyncpg
+        (copy_records_to_table), ou INSERT multi-lignes si le pilote ne le permet pas.
+        
+        Args:
+            patients: Les patients à créer (déjà validés)
+            
+        Returns:
+            int: Le nombre de patients créés
+        """
+        if not patients:
+            return 0
+        try:
+            connection = await self.session.connection()
+            raw_connection = await connection.get_raw_connection()
+            driver_connection = getattr(raw_connection, "driver_connection", None)
+            
+            if hasattr(driver_connection, "copy_records_to_table"):
+                await driver_connection.copy_records_to_table(
+                    PatientModel.__tablename__,
+                    records=[self._map_to_copy_record(patient) for patient in patients],
+                    columns=_COPY_COLUMNS
+                )
+            else:
+                await self.session.execute(
+                    insert(PatientModel),
+                    [self._map_to_values(patient) for patient in patients]
+                )
+            
+            await self.session.commit()
+            logger.debug(f"{len(patients)} patients créés en lot")
+            return len(patients)
+        except Exception as e:
+            logger.exception(f"Erreur lors de la création en lot de patients: {str(e)}")
+            await self.session.rollback()
+            raise
+    
+    def _map_to_values(self, patient: Patient) -> Dict[str, Any]:
+        """Convertit une entité en valeurs de colonnes pour un INSERT"""
+        return {name: getattr(patient, name) for name in _COPY_COLUMNS}
+    
+    def _map_to_copy_record(self, patient: Patient) -> tuple:
+        """Convertit une entité en enregistrement COPY (colonnes JSONB sérialisées en texte)"""
+        return tuple(
+            json.dumps(getattr(patient, name)) if name in _JSONB_FIELDS else getattr(patient, name)
+            for name in _COPY_COLUMNS
+        )
+    
+    def _search_filters(
+        self,
+        name: Optional[str],
+        date_of_birth: Optional[date],
+        email: Optional[str],
+        phone: Optional[str]
+    ) -> List[Any]:
+        """Construit les filtres de recherche des patients à partir des critères fournis"""
+        filters = []
+        
+        if name:
+            # Recherche partielle sur le prénom ou le nom
+            filters.append(
+                or_(
+                    PatientModel.first_name.ilike(f"%{name}%"),
+                    PatientModel.last_name.ilike(f"%{name}%")
+                )
+            )
+        
+        if date_of_birth:
+            filters.append(PatientModel.date_of_birth == date_of_birth)
+        
+        if email:
+            filters.append(PatientModel.email == email)
+        
+        if phone:
+            filters.append(PatientModel.phone_number.ilike(f"%{phone}%"))
+        
+        return filters
+    
+    async def stream_projected(self, fields: Sequence[str], batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Parcourt les patients en flux pour un export avec un curseur côté serveur:
+        la mémoire utilisée ne dépend que de batch_size, pas de la taille de la table.
+        
+        Args:
+            fields: Les champs de l'entité Patient à récupérer
+            batch_size: Le nombre de lignes lues à chaque aller-retour avec la base
+            
+        Yields:
+            Dict[str, Any]: Les champs demandés de chaque patient
+        """
+        query = select(*self._columns(fields)).execution_options(yield_per=batch_size)
+        with replica_reads():
+            result = await self.session.stream(query)
+        try:
+            async for partition in result.partitions():
+                for row in partition:
+                    yield self._map_to_dict(row)
+        finally:
+            await result.close()
+    
+    def _columns(self, fields: Sequence[str]) -> List[Any]:
+        """Retourne les colonnes du modèle correspondant aux champs demandés"""
+        return [getattr(PatientModel, name) for name in fields]
+    
+    def _map_to_dict(self, row) -> Dict[str, Any]:
+        """
+        Convertit une ligne projetée en dictionnaire, avec les mêmes valeurs par défaut que _map_to_entity.
+        
+        Args:
+            row: La ligne retournée par un SELECT de colonnes
+            
+        Returns:
+            Dict[str, Any]: Les champs de la ligne
+        """
+        data = dict(row._mapping)
+        data.pop(TOTAL_COLUMN, None)
+        for name in _JSONB_FIELDS.intersection(data):
+            if data[name] is None:
+                data[name] = {}
+        return data
+    
     def _map_to_entity(self, patient_model: PatientModel) -> Patient:
         """
         Convertit un modèle SQLAlchemy en entité du domaine.
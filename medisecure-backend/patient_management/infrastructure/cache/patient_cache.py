@@ -0,0 +1,115 @@
+import logging
+import os
+from typing import Optional
+
+from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
+from patient_management.infrastructure.adapters.secondary.caching_patient_repository import CachingPatientRepository, patient_cache_key
+from shared.adapters.secondary.in_memory_cache_backend import InMemoryCacheBackend
+from shared.adapters.secondary.redis_cache_backend import RedisCacheBackend
+from shared.infrastructure.cache.cache_generations import CacheGenerations
+from shared.infrastructure.cache.cache_stats import CacheStats
+from shared.infrastructure.database.invalidation_listener import ChangeEvent
+from shared.ports.secondary.cache_backend_protocol import CacheBackendProtocol
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Backend du cache des dossiers patients: "memory" (par défaut), "redis" (partagé par les workers) ou "none"
+PATIENT_CACHE_BACKEND = os.getenv("PATIENT_CACHE_BACKEND", "memory").lower()
+
+# Durée de vie d'un dossier en cache (délai maximal de prise en compte d'une écriture d'un autre processus)
+PATIENT_CACHE_TTL_SECONDS = float(os.getenv("PATIENT_CACHE_TTL_SECONDS", "30"))
+
+# Nombre maximal de dossiers conservés par le backend en mémoire
+PATIENT_CACHE_MAX_ENTRIES = int(os.getenv("PATIENT_CACHE_MAX_ENTRIES", "10000"))
+
+def create_patient_cache_backend(kind: str = PATIENT_CACHE_BACKEND) -> Optional[CacheBackendProtocol]:
+    """
+    Crée le backend du cache des dossiers patients.
+
+    Args:
+        kind: Le type de backend ("memory", "redis" ou "none")
+
+    Returns:
+        Optional[CacheBackendProtocol]: Le backend, ou None si le cache est désactivé
+    """
+    if kind == "none" or PATIENT_CACHE_TTL_SECONDS <= 0:
+        return None
+    if kind == "redis":
+        return RedisCacheBackend(
+            os.getenv("PATIENT_CACHE_REDIS_URL", "redis://localhost:6379/0"),
+            command_timeout=float(os.getenv("PATIENT_CACHE_REDIS_TIMEOUT_SECONDS", "0.5"))
+        )
+    if kind != "memory":
+        logger.warning(f"PATIENT_CACHE_BACKEND inconnu ({kind}), cache en mémoire utilisé")
+    return InMemoryCacheBackend(PATIENT_CACHE_MAX_ENTRIES, PATIENT_CACHE_TTL_SECONDS)
+
+# Instances partagées par le processus (le container est recréé à chaque requête)
+_patient_cache_backend = create_patient_cache_backend()
+_patient_cache_stats = CacheStats()
+_patient_cache_generations = CacheGenerations()
+
+def get_patient_cache_backend() -> Optional[CacheBackendProtocol]:
+    """
+    Fournit le backend du cache des dossiers patients partagé par le processus (None si désactivé).
+    """
+    return _patient_cache_backend
+
+def get_patient_cache_stats() -> CacheStats:
+    """
+    Fournit les compteurs du cache des dossiers patients partagés par le processus.
+    """
+    return _patient_cache_stats
+
+def get_patient_cache_generations() -> CacheGenerations:
+    """
+    Fournit les générations des entrées du cache des dossiers patients partagées par le processus.
+    """
+    return _patient_cache_generations
+
+def cached_patient_repository(
+    repository: PatientRepositoryProtocol,
+    backend: Optional[CacheBackendProtocol],
+    stats: CacheStats,
+    generations: Optional[CacheGenerations] = None
+) -> PatientRepositoryProtocol:
+    """
+    Ajoute le cache de lecture au repository des patients, s'il est activé.
+
+    Args:
+        repository: Le repository des patients
+        backend: Le backend du cache (None si désactivé)
+        stats: Les compteurs du cache
+        generations: Les générations des entrées du cache
+
+    Returns:
+        PatientRepositoryProtocol: Le repository avec cache, ou le repository lui-même
+    """
+    if backend is None:
+        return repository
+    return CachingPatientRepository(repository, backend, PATIENT_CACHE_TTL_SECONDS, stats, generations)
+
+async def invalidate_patient_cache(event: ChangeEvent) -> None:
+    """
+    Applique la modification d'un patient notifiée par la base de données (écriture d'un autre worker).
+
+    Args:
+        event: La modification notifiée (id None: toute la table)
+    """
+    if _patient_cache_backend is None:
+        return
+    if event.id is None:
+        await flush_patient_cache()
+        return
+    _patient_cache_generations.bump(patient_cache_key(event.id))
+    await _patient_cache_backend.delete(patient_cache_key(event.id))
+    _patient_cache_stats.invalidations += 1
+
+async def flush_patient_cache() -> None:
+    """
+    Vide le cache des dossiers en mémoire du processus lorsque des notifications ont pu être manquées.
+    Le cache Redis, partagé, est invalidé par les écritures elles-mêmes et n'est pas vidé.
+    """
+    _patient_cache_generations.bump_all()
+    if isinstance(_patient_cache_backend, InMemoryCacheBackend):
+        _patient_cache_backend.clear()
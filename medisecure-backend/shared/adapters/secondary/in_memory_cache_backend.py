@@ -0,0 +1,68 @@
+from typing import Optional
+
+from shared.infrastructure.cache.ttl_cache import TTLCache
+from shared.ports.secondary.cache_backend_protocol import CacheBackendProtocol
+
+class InMemoryCacheBackend(CacheBackendProtocol):
+    """
+    Adaptateur secondaire de cache en mémoire du processus (LRU borné avec durée de vie).
+    Implémente le port CacheBackendProtocol.
+
+    Chaque worker a son propre cache: une écriture faite par un autre worker n'est visible
+    qu'à l'expiration de l'entrée.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 30.0, cache: Optional[TTLCache] = None):
+        """
+        Initialise un cache vide.
+
+        Args:
+            max_entries: Le nombre maximal d'entrées conservées
+            ttl_seconds: La durée de vie par défaut d'une entrée
+            cache: Le cache sous-jacent (injectable pour les tests)
+        """
+        self._cache: TTLCache[bytes] = cache if cache is not None else TTLCache(ttl_seconds, max_entries=max_entries)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def evictions(self) -> int:
+        return self._cache.evictions
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Lit une entrée du cache.
+
+        Args:
+            key: La clé de l'entrée
+
+        Returns:
+            Optional[bytes]: La valeur sérialisée, ou None si absente ou expirée
+        """
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """
+        Écrit une entrée dans le cache.
+
+        Args:
+            key: La clé de l'entrée
+            value: La valeur sérialisée
+            ttl_seconds: La durée de vie de l'entrée en secondes
+        """
+        self._cache.set(key, value, ttl_seconds)
+
+    async def delete(self, *keys: str) -> None:
+        """
+        Supprime des entrées du cache.
+
+        Args:
+            keys: Les clés des entrées à supprimer
+        """
+        for key in keys:
+            self._cache.invalidate(key)
+
+    def clear(self) -> None:
+        """Vide le cache (notifications d'invalidation manquées)"""
+        self._cache.invalidate()
@@ -0,0 +1,40 @@
+from typing import Dict, Sequence
+
+from shared.ports.secondary.collection_version_store_protocol import CollectionVersionStoreProtocol
+
+class InMemoryCollectionVersionStore(CollectionVersionStoreProtocol):
+    """
+    Adaptateur secondaire pour les versions des collections en mémoire (pour les tests).
+    Implémente le port CollectionVersionStoreProtocol.
+    """
+
+    def __init__(self):
+        """
+        Initialise le store sans aucune version.
+        """
+        self.versions: Dict[str, int] = {}
+
+    async def get_versions(self, names: Sequence[str]) -> Dict[str, int]:
+        """
+        Récupère la version courante de plusieurs collections.
+
+        Args:
+            names: Les noms des collections
+
+        Returns:
+            Dict[str, int]: La version de chaque collection (0 si elle n'a jamais été modifiée)
+        """
+        return {name: self.versions.get(name, 0) for name in names}
+
+    def bump(self, name: str) -> int:
+        """
+        Incrémente la version d'une collection (équivalent des triggers de la base).
+
+        Args:
+            name: Le nom de la collection
+
+        Returns:
+            int: La nouvelle version
+        """
+        self.versions[name] = self.versions.get(name, 0) + 1
+        return self.versions[name]
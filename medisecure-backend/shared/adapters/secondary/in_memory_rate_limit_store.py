@@ -0,0 +1,101 @@
+import time
+from typing import Callable, Dict, List, Tuple
+
+from shared.ports.secondary.rate_limit_store_protocol import RateLimitStoreProtocol
+
+class InMemoryRateLimitStore(RateLimitStoreProtocol):
+    """
+    Adaptateur secondaire pour la limitation de débit en mémoire du processus.
+    Implémente le port RateLimitStoreProtocol.
+
+    Les seaux sont répartis en shards. Un seau plein (client inactif) est équivalent à un seau
+    absent: il est supprimé paresseusement, un shard à la fois, pour que l'éviction ne coûte
+    jamais un parcours complet de la mémoire sur le chemin d'une requête.
+    Prévu pour la boucle d'événements (un seul thread): aucun verrou n'est nécessaire.
+    """
+
+    def __init__(
+        self,
+        shard_count: int = 16,
+        max_keys_per_shard: int = 10000,
+        sweep_interval_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialise un store vide.
+
+        Args:
+            shard_count: Le nombre de shards (arrondi à une puissance de deux)
+            max_keys_per_shard: Le nombre maximal de seaux par shard
+            sweep_interval_seconds: L'intervalle entre deux nettoyages de shard
+            clock: L'horloge monotone utilisée (injectable pour les tests)
+        """
+        size = 1
+        while size < max(1, shard_count):
+            size <<= 1
+        self._mask = size - 1
+        self._shards: List[Dict[str, List[float]]] = [{} for _ in range(size)]
+        self.max_keys_per_shard = max_keys_per_shard
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self._clock = clock
+        self._next_sweep = 0.0
+        self._sweep_cursor = 0
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    async def consume(
+        self,
+        key: str,
+        capacity: float,
+        refill_per_second: float,
+        cost: float = 1.0
+    ) -> Tuple[bool, float]:
+        """
+        Tente de consommer des jetons dans le seau associé à une clé.
+
+        Args:
+            key: La clé du seau
+            capacity: La capacité maximale du seau
+            refill_per_second: Le nombre de jetons ajoutés par seconde
+            cost: Le nombre de jetons consommés par la requête
+
+        Returns:
+            Tuple[bool, float]: Si la requête est autorisée, et sinon le délai avant nouvel essai
+        """
+        now = self._clock()
+        if now >= self._next_sweep:
+            self._sweep(now)
+
+        shard = self._shards[hash(key) & self._mask]
+        bucket = shard.get(key)
+        if bucket is None:
+            if len(shard) >= self.max_keys_per_shard:
+                self._evict(shard, now)
+            tokens = capacity
+            bucket = shard[key] = [capacity, now, capacity / refill_per_second]
+        else:
+            tokens = min(capacity, bucket[0] + (now - bucket[1]) * refill_per_second)
+            bucket[1] = now
+
+        if tokens >= cost:
+            bucket[0] = tokens - cost
+            return True, 0.0
+
+        bucket[0] = tokens
+        return False, (cost - tokens) / refill_per_second
+
+    def _sweep(self, now: float) -> None:
+        """Nettoie le shard suivant (tourniquet) et planifie le prochain nettoyage"""
+        self._evict(self._shards[self._sweep_cursor], now)
+        self._sweep_cursor = (self._sweep_cursor + 1) & self._mask
+        self._next_sweep = now + self.sweep_interval_seconds
+
+    def _evict(self, shard: Dict[str, List[float]], now: float) -> None:
+        """Supprime les seaux redevenus pleins; si le shard reste saturé, supprime les plus anciens"""
+        # bucket = [jetons, dernière mise à jour, durée de remplissage complet]
+        idle = [key for key, bucket in shard.items() if now - bucket[1] >= bucket[2]]
+        for key in idle:
+            del shard[key]
+        while len(shard) >= self.max_keys_per_shard:
+            del shard[next(iter(shard))]
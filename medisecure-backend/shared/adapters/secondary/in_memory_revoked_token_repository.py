@@ -0,0 +1,59 @@
+from typing import List, Dict
+from datetime import datetime
+
+from shared.domain.entities.revoked_token import RevokedToken
+from shared.ports.secondary.revoked_token_repository_protocol import RevokedTokenRepositoryProtocol
+
+class InMemoryRevokedTokenRepository(RevokedTokenRepositoryProtocol):
+    """
+    Adaptateur secondaire pour le repository des tokens révoqués en mémoire (pour les tests).
+    Implémente le port RevokedTokenRepositoryProtocol.
+    """
+
+    def __init__(self):
+        """
+        Initialise le repository avec un dictionnaire vide.
+        """
+        self.revoked_tokens: Dict[str, RevokedToken] = {}
+
+    async def add(self, revoked_token: RevokedToken) -> bool:
+        """
+        Enregistre un token révoqué (idempotent sur le jti).
+
+        Args:
+            revoked_token: Le token révoqué à enregistrer
+
+        Returns:
+            bool: True si le token vient d'être révoqué, False s'il l'était déjà
+        """
+        if revoked_token.jti in self.revoked_tokens:
+            return False
+        self.revoked_tokens[revoked_token.jti] = revoked_token
+        return True
+
+    async def list_active(self, now: datetime) -> List[RevokedToken]:
+        """
+        Liste les tokens révoqués qui ne sont pas encore expirés.
+
+        Args:
+            now: La date de référence (UTC)
+
+        Returns:
+            List[RevokedToken]: Les tokens révoqués encore valides
+        """
+        return [token for token in self.revoked_tokens.values() if not token.is_expired(now)]
+
+    async def purge_expired(self, now: datetime) -> int:
+        """
+        Supprime les tokens révoqués expirés.
+
+        Args:
+            now: La date de référence (UTC)
+
+        Returns:
+            int: Le nombre d'entrées supprimées
+        """
+        expired = [jti for jti, token in self.revoked_tokens.items() if token.is_expired(now)]
+        for jti in expired:
+            del self.revoked_tokens[jti]
+        return len(expired)
@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Sequence
 from uuid import UUID
 from shared.domain.entities.user import User
 from shared.ports.secondary.user_repository_protocol import UserRepositoryProtocol
@@ -15,6 +15,7 @@ class InMemoryUserRepository(UserRepositoryProtocol):
         """
         self.users: Dict[UUID, User] = {}
         self.email_index: Dict[str, UUID] = {}
+        self.hashed_passwords: Dict[UUID, str] = {}
     
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
         """
@@ -114,4 +115,34 @@ class InMemoryUserRepository(UserRepositoryProtocol):
         Returns:
             List[User]: La liste des utilisateurs ayant le rôle spécifié
         """
-        return [user for user in self.users.values() if user.role.value == role]
\ No newline at end of file
+        return [user for user in self.users.values() if user.role.value == role]
+    
+    async def list_by_ids(self, user_ids: Sequence[UUID]) -> List[User]:
+        """
+        Liste plusieurs utilisateurs en une seule requête (id = ANY(:ids)),
+        par exemple les médecins d'une liste de rendez-vous.
+        
+        Args:
+            user_ids: Les IDs des utilisateurs à récupérer
+            
+        Returns:
+            List[User]: Les utilisateurs trouvés (ordre non garanti)
+        """
+        return [self.users[user_id] for user_id in set(user_ids) if user_id in self.users]
+    
+    async def update_password_hash(self, user_id: UUID, hashed_password: str) -> bool:
+        """
+        Remplace le hash du mot de passe d'un utilisateur.
+        
+        Args:
+            user_id: L'ID de l'utilisateur
+            hashed_password: Le nouveau hash du mot de passe
+            
+        Returns:
+            bool: True si le hash a été mis à jour, False sinon
+        """
+        if user_id not in self.users:
+            return False
+        
+        self.hashed_passwords[user_id] = hashed_password
+        return True
\ No newline at end of file
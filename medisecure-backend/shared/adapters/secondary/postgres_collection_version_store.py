@@ -0,0 +1,50 @@
+from typing import Dict, Sequence
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.infrastructure.database.models.collection_version_model import CollectionVersionModel
+from shared.infrastructure.database.replica_routing import replica_read
+from shared.ports.secondary.collection_version_store_protocol import CollectionVersionStoreProtocol
+
+class PostgresCollectionVersionStore(CollectionVersionStoreProtocol):
+    """
+    Adaptateur secondaire pour les versions des collections avec PostgreSQL.
+    Implémente le port CollectionVersionStoreProtocol.
+
+    Les versions sont incrémentées par les triggers de init.sql (une fois par instruction INSERT,
+    UPDATE, DELETE, COPY ou TRUNCATE), dans la transaction de l'écriture: une version n'est
+    visible qu'une fois les lignes modifiées validées. Une collection a 16 compteurs, incrémentés
+    chacun par les connexions d'un même slot pour que les écritures concurrentes ne s'attendent pas;
+    sa version est leur somme (parcours de la clé primaire, 16 lignes par collection).
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialise le store avec une session SQLAlchemy.
+
+        Args:
+            session: La session SQLAlchemy à utiliser
+        """
+        self.session = session
+
+    @replica_read
+    async def get_versions(self, names: Sequence[str]) -> Dict[str, int]:
+        """
+        Récupère la version courante de plusieurs collections.
+
+        Args:
+            names: Les noms des collections
+
+        Returns:
+            Dict[str, int]: La version de chaque collection (0 si elle n'a jamais été modifiée)
+        """
+        query = select(
+            CollectionVersionModel.name,
+            func.sum(CollectionVersionModel.version).label("version")
+        ).where(
+            CollectionVersionModel.name == func.any(list(names))
+        ).group_by(CollectionVersionModel.name)
+        result = await self.session.execute(query)
+        versions = {name: 0 for name in names}
+        versions.update({row.name: int(row.version) for row in result})
+        return versions
@@ -0,0 +1,81 @@
+import time
+from typing import Tuple
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from shared.ports.secondary.rate_limit_store_protocol import RateLimitStoreProtocol
+
+# Jetons disponibles après recharge depuis la dernière mise à jour (paramètres typés pour asyncpg)
+_REFILLED = (
+    "LEAST(CAST(:capacity AS double precision), "
+    "b.tokens + EXTRACT(EPOCH FROM clock_timestamp() - b.updated_at) * CAST(:rate AS double precision))"
+)
+_COST = "CAST(:cost AS double precision)"
+
+# Recharge et consommation atomiques en une seule instruction: aucun verrou applicatif,
+# la ligne du seau est verrouillée par l'UPSERT le temps de la transaction.
+CONSUME_QUERY = text(f"""
+    INSERT INTO rate_limit_buckets AS b (key, tokens, allowed, updated_at)
+    VALUES (:key, CAST(:capacity AS double precision) - {_COST}, CAST(:capacity AS double precision) >= {_COST}, clock_timestamp())
+    ON CONFLICT (key) DO UPDATE SET
+        tokens = CASE WHEN {_REFILLED} >= {_COST} THEN {_REFILLED} - {_COST} ELSE {_REFILLED} END,
+        allowed = {_REFILLED} >= {_COST},
+        updated_at = clock_timestamp()
+    RETURNING tokens, allowed
+""")
+
+PURGE_QUERY = text("DELETE FROM rate_limit_buckets WHERE updated_at < clock_timestamp() - make_interval(secs => CAST(:ttl AS double precision))")
+
+class PostgresRateLimitStore(RateLimitStoreProtocol):
+    """
+    Adaptateur secondaire pour la limitation de débit partagée entre workers avec PostgreSQL.
+    Implémente le port RateLimitStoreProtocol.
+    Coûte un aller-retour en base par requête limitée: à réserver aux déploiements multi-workers.
+    """
+
+    def __init__(self, engine: AsyncEngine, idle_ttl_seconds: float = 3600.0):
+        """
+        Initialise le store avec le moteur SQLAlchemy du processus.
+
+        Args:
+            engine: Le moteur SQLAlchemy asynchrone
+            idle_ttl_seconds: La durée d'inactivité après laquelle un seau est purgé
+        """
+        self.engine = engine
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._next_purge = time.monotonic() + idle_ttl_seconds
+
+    async def consume(
+        self,
+        key: str,
+        capacity: float,
+        refill_per_second: float,
+        cost: float = 1.0
+    ) -> Tuple[bool, float]:
+        """
+        Tente de consommer des jetons dans le seau associé à une clé.
+
+        Args:
+            key: La clé du seau
+            capacity: La capacité maximale du seau
+            refill_per_second: Le nombre de jetons ajoutés par seconde
+            cost: Le nombre de jetons consommés par la requête
+
+        Returns:
+            Tuple[bool, float]: Si la requête est autorisée, et sinon le délai avant nouvel essai
+        """
+        async with self.engine.begin() as connection:
+            result = await connection.execute(
+                CONSUME_QUERY,
+                {"key": key, "capacity": capacity, "rate": refill_per_second, "cost": cost}
+            )
+            tokens, allowed = result.one()
+
+            # Purge paresseuse des seaux inactifs, au plus une fois par période d'inactivité
+            if time.monotonic() >= self._next_purge:
+                self._next_purge = time.monotonic() + self.idle_ttl_seconds
+                await connection.execute(PURGE_QUERY, {"ttl": self.idle_ttl_seconds})
+
+        if allowed:
+            return True, 0.0
+        return False, (cost - tokens) / refill_per_second
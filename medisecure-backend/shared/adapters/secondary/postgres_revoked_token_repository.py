@@ -0,0 +1,112 @@
+from typing import List
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+
+from shared.domain.entities.revoked_token import RevokedToken
+from shared.infrastructure.database.models.revoked_token_model import RevokedTokenModel
+from shared.ports.secondary.revoked_token_repository_protocol import RevokedTokenRepositoryProtocol
+
+class PostgresRevokedTokenRepository(RevokedTokenRepositoryProtocol):
+    """
+    Adaptateur secondaire pour le repository des tokens révoqués avec PostgreSQL.
+    Implémente le port RevokedTokenRepositoryProtocol.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialise le repository avec une session SQLAlchemy.
+
+        Args:
+            session: La session SQLAlchemy à utiliser
+        """
+        self.session = session
+
+    async def add(self, revoked_token: RevokedToken) -> bool:
+        """
+        Enregistre un token révoqué (idempotent sur le jti). L'insertion est atomique: parmi
+        plusieurs révocations concurrentes du même token, une seule retourne True.
+
+        Args:
+            revoked_token: Le token révoqué à enregistrer
+
+        Returns:
+            bool: True si le token vient d'être révoqué, False s'il l'était déjà
+        """
+        query = (
+            insert(RevokedTokenModel)
+            .values(
+                jti=revoked_token.jti,
+                user_id=revoked_token.user_id,
+                expires_at=revoked_token.expires_at,
+                revoked_at=revoked_token.revoked_at
+            )
+            .on_conflict_do_nothing(index_elements=[RevokedTokenModel.jti])
+            .returning(RevokedTokenModel.jti)
+        )
+
+        try:
+            result = await self.session.execute(query)
+            inserted = result.scalar_one_or_none() is not None
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        return inserted
+
+    async def list_active(self, now: datetime) -> List[RevokedToken]:
+        """
+        Liste les tokens révoqués qui ne sont pas encore expirés.
+
+        Args:
+            now: La date de référence (UTC)
+
+        Returns:
+            List[RevokedToken]: Les tokens révoqués encore valides
+        """
+        query = select(RevokedTokenModel).where(RevokedTokenModel.expires_at > now)
+        result = await self.session.execute(query)
+        revoked_token_models = result.scalars().all()
+
+        return [self._map_to_entity(model) for model in revoked_token_models]
+
+    async def purge_expired(self, now: datetime) -> int:
+        """
+        Supprime les tokens révoqués expirés.
+
+        Args:
+            now: La date de référence (UTC)
+
+        Returns:
+            int: Le nombre d'entrées supprimées
+        """
+        query = delete(RevokedTokenModel).where(RevokedTokenModel.expires_at <= now)
+
+        try:
+            result = await self.session.execute(query)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        return result.rowcount or 0
+
+    def _map_to_entity(self, revoked_token_model: RevokedTokenModel) -> RevokedToken:
+        """
+        Convertit un modèle SQLAlchemy en entité du domaine.
+
+        Args:
+            revoked_token_model: Le modèle SQLAlchemy à convertir
+
+        Returns:
+            RevokedToken: L'entité du domaine correspondante
+        """
+        return RevokedToken(
+            jti=revoked_token_model.jti,
+            user_id=revoked_token_model.user_id,
+            expires_at=revoked_token_model.expires_at,
+            revoked_at=revoked_token_model.revoked_at
+        )
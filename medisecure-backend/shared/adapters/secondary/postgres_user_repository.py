@@ -1,8 +1,8 @@
-from typing import Optional, List
+from typing import Optional, List, Sequence
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update, delete
+from sqlalchemy import update, delete, func
 
 from shared.domain.entities.user import User
 from shared.domain.enums.roles import UserRole
@@ -117,6 +117,32 @@ class PostgresUserRepository(UserRepositoryProtocol):
         
         return user
     
+    async def update_password_hash(self, user_id: UUID, hashed_password: str) -> bool:
+        """
+        Remplace le hash du mot de passe d'un utilisateur.
+        
+        Args:
+            user_id: L'ID de l'utilisateur
+            hashed_password: Le nouveau hash du mot de passe
+            
+        Returns:
+            bool: True si le hash a été mis à jour, False sinon
+        """
+        query = (
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(hashed_password=hashed_password)
+        )
+        
+        try:
+            result = await self.session.execute(query)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        
+        return result.rowcount > 0
+    
     async def delete(self, user_id: UUID) -> bool:
         """
         Supprime un utilisateur.
@@ -165,6 +191,26 @@ class PostgresUserRepository(UserRepositoryProtocol):
         
         return [self._map_to_entity(user_model) for user_model in user_models]
     
+    async def list_by_ids(self, user_ids: Sequence[UUID]) -> List[User]:
+        """
+        Liste plusieurs utilisateurs en une seule requête (id = ANY(:ids)),
+        par exemple les médecins d'une liste de rendez-vous.
+        
+        Args:
+            user_ids: Les IDs des utilisateurs à récupérer
+            
+        Returns:
+            List[User]: Les utilisateurs trouvés (ordre non garanti)
+        """
+        if not user_ids:
+            return []
+        
+        query = select(UserModel).where(UserModel.id == func.any(list(set(user_ids))))
+        result = await self.session.execute(query)
+        user_models = result.scalars().all()
+        
+        return [self._map_to_entity(user_model) for user_model in user_models]
+    
     def _map_to_entity(self, user_model: UserModel) -> User:
         """
         Convertit un modèle SQLAlchemy en entité du domaine.
@@ -0,0 +1,191 @@
+import asyncio
+import logging
+from typing import Any, List, Optional
+from urllib.parse import unquote, urlparse
+
+from shared.ports.secondary.cache_backend_protocol import CacheBackendProtocol
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+class RedisProtocolError(Exception):
+    """Erreur retournée par le serveur (réponse RESP de type -ERR)"""
+    pass
+
+class RedisCacheBackend(CacheBackendProtocol):
+    """
+    Adaptateur secondaire de cache partagé par tous les workers, sur un serveur parlant le
+    protocole Redis (RESP): Redis, Valkey, KeyDB, ou un serveur local de substitution en test.
+    Implémente le port CacheBackendProtocol.
+
+    Seules les commandes GET, SET (PX) et DEL sont utilisées, sur une connexion unique par
+    processus dont les commandes sont sérialisées. L'éviction est gérée par le serveur
+    (maxmemory-policy allkeys-lru).
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        connect_timeout: float = 1.0,
+        key_prefix: str = "medisecure:",
+        command_timeout: float = 0.5
+    ):
+        """
+        Initialise le backend; la connexion est ouverte à la première commande.
+
+        Args:
+            url: L'URL du serveur (redis://[utilisateur:mot_de_passe@]hôte:port/base)
+            connect_timeout: Le délai maximal d'ouverture de la connexion en secondes
+            key_prefix: Le préfixe ajouté à toutes les clés
+            command_timeout: Le délai maximal d'attente de la réponse à une commande en secondes
+        """
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.username = unquote(parsed.username) if parsed.username else None
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.database = int(parsed.path.lstrip("/") or 0)
+        self.connect_timeout = connect_timeout
+        self.command_timeout = command_timeout
+        self.key_prefix = key_prefix
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def evictions(self) -> int:
+        return 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Lit une entrée du cache (GET).
+
+        Args:
+            key: La clé de l'entrée
+
+        Returns:
+            Optional[bytes]: La valeur sérialisée, ou None si absente ou expirée
+        """
+        return await self._command(b"GET", self._key(key))
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """
+        Écrit une entrée dans le cache (SET ... PX).
+
+        Args:
+            key: La clé de l'entrée
+            value: La valeur sérialisée
+            ttl_seconds: La durée de vie de l'entrée en secondes
+        """
+        milliseconds = int(ttl_seconds * 1000)
+        if milliseconds <= 0:
+            return
+        await self._command(b"SET", self._key(key), value, b"PX", str(milliseconds).encode())
+
+    async def delete(self, *keys: str) -> None:
+        """
+        Supprime des entrées du cache (DEL).
+
+        Args:
+            keys: Les clés des entrées à supprimer
+        """
+        if keys:
+            await self._command(b"DEL", *(self._key(key) for key in keys))
+
+    async def close(self) -> None:
+        """Ferme la connexion au serveur"""
+        writer = self._reset()
+        if writer is not None:
+            try:
+                await writer.wait_closed()
+            except (OSError, ConnectionError):
+                pass
+
+    def _reset(self) -> Optional[asyncio.StreamWriter]:
+        """Abandonne la connexion sans attendre (utilisable pendant une annulation); retourne son flux d'écriture"""
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            writer.close()
+        return writer
+
+    def _key(self, key: str) -> bytes:
+        return (self.key_prefix + key).encode("utf-8")
+
+    async def _command(self, *args: bytes) -> Any:
+        """
+        Envoie une commande et lit sa réponse. En cas d'erreur réseau, de délai dépassé ou
+        d'annulation entre l'envoi et la lecture de la réponse, la connexion est abandonnée pour
+        être rouverte à la commande suivante (sinon celle-ci lirait la réponse restée en attente,
+        c'est-à-dire la valeur d'une autre clé), et l'erreur est propagée.
+        """
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            # Les flux et le verrou sont liés à la boucle d'événements qui les a créés
+            self._reader, self._writer = None, None
+            self._lock = asyncio.Lock()
+            self._loop = loop
+
+        async with self._lock:
+            try:
+                if self._writer is None:
+                    await self._connect()
+                self._writer.write(self._encode(args))
+                await self._writer.drain()
+                return await asyncio.wait_for(self._read_reply(), self.command_timeout)
+            except RedisProtocolError:
+                # Réponse d'erreur lue entièrement: la connexion reste utilisable
+                raise
+            except BaseException:
+                self._reset()
+                raise
+
+    async def _connect(self) -> None:
+        """Ouvre la connexion, s'authentifie et sélectionne la base"""
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.connect_timeout
+        )
+        logger.info(f"Connexion au cache {self.host}:{self.port}/{self.database}")
+        try:
+            if self.password is not None:
+                credentials = [self.username, self.password] if self.username else [self.password]
+                self._writer.write(self._encode([b"AUTH", *(value.encode("utf-8") for value in credentials)]))
+                await self._read_reply()
+            if self.database:
+                self._writer.write(self._encode([b"SELECT", str(self.database).encode()]))
+                await self._read_reply()
+        except RedisProtocolError:
+            # Connexion inutilisable (authentification refusée, base inexistante)
+            await self.close()
+            raise
+
+    @staticmethod
+    def _encode(args) -> bytes:
+        """Encode une commande en tableau RESP de chaînes binaires"""
+        parts: List[bytes] = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(parts)
+
+    async def _read_reply(self) -> Any:
+        """Lit une réponse RESP (chaîne simple, erreur, entier, chaîne binaire ou tableau)"""
+        line = await self._reader.readuntil(b"\r\n")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload
+        if kind == b"-":
+            raise RedisProtocolError(payload.decode("utf-8", "replace"))
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = await self._reader.readexactly(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            count = int(payload)
+            if count < 0:
+                return None
+            return [await self._read_reply() for _ in range(count)]
+        raise RedisProtocolError(f"Réponse inattendue du serveur: {line!r}")
@@ -54,6 +54,15 @@ class TokenResponseDTO(BaseModel):
     token_type: str
     expires_in: int
     user: UserResponseDTO
+    refresh_token: Optional[str] = None
+
+class RefreshTokenRequestDTO(BaseModel):
+    """DTO pour la demande de rafraîchissement du token d'accès"""
+    refresh_token: str
+
+class LogoutRequestDTO(BaseModel):
+    """DTO pour la déconnexion (révocation du token de rafraîchissement)"""
+    refresh_token: Optional[str] = None
 
 class PasswordResetRequestDTO(BaseModel):
     """DTO pour la demande de réinitialisation de mot de passe"""
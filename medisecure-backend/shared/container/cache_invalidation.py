@@ -0,0 +1,76 @@
+# medisecure-backend/shared/container/cache_invalidation.py
+import logging
+import os
+from typing import Optional
+
+from appointment_management.infrastructure.cache.calendar_cache import get_calendar_cache
+from dashboard.infrastructure.cache.dashboard_summary_cache import flush_dashboard_summary_cache
+from patient_management.infrastructure.cache.patient_cache import flush_patient_cache, invalidate_patient_cache
+from shared.container.container import close_session
+from shared.infrastructure.database.connection import DB_PGBOUNCER_MODE
+from shared.infrastructure.database.invalidation_listener import ChangeEvent, InvalidationListener
+from shared.services.authenticator.token_revocation_list import get_token_revocation_list
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+def create_invalidation_listener(container) -> Optional[InvalidationListener]:
+    """
+    Crée l'écoute des invalidations (LISTEN/NOTIFY) et y abonne les caches du processus.
+    Désactivée par CACHE_INVALIDATION_ENABLED=false.
+
+    Args:
+        container: Le container de l'application (rechargement de la liste de révocation)
+
+    Returns:
+        Optional[InvalidationListener]: L'écoute à démarrer, ou None si désactivée
+    """
+    if os.getenv("CACHE_INVALIDATION_ENABLED", "true").lower() != "true":
+        return None
+
+    # LISTEN est un état de session: PgBouncer en mode transaction ne le conserve pas
+    if DB_PGBOUNCER_MODE and not os.getenv("CACHE_INVALIDATION_DSN"):
+        logger.warning("Mode PgBouncer sans CACHE_INVALIDATION_DSN: l'écoute des invalidations doit se connecter directement à Postgres")
+
+    listener = InvalidationListener(keepalive_seconds=float(os.getenv("CACHE_INVALIDATION_KEEPALIVE_SECONDS", "15")))
+
+    # Dossiers patients: entrée du patient modifié
+    listener.subscribe(("patients",), invalidate_patient_cache, flush_patient_cache)
+
+    # Tableau de bord: agrégats sur les patients, rendez-vous et médecins
+    async def on_dashboard_change(event: ChangeEvent) -> None:
+        await flush_dashboard_summary_cache()
+    listener.subscribe(("patients", "appointments", "users"), on_dashboard_change, flush_dashboard_summary_cache)
+
+    # Calendrier: mois de l'ancien et du nouveau créneau; variantes include=patient / include=doctor
+    calendar_cache = get_calendar_cache()
+
+    async def on_appointment_change(event: ChangeEvent) -> None:
+        if event.id is None:
+            calendar_cache.clear()
+        else:
+            calendar_cache.invalidate_months(event.months)
+
+    async def on_relation_change(event: ChangeEvent) -> None:
+        calendar_cache.invalidate_relation("patient" if event.table == "patients" else "doctor")
+
+    async def flush_calendar_cache() -> None:
+        calendar_cache.clear()
+    listener.subscribe(("appointments",), on_appointment_change, flush_calendar_cache)
+    listener.subscribe(("patients", "users"), on_relation_change)
+
+    # Révocations faites par un autre worker; après une coupure, la liste est rechargée depuis la base
+    revocation_list = get_token_revocation_list()
+
+    async def on_token_revoked(event: ChangeEvent) -> None:
+        if event.id and event.expires_at is not None:
+            revocation_list.revoke(event.id, float(event.expires_at))
+
+    async def reload_revocations() -> None:
+        try:
+            await container.token_revocation_service().reload()
+        finally:
+            await close_session(container)
+    listener.subscribe(("revoked_tokens",), on_token_revoked, reload_revocations)
+
+    return listener
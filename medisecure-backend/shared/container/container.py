@@ -1,23 +1,42 @@
 # medisecure-backend/shared/container/container.py
 from dependency_injector import containers, providers
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
 from typing import Dict, Any  # Ajout de l'import pour Dict
 
 from shared.adapters.primary.uuid_generator import UuidGenerator
 from shared.adapters.secondary.postgres_user_repository import PostgresUserRepository
 from shared.adapters.secondary.in_memory_user_repository import InMemoryUserRepository
+from shared.adapters.secondary.postgres_revoked_token_repository import PostgresRevokedTokenRepository
+from shared.adapters.secondary.in_memory_revoked_token_repository import InMemoryRevokedTokenRepository
+from shared.adapters.secondary.postgres_collection_version_store import PostgresCollectionVersionStore
 from shared.infrastructure.services.smtp_mailer import SmtpMailer
+from shared.infrastructure.concurrency.single_flight import get_single_flight
+from shared.infrastructure.database.connection import get_engine, get_replica_set
+from shared.infrastructure.database.replica_routing import RoutingSession
 from shared.services.authenticator.basic_authenticator import BasicAuthenticator
+from shared.services.authenticator.token_revocation_list import get_token_revocation_list
+from shared.services.authenticator.token_revocation_service import TokenRevocationService
 
 from patient_management.infrastructure.adapters.secondary.postgres_patient_repository import PostgresPatientRepository
 from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
 from patient_management.domain.services.patient_service import PatientService
+from patient_management.infrastructure.cache.patient_cache import (
+    cached_patient_repository,
+    get_patient_cache_backend,
+    get_patient_cache_generations,
+    get_patient_cache_stats
+)
 
 from appointment_management.infrastructure.adapters.secondary.postgres_appointment_repository import PostgresAppointmentRepository
 from appointment_management.infrastructure.adapters.secondary.in_memory_appointment_repository import InMemoryAppointmentRepository
+from appointment_management.infrastructure.adapters.secondary.calendar_invalidating_appointment_repository import CalendarInvalidatingAppointmentRepository
+from appointment_management.infrastructure.cache.calendar_cache import get_calendar_cache
 from appointment_management.domain.services.appointment_service import AppointmentService
 
+from dashboard.infrastructure.adapters.secondary.postgres_dashboard_repository import PostgresDashboardRepository
+from dashboard.infrastructure.cache.dashboard_summary_cache import get_dashboard_summary_cache
+
 import os
 import logging
 from dotenv import load_dotenv
@@ -26,7 +45,6 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Configuration du logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class Container(containers.DeclarativeContainer):
@@ -45,20 +63,22 @@ class Container(containers.DeclarativeContainer):
     if config.database_url() and "postgresql://" in config.database_url() and "asyncpg" not in config.database_url():
         config.database_url.override(config.database_url().replace("postgresql://", "postgresql+asyncpg://"))
     
-    # Création du moteur - Activer echo=True pour le développement pour voir les requêtes SQL
-    engine = providers.Singleton(
-        create_async_engine,
-        config.database_url,
-        echo=True if config.environment() == "development" else False
-    )
+    # Moteur partagé par le processus: le container est recréé à chaque requête, le pool de
+    # connexions ne doit pas l'être (voir shared/infrastructure/database/connection.py)
+    engine = providers.Object(get_engine())
+    
+    # Réplicas en lecture partagés par le processus (vide sans DATABASE_REPLICA_URLS)
+    replica_set = providers.Object(get_replica_set())
     
-    # Création de la session SQLAlchemy
+    # Création de la session SQLAlchemy (lectures replica_read routées vers les réplicas)
     async_session_factory = providers.Factory(
         sessionmaker,
         autocommit=False,
         autoflush=False,
         bind=engine,
         class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        replicas=replica_set,
         expire_on_commit=False
     )
     
@@ -76,6 +96,9 @@ class Container(containers.DeclarativeContainer):
     patient_service = providers.Factory(PatientService)
     appointment_service = providers.Factory(AppointmentService)
     
+    # Regroupement des lectures identiques concurrentes, partagé par le processus
+    single_flight = providers.Object(get_single_flight())
+    
     # Adaptateurs secondaires - Repositories
     # Utilisons les repositories Postgres par défaut
     user_repository = providers.Factory(
@@ -83,21 +106,61 @@ class Container(containers.DeclarativeContainer):
         session=db_session
     )
     
+    # Cache de lecture des dossiers patients: backend et compteurs partagés par tout le processus
+    # (PATIENT_CACHE_BACKEND: "memory" par défaut, "redis" ou "none")
+    patient_cache_backend = providers.Object(get_patient_cache_backend())
+    patient_cache_stats = providers.Object(get_patient_cache_stats())
+    patient_cache_generations = providers.Object(get_patient_cache_generations())
+    
     patient_repository = providers.Factory(
-        PostgresPatientRepository,
-        session=db_session
+        cached_patient_repository,
+        repository=providers.Factory(PostgresPatientRepository, session=db_session),
+        backend=patient_cache_backend,
+        stats=patient_cache_stats,
+        generations=patient_cache_generations
     )
     
+    # Mois de calendrier encodés, partagés par le processus; les écritures invalident leurs mois
+    calendar_cache = providers.Object(get_calendar_cache())
+    
     appointment_repository = providers.Factory(
-        PostgresAppointmentRepository,
+        CalendarInvalidatingAppointmentRepository,
+        repository=providers.Factory(PostgresAppointmentRepository, session=db_session),
+        calendar_cache=calendar_cache
+    )
+    
+    revoked_token_repository = providers.Factory(
+        PostgresRevokedTokenRepository,
+        session=db_session
+    )
+    
+    dashboard_repository = providers.Factory(
+        PostgresDashboardRepository,
+        session=db_session
+    )
+    
+    collection_version_store = providers.Factory(
+        PostgresCollectionVersionStore,
         session=db_session
     )
     
     # Repositories en mémoire pour les tests
     user_repository_in_memory = providers.Factory(InMemoryUserRepository)
+    revoked_token_repository_in_memory = providers.Factory(InMemoryRevokedTokenRepository)
     patient_repository_in_memory = providers.Factory(InMemoryPatientRepository)
     appointment_repository_in_memory = providers.Factory(InMemoryAppointmentRepository)
     
+    # Révocation des tokens: la liste en mémoire est partagée par tout le processus
+    token_revocation_list = providers.Object(get_token_revocation_list())
+    token_revocation_service = providers.Factory(
+        TokenRevocationService,
+        revoked_token_repository=revoked_token_repository,
+        revocation_list=token_revocation_list
+    )
+    
+    # Statistiques du tableau de bord: le cache est partagé par tout le processus
+    dashboard_summary_cache = providers.Object(get_dashboard_summary_cache())
+    
     # Services d'infrastructure
     mailer = providers.Factory(SmtpMailer)
     
@@ -113,4 +176,14 @@ class Container(containers.DeclarativeContainer):
             masked_url = f"{masked_url[0]}:***@{parts[1]}"
             logger.info(f"Environnement: {env}, Base de données: {masked_url}")
         else:
-            logger.info(f"Environnement: {env}, URL de base de données configurée")
\ No newline at end of file
+            logger.info(f"Environnement: {env}, URL de base de données configurée")
+
+async def close_session(container: Container) -> None:
+    """
+    Ferme la session du container si elle a été ouverte: sa connexion est rendue au pool.
+
+    Args:
+        container: Le container de la requête
+    """
+    if container.db_session.initialized:
+        await container.db_session().close()
@@ -0,0 +1,109 @@
+# medisecure-backend/shared/container/warmup.py
+import asyncio
+import logging
+import os
+import time
+from datetime import date
+from typing import Any, Awaitable, Callable, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.pool import QueuePool
+
+from appointment_management.infrastructure.adapters.secondary.postgres_appointment_repository import PostgresAppointmentRepository
+from patient_management.infrastructure.adapters.secondary.postgres_patient_repository import PostgresPatientRepository
+from shared.adapters.secondary.postgres_collection_version_store import PostgresCollectionVersionStore
+from shared.adapters.secondary.postgres_user_repository import PostgresUserRepository
+from shared.ports.secondary.collection_version_store_protocol import (
+    APPOINTMENTS_COLLECTION,
+    PATIENTS_COLLECTION,
+    USERS_COLLECTION,
+)
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Nombre de connexions ouvertes au démarrage de chaque worker (0 désactive le préchauffage)
+DB_WARMUP_CONNECTIONS = int(os.getenv("DB_WARMUP_CONNECTIONS", "2"))
+
+# Identifiant d'aucune ligne: les lectures de préchauffage ne retournent rien
+_NO_ID = UUID(int=0)
+
+# Lectures des routes les plus sollicitées: leur première exécution paie la compilation SQLAlchemy
+HOT_READS: Sequence[Tuple[str, Callable[[AsyncSession], Awaitable[Any]]]] = (
+    ("utilisateur par email", lambda session: PostgresUserRepository(session).get_by_email("")),
+    ("versions des collections", lambda session: PostgresCollectionVersionStore(session).get_versions(
+        (PATIENTS_COLLECTION, APPOINTMENTS_COLLECTION, USERS_COLLECTION)
+    )),
+    ("patient par ID", lambda session: PostgresPatientRepository(session).get_by_id(_NO_ID)),
+    ("champs d'un patient", lambda session: PostgresPatientRepository(session).get_projected_by_id(
+        _NO_ID, ("created_at", "updated_at", "has_consent")
+    )),
+    ("liste des patients", lambda session: PostgresPatientRepository(session).list_summaries(0, 1)),
+    ("nombre de patients", lambda session: PostgresPatientRepository(session).count()),
+    ("rendez-vous d'un patient", lambda session: PostgresAppointmentRepository(session).get_by_patient(_NO_ID, 0, 1)),
+    ("calendrier", lambda session: PostgresAppointmentRepository(session).get_by_date_range(date.today(), date.today(), 0, 1)),
+)
+
+async def open_pool_connections(engine: AsyncEngine, count: int) -> int:
+    """
+    Ouvre des connexions du pool en même temps (connexion TCP et authentification), puis les y rend.
+
+    Args:
+        engine: Le moteur dont le pool est préchauffé
+        count: Le nombre de connexions à ouvrir (au plus la taille du pool, qui seule les conserve)
+
+    Returns:
+        int: Le nombre de connexions ouvertes
+    """
+    results = await asyncio.gather(*(engine.connect() for _ in range(count)), return_exceptions=True)
+    connections = [result for result in results if not isinstance(result, BaseException)]
+    try:
+        for connection in connections:
+            await connection.execute(text("SELECT 1"))
+    finally:
+        for connection in connections:
+            await connection.close()
+    for error in (result for result in results if isinstance(result, BaseException)):
+        logger.warning(f"Préchauffage du pool: connexion impossible ({str(error)})")
+    return len(connections)
+
+async def warm_up_database(container, connections: int = DB_WARMUP_CONNECTIONS) -> None:
+    """
+    Préchauffe l'accès à la base de données avant les premières requêtes d'un worker: ouverture
+    des connexions du pool et première compilation des lectures les plus sollicitées.
+    Un échec est journalisé sans empêcher le démarrage (voir /api/ready).
+
+    Args:
+        container: Le container de l'application (moteur et fabrique de sessions)
+        connections: Le nombre de connexions à ouvrir
+    """
+    if connections <= 0:
+        return
+
+    started = time.perf_counter()
+    engine = container.engine()
+    # Sans pool dans le worker (NullPool, mode PgBouncer), une connexion vérifie seulement l'accès
+    pool_size = engine.pool.size() if isinstance(engine.pool, QueuePool) else 1
+    opened = await open_pool_connections(engine, min(connections, pool_size))
+    if not opened:
+        return
+
+    compiled = 0
+    session = container.async_session_factory()()
+    try:
+        for name, read in HOT_READS:
+            try:
+                await read(session)
+                compiled += 1
+            except Exception as e:
+                logger.warning(f"Préchauffage de la lecture \"{name}\" impossible: {str(e)}")
+            await session.rollback()
+    finally:
+        await session.close()
+
+    logger.info(
+        f"Pool préchauffé en {(time.perf_counter() - started) * 1000:.0f} ms: "
+        f"{opened} connexions, {compiled}/{len(HOT_READS)} lectures compilées"
+    )
@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import Generic, List, TypeVar
+
+T = TypeVar("T")
+
+@dataclass(frozen=True)
+class PagedResult(Generic[T]):
+    """
+    Page de résultats retournée par un repository: les éléments de la page et le nombre total
+    d'éléments correspondant aux critères (toutes pages confondues), lus en une seule requête.
+    """
+    items: List[T] = field(default_factory=list)
+    total: int = 0
+
@@ -0,0 +1,19 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+@dataclass
+class RevokedToken:
+    """
+    Entité représentant un token JWT révoqué.
+    Un token révoqué reste inscrit jusqu'à sa date d'expiration naturelle.
+    """
+    jti: str
+    expires_at: datetime
+    user_id: Optional[UUID] = None
+    revoked_at: datetime = field(default_factory=datetime.utcnow)
+
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
+        """Vérifie si le token révoqué a dépassé sa date d'expiration"""
+        return self.expires_at <= (now or datetime.utcnow())
@@ -0,0 +1,44 @@
+from typing import Hashable, List
+
+class CacheGenerations:
+    """
+    Générations des entrées d'un cache de lecture, partagées par le processus: une lecture
+    manquée relève la génération de sa clé avant d'interroger la base, et ne remplit le cache
+    que si aucune invalidation n'est survenue entre-temps (sinon elle y remettrait l'ancienne
+    version, jusqu'à l'expiration de l'entrée).
+
+    Les clés sont réparties sur un nombre fixe de compteurs: la mémoire reste bornée, et deux
+    clés d'un même compteur ne font que renoncer à une écriture dans le cache.
+    """
+
+    def __init__(self, stripes: int = 4096):
+        """
+        Initialise les générations.
+
+        Args:
+            stripes: Le nombre de compteurs
+        """
+        self._counters: List[int] = [0] * stripes
+        self.bumps = 0
+
+    def get(self, key: Hashable) -> int:
+        """
+        Retourne la génération d'une clé, à relever avant la lecture de la base de données.
+
+        Args:
+            key: La clé de l'entrée
+
+        Returns:
+            int: La génération de la clé
+        """
+        return self._counters[hash(key) % len(self._counters)]
+
+    def bump(self, key: Hashable) -> None:
+        """Fait changer la génération d'une clé (invalidation de son entrée)"""
+        self._counters[hash(key) % len(self._counters)] += 1
+        self.bumps += 1
+
+    def bump_all(self) -> None:
+        """Fait changer la génération de toutes les clés (cache vidé)"""
+        self._counters = [counter + 1 for counter in self._counters]
+        self.bumps += 1
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+@dataclass
+class CacheStats:
+    """
+    Compteurs cumulés d'un cache de lecture, partagés par le processus.
+
+    Attributes:
+        hits: Le nombre de lectures servies par le cache
+        misses: Le nombre de lectures transmises au repository
+        invalidations: Le nombre d'entrées invalidées après une écriture
+        errors: Le nombre d'opérations du backend en échec (le cache est alors contourné)
+        evictions: Le nombre d'entrées évincées par le backend (LRU), relevé après chaque écriture
+    """
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    errors: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
@@ -0,0 +1,86 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+class TTLCache(Generic[V]):
+    """
+    Cache en mémoire du processus dont les entrées expirent après une durée fixe.
+    Le nombre d'entrées est borné: au-delà, l'entrée la moins récemment utilisée est évincée.
+    Prévu pour des résultats coûteux à calculer et tolérant quelques secondes de retard.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialise un cache vide.
+
+        Args:
+            ttl_seconds: La durée de vie d'une entrée en secondes (0 désactive le cache)
+            max_entries: Le nombre maximal d'entrées conservées
+            clock: L'horloge utilisée pour les expirations (monotone par défaut)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        # Nombre d'entrées évincées pour respecter max_entries (les expirations ne sont pas comptées)
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """
+        Retourne la valeur associée à une clé si elle n'a pas expiré.
+
+        Args:
+            key: La clé de l'entrée
+
+        Returns:
+            Optional[V]: La valeur, ou None si absente ou expirée
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Associe une valeur à une clé pour la durée de vie du cache.
+
+        Args:
+            key: La clé de l'entrée
+            value: La valeur à conserver
+            ttl_seconds: La durée de vie de cette entrée (par défaut celle du cache)
+        """
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl_seconds <= 0:
+            return
+        self._entries[key] = (self._clock() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Supprime une entrée, ou toutes les entrées si aucune clé n'est donnée.
+
+        Args:
+            key: La clé de l'entrée à supprimer
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
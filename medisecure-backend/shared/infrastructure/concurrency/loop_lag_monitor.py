@@ -0,0 +1,57 @@
+import asyncio
+import time
+from typing import Callable, Optional
+
+class LoopLagMonitor:
+    """
+    Mesure le retard de la boucle d'événements: une tâche se réveille à intervalle fixe et
+    relève l'écart avec l'heure prévue. Un retard élevé signifie que les coroutines prêtes
+    attendent leur tour (calcul bloquant, trop de requêtes simultanées).
+
+    La valeur suit immédiatement une hausse et décroît progressivement.
+    """
+
+    def __init__(self, interval_seconds: float = 0.05, decay: float = 0.8, clock: Callable[[], float] = time.perf_counter):
+        """
+        Initialise le moniteur; la mesure démarre au premier appel de ensure_started().
+
+        Args:
+            interval_seconds: L'intervalle entre deux mesures
+            decay: La part de l'ancienne valeur conservée lorsque le retard diminue
+            clock: L'horloge utilisée pour les mesures
+        """
+        self.interval_seconds = interval_seconds
+        self.decay = decay
+        self._clock = clock
+        self._task: Optional[asyncio.Task] = None
+        self.lag = 0.0
+
+    def ensure_started(self) -> None:
+        """Démarre la mesure dans la boucle courante (sans effet si elle y tourne déjà)"""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._task = loop.create_task(self._run(), name="loop-lag-monitor")
+
+    def record(self, lag: float) -> None:
+        """
+        Prend en compte une mesure du retard.
+
+        Args:
+            lag: Le retard mesuré en secondes
+        """
+        self.lag = lag if lag >= self.lag else self.lag * self.decay + lag * (1 - self.decay)
+
+    async def _run(self) -> None:
+        while True:
+            start = self._clock()
+            await asyncio.sleep(self.interval_seconds)
+            self.record(max(0.0, self._clock() - start - self.interval_seconds))
+
+# Instance partagée par le processus
+_loop_lag_monitor = LoopLagMonitor()
+
+def get_loop_lag_monitor() -> LoopLagMonitor:
+    """
+    Fournit la mesure du retard de la boucle d'événements partagée par le processus.
+    """
+    return _loop_lag_monitor
@@ -0,0 +1,106 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+@dataclass
+class SingleFlightStats:
+    """
+    Compteurs cumulés du regroupement des lectures concurrentes, partagés par le processus.
+
+    Attributes:
+        executions: Le nombre de lectures effectivement exécutées
+        coalesced: Le nombre d'appels servis par une lecture déjà en cours
+        abandoned: Le nombre de lectures annulées car leur appelant initial est parti
+    """
+    executions: int = 0
+    coalesced: int = 0
+    abandoned: int = 0
+
+    @property
+    def coalesced_ratio(self) -> float:
+        calls = self.executions + self.coalesced
+        return self.coalesced / calls if calls else 0.0
+
+class _Flight:
+    """Lecture en cours, et si elle a été annulée au départ de son appelant initial"""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.abandoned = False
+
+class SingleFlight:
+    """
+    Regroupe les lectures identiques concurrentes (même clé): la première est exécutée dans une
+    tâche, les suivantes attendent cette tâche et reçoivent le même résultat ou la même exception.
+
+    La lecture utilise les ressources de l'appelant qui l'a lancée (sa session de base de
+    données, fermée à la fin de sa requête): elle ne lui survit pas. Si cet appelant est annulé
+    (client déconnecté), la lecture est annulée et les appelants qui l'attendaient la relancent,
+    le premier d'entre eux avec ses propres ressources. L'annulation d'un autre appelant
+    n'interrompt rien. Le résultat n'est pas conservé au-delà de la lecture: les appelants ne
+    doivent pas le modifier.
+    """
+
+    def __init__(self):
+        """Initialise un regroupement sans lecture en cours"""
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.stats = SingleFlightStats()
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: Hashable, read: Callable[[], Awaitable[T]]) -> T:
+        """
+        Exécute une lecture, ou attend celle déjà en cours pour la même clé.
+
+        Args:
+            key: L'identifiant de la lecture (tout ce dont dépend son résultat)
+            read: La fonction qui lance la lecture (appelée seulement si aucune n'est en cours)
+
+        Returns:
+            T: Le résultat de la lecture, partagé par tous les appelants
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            flight = self._flights.get(key)
+            owner = flight is None or flight.task.get_loop() is not loop
+            if owner:
+                flight = self._start(loop, key, read)
+            else:
+                self.stats.coalesced += 1
+
+            # asyncio.wait n'annule pas la lecture si l'appelant est annulé
+            try:
+                await asyncio.wait({flight.task})
+            finally:
+                if owner and not flight.task.done():
+                    # L'appelant initial est parti: sa session va être fermée, la lecture est annulée
+                    self._forget(key, flight)
+                    flight.abandoned = True
+                    flight.task.cancel()
+                    self.stats.abandoned += 1
+
+            if not (flight.abandoned and flight.task.cancelled()):
+                return flight.task.result()
+
+    def _start(self, loop: asyncio.AbstractEventLoop, key: Hashable, read: Callable[[], Awaitable[T]]) -> _Flight:
+        flight = _Flight(loop.create_task(read()))
+        self._flights[key] = flight
+        flight.task.add_done_callback(lambda _task: self._forget(key, flight))
+        self.stats.executions += 1
+        return flight
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+# Instance partagée par le processus (le container est recréé à chaque requête)
+_single_flight = SingleFlight()
+
+def get_single_flight() -> SingleFlight:
+    """
+    Fournit le regroupement des lectures concurrentes partagé par le processus.
+    """
+    return _single_flight
@@ -2,5 +2,8 @@
 from shared.infrastructure.database.models.user_model import UserModel
 from shared.infrastructure.database.models.patient_model import PatientModel
 from shared.infrastructure.database.models.appointment_model import AppointmentModel
+from shared.infrastructure.database.models.revoked_token_model import RevokedTokenModel
+from shared.infrastructure.database.models.rate_limit_bucket_model import RateLimitBucketModel
+from shared.infrastructure.database.models.collection_version_model import CollectionVersionModel
 
 # Cet ordre est important pour résoudre les dépendances circulaires
\ No newline at end of file
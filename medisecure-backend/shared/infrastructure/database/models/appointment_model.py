@@ -1,5 +1,5 @@
 # shared/infrastructure/database/models/appointment_model.py
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, Enum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -40,5 +40,14 @@ class AppointmentModel(Base):
     patient = relationship("PatientModel", back_populates="appointments")
     doctor = relationship("UserModel", foreign_keys=[doctor_id])
     
+    # Index des filtres de la liste des rendez-vous (AppointmentFilter), triés par date de début
+    __table_args__ = (
+        Index("ix_appointments_start_time", "start_time"),
+        Index("ix_appointments_end_time", "end_time"),
+        Index("ix_appointments_patient_id_start_time", "patient_id", "start_time"),
+        Index("ix_appointments_doctor_id_start_time", "doctor_id", "start_time"),
+        Index("ix_appointments_status_start_time", "status", "start_time"),
+    )
+    
     def __repr__(self):
         return f"<Appointment {self.id} for patient {self.patient_id}>"
\ No newline at end of file
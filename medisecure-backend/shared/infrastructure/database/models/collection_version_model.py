@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, BigInteger, DateTime, SmallInteger
+from datetime import datetime
+
+from shared.infrastructure.database.connection import Base
+
+class CollectionVersionModel(Base):
+    """
+    Modèle SQLAlchemy pour la table des versions de collections (incrémentées par trigger à chaque écriture).
+    Chaque collection a plusieurs compteurs (slot); sa version est leur somme.
+    """
+    __tablename__ = "collection_versions"
+
+    name = Column(String(50), primary_key=True)
+    slot = Column(SmallInteger, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<CollectionVersion {self.name}[{self.slot}]={self.version}>"
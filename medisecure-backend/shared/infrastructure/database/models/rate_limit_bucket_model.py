@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, Float, Boolean, DateTime
+from datetime import datetime
+
+from shared.infrastructure.database.connection import Base
+
+class RateLimitBucketModel(Base):
+    """Modèle SQLAlchemy pour la table des seaux de limitation de débit (partagés entre workers)"""
+    __tablename__ = "rate_limit_buckets"
+    # Données éphémères: pas de journalisation WAL
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
+
+    key = Column(String, primary_key=True)
+    tokens = Column(Float, nullable=False)
+    allowed = Column(Boolean, nullable=False, default=True)
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<RateLimitBucket {self.key}>"
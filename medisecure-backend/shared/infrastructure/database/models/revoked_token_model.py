@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+
+from shared.infrastructure.database.connection import Base
+
+class RevokedTokenModel(Base):
+    """Modèle SQLAlchemy pour la table des tokens JWT révoqués"""
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String, primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    revoked_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<RevokedToken {self.jti}>"
@@ -0,0 +1,36 @@
+# medisecure-backend/shared/infrastructure/database/pagination.py
+from typing import Any, List, Tuple
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Colonne ajoutée aux requêtes paginées: nombre total de lignes avant OFFSET / LIMIT
+TOTAL_COLUMN = "_total"
+
+async def fetch_page(session: AsyncSession, query: Select, skip: int, limit: int) -> Tuple[List[Any], int]:
+    """
+    Exécute une requête paginée et retourne ses lignes avec le nombre total de lignes correspondant
+    aux critères, calculé dans la même requête par COUNT(*) OVER () (évalué avant OFFSET / LIMIT).
+
+    Une page vide au-delà de la dernière page ne porte pas le total: il est alors lu par un COUNT
+    séparé, seul cas où deux requêtes sont nécessaires.
+
+    Args:
+        session: La session de base de données
+        query: La requête filtrée et triée, sans OFFSET ni LIMIT
+        skip: Le nombre de lignes à sauter
+        limit: Le nombre maximum de lignes à retourner
+
+    Returns:
+        Tuple[List[Any], int]: Les lignes de la page (colonne TOTAL_COLUMN comprise) et le total
+    """
+    paged = query.add_columns(func.count().over().label(TOTAL_COLUMN)).offset(skip).limit(limit)
+    rows = list(await session.execute(paged))
+    if rows:
+        return rows, rows[0]._mapping[TOTAL_COLUMN]
+    if skip == 0:
+        return rows, 0
+
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    result = await session.execute(count_query)
+    return rows, result.scalar_one()
@@ -0,0 +1,124 @@
+# medisecure-backend/shared/infrastructure/database/pool_monitor.py
+import itertools
+import time
+from typing import Callable, Dict
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+
+from shared.infrastructure.database.request_deadline import record_pool_timeout
+
+class PoolWaitMonitor:
+    """
+    Mesure l'attente d'une connexion du pool (checkout): moyenne glissante des attentes
+    terminées et durée de la plus ancienne attente en cours. La seconde révèle un pool
+    bloqué avant qu'aucune attente ne se termine.
+
+    La moyenne décroît avec le temps écoulé depuis la dernière attente terminée: sans
+    checkout (par exemple parce que le contrôle d'admission déleste les requêtes), elle
+    retombe d'elle-même au lieu de rester figée à sa valeur de pointe.
+    """
+
+    def __init__(
+        self,
+        smoothing: float = 0.2,
+        clock: Callable[[], float] = time.perf_counter,
+        half_life_seconds: float = 1.0
+    ):
+        """
+        Initialise le moniteur.
+
+        Args:
+            smoothing: Le poids d'une nouvelle attente dans la moyenne glissante
+            clock: L'horloge utilisée pour les mesures
+            half_life_seconds: La durée au bout de laquelle la moyenne est divisée par deux sans nouvelle attente
+        """
+        self.smoothing = smoothing
+        self.half_life_seconds = half_life_seconds
+        self._clock = clock
+        self._waiting: Dict[int, float] = {}
+        self._tokens = itertools.count()
+        self._average = 0.0
+        self._updated_at = clock()
+        self.checkouts = 0
+
+    def begin(self) -> int:
+        """Signale le début d'une attente; retourne le jeton à passer à end()"""
+        token = next(self._tokens)
+        self._waiting[token] = self._clock()
+        return token
+
+    def end(self, token: int) -> None:
+        """Signale la fin d'une attente (connexion obtenue ou délai dépassé)"""
+        now = self._clock()
+        wait = now - self._waiting.pop(token)
+        average = self._decayed(now)
+        self._average = average + self.smoothing * (wait - average)
+        self._updated_at = now
+        self.checkouts += 1
+
+    @property
+    def average(self) -> float:
+        """Moyenne glissante des attentes terminées, décrue depuis la dernière (secondes)"""
+        return self._decayed(self._clock())
+
+    def _decayed(self, now: float) -> float:
+        return self._average * 0.5 ** ((now - self._updated_at) / self.half_life_seconds)
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiting)
+
+    def current_wait(self) -> float:
+        """
+        Retourne l'attente actuelle d'une connexion.
+
+        Returns:
+            float: La plus grande valeur entre la moyenne glissante et l'attente en cours la plus ancienne (secondes)
+        """
+        now = self._clock()
+        if not self._waiting:
+            return self._decayed(now)
+        return max(self._decayed(now), now - min(self._waiting.values()))
+
+# Instance partagée par le processus (un pool par worker)
+_pool_wait_monitor = PoolWaitMonitor()
+
+def get_pool_wait_monitor() -> PoolWaitMonitor:
+    """
+    Fournit la mesure de l'attente des connexions du pool partagée par le processus.
+    """
+    return _pool_wait_monitor
+
+class MonitoredAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Pool asyncio de SQLAlchemy dont les attentes de connexion sont mesurées par PoolWaitMonitor.
+    Une attente expirée est relevée sur l'échéance de la requête HTTP en cours (réponse 503).
+    """
+
+    def _do_get(self):
+        token = _pool_wait_monitor.begin()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            record_pool_timeout()
+            raise
+        finally:
+            _pool_wait_monitor.end(token)
+
+class MonitoredNullPool(NullPool):
+    """
+    NullPool (mode PgBouncer) dont l'ouverture des connexions est mesurée par PoolWaitMonitor.
+
+    Sans pool, il n'y a pas de file d'attente du côté de l'application: le signal retenu est la
+    durée d'ouverture d'une connexion vers PgBouncer, qui s'allonge lorsque PgBouncer ou la base
+    saturent. L'attente d'une connexion serveur dans la file de PgBouncer (cl_waiting), qui
+    intervient à la première requête de la transaction, n'y figure pas.
+    """
+
+    def _do_get(self):
+        token = _pool_wait_monitor.begin()
+        try:
+            return super()._do_get()
+        finally:
+            _pool_wait_monitor.end(token)
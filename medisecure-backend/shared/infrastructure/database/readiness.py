@@ -0,0 +1,111 @@
+# medisecure-backend/shared/infrastructure/database/readiness.py
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from shared.infrastructure.concurrency.single_flight import SingleFlight, get_single_flight
+from shared.infrastructure.database.connection import get_engine
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Durée pendant laquelle le résultat d'une vérification est réutilisé par les sondes suivantes
+READINESS_CACHE_SECONDS = float(os.getenv("READINESS_CACHE_SECONDS", "5"))
+
+# Délai maximal d'une vérification (connexion du pool comprise)
+READINESS_TIMEOUT_SECONDS = float(os.getenv("READINESS_TIMEOUT_SECONDS", "2"))
+
+@dataclass(frozen=True)
+class ReadinessStatus:
+    """
+    Résultat d'une vérification de la base de données.
+
+    Attributes:
+        ready: True si la base de données a répondu
+        checked_at: L'instant de la vérification (horloge de la sonde)
+        error: La cause de l'échec, journalisée mais non exposée par /api/ready
+    """
+    ready: bool
+    checked_at: float
+    error: Optional[str] = None
+
+class ReadinessProbe:
+    """
+    Vérifie que la base de données est joignable (SELECT 1 sur une connexion du pool).
+
+    Le résultat est conservé READINESS_CACHE_SECONDS: les sondes de l'orchestrateur, quel que
+    soit leur nombre, font au plus une requête par intervalle et par worker, et les sondes
+    simultanées partagent la même vérification.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        ttl_seconds: float = READINESS_CACHE_SECONDS,
+        timeout_seconds: float = READINESS_TIMEOUT_SECONDS,
+        single_flight: Optional[SingleFlight] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialise la sonde.
+
+        Args:
+            engine: Le moteur dont le pool est vérifié
+            ttl_seconds: La durée de réutilisation d'un résultat
+            timeout_seconds: Le délai maximal d'une vérification
+            single_flight: Le regroupement des vérifications simultanées
+            clock: L'horloge utilisée pour l'expiration du résultat
+        """
+        self.engine = engine
+        self.ttl_seconds = ttl_seconds
+        self.timeout_seconds = timeout_seconds
+        self.single_flight = single_flight or get_single_flight()
+        self._clock = clock
+        self._status: Optional[ReadinessStatus] = None
+        self.checks = 0
+
+    async def check(self) -> ReadinessStatus:
+        """
+        Retourne l'état de la base de données, vérifié au plus une fois par intervalle.
+
+        Returns:
+            ReadinessStatus: Le dernier résultat, ou celui d'une nouvelle vérification s'il a expiré
+        """
+        status = self._status
+        if status is not None and self._clock() - status.checked_at < self.ttl_seconds:
+            return status
+        return await self.single_flight.do(("readiness", id(self)), self._probe)
+
+    async def _probe(self) -> ReadinessStatus:
+        self.checks += 1
+        try:
+            await asyncio.wait_for(self._ping(), self.timeout_seconds)
+            status = ReadinessStatus(ready=True, checked_at=self._clock())
+        except Exception as e:
+            status = ReadinessStatus(ready=False, checked_at=self._clock(), error=str(e) or type(e).__name__)
+
+        previous, self._status = self._status, status
+        if not status.ready and (previous is None or previous.ready):
+            logger.warning(f"Base de données injoignable: {status.error}")
+        elif status.ready and previous is not None and not previous.ready:
+            logger.info("Base de données de nouveau joignable")
+        return status
+
+    async def _ping(self) -> None:
+        async with self.engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+# Instance partagée par le processus
+_readiness_probe = ReadinessProbe(get_engine())
+
+def get_readiness_probe() -> ReadinessProbe:
+    """
+    Fournit la sonde de disponibilité de la base de données partagée par le processus.
+    """
+    return _readiness_probe
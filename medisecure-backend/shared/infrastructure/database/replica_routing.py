@@ -0,0 +1,208 @@
+# medisecure-backend/shared/infrastructure/database/replica_routing.py
+import asyncio
+import functools
+import itertools
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.dml import UpdateBase
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Retard de réplication: nul si le serveur n'est pas un réplica ou s'il a rejoué tout le WAL reçu
+REPLICATION_LAG_QUERY = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+class ReplicaSet:
+    """
+    Réplicas en lecture de la base de données: choix à tour de rôle parmi les réplicas
+    disponibles, vérification périodique (connexion et retard de réplication), et mise à
+    l'écart immédiate d'un réplica dont la connexion échoue.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        max_lag_seconds: float = 5.0,
+        check_interval_seconds: float = 5.0,
+        check_timeout_seconds: float = 2.0
+    ):
+        """
+        Initialise l'ensemble des réplicas (tous considérés disponibles avant la première vérification).
+
+        Args:
+            engines: Les moteurs des réplicas
+            max_lag_seconds: Le retard de réplication au-delà duquel un réplica est écarté
+            check_interval_seconds: L'intervalle entre deux vérifications
+            check_timeout_seconds: Le délai accordé à la vérification d'un réplica
+        """
+        self.engines: List[AsyncEngine] = list(engines)
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.check_timeout_seconds = check_timeout_seconds
+        self._healthy: Dict[int, bool] = {id(engine): True for engine in self.engines}
+        self._turns = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+        for engine in self.engines:
+            event.listen(engine.sync_engine, "handle_error", functools.partial(self._on_error, engine))
+
+    def __len__(self) -> int:
+        return len(self.engines)
+
+    def is_healthy(self, engine: AsyncEngine) -> bool:
+        return self._healthy.get(id(engine), False)
+
+    def choose(self) -> Optional[AsyncEngine]:
+        """
+        Choisit un réplica disponible, à tour de rôle.
+
+        Returns:
+            Optional[AsyncEngine]: Le réplica choisi, ou None si aucun n'est disponible
+        """
+        healthy = [engine for engine in self.engines if self._healthy[id(engine)]]
+        if not healthy:
+            return None
+        return healthy[next(self._turns) % len(healthy)]
+
+    def mark(self, engine: AsyncEngine, healthy: bool, reason: str = "") -> None:
+        """
+        Met à jour la disponibilité d'un réplica (journalisée lorsqu'elle change).
+
+        Args:
+            engine: Le réplica
+            healthy: Sa disponibilité
+            reason: La cause d'une indisponibilité
+        """
+        if self._healthy.get(id(engine)) == healthy:
+            return
+        self._healthy[id(engine)] = healthy
+        if healthy:
+            logger.info(f"Réplica {engine.url.host} de nouveau disponible")
+        else:
+            logger.warning(f"Réplica {engine.url.host} écarté: {reason}")
+
+    def _on_error(self, engine: AsyncEngine, context) -> None:
+        if context.is_disconnect or context.connection is None:
+            self.mark(engine, False, str(context.original_exception))
+
+    async def check(self) -> None:
+        """Vérifie chaque réplica: connexion et retard de réplication"""
+        await asyncio.gather(*(self._check(engine) for engine in self.engines))
+
+    async def _check(self, engine: AsyncEngine) -> None:
+        try:
+            lag = await asyncio.wait_for(self._replication_lag(engine), self.check_timeout_seconds)
+        except Exception as e:
+            self.mark(engine, False, str(e) or type(e).__name__)
+            return
+        if lag > self.max_lag_seconds:
+            self.mark(engine, False, f"retard de réplication de {lag:.1f} s")
+        else:
+            self.mark(engine, True)
+
+    async def _replication_lag(self, engine: AsyncEngine) -> float:
+        async with engine.connect() as connection:
+            return float((await connection.execute(REPLICATION_LAG_QUERY)).scalar() or 0)
+
+    async def start(self) -> None:
+        """Vérifie les réplicas, puis démarre leur vérification périodique"""
+        if not self.engines or self._task is not None:
+            return
+        await self.check()
+        self._task = asyncio.create_task(self._run(), name="replica-health-check")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval_seconds)
+            await self.check()
+
+    async def stop(self) -> None:
+        """Arrête la vérification périodique et ferme les connexions des réplicas"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        for engine in self.engines:
+            await engine.dispose()
+
+# Lectures autorisées sur un réplica dans le contexte courant (voir replica_read)
+_replica_reads: ContextVar[bool] = ContextVar("replica_reads", default=False)
+
+# Lectures imposées au primaire dans le contexte courant, même replica_read (voir primary_reads)
+_primary_reads: ContextVar[bool] = ContextVar("primary_reads", default=False)
+
+@contextmanager
+def replica_reads() -> Iterator[None]:
+    """Autorise les lectures du bloc à être servies par un réplica"""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+@contextmanager
+def primary_reads() -> Iterator[None]:
+    """
+    Envoie au primaire toutes les lectures du bloc, y compris celles marquées replica_read.
+    Pour les résultats conservés dans un cache du processus: invalidé à chaque écriture, il ne
+    doit pas être rempli par un réplica en retard, dont la réponse y resterait après
+    l'invalidation.
+    """
+    token = _primary_reads.set(True)
+    try:
+        yield
+    finally:
+        _primary_reads.reset(token)
+
+def replica_read(method):
+    """
+    Décorateur des méthodes de repository en lecture seule dont le résultat peut avoir le retard
+    d'un réplica (listes, recherches, comptages, calendrier). Les lectures unitaires et les
+    lectures qui précèdent une écriture (conflits, unicité) restent sur le primaire.
+    """
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        with replica_reads():
+            return await method(*args, **kwargs)
+    return wrapper
+
+class RoutingSession(Session):
+    """
+    Session qui envoie les lectures autorisées (replica_read) à un réplica et tout le reste au
+    primaire. Après la première écriture de la session, toutes ses lectures vont au primaire
+    (lecture de ses propres écritures). Une connexion demandée sans requête hors d'une lecture
+    autorisée (session.connection(), par exemple pour un COPY) compte comme une écriture. Le
+    réplica est choisi une fois par session.
+    """
+
+    def __init__(self, *args, replicas: Optional[ReplicaSet] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self.replica: Optional[AsyncEngine] = None
+        self.wrote = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or isinstance(clause, UpdateBase) or (clause is None and not _replica_reads.get()):
+            self.wrote = True
+        elif (
+            self.replicas
+            and not self.wrote
+            and _replica_reads.get()
+            and not _primary_reads.get()
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+        ):
+            if self.replica is None or not self.replicas.is_healthy(self.replica):
+                self.replica = self.replicas.choose()
+            if self.replica is not None:
+                return self.replica.sync_engine
+        return super().get_bind(mapper, clause=clause, **kwargs)
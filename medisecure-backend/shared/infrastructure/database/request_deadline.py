@@ -0,0 +1,103 @@
+# medisecure-backend/shared/infrastructure/database/request_deadline.py
+import time
+from contextvars import ContextVar, Token
+from typing import Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+# Code SQLSTATE d'une requête annulée par Postgres (statement_timeout ou demande d'annulation)
+QUERY_CANCELED_SQLSTATE = "57014"
+
+class RequestDeadline:
+    """
+    Échéance d'une requête HTTP: budget de temps partagé par toutes ses transactions, et cause
+    du dépassement relevée par la couche d'accès aux données (annulation d'une requête SQL par
+    statement_timeout, attente d'une connexion du pool expirée).
+    """
+
+    STATEMENT_TIMEOUT = "statement_timeout"
+    POOL_TIMEOUT = "pool_timeout"
+
+    def __init__(self, budget_seconds: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialise l'échéance.
+
+        Args:
+            budget_seconds: Le temps accordé à la requête à partir de maintenant
+            clock: L'horloge utilisée pour les mesures
+        """
+        self._clock = clock
+        self.budget_seconds = budget_seconds
+        self.expires_at = clock() + budget_seconds
+        self.breach: Optional[str] = None
+
+    def remaining(self) -> float:
+        """Retourne le temps restant en secondes (négatif une fois l'échéance passée)"""
+        return self.expires_at - self._clock()
+
+    def statement_timeout_ms(self) -> int:
+        """
+        Retourne le statement_timeout d'une nouvelle transaction: le temps restant, au moins 1 ms
+        (0 désactiverait la limite).
+        """
+        return max(1, int(self.remaining() * 1000))
+
+# Échéance de la requête en cours (héritée par les tâches et les greenlets de SQLAlchemy)
+_current_deadline: ContextVar[Optional[RequestDeadline]] = ContextVar("request_deadline", default=None)
+
+def start_deadline(deadline: RequestDeadline) -> Token:
+    """
+    Définit l'échéance du contexte courant.
+
+    Args:
+        deadline: L'échéance de la requête
+
+    Returns:
+        Token: Le jeton à passer à reset_deadline()
+    """
+    return _current_deadline.set(deadline)
+
+def reset_deadline(token: Token) -> None:
+    """Rétablit l'échéance précédente du contexte courant"""
+    _current_deadline.reset(token)
+
+def get_current_deadline() -> Optional[RequestDeadline]:
+    """Retourne l'échéance de la requête en cours, ou None hors requête (démarrage, tâches de fond)"""
+    return _current_deadline.get()
+
+def apply_statement_timeout(session, transaction, connection) -> None:
+    """
+    Écouteur after_begin des sessions: limite les requêtes SQL de la transaction au temps restant
+    de la requête HTTP. SET LOCAL expire avec la transaction: la connexion rendue au pool n'en
+    garde aucune trace.
+    """
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {deadline.statement_timeout_ms()}")
+
+def record_statement_cancel(context) -> None:
+    """Écouteur handle_error du moteur: relève l'annulation d'une requête SQL de la requête HTTP en cours"""
+    deadline = _current_deadline.get()
+    if deadline is not None and getattr(context.original_exception, "sqlstate", None) == QUERY_CANCELED_SQLSTATE:
+        deadline.breach = RequestDeadline.STATEMENT_TIMEOUT
+
+def record_pool_timeout() -> None:
+    """Relève l'expiration de l'attente d'une connexion du pool pour la requête HTTP en cours"""
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        deadline.breach = RequestDeadline.POOL_TIMEOUT
+
+def install_statement_timeouts(engine: AsyncEngine) -> None:
+    """
+    Applique l'échéance des requêtes HTTP aux transactions de toutes les sessions et relève
+    les annulations des requêtes SQL du moteur.
+
+    Args:
+        engine: Le moteur de base de données
+    """
+    if not event.contains(Session, "after_begin", apply_statement_timeout):
+        event.listen(Session, "after_begin", apply_statement_timeout)
+    if not event.contains(engine.sync_engine, "handle_error", record_statement_cancel):
+        event.listen(engine.sync_engine, "handle_error", record_statement_cancel)
@@ -0,0 +1,181 @@
+import zlib
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Encodages optionnels: proposés seulement si la bibliothèque est installée
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    zstandard = None
+
+class StreamCompressor(ABC):
+    """
+    Compresseur incrémental d'un corps de réponse envoyé en plusieurs morceaux.
+    Chaque morceau compressé est vidé immédiatement pour que le client le reçoive sans attendre la fin.
+    """
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compresse un morceau et retourne les octets à envoyer"""
+        pass
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        """Termine le flux compressé"""
+        pass
+
+class Codec(ABC):
+    """Algorithme de compression identifié par sa valeur de Content-Encoding"""
+    encoding = ""
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compresse un corps complet"""
+        pass
+
+    @abstractmethod
+    def stream(self) -> StreamCompressor:
+        """Crée un compresseur incrémental pour un corps envoyé en plusieurs morceaux"""
+        pass
+
+class _GzipStream(StreamCompressor):
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+class GzipCodec(Codec):
+    """Compression gzip (bibliothèque standard, toujours disponible)"""
+    encoding = "gzip"
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, 31)
+        return compressor.compress(data) + compressor.flush()
+
+    def stream(self) -> StreamCompressor:
+        return _GzipStream(self.level)
+
+class _BrotliStream(StreamCompressor):
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+class BrotliCodec(Codec):
+    """Compression brotli (paquet brotli)"""
+    encoding = "br"
+
+    def __init__(self, quality: int = 4):
+        self.quality = quality
+
+    def compress(self, data: bytes) -> bytes:
+        return brotli.compress(data, quality=self.quality)
+
+    def stream(self) -> StreamCompressor:
+        return _BrotliStream(self.quality)
+
+class _ZstdStream(StreamCompressor):
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+class ZstdCodec(Codec):
+    """Compression zstd (paquet zstandard)"""
+    encoding = "zstd"
+
+    def __init__(self, level: int = 3):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zstandard.ZstdCompressor(level=self.level).compress(data)
+
+    def stream(self) -> StreamCompressor:
+        return _ZstdStream(self.level)
+
+def available_codecs(
+    encodings: Sequence[str],
+    gzip_level: int = 6,
+    brotli_quality: int = 4,
+    zstd_level: int = 3
+) -> Dict[str, Codec]:
+    """
+    Retourne les codecs demandés dont la bibliothèque est installée, dans l'ordre de préférence donné.
+
+    Args:
+        encodings: Les encodages souhaités par ordre de préférence ("zstd", "br", "gzip")
+        gzip_level: Le niveau de compression gzip (1-9)
+        brotli_quality: La qualité brotli (0-11)
+        zstd_level: Le niveau de compression zstd (1-22)
+
+    Returns:
+        Dict[str, Codec]: Les codecs disponibles, indexés par encodage
+    """
+    factories = {"gzip": lambda: GzipCodec(gzip_level)}
+    if brotli is not None:
+        factories["br"] = lambda: BrotliCodec(brotli_quality)
+    if zstandard is not None:
+        factories["zstd"] = lambda: ZstdCodec(zstd_level)
+    return {encoding: factories[encoding]() for encoding in encodings if encoding in factories}
+
+def _parse_accept_encoding(accept_encoding: str) -> List[Tuple[str, float]]:
+    """Découpe l'en-tête Accept-Encoding en couples (encodage, q)"""
+    accepted = []
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted.append((name, quality))
+    return accepted
+
+def negotiate_encoding(accept_encoding: str, preferred: Sequence[str]) -> Optional[str]:
+    """
+    Choisit l'encodage de la réponse parmi ceux acceptés par le client.
+    L'encodage de plus grand q l'emporte; à q égal, l'ordre de préférence du serveur décide.
+
+    Args:
+        accept_encoding: La valeur de l'en-tête Accept-Encoding
+        preferred: Les encodages disponibles par ordre de préférence du serveur
+
+    Returns:
+        Optional[str]: L'encodage choisi, ou None pour une réponse non compressée
+    """
+    if not accept_encoding:
+        return None
+    accepted = dict(_parse_accept_encoding(accept_encoding))
+    wildcard = accepted.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in preferred:
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
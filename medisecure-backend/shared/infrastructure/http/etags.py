@@ -0,0 +1,122 @@
+import hashlib
+from typing import Any, Optional, Sequence
+
+from fastapi import Request, Response, status
+
+from shared.ports.secondary.collection_version_store_protocol import CollectionVersionStoreProtocol
+
+# Le client garde la réponse mais la revalide à chaque utilisation (If-None-Match)
+CACHE_CONTROL = "private, no-cache"
+
+def weak_etag(*parts: Any) -> str:
+    """
+    Calcule un ETag faible à partir des éléments qui déterminent le contenu d'une réponse.
+    L'ETag est faible: les représentations compressées d'une même réponse partagent le même ETag.
+
+    Args:
+        parts: Les éléments (chemin, paramètres, versions, dates de modification)
+
+    Returns:
+        str: L'ETag, de la forme W/"..."
+    """
+    digest = hashlib.blake2b("|".join(str(part) for part in parts).encode("utf-8"), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Vérifie si l'en-tête If-None-Match désigne l'ETag courant (comparaison faible).
+
+    Args:
+        if_none_match: La valeur de l'en-tête If-None-Match
+        etag: L'ETag courant de la ressource
+
+    Returns:
+        bool: True si la version du client est à jour
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+class ConditionalGet:
+    """
+    Dépendance des routes de lecture gérant les requêtes conditionnelles (ETag / If-None-Match).
+
+    La route calcule l'ETag à partir d'une donnée peu coûteuse (date de modification d'une ligne,
+    version d'une collection) et, si le client a déjà cette version, répond 304 avant toute
+    lecture complète ou construction de DTO.
+    """
+
+    def __init__(self, request: Request):
+        self.resource = f"{request.url.path}?{request.url.query}"
+        self.if_none_match = request.headers.get("if-none-match")
+
+    def etag(self, *parts: Any) -> str:
+        """
+        Calcule l'ETag de la réponse: la ressource demandée (chemin et paramètres) et les éléments donnés.
+
+        Args:
+            parts: Les versions dont dépend la réponse
+
+        Returns:
+            str: L'ETag faible de la réponse
+        """
+        return weak_etag(self.resource, *parts)
+
+    async def collection_etag(self, store: CollectionVersionStoreProtocol, names: Sequence[str]) -> str:
+        """
+        Calcule l'ETag d'une liste à partir des versions des collections dont elle dépend.
+        Aucune ligne n'est lue: la version change à chaque écriture dans la collection.
+
+        Args:
+            store: Le store des versions des collections
+            names: Les collections dont dépend la réponse (relations intégrées comprises)
+
+        Returns:
+            str: L'ETag faible de la réponse
+        """
+        versions = await store.get_versions(names)
+        return self.etag(*(f"{name}:{versions[name]}" for name in names))
+
+    def not_modified(self, etag: str) -> Optional[Response]:
+        """
+        Retourne une réponse 304 si le client a déjà la version courante.
+
+        Args:
+            etag: L'ETag courant de la réponse
+
+        Returns:
+            Optional[Response]: La réponse 304, ou None si la réponse complète doit être construite
+        """
+        if not etag_matches(self.if_none_match, etag):
+            return None
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        )
+
+    @staticmethod
+    def tag(response: Response, etag: Optional[str]) -> Response:
+        """
+        Ajoute l'ETag et la politique de revalidation à une réponse complète.
+
+        Args:
+            response: La réponse construite
+            etag: L'ETag de la réponse (aucun en-tête si None)
+
+        Returns:
+            Response: La même réponse
+        """
+        if etag is None:
+            return response
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = CACHE_CONTROL
+        return response
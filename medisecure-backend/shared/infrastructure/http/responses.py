@@ -0,0 +1,47 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+def _default(obj: Any) -> Any:
+    """Sérialise les modèles Pydantic par leurs valeurs de champs, sans .dict() ni revalidation"""
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f"Type non sérialisable en JSON: {type(obj).__name__}")
+
+class TrustedJSONResponse(ORJSONResponse):
+    """
+    Réponse JSON pour des DTOs construits à partir de données de nos propres repositories.
+
+    Retournée directement par un contrôleur, FastAPI ne revalide pas le contenu contre le
+    response_model de la route (conservé pour la documentation OpenAPI) et ne passe pas par
+    jsonable_encoder: orjson sérialise nativement UUID, date et datetime, et les DTOs
+    imbriqués sont parcourus par leur __dict__.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+# En-tête interne (retiré par CompressionMiddleware avant l'envoi) signalant une réponse
+# dont les versions compressées peuvent être conservées pour les requêtes suivantes
+COMPRESSION_CACHE_HEADER = b"x-compression-cache"
+
+class CacheableJSONResponse(TrustedJSONResponse):
+    """
+    TrustedJSONResponse d'une ressource lue souvent et rarement modifiée (mois de calendrier).
+
+    CompressionMiddleware conserve ses versions compressées, indexées par l'empreinte du corps:
+    une réponse identique à une précédente n'est pas recompressée, et une réponse modifiée
+    a une autre empreinte (aucune invalidation n'est nécessaire). Un corps déjà encodé (bytes,
+    cache des mois de calendrier) est envoyé tel quel.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return super().render(content)
+
+    def init_headers(self, headers=None) -> None:
+        super().init_headers(headers)
+        self.raw_headers.append((COMPRESSION_CACHE_HEADER, b"1"))
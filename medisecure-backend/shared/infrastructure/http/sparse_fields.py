@@ -0,0 +1,108 @@
+from typing import Callable, Iterable, Optional, Tuple
+
+from fastapi import HTTPException, Query, status
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Analyse un paramètre fields= ("first_name,last_name,email") contre une liste autorisée.
+    L'identifiant est toujours inclus, en tête, pour que le client puisse référencer les ressources.
+
+    Args:
+        fields: La liste de champs séparés par des virgules, ou None
+        allowed: Les champs autorisés (dans l'ordre de la réponse complète)
+
+    Returns:
+        Optional[Tuple[str, ...]]: Les champs demandés dans l'ordre de la liste autorisée,
+                                   ou None si aucun filtrage n'est demandé
+
+    Raises:
+        ValueError: Si un champ n'est pas autorisé
+    """
+    if fields is None or not fields.strip():
+        return None
+
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    allowed = tuple(allowed)
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise ValueError(f"Champs inconnus: {', '.join(sorted(unknown))}. Champs autorisés: {', '.join(allowed)}")
+
+    requested.add("id")
+    return tuple(name for name in allowed if name in requested)
+
+def sparse_fields(allowed: Iterable[str]) -> Callable[..., Optional[Tuple[str, ...]]]:
+    """
+    Crée une dépendance FastAPI lisant le paramètre de requête fields= d'une route.
+    La validation a lieu avant l'exécution de la route: un champ inconnu donne une erreur 400.
+
+    Args:
+        allowed: Les champs autorisés pour la ressource
+
+    Returns:
+        Callable: La dépendance retournant les champs demandés, ou None pour la réponse complète
+    """
+    allowed = tuple(allowed)
+
+    def dependency(
+        fields: Optional[str] = Query(
+            None,
+            description=f"Champs à retourner, séparés par des virgules (id toujours inclus). Valeurs: {', '.join(allowed)}"
+        )
+    ) -> Optional[Tuple[str, ...]]:
+        try:
+            return parse_fields(fields, allowed)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return dependency
+
+def parse_include(include: Optional[str], allowed: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Analyse un paramètre include= ("patient,doctor") contre la liste des relations intégrables.
+
+    Args:
+        include: La liste de relations séparées par des virgules, ou None
+        allowed: Les relations intégrables
+
+    Returns:
+        Tuple[str, ...]: Les relations demandées dans l'ordre de la liste autorisée (vide si aucune)
+
+    Raises:
+        ValueError: Si une relation n'est pas intégrable
+    """
+    if include is None or not include.strip():
+        return ()
+
+    requested = {name.strip() for name in include.split(",") if name.strip()}
+    allowed = tuple(allowed)
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise ValueError(f"Relations inconnues: {', '.join(sorted(unknown))}. Relations disponibles: {', '.join(allowed)}")
+
+    return tuple(name for name in allowed if name in requested)
+
+def include_relations(allowed: Iterable[str]) -> Callable[..., Tuple[str, ...]]:
+    """
+    Crée une dépendance FastAPI lisant le paramètre de requête include= d'une route.
+    Une relation inconnue donne une erreur 400 avant l'exécution de la route.
+
+    Args:
+        allowed: Les relations intégrables pour la ressource
+
+    Returns:
+        Callable: La dépendance retournant les relations demandées
+    """
+    allowed = tuple(allowed)
+
+    def dependency(
+        include: Optional[str] = Query(
+            None,
+            description=f"Relations à intégrer à la réponse, séparées par des virgules. Valeurs: {', '.join(allowed)}"
+        )
+    ) -> Tuple[str, ...]:
+        try:
+            return parse_include(include, allowed)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return dependency
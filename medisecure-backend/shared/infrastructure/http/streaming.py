@@ -0,0 +1,106 @@
+import csv
+import io
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, Sequence
+
+import orjson
+from fastapi.responses import StreamingResponse
+
+# Taille visée des morceaux envoyés au client: assez grande pour amortir le coût de chaque
+# envoi ASGI, assez petite pour que la mémoire reste constante quelle que soit la taille de l'export
+CHUNK_SIZE = 64 * 1024
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+async def ndjson_chunks(rows: AsyncIterator[Dict[str, Any]], chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """
+    Encode des lignes en NDJSON (un objet JSON par ligne), regroupées en morceaux.
+
+    Args:
+        rows: Les lignes à encoder
+        chunk_size: La taille visée des morceaux en octets
+
+    Yields:
+        bytes: Les morceaux de l'export
+    """
+    buffer = bytearray()
+    async for row in rows:
+        buffer += orjson.dumps(row, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+def _csv_value(value: Any) -> Any:
+    """Convertit une valeur pour une cellule CSV (mêmes représentations que l'export JSON)"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value).decode("utf-8")
+    return value
+
+async def csv_chunks(
+    rows: AsyncIterator[Dict[str, Any]],
+    fields: Sequence[str],
+    chunk_size: int = CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """
+    Encode des lignes en CSV avec une ligne d'en-tête, regroupées en morceaux.
+
+    Args:
+        rows: Les lignes à encoder
+        fields: Les colonnes de l'export, dans l'ordre
+        chunk_size: La taille visée des morceaux en octets
+
+    Yields:
+        bytes: Les morceaux de l'export
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    async for row in rows:
+        writer.writerow([_csv_value(row[name]) for name in fields])
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+def export_response(
+    rows: AsyncIterator[Dict[str, Any]],
+    fields: Sequence[str],
+    export_format: str,
+    filename: str
+) -> StreamingResponse:
+    """
+    Crée la réponse en flux d'un export.
+    Les lignes ne sont lues qu'au rythme où le client consomme la réponse: chaque morceau
+    attend la fin de l'envoi du précédent (contrôle de flux du serveur ASGI).
+
+    Args:
+        rows: Les lignes à exporter (itérateur asynchrone, typiquement un curseur serveur)
+        fields: Les colonnes de l'export
+        export_format: "ndjson" ou "csv"
+        filename: Le nom du fichier proposé au client, sans extension
+
+    Returns:
+        StreamingResponse: La réponse en flux
+    """
+    if export_format == "csv":
+        chunks = csv_chunks(rows, fields)
+    else:
+        chunks = ndjson_chunks(rows)
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'}
+    )
@@ -0,0 +1,139 @@
+import atexit
+import copy
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, TextIO
+
+from shared.infrastructure.logging.json_formatter import JsonFormatter
+from shared.infrastructure.logging.redaction import RedactionFilter
+from shared.infrastructure.logging.request_context import RequestIdFilter
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s"
+
+# Loggers d'uvicorn rattachés au pipeline commun (ils ont leurs propres handlers synchrones par défaut)
+UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    QueueHandler qui ne fait que figer le message dans le thread appelant.
+    Le formatage (JSON), le masquage et l'écriture sont faits par le thread du QueueListener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # La trace n'est plus exploitable une fois sortie du contexte de l'exception
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+def parse_module_levels(value: Optional[str]) -> Dict[str, str]:
+    """
+    Analyse une liste de niveaux par module au format "module=NIVEAU,module=NIVEAU".
+
+    Args:
+        value: La chaîne à analyser (variable LOG_LEVELS)
+
+    Returns:
+        Dict[str, str]: Les niveaux indexés par nom de logger
+    """
+    levels: Dict[str, str] = {}
+    for item in (value or "").split(","):
+        name, _, level = item.partition("=")
+        if name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+def configure_logging(
+    level: Optional[str] = None,
+    module_levels: Optional[Dict[str, str]] = None,
+    log_format: Optional[str] = None,
+    stream: Optional[TextIO] = None
+) -> QueueListener:
+    """
+    Configure le pipeline de logs unique de l'application.
+    Les appelants ne font que déposer les enregistrements dans une file; un thread dédié
+    les masque, les formate et les écrit. Sans effet si le pipeline est déjà configuré.
+
+    Args:
+        level: Le niveau racine (LOG_LEVEL, INFO par défaut)
+        module_levels: Les niveaux par module (LOG_LEVELS, ex: "sqlalchemy.engine=WARNING")
+        log_format: "json" (par défaut) ou "text" (LOG_FORMAT)
+        stream: Le flux de sortie (stdout par défaut)
+
+    Returns:
+        QueueListener: Le listener qui écrit les logs
+    """
+    global _listener, _queue_handler
+
+    if _listener is not None:
+        return _listener
+
+    level = (level or os.getenv("LOG_LEVEL", "INFO")).upper()
+    if module_levels is None:
+        module_levels = parse_module_levels(os.getenv("LOG_LEVELS"))
+    log_format = (log_format or os.getenv("LOG_FORMAT", "json")).lower()
+
+    output_handler = logging.StreamHandler(stream or sys.stdout)
+    output_handler.setFormatter(JsonFormatter() if log_format == "json" else logging.Formatter(TEXT_FORMAT))
+    output_handler.addFilter(RedactionFilter())
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _queue_handler = NonBlockingQueueHandler(log_queue)
+    _queue_handler.addFilter(RequestIdFilter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    root.setLevel(level)
+
+    for name in UVICORN_LOGGERS:
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers = []
+        uvicorn_logger.propagate = True
+
+    for name, module_level in module_levels.items():
+        logging.getLogger(name).setLevel(module_level)
+
+    _listener = QueueListener(log_queue, output_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return _listener
+
+def shutdown_logging() -> None:
+    """
+    Vide la file, arrête le thread d'écriture et détache le pipeline.
+    """
+    global _listener, _queue_handler
+
+    if _listener is None:
+        return
+
+    _listener.stop()
+    logging.getLogger().removeHandler(_queue_handler)
+    _listener = None
+    _queue_handler = None
+
+def restart_logging_after_fork() -> None:
+    """
+    Relance le thread d'écriture dans un processus issu d'un fork (workers de gunicorn avec
+    préchargement de l'application): le thread du QueueListener n'existe que dans le parent.
+    """
+    global _listener
+
+    if _listener is None:
+        return
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _queue_handler.queue = log_queue
+    _listener = QueueListener(log_queue, *_listener.handlers, respect_handler_level=True)
+    _listener.start()
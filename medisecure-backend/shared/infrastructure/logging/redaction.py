@@ -0,0 +1,73 @@
+import logging
+import re
+from typing import Iterable, Optional
+
+# Clés dont la valeur ne doit jamais apparaître dans les logs (secrets et données de santé)
+SENSITIVE_KEYS = (
+    "password", "hashed_password", "new_password", "plain_password",
+    "token", "access_token", "refresh_token", "secret", "authorization",
+    "first_name", "last_name", "date_of_birth", "address", "phone_number", "phone", "email",
+    "insurance_id", "blood_type", "allergies", "chronic_diseases", "current_medications", "notes"
+)
+
+REDACTED = "[REDACTED]"
+
+# Les lookbehind évitent de retenter la correspondance à chaque caractère d'un mot
+_JWT_PATTERN = re.compile(r"eyJ[\w-]+\.[\w-]+\.[\w-]+")
+_BCRYPT_PATTERN = re.compile(r"\$2[aby]?\$\d{2}\$[./A-Za-z0-9]{53}")
+_EMAIL_PATTERN = re.compile(r"(?<![\w.+-])[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+
+def _build_key_value_pattern(keys: Iterable[str]) -> "re.Pattern[str]":
+    """Construit l'expression reconnaissant `cle=valeur`, `'cle': 'valeur'` et `"cle": "valeur"`"""
+    alternatives = "|".join(sorted((re.escape(key) for key in keys), key=len, reverse=True))
+    return re.compile(
+        r"(?<!\w)(?P<key>" + alternatives + r")(?P<sep>['\"]?\s*[:=]\s*)"
+        r"(?P<value>[\w.]+\([^)]*\)|'[^']*'|\"[^\"]*\"|\{[^}]*\}|\[[^\]]*\]|[^\s,;)}]+)"
+    )
+
+class RedactionFilter(logging.Filter):
+    """
+    Filtre qui masque les secrets et les données personnelles de santé dans les messages de log.
+    Exécuté dans le thread d'écriture des logs, hors de la boucle d'événements.
+    """
+
+    def __init__(self, keys: Optional[Iterable[str]] = None):
+        """
+        Initialise le filtre.
+
+        Args:
+            keys: Les clés dont la valeur doit être masquée (SENSITIVE_KEYS par défaut)
+        """
+        super().__init__()
+        self._key_value_pattern = _build_key_value_pattern(keys or SENSITIVE_KEYS)
+
+    def redact(self, text: str) -> str:
+        """
+        Masque les données sensibles d'un texte.
+
+        Args:
+            text: Le texte à nettoyer
+
+        Returns:
+            str: Le texte sans données sensibles
+        """
+        text = self._key_value_pattern.sub(self._redact_value, text)
+        # Tests de sous-chaîne préalables: la plupart des messages ne contiennent aucun de ces motifs
+        if "eyJ" in text:
+            text = _JWT_PATTERN.sub(REDACTED, text)
+        if "$2" in text:
+            text = _BCRYPT_PATTERN.sub(REDACTED, text)
+        if "@" in text:
+            text = _EMAIL_PATTERN.sub(REDACTED, text)
+        return text
+
+    @staticmethod
+    def _redact_value(match: "re.Match[str]") -> str:
+        return f"{match.group('key')}{match.group('sep')}{REDACTED}"
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.msg = self.redact(record.getMessage())
+        record.args = None
+        if record.exc_text:
+            record.exc_text = self.redact(record.exc_text)
+        return True
@@ -0,0 +1,25 @@
+import logging
+from contextvars import ContextVar
+from typing import Optional
+
+# Identifiant de la requête HTTP en cours, propagé dans toutes les tâches asynchrones qui en découlent
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+def get_request_id() -> Optional[str]:
+    """
+    Retourne l'identifiant de la requête en cours.
+
+    Returns:
+        Optional[str]: L'identifiant de la requête ou None hors d'une requête
+    """
+    return request_id_var.get()
+
+class RequestIdFilter(logging.Filter):
+    """
+    Filtre qui attache l'identifiant de la requête en cours à chaque enregistrement.
+    Doit être exécuté dans le contexte de l'appelant (avant la mise en file).
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
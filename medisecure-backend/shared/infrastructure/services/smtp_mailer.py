@@ -1,4 +1,5 @@
 import os
+import logging
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -10,6 +11,9 @@ from shared.ports.secondary.mailer_protocol import MailerProtocol
 # Charger les variables d'environnement
 load_dotenv()
 
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
 class SmtpMailer(MailerProtocol):
     """
     Adaptateur secondaire pour l'envoi d'emails via SMTP.
@@ -91,7 +95,7 @@ class SmtpMailer(MailerProtocol):
             return True
         
         except Exception as e:
-            print(f"Erreur lors de l'envoi de l'email: {str(e)}")
+            logger.error(f"Erreur lors de l'envoi de l'email: {str(e)}")
             return False
     
     async def send_password_reset(self, to_email: str, reset_token: str) -> bool:
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
 class AuthenticatorProtocol(ABC):
@@ -22,6 +22,33 @@ class AuthenticatorProtocol(ABC):
         """
         pass
     
+    @abstractmethod
+    def create_refresh_token(self, data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
+        """
+        Crée un token de rafraîchissement JWT.
+        
+        Args:
+            data: Les données à encoder dans le token
+            expires_delta: Durée de validité du token (optionnel)
+            
+        Returns:
+            str: Le token de rafraîchissement JWT encodé
+        """
+        pass
+    
+    @abstractmethod
+    def decode_token(self, token: str) -> Dict[str, Any]:
+        """
+        Décode et valide un token JWT.
+        
+        Args:
+            token: Le token JWT encodé
+            
+        Returns:
+            Dict[str, Any]: Le payload du token
+        """
+        pass
+    
     @abstractmethod
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
@@ -36,6 +63,20 @@ class AuthenticatorProtocol(ABC):
         """
         pass
     
+    @abstractmethod
+    def verify_and_update(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Vérifie un mot de passe et fournit un nouveau hash si le hash stocké est obsolète.
+        
+        Args:
+            plain_password: Le mot de passe en clair
+            hashed_password: Le hash du mot de passe stocké
+            
+        Returns:
+            Tuple[bool, Optional[str]]: Le résultat de la vérification et le nouveau hash (ou None)
+        """
+        pass
+    
     @abstractmethod
     def get_password_hash(self, password: str) -> str:
         """
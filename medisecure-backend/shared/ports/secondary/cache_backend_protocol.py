@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+class CacheBackendProtocol(ABC):
+    """
+    Port secondaire pour le stockage des entrées d'un cache de lecture (valeurs sérialisées).
+    Cette interface définit comment les entrées doivent être lues, écrites et invalidées.
+    """
+
+    @property
+    @abstractmethod
+    def evictions(self) -> int:
+        """
+        Nombre d'entrées évincées par le backend pour respecter sa taille maximale
+        (0 lorsque l'éviction est gérée par un serveur externe).
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Lit une entrée du cache.
+
+        Args:
+            key: La clé de l'entrée
+
+        Returns:
+            Optional[bytes]: La valeur sérialisée, ou None si absente ou expirée
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """
+        Écrit une entrée dans le cache.
+
+        Args:
+            key: La clé de l'entrée
+            value: La valeur sérialisée
+            ttl_seconds: La durée de vie de l'entrée en secondes
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """
+        Supprime des entrées du cache (les clés absentes sont ignorées).
+
+        Args:
+            keys: Les clés des entrées à supprimer
+        """
+        pass
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Sequence
+
+# Collections dont la version est maintenue à chaque écriture (voir init.sql)
+PATIENTS_COLLECTION = "patients"
+APPOINTMENTS_COLLECTION = "appointments"
+USERS_COLLECTION = "users"
+
+class CollectionVersionStoreProtocol(ABC):
+    """
+    Port secondaire pour les versions des collections.
+    La version d'une collection change à chaque écriture dans la table correspondante: elle permet
+    de savoir si une liste a changé sans parcourir ses lignes (ETag des pages et des mois de calendrier).
+    """
+
+    @abstractmethod
+    async def get_versions(self, names: Sequence[str]) -> Dict[str, int]:
+        """
+        Récupère la version courante de plusieurs collections.
+
+        Args:
+            names: Les noms des collections
+
+        Returns:
+            Dict[str, int]: La version de chaque collection (0 si elle n'a jamais été modifiée)
+        """
+        pass
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import Tuple
+
+class RateLimitStoreProtocol(ABC):
+    """
+    Port secondaire pour le stockage des seaux à jetons (token buckets) de limitation de débit.
+    Cette interface définit comment la consommation de jetons doit être effectuée.
+    """
+
+    @abstractmethod
+    async def consume(
+        self,
+        key: str,
+        capacity: float,
+        refill_per_second: float,
+        cost: float = 1.0
+    ) -> Tuple[bool, float]:
+        """
+        Tente de consommer des jetons dans le seau associé à une clé.
+
+        Args:
+            key: La clé du seau (politique et identité du client)
+            capacity: La capacité maximale du seau (rafale autorisée)
+            refill_per_second: Le nombre de jetons ajoutés par seconde
+            cost: Le nombre de jetons consommés par la requête
+
+        Returns:
+            Tuple[bool, float]: Si la requête est autorisée, et sinon le délai (secondes)
+            avant que suffisamment de jetons soient disponibles
+        """
+        pass
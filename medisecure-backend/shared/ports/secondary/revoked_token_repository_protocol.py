@@ -0,0 +1,50 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+
+from shared.domain.entities.revoked_token import RevokedToken
+
+class RevokedTokenRepositoryProtocol(ABC):
+    """
+    Port secondaire pour le repository des tokens révoqués.
+    Cette interface définit comment les révocations de tokens doivent être persistées.
+    """
+
+    @abstractmethod
+    async def add(self, revoked_token: RevokedToken) -> bool:
+        """
+        Enregistre un token révoqué.
+
+        Args:
+            revoked_token: Le token révoqué à enregistrer
+
+        Returns:
+            bool: True si le token vient d'être révoqué, False s'il l'était déjà
+        """
+        pass
+
+    @abstractmethod
+    async def list_active(self, now: datetime) -> List[RevokedToken]:
+        """
+        Liste les tokens révoqués qui ne sont pas encore expirés.
+
+        Args:
+            now: La date de référence (UTC)
+
+        Returns:
+            List[RevokedToken]: Les tokens révoqués encore valides
+        """
+        pass
+
+    @abstractmethod
+    async def purge_expired(self, now: datetime) -> int:
+        """
+        Supprime les tokens révoqués expirés.
+
+        Args:
+            now: La date de référence (UTC)
+
+        Returns:
+            int: Le nombre d'entrées supprimées
+        """
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Sequence
 from uuid import UUID
 from shared.domain.entities.user import User
 
@@ -95,4 +95,32 @@ class UserRepositoryProtocol(ABC):
         Returns:
             List[User]: La liste des utilisateurs ayant le rôle spécifié
         """
+        pass
+    
+    @abstractmethod
+    async def list_by_ids(self, user_ids: Sequence[UUID]) -> List[User]:
+        """
+        Liste plusieurs utilisateurs en une seule requête (id = ANY(:ids)),
+        par exemple les médecins d'une liste de rendez-vous.
+        
+        Args:
+            user_ids: Les IDs des utilisateurs à récupérer
+            
+        Returns:
+            List[User]: Les utilisateurs trouvés (ordre non garanti)
+        """
+        pass
+    
+    @abstractmethod
+    async def update_password_hash(self, user_id: UUID, hashed_password: str) -> bool:
+        """
+        Remplace le hash du mot de passe d'un utilisateur (rehachage au coût courant).
+        
+        Args:
+            user_id: L'ID de l'utilisateur
+            hashed_password: Le nouveau hash du mot de passe
+            
+        Returns:
+            bool: True si le hash a été mis à jour, False sinon
+        """
         pass
\ No newline at end of file
@@ -1,16 +1,20 @@
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 import os
+import uuid
+import logging
 from dotenv import load_dotenv
-import traceback
 
 from shared.ports.primary.authenticator_protocol import AuthenticatorProtocol
 
 # Charger les variables d'environnement
 load_dotenv()
 
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
 class BasicAuthenticator(AuthenticatorProtocol):
     """
     Adaptateur primaire pour l'authentification de base avec JWT.
@@ -21,10 +25,20 @@ class BasicAuthenticator(AuthenticatorProtocol):
         """
         Initialise l'authentificateur avec les clés et algorithmes de chiffrement.
         """
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        # Coût bcrypt calibré pour la machine (voir shared/services/authenticator/bcrypt_calibration.py).
+        # min_rounds = max_rounds = coût cible: tout hash d'un autre coût est signalé comme à mettre à jour.
+        self.bcrypt_rounds = int(os.getenv("BCRYPT_ROUNDS", "12"))
+        self.pwd_context = CryptContext(
+            schemes=["bcrypt"],
+            deprecated="auto",
+            bcrypt__default_rounds=self.bcrypt_rounds,
+            bcrypt__min_rounds=self.bcrypt_rounds,
+            bcrypt__max_rounds=self.bcrypt_rounds
+        )
         self.jwt_secret_key = os.getenv("JWT_SECRET_KEY", "default_secret_key")
         self.algorithm = os.getenv("JWT_ALGORITHM", "HS256")
         self.access_token_expire_minutes = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+        self.refresh_token_expire_minutes = int(os.getenv("JWT_REFRESH_TOKEN_EXPIRE_MINUTES", str(7 * 24 * 60)))
     
     def create_access_token(self, data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
         """
@@ -37,21 +51,66 @@ class BasicAuthenticator(AuthenticatorProtocol):
         Returns:
             str: Le token d'accès JWT encodé
         """
-        to_encode = data.copy()
+        if not expires_delta:
+            expires_delta = timedelta(minutes=self.access_token_expire_minutes)
         
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
+        return self._encode_token(data, "access", expires_delta)
+    
+    def create_refresh_token(self, data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
+        """
+        Crée un token de rafraîchissement JWT, à usage unique (rotation à chaque utilisation).
         
-        to_encode.update({"exp": expire})
+        Args:
+            data: Les données à encoder dans le token
+            expires_delta: Durée de validité du token (optionnel)
+            
+        Returns:
+            str: Le token de rafraîchissement JWT encodé
+        """
+        if not expires_delta:
+            expires_delta = timedelta(minutes=self.refresh_token_expire_minutes)
+        
+        return self._encode_token(data, "refresh", expires_delta)
+    
+    def decode_token(self, token: str) -> Dict[str, Any]:
+        """
+        Décode et valide un token JWT (signature et expiration).
+        
+        Args:
+            token: Le token JWT encodé
+            
+        Returns:
+            Dict[str, Any]: Le payload du token
+            
+        Raises:
+            JWTError: Si le token est invalide ou expiré
+        """
+        return jwt.decode(token, self.jwt_secret_key, algorithms=[self.algorithm])
+    
+    def _encode_token(self, data: Dict[str, Any], token_type: str, expires_delta: timedelta) -> str:
+        """
+        Encode un token JWT avec un identifiant unique (jti) permettant sa révocation.
+        
+        Args:
+            data: Les données à encoder dans le token
+            token_type: Le type de token ("access" ou "refresh")
+            expires_delta: Durée de validité du token
+            
+        Returns:
+            str: Le token JWT encodé
+        """
+        to_encode = data.copy()
+        to_encode.update({
+            "exp": datetime.utcnow() + expires_delta,
+            "jti": uuid.uuid4().hex,
+            "type": token_type
+        })
         
         try:
             encoded_jwt = jwt.encode(to_encode, self.jwt_secret_key, algorithm=self.algorithm)
             return encoded_jwt
         except Exception as e:
-            print(f"Erreur lors de la création du token: {str(e)}")
-            print(traceback.format_exc())
+            logger.exception(f"Erreur lors de la création du token: {str(e)}")
             raise
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
@@ -66,15 +125,24 @@ class BasicAuthenticator(AuthenticatorProtocol):
             bool: True si le mot de passe correspond, False sinon
         """
         try:
-            print(f"Vérification du mot de passe. Mot de passe en clair: {plain_password}, Hash: {hashed_password}")
-            result = self.pwd_context.verify(plain_password, hashed_password)
-            print(f"Résultat de la vérification: {result}")
-            return result
+            return self.pwd_context.verify(plain_password, hashed_password)
         except Exception as e:
-            print(f"Erreur lors de la vérification du mot de passe: {str(e)}")
-            print(traceback.format_exc())
+            logger.exception(f"Erreur lors de la vérification du mot de passe: {str(e)}")
             raise
     
+    def verify_and_update(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Vérifie un mot de passe et recalcule son hash si le coût stocké n'est plus le coût configuré.
+        
+        Args:
+            plain_password: Le mot de passe en clair
+            hashed_password: Le hash du mot de passe stocké
+            
+        Returns:
+            Tuple[bool, Optional[str]]: Le résultat de la vérification et le nouveau hash à enregistrer (ou None)
+        """
+        return self.pwd_context.verify_and_update(plain_password, hashed_password)
+    
     def get_password_hash(self, password: str) -> str:
         """
         Génère un hash à partir d'un mot de passe en clair.
@@ -88,6 +156,5 @@ class BasicAuthenticator(AuthenticatorProtocol):
         try:
             return self.pwd_context.hash(password)
         except Exception as e:
-            print(f"Erreur lors du hachage du mot de passe: {str(e)}")
-            print(traceback.format_exc())
+            logger.exception(f"Erreur lors du hachage du mot de passe: {str(e)}")
             raise
\ No newline at end of file
@@ -0,0 +1,93 @@
+import argparse
+import os
+import statistics
+import time
+from typing import Dict
+
+from passlib.hash import bcrypt
+
+# Bornes acceptées par bcrypt
+MIN_BCRYPT_ROUNDS = 4
+MAX_BCRYPT_ROUNDS = 31
+
+def measure_bcrypt_rounds(rounds: int, samples: int = 3) -> float:
+    """
+    Mesure la durée médiane d'une vérification bcrypt pour un coût donné.
+
+    Args:
+        rounds: Le coût bcrypt (log2 du nombre d'itérations)
+        samples: Le nombre de mesures effectuées
+
+    Returns:
+        float: La durée médiane en millisecondes
+    """
+    hashed_password = bcrypt.using(rounds=rounds).hash("calibration-password")
+    durations = []
+    for _ in range(max(1, samples)):
+        start = time.perf_counter()
+        bcrypt.verify("calibration-password", hashed_password)
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+def calibrate_bcrypt_rounds(
+    target_ms: float = 100.0,
+    min_rounds: int = 10,
+    max_rounds: int = 16,
+    samples: int = 3
+) -> Dict[str, float]:
+    """
+    Choisit le coût bcrypt le plus élevé dont la vérification reste sous la latence cible sur cette machine.
+    Le coût double à chaque incrément: la recherche s'arrête au premier coût qui dépasse la cible.
+
+    Args:
+        target_ms: La latence cible d'une vérification, en millisecondes
+        min_rounds: Le coût minimal retenu, même s'il dépasse la cible
+        max_rounds: Le coût maximal testé
+        samples: Le nombre de mesures par coût
+
+    Returns:
+        Dict[str, float]: Le coût retenu ("rounds") et sa durée mesurée ("duration_ms")
+    """
+    min_rounds = max(MIN_BCRYPT_ROUNDS, min_rounds)
+    max_rounds = min(MAX_BCRYPT_ROUNDS, max(min_rounds, max_rounds))
+
+    selected = {"rounds": min_rounds, "duration_ms": measure_bcrypt_rounds(min_rounds, samples)}
+    for rounds in range(min_rounds + 1, max_rounds + 1):
+        duration_ms = measure_bcrypt_rounds(rounds, samples)
+        if duration_ms > target_ms:
+            break
+        selected = {"rounds": rounds, "duration_ms": duration_ms}
+    return selected
+
+def persist_bcrypt_rounds(rounds: int, env_path: str = ".env") -> None:
+    """
+    Enregistre le coût retenu dans le fichier de configuration (variable BCRYPT_ROUNDS).
+
+    Args:
+        rounds: Le coût bcrypt à enregistrer
+        env_path: Le chemin du fichier .env
+    """
+    lines = []
+    if os.path.exists(env_path):
+        with open(env_path, "r", encoding="utf-8") as env_file:
+            lines = [line for line in env_file.read().splitlines() if not line.startswith("BCRYPT_ROUNDS=")]
+    lines.append(f"BCRYPT_ROUNDS={rounds}")
+    with open(env_path, "w", encoding="utf-8") as env_file:
+        env_file.write("\n".join(lines) + "\n")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calibre le coût bcrypt pour la machine courante")
+    parser.add_argument("--target-ms", type=float, default=100.0, help="Latence cible d'une vérification (ms)")
+    parser.add_argument("--min-rounds", type=int, default=10, help="Coût minimal accepté")
+    parser.add_argument("--max-rounds", type=int, default=16, help="Coût maximal testé")
+    parser.add_argument("--samples", type=int, default=3, help="Nombre de mesures par coût")
+    parser.add_argument("--env-file", default=".env", help="Fichier de configuration à mettre à jour")
+    parser.add_argument("--dry-run", action="store_true", help="Afficher le résultat sans l'enregistrer")
+    args = parser.parse_args()
+
+    result = calibrate_bcrypt_rounds(args.target_ms, args.min_rounds, args.max_rounds, args.samples)
+    print(f"Coût bcrypt retenu: {result['rounds']} ({result['duration_ms']:.1f} ms par vérification)")
+
+    if not args.dry_run:
+        persist_bcrypt_rounds(int(result["rounds"]), args.env_file)
+        print(f"BCRYPT_ROUNDS={result['rounds']} enregistré dans {args.env_file}")
@@ -0,0 +1,44 @@
+import hashlib
+import math
+
+class BloomFilter:
+    """
+    Filtre de Bloom simple à base de bytearray.
+    Permet de répondre "absent" sans faux négatif et avec un taux de faux positifs borné.
+    """
+
+    def __init__(self, expected_items: int = 10000, false_positive_rate: float = 0.001):
+        """
+        Dimensionne le filtre pour le nombre d'éléments attendu.
+
+        Args:
+            expected_items: Le nombre d'éléments attendus dans le filtre
+            false_positive_rate: Le taux de faux positifs visé
+        """
+        expected_items = max(1, expected_items)
+        self.size = max(8, int(-expected_items * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.size / expected_items * math.log(2))))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        """Calcule les positions des bits par double hachage"""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str) -> None:
+        """Ajoute un élément au filtre"""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        """Retourne False si l'élément est absent à coup sûr, True s'il est peut-être présent"""
+        bits = self._bits
+        for position in self._positions(item):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
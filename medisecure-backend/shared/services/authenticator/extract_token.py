@@ -5,6 +5,8 @@ from typing import Dict, Any
 import os
 from dotenv import load_dotenv
 
+from shared.services.authenticator.token_revocation_list import get_token_revocation_list
+
 # Charger les variables d'environnement
 load_dotenv()
 
@@ -36,6 +38,10 @@ async def extract_token_payload(
             algorithms=[os.getenv("JWT_ALGORITHM", "HS256")]
         )
         
+        # Seuls les tokens d'accès non révoqués donnent accès aux routes
+        if payload.get("type", "access") != "access" or get_token_revocation_list().is_revoked(payload.get("jti")):
+            raise JWTError("Token non utilisable pour l'accès")
+        
         # Assurez-vous que le rôle est en majuscules pour la vérification ultérieure
         # Mais ne modifiez pas le payload original
         if "role" in payload and isinstance(payload["role"], str):
@@ -0,0 +1,126 @@
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from shared.services.authenticator.bloom_filter import BloomFilter
+
+class TokenRevocationList:
+    """
+    Liste de révocation des tokens JWT conservée en mémoire du processus.
+    Un filtre de Bloom écarte sans I/O la quasi-totalité des tokens non révoqués,
+    le dictionnaire exact ne sert qu'à lever les faux positifs.
+    Les entrées disparaissent d'elles-mêmes à l'expiration du token concerné.
+    """
+
+    def __init__(
+        self,
+        expected_items: int = 10000,
+        false_positive_rate: float = 0.001,
+        purge_interval_seconds: float = 60.0
+    ):
+        """
+        Initialise une liste de révocation vide.
+
+        Args:
+            expected_items: Le nombre de révocations simultanées attendues
+            false_positive_rate: Le taux de faux positifs visé pour le filtre de Bloom
+            purge_interval_seconds: L'intervalle minimal entre deux purges des entrées expirées
+        """
+        self.expected_items = expected_items
+        self.false_positive_rate = false_positive_rate
+        self.purge_interval_seconds = purge_interval_seconds
+        self._entries: Dict[str, float] = {}
+        self._bloom = BloomFilter(expected_items, false_positive_rate)
+        self._next_purge = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def revoke(self, jti: str, expires_at: float) -> None:
+        """
+        Révoque un token jusqu'à son expiration.
+
+        Args:
+            jti: L'identifiant unique du token
+            expires_at: Le timestamp UNIX d'expiration du token
+        """
+        if not jti or expires_at <= time.time():
+            return
+
+        if jti not in self._entries:
+            if self._bloom.count >= self.expected_items:
+                # Le filtre est saturé: on l'agrandit avant d'insérer
+                self.expected_items *= 2
+                self._rebuild()
+            self._bloom.add(jti)
+        self._entries[jti] = max(expires_at, self._entries.get(jti, 0.0))
+
+    def is_revoked(self, jti: Optional[str], now: Optional[float] = None) -> bool:
+        """
+        Vérifie si un token est révoqué, sans aucune I/O.
+
+        Args:
+            jti: L'identifiant unique du token
+            now: Le timestamp de référence (optionnel)
+
+        Returns:
+            bool: True si le token est révoqué et pas encore expiré
+        """
+        if not jti or jti not in self._bloom:
+            return False
+
+        now = time.time() if now is None else now
+        self._maybe_purge(now)
+
+        expires_at = self._entries.get(jti)
+        return expires_at is not None and expires_at > now
+
+    def load(self, entries: Iterable[Tuple[str, float]]) -> None:
+        """
+        Remplace le contenu de la liste (reconstruction depuis la base de données).
+
+        Args:
+            entries: Les couples (jti, timestamp d'expiration) à charger
+        """
+        now = time.time()
+        self._entries = {jti: expires_at for jti, expires_at in entries if expires_at > now}
+        self.expected_items = max(self.expected_items, len(self._entries) * 2)
+        self._rebuild()
+
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        """
+        Supprime les entrées expirées et reconstruit le filtre de Bloom.
+
+        Args:
+            now: Le timestamp de référence (optionnel)
+
+        Returns:
+            int: Le nombre d'entrées supprimées
+        """
+        now = time.time() if now is None else now
+        expired = [jti for jti, expires_at in self._entries.items() if expires_at <= now]
+        for jti in expired:
+            del self._entries[jti]
+        if expired:
+            self._rebuild()
+        self._next_purge = now + self.purge_interval_seconds
+        return len(expired)
+
+    def _maybe_purge(self, now: float) -> None:
+        """Purge paresseuse, au plus une fois par intervalle"""
+        if now >= self._next_purge:
+            self.purge_expired(now)
+
+    def _rebuild(self) -> None:
+        """Reconstruit le filtre de Bloom à partir des entrées exactes"""
+        self._bloom = BloomFilter(self.expected_items, self.false_positive_rate)
+        for jti in self._entries:
+            self._bloom.add(jti)
+
+# Instance partagée par le processus (le container est recréé à chaque requête)
+_token_revocation_list = TokenRevocationList()
+
+def get_token_revocation_list() -> TokenRevocationList:
+    """
+    Fournit la liste de révocation partagée par le processus.
+    """
+    return _token_revocation_list
@@ -0,0 +1,85 @@
+from datetime import datetime
+from typing import Dict, Any, Optional
+from uuid import UUID
+import logging
+
+from shared.domain.entities.revoked_token import RevokedToken
+from shared.ports.secondary.revoked_token_repository_protocol import RevokedTokenRepositoryProtocol
+from shared.services.authenticator.token_revocation_list import TokenRevocationList
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+class TokenRevocationService:
+    """
+    Service de révocation des tokens JWT.
+    Persiste les révocations dans la table revoked_tokens et maintient la liste en mémoire.
+    """
+
+    def __init__(
+        self,
+        revoked_token_repository: RevokedTokenRepositoryProtocol,
+        revocation_list: TokenRevocationList
+    ):
+        """
+        Initialise le service avec ses dépendances.
+
+        Args:
+            revoked_token_repository: Le repository des tokens révoqués
+            revocation_list: La liste de révocation en mémoire du processus
+        """
+        self.revoked_token_repository = revoked_token_repository
+        self.revocation_list = revocation_list
+
+    async def revoke(self, payload: Dict[str, Any]) -> bool:
+        """
+        Révoque le token décrit par son payload JWT.
+
+        Args:
+            payload: Le payload décodé du token (doit contenir jti et exp)
+
+        Returns:
+            bool: True si le token vient d'être révoqué, False s'il n'était pas révocable
+                  ou s'il avait déjà été révoqué (éventuellement par un autre worker)
+        """
+        jti = payload.get("jti")
+        exp = payload.get("exp")
+        if not jti or not exp:
+            return False
+
+        user_id: Optional[UUID] = None
+        try:
+            user_id = UUID(str(payload.get("sub")))
+        except (TypeError, ValueError):
+            pass
+
+        inserted = await self.revoked_token_repository.add(
+            RevokedToken(
+                jti=jti,
+                user_id=user_id,
+                expires_at=datetime.utcfromtimestamp(exp)
+            )
+        )
+        self.revocation_list.revoke(jti, float(exp))
+        return inserted
+
+    async def reload(self) -> int:
+        """
+        Reconstruit la liste en mémoire depuis la table revoked_tokens
+        et supprime au passage les entrées expirées.
+
+        Returns:
+            int: Le nombre de révocations actives chargées
+        """
+        now = datetime.utcnow()
+        purged = await self.revoked_token_repository.purge_expired(now)
+        active = await self.revoked_token_repository.list_active(now)
+        self.revocation_list.load(
+            (token.jti, _to_timestamp(token.expires_at)) for token in active
+        )
+        logger.info(f"Liste de révocation chargée: {len(active)} token(s) actif(s), {purged} purgé(s)")
+        return len(active)
+
+def _to_timestamp(value: datetime) -> float:
+    """Convertit une date UTC naïve en timestamp UNIX"""
+    return (value - datetime(1970, 1, 1)).total_seconds()
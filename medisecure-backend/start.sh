@@ -50,5 +50,12 @@ else
   echo 'Cela peut être dû à des erreurs dans le script d''initialisation.'
 fi
 
-echo 'Démarrage de l API...'
-uvicorn api.main:app --host 0.0.0.0 --port 8000 --reload
\ No newline at end of file
+# Développement (SERVER_RELOAD=true): un seul processus qui surveille les fichiers;
+# sinon serveur de production multi-workers (voir api/serve.py)
+if [ "${SERVER_RELOAD:-false}" = "true" ]; then
+  echo 'Démarrage de l API (développement, rechargement automatique)...'
+  exec uvicorn api.main:app --host 0.0.0.0 --port "${PORT:-8000}" --reload
+else
+  echo 'Démarrage de l API (production)...'
+  exec python -m api.serve
+fi
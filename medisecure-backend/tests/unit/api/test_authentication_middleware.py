@@ -0,0 +1,93 @@
+import asyncio
+import os
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi import Depends, FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from jose import jwt
+
+from api.middlewares.authentication_middleware import AuthenticationMiddleware
+from shared.services.authenticator.extract_token import extract_token_payload
+from shared.services.authenticator.token_revocation_list import get_token_revocation_list
+
+def make_app():
+    """Application montée comme api.main: CORS ajouté avant l'authentification"""
+    app = FastAPI()
+
+    @app.get("/api/me")
+    async def me(request: Request, payload=Depends(extract_token_payload)):
+        return {"sub": payload["sub"]}
+
+    @app.get("/api/identity")
+    async def identity(request: Request):
+        return {"user": getattr(request.state, "user", None) is not None}
+
+    app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
+    app.middleware("http")(AuthenticationMiddleware())
+    return app
+
+def make_token(token_type="access"):
+    payload = {
+        "sub": str(uuid.uuid4()),
+        "role": "admin",
+        "type": token_type,
+        "jti": uuid.uuid4().hex,
+        "exp": datetime.utcnow() + timedelta(minutes=5),
+    }
+    secret = os.getenv("JWT_SECRET_KEY", "default_secret_key")
+    return payload["jti"], jwt.encode(payload, secret, algorithm=os.getenv("JWT_ALGORITHM", "HS256"))
+
+def call(app, path, token):
+    """Appelle l'application ASGI depuis une origine du frontend; retourne le statut, les en-têtes et le corps"""
+    scope = {
+        "type": "http", "method": "GET", "path": path, "raw_path": path.encode(), "query_string": b"",
+        "scheme": "http", "server": ("testserver", 80), "client": ("127.0.0.1", 1234), "root_path": "",
+        "http_version": "1.1",
+        "headers": [(b"origin", b"http://localhost:3000"), (b"authorization", f"Bearer {token}".encode())],
+    }
+    messages = []
+    requests = [{"type": "http.request", "body": b""}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        # Client toujours connecté: la requête se termine avec la réponse
+        await asyncio.sleep(3600)
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(asyncio.wait_for(app(scope, receive, send), 5))
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    return messages[0]["status"], dict(messages[0]["headers"]), body
+
+def test_revoked_token_is_refused_with_cors_headers():
+    """Test que le refus d'un token révoqué passe par la couche CORS (le frontend peut lire le 401)"""
+    # Arrange
+    app = make_app()
+    jti, token = make_token()
+    get_token_revocation_list().revoke(jti, time.time() + 60)
+
+    # Act
+    status, headers, _ = call(app, "/api/me", token)
+
+    # Assert
+    assert status == 401
+    assert headers[b"access-control-allow-origin"] == b"*"
+
+def test_only_access_tokens_identify_the_user():
+    """Test qu'un token de rafraîchissement n'identifie pas l'utilisateur de la requête"""
+    # Arrange
+    app = make_app()
+    _, access = make_token("access")
+    _, refresh = make_token("refresh")
+
+    # Act
+    _, _, with_access = call(app, "/api/identity", access)
+    _, _, with_refresh = call(app, "/api/identity", refresh)
+
+    # Assert
+    assert with_access == b'{"user":true}'
+    assert with_refresh == b'{"user":false}'
@@ -0,0 +1,96 @@
+import asyncio
+import gzip
+
+import orjson
+
+from api.middlewares.compression_middleware import CompressionMiddleware
+from shared.infrastructure.cache.ttl_cache import TTLCache
+from shared.infrastructure.http.compression import negotiate_encoding
+from shared.infrastructure.http.responses import CacheableJSONResponse, TrustedJSONResponse
+
+BODY = orjson.dumps({"appointments": [{"status": "scheduled", "reason": "Consultation"}] * 100})
+
+def response_app(response):
+    """Application ASGI qui retourne toujours la même réponse Starlette"""
+    async def app(scope, receive, send):
+        await response(scope, receive, send)
+    return app
+
+async def streaming_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/x-ndjson")]})
+    for index in range(3):
+        await send({"type": "http.response.body", "body": b'{"row": %d}\n' % index, "more_body": True})
+    await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+def call(app, accept_encoding="gzip"):
+    """Appelle l'application ASGI et retourne les en-têtes et le corps de la réponse"""
+    headers = [(b"accept-encoding", accept_encoding.encode())] if accept_encoding else []
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": headers}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    return dict(messages[0]["headers"]), body
+
+def middleware(app, **kwargs):
+    kwargs.setdefault("minimum_size", 500)
+    return CompressionMiddleware(app, encodings=("zstd", "br", "gzip"), cache=TTLCache(60), **kwargs)
+
+def test_negotiate_encoding_uses_quality_then_server_preference():
+    """Test le choix de l'encodage d'après Accept-Encoding"""
+    # Assert
+    assert negotiate_encoding("gzip, br", ("br", "gzip")) == "br"
+    assert negotiate_encoding("gzip;q=1.0, br;q=0.5", ("br", "gzip")) == "gzip"
+    assert negotiate_encoding("*;q=0.1, gzip;q=0", ("br", "gzip")) == "br"
+    assert negotiate_encoding("identity", ("br", "gzip")) is None
+    assert negotiate_encoding("", ("gzip",)) is None
+
+def test_compresses_large_json_and_skips_small_or_unlisted_bodies():
+    """Test le seuil de taille et la liste des types de contenu compressés"""
+    # Act
+    headers, body = call(middleware(response_app(TrustedJSONResponse(orjson.loads(BODY)))))
+    small_headers, small_body = call(middleware(response_app(TrustedJSONResponse({"status": "ok"}))))
+    binary_headers, _ = call(middleware(response_app(
+        TrustedJSONResponse(orjson.loads(BODY), media_type="application/octet-stream")
+    )))
+    plain_headers, _ = call(middleware(response_app(TrustedJSONResponse(orjson.loads(BODY)))), accept_encoding=None)
+
+    # Assert
+    assert headers[b"content-encoding"] == b"gzip"
+    assert headers[b"vary"] == b"Accept-Encoding"
+    assert int(headers[b"content-length"]) == len(body) < len(BODY)
+    assert gzip.decompress(body) == BODY
+    assert b"content-encoding" not in small_headers and small_body == b'{"status":"ok"}'
+    assert b"content-encoding" not in binary_headers
+    assert b"content-encoding" not in plain_headers
+
+def test_cacheable_response_is_compressed_once():
+    """Test la réutilisation de la version compressée d'une CacheableJSONResponse identique"""
+    # Arrange
+    compression = middleware(response_app(CacheableJSONResponse(orjson.loads(BODY))))
+
+    # Act
+    first_headers, first = call(compression)
+    _, second = call(compression)
+
+    # Assert
+    assert first == second and gzip.decompress(second) == BODY
+    assert b"x-compression-cache" not in first_headers
+    assert (compression.stats.responses, compression.stats.cache_hits) == (2, 1)
+    assert compression.stats.bytes_saved == 2 * (len(BODY) - len(first))
+
+def test_streaming_response_is_compressed_incrementally():
+    """Test la compression au fil de l'eau d'une réponse en plusieurs morceaux (export NDJSON)"""
+    # Act
+    headers, body = call(middleware(streaming_app))
+
+    # Assert
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    assert gzip.decompress(body) == b'{"row": 0}\n{"row": 1}\n{"row": 2}\n'
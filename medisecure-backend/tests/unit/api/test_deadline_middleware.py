@@ -0,0 +1,199 @@
+import asyncio
+
+from api.middlewares.deadline_middleware import DeadlineMetrics, DeadlineMiddleware
+from shared.infrastructure.database.request_deadline import (
+    RequestDeadline,
+    apply_statement_timeout,
+    get_current_deadline,
+    record_pool_timeout,
+    reset_deadline,
+    start_deadline,
+)
+from tests.unit.fakes import FakeClock
+
+READ_PATH = "/api/patients/4f1c2b7e-0000-0000-0000-000000000000"
+
+class FakeClient:
+    """Client ASGI: envoie le corps de la requête, puis se déconnecte à la demande du test"""
+    def __init__(self, body=b""):
+        self.messages = [{"type": "http.request", "body": body, "more_body": False}]
+        self.disconnected = False
+        # Créé dans la boucle du test (asyncio.run), à la première attente
+        self._gone = None
+        self.sent = []
+
+    def disconnect(self):
+        self.disconnected = True
+        if self._gone is not None:
+            self._gone.set()
+
+    async def receive(self):
+        if self.messages:
+            return self.messages.pop(0)
+        if not self.disconnected:
+            self._gone = asyncio.Event()
+            await self._gone.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(self, message):
+        self.sent.append(message)
+
+    @property
+    def status(self):
+        return self.sent[0]["status"] if self.sent else None
+
+def make_middleware(app, budget=0.05):
+    metrics = DeadlineMetrics()
+    deadlines = {name: budget for name in ("auth", "read", "write", "list", "export")}
+    return DeadlineMiddleware(app, deadlines=deadlines, metrics=metrics, retry_after_seconds=4), metrics
+
+def request(middleware, client, path=READ_PATH, method="GET"):
+    scope = {"type": "http", "method": method, "path": path, "headers": []}
+    return middleware(scope, client.receive, client.send)
+
+async def respond(send, status=200, body=b"ok"):
+    await send({"type": "http.response.start", "status": status, "headers": []})
+    await send({"type": "http.response.body", "body": body})
+
+def test_request_is_cancelled_with_504_at_its_deadline():
+    """Test que la requête est annulée et reçoit une 504 à l'échéance"""
+    # Arrange
+    cancelled = []
+
+    async def slow_app(scope, receive, send):
+        scope["endpoint"] = search_patients
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def search_patients():
+        pass
+
+    middleware, metrics = make_middleware(slow_app)
+    client = FakeClient()
+
+    # Act
+    asyncio.run(request(middleware, client, "/api/patients/search", "POST"))
+
+    # Assert
+    assert client.status == 504
+    assert cancelled == [True]
+    assert metrics.routes["search_patients"].timeouts == 1
+
+def test_request_is_cancelled_when_the_client_disconnects():
+    """Test que la requête est annulée dès la déconnexion du client, sans réponse"""
+    # Arrange
+    cancelled = []
+
+    async def slow_app(scope, receive, send):
+        await receive()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    middleware, metrics = make_middleware(slow_app, budget=10)
+    client = FakeClient(b'{"name": "Dupont"}')
+
+    async def scenario():
+        task = asyncio.create_task(request(middleware, client, "/api/patients/search", "POST"))
+        await asyncio.sleep(0.01)
+        client.disconnect()
+        await asyncio.wait_for(task, 1)
+
+    # Act
+    asyncio.run(scenario())
+
+    # Assert
+    assert client.sent == []
+    assert cancelled == [True]
+    assert metrics.routes["list"].disconnects == 1
+
+def test_application_reads_body_and_finishes_after_the_response():
+    """Test que le corps est transmis et que le travail après la réponse n'est pas interrompu"""
+    # Arrange
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen["body"] = (await receive())["body"]
+        seen["deadline"] = get_current_deadline()
+        await respond(send)
+        await asyncio.sleep(0.01)
+        seen["after_response"] = True
+
+    middleware, metrics = make_middleware(app, budget=5)
+    client = FakeClient(b"payload")
+    client.disconnect()
+
+    # Act
+    asyncio.run(request(middleware, client, "/api/appointments/", "PUT"))
+
+    # Assert
+    assert client.status == 200
+    assert seen["body"] == b"payload"
+    assert seen["deadline"].budget_seconds == 5
+    assert seen["after_response"]
+    assert get_current_deadline() is None
+    assert metrics.breaches() == {}
+
+def test_internal_errors_caused_by_deadline_breaches_are_mapped():
+    """Test qu'une 500 causée par une requête SQL annulée devient une 504, et par le pool une 503"""
+    # Arrange
+    async def failing_app(scope, receive, send):
+        deadline = get_current_deadline()
+        if scope["path"] == READ_PATH:
+            deadline.breach = RequestDeadline.STATEMENT_TIMEOUT
+        else:
+            record_pool_timeout()
+        await respond(send, 500, b'{"detail": "Erreur"}')
+
+    middleware, metrics = make_middleware(failing_app, budget=5)
+    statement_client, pool_client = FakeClient(), FakeClient()
+
+    # Act
+    asyncio.run(request(middleware, statement_client))
+    asyncio.run(request(middleware, pool_client, "/api/patients"))
+
+    # Assert
+    assert statement_client.status == 504
+    assert b"retry-after" not in dict(statement_client.sent[0]["headers"])
+    assert pool_client.status == 503
+    assert dict(pool_client.sent[0]["headers"])[b"retry-after"] == b"4"
+    assert len(pool_client.sent) == 2
+    assert metrics.routes["read"].timeouts == 1
+    assert metrics.routes["list"].pool_timeouts == 1
+
+class FakeConnection:
+    def __init__(self):
+        self.statements = []
+
+    def exec_driver_sql(self, statement):
+        self.statements.append(statement)
+
+def test_transactions_are_limited_to_the_remaining_budget():
+    """Test que chaque transaction reçoit le temps restant de la requête comme statement_timeout"""
+    # Arrange
+    clock = FakeClock(50.0)
+    connection = FakeConnection()
+    apply_statement_timeout(None, None, connection)
+
+    # Act
+    token = start_deadline(RequestDeadline(2.0, clock=clock))
+    try:
+        apply_statement_timeout(None, None, connection)
+        clock.now += 1.5
+        apply_statement_timeout(None, None, connection)
+        clock.now += 1.0
+        apply_statement_timeout(None, None, connection)
+    finally:
+        reset_deadline(token)
+
+    # Assert
+    assert connection.statements == [
+        "SET LOCAL statement_timeout = 2000",
+        "SET LOCAL statement_timeout = 500",
+        "SET LOCAL statement_timeout = 1",
+    ]
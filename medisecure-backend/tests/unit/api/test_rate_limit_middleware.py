@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from api.middlewares.rate_limit_middleware import RateLimitMiddleware, RateLimitPolicy, parse_rate
+from shared.adapters.secondary.in_memory_rate_limit_store import InMemoryRateLimitStore
+from tests.unit.fakes import FakeClock
+
+async def ok_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+def call(app, path="/api/auth/login", method="POST", client="10.0.0.1", user=None):
+    """Appelle l'application ASGI et retourne le statut et les en-têtes de la réponse"""
+    scope = {"type": "http", "method": method, "path": path, "headers": [], "client": (client, 1234)}
+    if user:
+        scope["state"] = {"user": user}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return messages[0]["status"], dict(messages[0]["headers"])
+
+@pytest.fixture
+def clock():
+    return FakeClock(1000.0)
+
+@pytest.fixture
+def middleware(clock):
+    """Fixture pour un middleware avec 2 requêtes par minute sur login et recherche"""
+    store = InMemoryRateLimitStore(clock=clock)
+    policies = [
+        RateLimitPolicy("login", "POST", "/api/auth/login", 2, 2 / 60, key="ip"),
+        RateLimitPolicy("search", "POST", "/api/patients/search", 2, 2 / 60, key="subject"),
+    ]
+    return RateLimitMiddleware(ok_app, store=store, policies=policies, trust_forwarded=False)
+
+def test_rejects_with_retry_after_when_bucket_is_empty(middleware, clock):
+    """Test le rejet 429 avec Retry-After une fois la rafale consommée"""
+    # Act
+    statuses = [call(middleware)[0] for _ in range(2)]
+    status, headers = call(middleware)
+
+    # Assert
+    assert statuses == [200, 200]
+    assert status == 429
+    assert headers[b"retry-after"] == b"30"
+
+def test_bucket_refills_over_time(middleware, clock):
+    """Test la recharge du seau avec le temps"""
+    # Arrange
+    call(middleware)
+    call(middleware)
+
+    # Act
+    clock.now += 31
+
+    # Assert
+    assert call(middleware)[0] == 200
+    assert call(middleware)[0] == 429
+
+def test_limits_are_per_client_and_unlimited_routes_pass(middleware):
+    """Test l'isolation des clients et l'absence de limite sur les autres routes"""
+    # Arrange
+    call(middleware)
+    call(middleware)
+
+    # Assert
+    assert call(middleware, client="10.0.0.2")[0] == 200
+    assert all(call(middleware, path="/api/patients/")[0] == 200 for _ in range(5))
+
+def test_subject_policy_keys_by_token_subject(middleware):
+    """Test la limitation par sujet du token, partagée entre adresses IP"""
+    # Arrange
+    user = {"sub": "user-1"}
+    call(middleware, path="/api/patients/search", client="10.0.0.1", user=user)
+    call(middleware, path="/api/patients/search", client="10.0.0.2", user=user)
+
+    # Assert
+    assert call(middleware, path="/api/patients/search", client="10.0.0.3", user=user)[0] == 429
+    assert call(middleware, path="/api/patients/search", client="10.0.0.3", user={"sub": "user-2"})[0] == 200
+
+def test_in_memory_store_evicts_idle_buckets(clock):
+    """Test l'éviction paresseuse des seaux inactifs"""
+    # Arrange
+    store = InMemoryRateLimitStore(shard_count=1, sweep_interval_seconds=1, clock=clock)
+    for i in range(100):
+        asyncio.run(store.consume(f"client-{i}", 10, 1))
+
+    # Act
+    clock.now += 11
+    asyncio.run(store.consume("client-new", 10, 1))
+
+    # Assert
+    assert len(store) == 1
+
+def test_parse_rate():
+    """Test l'analyse des limites déclaratives"""
+    assert parse_rate("10/minute") == (10.0, 10 / 60)
+    assert parse_rate("5/seconds") == (5.0, 5.0)
+    with pytest.raises(ValueError):
+        parse_rate("10/day")
@@ -0,0 +1,74 @@
+import asyncio
+from datetime import date, datetime
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus
+from appointment_management.domain.entities.appointment_filter import AppointmentFilter
+from appointment_management.infrastructure.adapters.primary.controllers.appointment_controller import appointment_filter_params
+from appointment_management.infrastructure.adapters.secondary.in_memory_appointment_repository import InMemoryAppointmentRepository
+from appointment_management.infrastructure.adapters.secondary.postgres_appointment_repository import PostgresAppointmentRepository
+from tests.unit.fakes import RecordingSession
+
+def appointment(patient_id, doctor_id, start, end, status=AppointmentStatus.SCHEDULED):
+    return Appointment(id=uuid4(), patient_id=patient_id, doctor_id=doctor_id, start_time=start, end_time=end, status=status)
+
+def test_in_memory_find_combines_criteria_and_overlapping_period():
+    """Test la sémantique du filtre (critères combinés, chevauchement de la période)"""
+    # Arrange
+    repository = InMemoryAppointmentRepository()
+    patient_id, doctor_id = uuid4(), uuid4()
+    overnight = appointment(patient_id, doctor_id, datetime(2024, 5, 9, 23), datetime(2024, 5, 10, 1))
+    same_day = appointment(patient_id, doctor_id, datetime(2024, 5, 10, 9), datetime(2024, 5, 10, 10))
+    cancelled = appointment(patient_id, doctor_id, datetime(2024, 5, 10, 14), datetime(2024, 5, 10, 15), AppointmentStatus.CANCELLED)
+    other_patient = appointment(uuid4(), doctor_id, datetime(2024, 5, 10, 11), datetime(2024, 5, 10, 12))
+    next_day = appointment(patient_id, doctor_id, datetime(2024, 5, 11, 9), datetime(2024, 5, 11, 10))
+    for item in (overnight, same_day, cancelled, other_patient, next_day):
+        asyncio.run(repository.create(item))
+    day_filter = AppointmentFilter(patient_id=patient_id, status=AppointmentStatus.SCHEDULED, start_date=date(2024, 5, 10), end_date=date(2024, 5, 10))
+
+    # Act
+    found = asyncio.run(repository.find(day_filter))
+    total = asyncio.run(repository.count(day_filter))
+
+    # Assert
+    assert [item.id for item in found] == [same_day.id, overnight.id]
+    assert total == 2
+    assert asyncio.run(repository.count()) == 5
+    assert asyncio.run(repository.count(AppointmentFilter(doctor_id=doctor_id, start_date=date(2024, 5, 11)))) == 1
+
+def test_postgres_find_compiles_filter_to_a_single_where_clause():
+    """Test que le filtre est traduit en une seule clause WHERE"""
+    # Arrange
+    session = RecordingSession()
+    repository = PostgresAppointmentRepository(session)
+    appointment_filter = AppointmentFilter(doctor_id=uuid4(), status=AppointmentStatus.CONFIRMED, start_date=date(2024, 5, 1), end_date=date(2024, 5, 7))
+
+    # Act
+    asyncio.run(repository.find_projected(appointment_filter, ("id", "start_time"), 0, 50))
+
+    # Assert
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    where = sql.split("WHERE", 1)[1]
+    assert sql.count("WHERE") == 1
+    assert "appointments.doctor_id = " in where
+    assert "appointments.status = " in where
+    assert "appointments.start_time <= " in where and "appointments.end_time >= " in where
+    assert "appointments.patient_id" not in where
+
+def test_filter_params_map_frontend_query_parameters():
+    """Test la lecture des paramètres envoyés par le frontend"""
+    # Act
+    day_filter = appointment_filter_params(None, None, "confirmed", date(2024, 5, 10), None, None)
+
+    # Assert
+    assert day_filter.status == AppointmentStatus.CONFIRMED
+    assert day_filter.start_date == day_filter.end_date == date(2024, 5, 10)
+    with pytest.raises(HTTPException) as error:
+        appointment_filter_params(None, None, "pending", None, None, None)
+    assert error.value.status_code == 400
+    with pytest.raises(HTTPException):
+        appointment_filter_params(None, None, None, None, date(2024, 5, 10), date(2024, 5, 1))
@@ -0,0 +1,97 @@
+import asyncio
+from datetime import date, datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from appointment_management.application.dtos.appointment_dtos import APPOINTMENT_INCLUDES
+from appointment_management.application.usecases.include_appointment_relations_usecase import IncludeAppointmentRelationsUseCase
+from appointment_management.domain.entities.appointment import Appointment
+from appointment_management.infrastructure.adapters.secondary.in_memory_appointment_repository import InMemoryAppointmentRepository
+from patient_management.domain.entities.patient import Patient
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from patient_management.infrastructure.adapters.secondary.postgres_patient_repository import PostgresPatientRepository
+from shared.adapters.secondary.in_memory_user_repository import InMemoryUserRepository
+from shared.domain.entities.user import User
+from shared.domain.enums.roles import UserRole
+from shared.infrastructure.http.sparse_fields import parse_include
+from tests.unit.fakes import RecordingSession
+
+class CountingPatientRepository(InMemoryPatientRepository):
+    """Repository en mémoire qui compte les requêtes de résumés"""
+    def __init__(self):
+        super().__init__()
+        self.queries = 0
+
+    async def get_summaries_by_ids(self, patient_ids):
+        self.queries += 1
+        return await super().get_summaries_by_ids(patient_ids)
+
+class CountingUserRepository(InMemoryUserRepository):
+    """Repository en mémoire qui compte les requêtes d'utilisateurs"""
+    def __init__(self):
+        super().__init__()
+        self.queries = 0
+
+    async def list_by_ids(self, user_ids):
+        self.queries += 1
+        return await super().list_by_ids(user_ids)
+
+def test_include_resolves_each_relation_with_one_query():
+    """Test l'intégration du patient et du médecin avec une requête par relation"""
+    # Arrange
+    patients = CountingPatientRepository()
+    users = CountingUserRepository()
+    appointments = InMemoryAppointmentRepository()
+    doctor = User(id=uuid4(), email="house@example.com", first_name="Gregory", last_name="House", role=UserRole.DOCTOR)
+    asyncio.run(users.create(doctor))
+    patient_ids = [uuid4(), uuid4()]
+    for i, patient_id in enumerate(patient_ids):
+        asyncio.run(patients.create(Patient(
+            id=patient_id, first_name="Jean", last_name=f"Dupont {i}", date_of_birth=date(1980, 1, 1), gender="male"
+        )))
+    for day in range(1, 11):
+        asyncio.run(appointments.create(Appointment(
+            id=uuid4(),
+            patient_id=patient_ids[day % 2] if day < 10 else uuid4(),
+            doctor_id=doctor.id,
+            start_time=datetime(2024, 5, day, 9),
+            end_time=datetime(2024, 5, day, 10)
+        )))
+    fields = IncludeAppointmentRelationsUseCase.required_fields(("id", "start_time"), ("patient", "doctor"))
+    rows = asyncio.run(appointments.get_projected_by_date_range(date(2024, 5, 1), date(2024, 5, 31), fields))
+
+    # Act
+    result = asyncio.run(IncludeAppointmentRelationsUseCase(patients, users).execute(rows, ("patient", "doctor")))
+
+    # Assert
+    assert fields == ("id", "patient_id", "doctor_id", "start_time")
+    assert (patients.queries, users.queries) == (1, 1)
+    assert len(result) == 10
+    embedded = {row["patient_id"]: row["patient"] for row in result}
+    assert embedded[patient_ids[1]].last_name == "Dupont 1"
+    assert sum(patient is None for patient in embedded.values()) == 1
+    assert all(row["doctor"].last_name == "House" for row in result)
+
+def test_parse_include_rejects_unknown_relations():
+    """Test l'analyse du paramètre include="""
+    assert parse_include("doctor, patient", APPOINTMENT_INCLUDES) == ("patient", "doctor")
+    assert parse_include(None, APPOINTMENT_INCLUDES) == ()
+    with pytest.raises(ValueError):
+        parse_include("patient,notes", APPOINTMENT_INCLUDES)
+
+def test_postgres_summaries_by_ids_uses_a_single_any_query():
+    """Test que les résumés sont lus par une seule requête id = ANY(:ids)"""
+    # Arrange
+    session = RecordingSession()
+    patient_id = uuid4()
+
+    # Act
+    asyncio.run(PostgresPatientRepository(session).get_summaries_by_ids([patient_id, patient_id, uuid4()]))
+
+    # Assert
+    assert len(session.statements) == 1
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "patients.id = any(" in sql
+    assert "notes" not in sql and "allergies" not in sql
@@ -0,0 +1,123 @@
+import asyncio
+from datetime import datetime
+from uuid import uuid4
+
+import orjson
+from starlette.requests import Request
+
+from appointment_management.domain.entities.appointment import Appointment
+from appointment_management.infrastructure.adapters.primary.controllers.appointment_controller import get_calendar
+from appointment_management.infrastructure.adapters.secondary.calendar_invalidating_appointment_repository import CalendarInvalidatingAppointmentRepository
+from appointment_management.infrastructure.adapters.secondary.in_memory_appointment_repository import InMemoryAppointmentRepository
+from appointment_management.infrastructure.cache.calendar_cache import CachedCalendar, CalendarCache, touched_months
+from shared.adapters.secondary.in_memory_collection_version_store import InMemoryCollectionVersionStore
+from shared.infrastructure.concurrency.single_flight import SingleFlight
+from shared.infrastructure.http.etags import ConditionalGet
+
+ADMIN = {"sub": str(uuid4()), "role": "admin"}
+
+class CountingAppointmentRepository(InMemoryAppointmentRepository):
+    """Repository en mémoire qui compte les lectures d'un mois"""
+    def __init__(self):
+        super().__init__()
+        self.month_reads = 0
+
+    async def get_by_date_range(self, start_date, end_date, skip=0, limit=100):
+        self.month_reads += 1
+        return await super().get_by_date_range(start_date, end_date, skip, limit)
+
+class FakeContainer:
+    """Container fournissant les adaptateurs en mémoire au contrôleur du calendrier"""
+    def __init__(self):
+        self.cache = CalendarCache()
+        self.repository = CountingAppointmentRepository()
+        self.versions = InMemoryCollectionVersionStore()
+        self.flight = SingleFlight()
+
+    def calendar_cache(self):
+        return self.cache
+
+    def appointment_repository(self):
+        return CalendarInvalidatingAppointmentRepository(self.repository, self.cache)
+
+    def collection_version_store(self):
+        return self.versions
+
+    def single_flight(self):
+        return self.flight
+
+def conditional(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return ConditionalGet(Request({"type": "http", "method": "GET", "path": "/api/appointments/calendar/", "query_string": b"", "headers": headers}))
+
+def fetch_calendar(container, year, month, if_none_match=None):
+    return asyncio.run(get_calendar(
+        year=year, month=month, fields=None, include=(),
+        conditional=conditional(if_none_match), token_payload=ADMIN, container=container
+    ))
+
+def appointment(start, end):
+    return Appointment(id=uuid4(), patient_id=uuid4(), doctor_id=uuid4(), start_time=start, end_time=end)
+
+def test_touched_months_spans_year_boundary():
+    """Test les mois chevauchés par un créneau, y compris d'une année à l'autre"""
+    # Assert
+    assert touched_months(datetime(2024, 5, 10, 9), datetime(2024, 5, 10, 10)) == ["2024-05"]
+    assert touched_months(datetime(2024, 12, 31, 23), datetime(2025, 2, 1, 1)) == ["2024-12", "2025-01", "2025-02"]
+    assert touched_months(datetime(2024, 5, 10, 9), datetime(2024, 5, 10, 9)) == ["2024-05"]
+
+def test_cached_month_is_served_without_repository_and_revalidated():
+    """Test qu'un mois en cache est renvoyé sans lecture ni sérialisation, avec son ETag"""
+    # Arrange
+    container = FakeContainer()
+    asyncio.run(container.appointment_repository().create(appointment(datetime(2024, 5, 10, 9), datetime(2024, 5, 10, 10))))
+    first = fetch_calendar(container, 2024, 5)
+
+    # Act
+    second = fetch_calendar(container, 2024, 5)
+    revalidated = fetch_calendar(container, 2024, 5, if_none_match=first.headers["etag"])
+
+    # Assert
+    assert container.repository.month_reads == 1
+    assert second.body == first.body
+    assert second.headers["etag"] == first.headers["etag"]
+    assert orjson.loads(second.body)["total"] == 1
+    assert revalidated.status_code == 304
+    assert (container.cache.stats.hits, container.cache.stats.misses) == (2, 1)
+
+def test_write_invalidates_only_the_months_of_old_and_new_slots():
+    """Test que le déplacement d'un rendez-vous n'invalide que les mois de ses deux créneaux"""
+    # Arrange
+    container = FakeContainer()
+    repository = container.appointment_repository()
+    moved = asyncio.run(repository.create(appointment(datetime(2024, 5, 10, 9), datetime(2024, 5, 10, 10))))
+    for month in (5, 6, 7):
+        fetch_calendar(container, 2024, month)
+    moved.start_time, moved.end_time = datetime(2024, 6, 3, 9), datetime(2024, 6, 3, 10)
+
+    # Act
+    asyncio.run(repository.update(moved))
+    reads_before = container.repository.month_reads
+    may, june, july = (orjson.loads(fetch_calendar(container, 2024, month).body) for month in (5, 6, 7))
+
+    # Assert
+    assert container.repository.month_reads - reads_before == 2
+    assert (may["total"], june["total"], july["total"]) == (0, 1, 0)
+
+def test_response_built_before_an_invalidation_is_not_kept():
+    """Test qu'une réponse construite avant une écriture concurrente n'est pas conservée"""
+    # Arrange
+    cache = CalendarCache()
+    generation = cache.generation("2024-05")
+    cache.invalidate_months(["2024-05"])
+
+    # Act
+    stored = cache.set("2024-05", (None, ()), CachedCalendar('W/"1"', b"{}"), generation)
+    relation_generation = cache.generation("2024-06")
+    cache.invalidate_relation("patient")
+    stored_after_relation_change = cache.set("2024-06", (None, ("patient",)), CachedCalendar('W/"2"', b"{}"), relation_generation)
+
+    # Assert
+    assert not stored
+    assert not stored_after_relation_change
+    assert cache.get("2024-05", (None, ())) is None
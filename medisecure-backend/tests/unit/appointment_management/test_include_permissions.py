@@ -0,0 +1,112 @@
+import asyncio
+from datetime import date, datetime
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from appointment_management.domain.entities.appointment import Appointment
+from appointment_management.infrastructure.adapters.primary.controllers.appointment_controller import (
+    get_appointment,
+    get_patient_appointments,
+)
+from appointment_management.infrastructure.adapters.secondary.in_memory_appointment_repository import InMemoryAppointmentRepository
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.services.patient_service import PatientService
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from shared.adapters.secondary.in_memory_collection_version_store import InMemoryCollectionVersionStore
+from shared.adapters.secondary.in_memory_user_repository import InMemoryUserRepository
+from shared.infrastructure.http.etags import ConditionalGet
+
+class FakeContainer:
+    """Container fournissant les adaptateurs en mémoire aux contrôleurs"""
+    def __init__(self):
+        self.patients = InMemoryPatientRepository()
+        self.appointments = InMemoryAppointmentRepository()
+        self.users = InMemoryUserRepository()
+        self.versions = InMemoryCollectionVersionStore()
+
+    def patient_repository(self):
+        return self.patients
+
+    def appointment_repository(self):
+        return self.appointments
+
+    def user_repository(self):
+        return self.users
+
+    def patient_service(self):
+        return PatientService()
+
+    def collection_version_store(self):
+        return self.versions
+
+def conditional(path):
+    return ConditionalGet(Request({"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": []}))
+
+def token(role):
+    return {"sub": str(uuid4()), "role": role}
+
+def seed(container, has_consent=True):
+    patient_id, appointment_id = uuid4(), uuid4()
+    asyncio.run(container.patients.create(Patient(
+        id=patient_id, first_name="Jean", last_name="Dupont", date_of_birth=date(1980, 1, 1),
+        gender="male", has_consent=has_consent
+    )))
+    asyncio.run(container.appointments.create(Appointment(
+        id=appointment_id, patient_id=patient_id, doctor_id=uuid4(),
+        start_time=datetime(2024, 5, 1, 9), end_time=datetime(2024, 5, 1, 10)
+    )))
+    return patient_id, appointment_id
+
+def fetch_appointment(container, appointment_id, token_payload):
+    return asyncio.run(get_appointment(
+        appointment_id=appointment_id, fields=None, include=("patient",),
+        conditional=conditional(f"/api/appointments/{appointment_id}"),
+        token_payload=token_payload, container=container
+    ))
+
+def fetch_patient_appointments(container, patient_id, token_payload):
+    return asyncio.run(get_patient_appointments(
+        patient_id=patient_id, skip=0, limit=10, fields=None, include=("patient",),
+        conditional=conditional(f"/api/appointments/patient/{patient_id}"),
+        token_payload=token_payload, container=container
+    ))
+
+def test_patient_token_cannot_include_patient_data():
+    """Test le refus (403) de include=patient pour un rôle qui n'est pas du personnel"""
+    # Arrange
+    container = FakeContainer()
+    patient_id, appointment_id = seed(container)
+
+    # Act / Assert
+    for fetch, resource_id in ((fetch_appointment, appointment_id), (fetch_patient_appointments, patient_id)):
+        with pytest.raises(HTTPException) as error:
+            fetch(container, resource_id, token("patient"))
+        assert error.value.status_code == 403
+
+def test_include_patient_requires_the_patient_consent():
+    """Test l'application de la règle de consentement au patient intégré"""
+    # Arrange
+    container = FakeContainer()
+    patient_id, appointment_id = seed(container, has_consent=False)
+
+    # Act / Assert
+    for fetch, resource_id in ((fetch_appointment, appointment_id), (fetch_patient_appointments, patient_id)):
+        with pytest.raises(HTTPException) as error:
+            fetch(container, resource_id, token("doctor"))
+        assert error.value.status_code == 403
+
+def test_staff_includes_a_consenting_patient():
+    """Test l'intégration du patient pour le personnel lorsque le patient a consenti"""
+    # Arrange
+    container = FakeContainer()
+    patient_id, appointment_id = seed(container)
+
+    # Act
+    response = fetch_appointment(container, appointment_id, token("nurse"))
+
+    # Assert
+    assert response.status_code == 200
+    assert b'"last_name":"Dupont"' in response.body
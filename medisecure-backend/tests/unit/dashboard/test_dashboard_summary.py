@@ -0,0 +1,135 @@
+import asyncio
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus
+from appointment_management.infrastructure.adapters.secondary.in_memory_appointment_repository import InMemoryAppointmentRepository
+from dashboard.application.usecases.get_dashboard_summary_usecase import GetDashboardSummaryUseCase
+from dashboard.infrastructure.adapters.secondary.in_memory_dashboard_repository import InMemoryDashboardRepository
+from dashboard.infrastructure.adapters.secondary.postgres_dashboard_repository import PostgresDashboardRepository
+from patient_management.domain.entities.patient import Patient
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from shared.infrastructure.cache.ttl_cache import TTLCache
+from tests.unit.fakes import FakeClock
+
+# Mercredi 15 mai 2024, 10h
+NOW = datetime(2024, 5, 15, 10)
+
+class CountingDashboardRepository(InMemoryDashboardRepository):
+    """Repository en mémoire qui compte les calculs des statistiques"""
+    def __init__(self, patient_repository, appointment_repository):
+        super().__init__(patient_repository, appointment_repository)
+        self.calls = 0
+
+    async def get_summary(self, now, upcoming_limit=5, recent_limit=5):
+        self.calls += 1
+        return await super().get_summary(now, upcoming_limit, recent_limit)
+
+def build_repositories():
+    patients = InMemoryPatientRepository()
+    appointments = InMemoryAppointmentRepository()
+    created = [NOW - timedelta(days=days) for days in (0, 1, 2, 3, 10, 20)]
+    for index, created_at in enumerate(created):
+        asyncio.run(patients.create(Patient(
+            id=uuid4(),
+            first_name=f"Patient{index}",
+            last_name="Test",
+            date_of_birth=date(1980, 1, 1),
+            gender="female",
+            created_at=created_at
+        )))
+    patient = next(iter(patients.patients.values()))
+    doctor_id = uuid4()
+    for hours, status in ((-2, AppointmentStatus.COMPLETED), (1, AppointmentStatus.SCHEDULED),
+                          (3, AppointmentStatus.CANCELLED), (5, AppointmentStatus.CONFIRMED),
+                          (26, AppointmentStatus.SCHEDULED), (50, AppointmentStatus.SCHEDULED)):
+        start = NOW + timedelta(hours=hours)
+        asyncio.run(appointments.create(Appointment(
+            id=uuid4(),
+            patient_id=patient.id,
+            doctor_id=doctor_id,
+            start_time=start,
+            end_time=start + timedelta(minutes=30),
+            status=status
+        )))
+    return patients, appointments
+
+def test_in_memory_summary_computes_statistics():
+    """Test le calcul des statistiques (semaine, jour par statut, prochains rendez-vous, patients récents)"""
+    # Arrange
+    repository = InMemoryDashboardRepository(*build_repositories())
+
+    # Act
+    summary = asyncio.run(repository.get_summary(NOW, upcoming_limit=3))
+
+    # Assert
+    assert summary.total_patients == 6
+    assert summary.new_patients_this_week == 3
+    assert summary.today_appointments_by_status == {"scheduled": 1, "confirmed": 1, "cancelled": 1, "completed": 1, "missed": 0}
+    assert summary.today_appointments == 4
+    assert [item.start_time - NOW for item in summary.upcoming_appointments] == [
+        timedelta(hours=1), timedelta(hours=5), timedelta(hours=26)
+    ]
+    assert summary.upcoming_appointments[0].patient_first_name is not None
+    assert [patient.first_name for patient in summary.recent_patients] == [f"Patient{index}" for index in range(5)]
+
+def test_summary_is_cached_per_role_until_expiry():
+    """Test la mise en cache des statistiques par rôle pour la durée de vie du cache"""
+    # Arrange
+    repository = CountingDashboardRepository(*build_repositories())
+    clock = FakeClock()
+    use_case = GetDashboardSummaryUseCase(repository, TTLCache(5, clock=clock), clock=lambda: NOW)
+
+    # Act
+    first = asyncio.run(use_case.execute("doctor"))
+    second = asyncio.run(use_case.execute("DOCTOR"))
+    asyncio.run(use_case.execute("nurse"))
+    clock.now = 5
+    asyncio.run(use_case.execute("doctor"))
+
+    # Assert
+    assert second is first
+    assert repository.calls == 3
+    assert first.total_patients == 6
+
+def test_postgres_summary_is_a_single_statement_with_ctes():
+    """Test que les statistiques sont calculées par une seule requête"""
+    # Arrange
+    repository = PostgresDashboardRepository(session=None)
+
+    # Act
+    sql = str(repository._summary_query(NOW, 5, 5).compile(dialect=postgresql.dialect()))
+
+    # Assert
+    assert sql.startswith("WITH ")
+    for cte in ("patient_totals AS", "today_appointments AS", "upcoming_appointments AS", "recent_patients AS"):
+        assert cte in sql
+    assert "json_object_agg" in sql
+    assert sql.count("json_agg(") == 2
+
+def test_postgres_summary_maps_aggregated_json():
+    """Test la conversion des listes agrégées en JSON (statuts lus par leur nom, dates en texte)"""
+    # Arrange
+    repository = PostgresDashboardRepository(session=None)
+    patient_id = str(uuid4())
+
+    # Act
+    counts = repository._map_status_counts({"CONFIRMED": 2})
+    upcoming = repository._map_upcoming({
+        "id": str(uuid4()), "patient_id": patient_id, "doctor_id": str(uuid4()),
+        "start_time": "2024-05-15T11:00:00.123456", "end_time": "2024-05-15T11:30:00",
+        "status": "SCHEDULED", "patient_first_name": "Jean", "patient_last_name": "Dupont"
+    })
+    patient = repository._map_patient({
+        "id": patient_id, "first_name": "Jean", "last_name": "Dupont", "date_of_birth": "1980-01-01",
+        "gender": "male", "is_active": True, "updated_at": None, "created_at": "2024-05-14T09:00:00"
+    })
+
+    # Assert
+    assert counts == {"scheduled": 0, "confirmed": 2, "cancelled": 0, "completed": 0, "missed": 0}
+    assert upcoming.status == AppointmentStatus.SCHEDULED
+    assert upcoming.start_time == datetime(2024, 5, 15, 11, 0, 0, 123456)
+    assert patient.date_of_birth == date(1980, 1, 1)
+    assert str(patient.id) == patient_id
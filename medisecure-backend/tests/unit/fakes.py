@@ -0,0 +1,16 @@
+class RecordingSession:
+    """Session factice qui enregistre les requêtes exécutées"""
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return []
+
+class FakeClock:
+    """Horloge contrôlée par le test"""
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
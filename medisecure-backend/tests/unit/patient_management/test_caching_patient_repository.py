@@ -0,0 +1,256 @@
+import asyncio
+import copy
+from datetime import date, datetime
+from uuid import uuid4
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.infrastructure.adapters.secondary.caching_patient_repository import CachingPatientRepository
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from shared.adapters.secondary.in_memory_cache_backend import InMemoryCacheBackend
+from shared.adapters.secondary.redis_cache_backend import RedisCacheBackend
+
+class CountingPatientRepository(InMemoryPatientRepository):
+    """Repository en mémoire qui compte les lectures par ID et par email"""
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    async def get_by_id(self, patient_id):
+        self.reads += 1
+        return await super().get_by_id(patient_id)
+
+    async def get_by_email(self, email):
+        self.reads += 1
+        return await super().get_by_email(email)
+
+class RespStandIn:
+    """Serveur local parlant le protocole Redis (GET, SET ... PX, DEL), sans expiration"""
+    def __init__(self):
+        self.data = {}
+        self.commands = []
+
+    async def handle(self, reader, writer):
+        while True:
+            header = await reader.readline()
+            if not header:
+                break
+            args = []
+            for _ in range(int(header[1:])):
+                length = int((await reader.readline())[1:])
+                args.append((await reader.readexactly(length + 2))[:-2])
+            self.commands.append(args[0])
+            if args[0] == b"GET":
+                value = self.data.get(args[1])
+                writer.write(b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value))
+            elif args[0] == b"SET":
+                self.data[args[1]] = args[2]
+                writer.write(b"+OK\r\n")
+            elif args[0] == b"DEL":
+                removed = sum(self.data.pop(key, None) is not None for key in args[1:])
+                writer.write(b":%d\r\n" % removed)
+            await writer.drain()
+        writer.close()
+
+class SlowRespStandIn(RespStandIn):
+    """Serveur RESP qui répond avec retard aux lectures des clés contenant slow"""
+    async def handle(self, reader, writer):
+        while True:
+            header = await reader.readline()
+            if not header:
+                break
+            args = []
+            for _ in range(int(header[1:])):
+                length = int((await reader.readline())[1:])
+                args.append((await reader.readexactly(length + 2))[:-2])
+            if b"slow" in args[1]:
+                await asyncio.sleep(0.2)
+            value = self.data.get(args[1])
+            writer.write(b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value))
+            await writer.drain()
+        writer.close()
+
+def make_patient(**overrides):
+    values = dict(
+        id=uuid4(), first_name="Jean", last_name="Dupont", date_of_birth=date(1980, 1, 1), gender="male",
+        email="jean.dupont@example.com", allergies={"arachides": "sévère"}, has_consent=True,
+        consent_date=datetime(2024, 5, 1, 9, 30), updated_at=datetime(2024, 5, 2, 10, 15, 0, 123456)
+    )
+    values.update(overrides)
+    return Patient(**values)
+
+def test_reads_are_served_from_cache_until_an_update():
+    """Test les lectures par ID, email et projection servies par le cache, puis l'invalidation"""
+    # Arrange
+    inner = CountingPatientRepository()
+    repository = CachingPatientRepository(inner, InMemoryCacheBackend(ttl_seconds=60))
+    patient = make_patient()
+    asyncio.run(inner.create(patient))
+
+    # Act
+    first = asyncio.run(repository.get_by_id(patient.id))
+    first.allergies["pollen"] = "légère"
+    second = asyncio.run(repository.get_by_id(patient.id))
+    cached_unchanged = second == patient
+    by_email = asyncio.run(repository.get_by_email(patient.email))
+    exists = asyncio.run(repository.get_projected_by_id(patient.id, ("id",)))
+    reads_before_update = inner.reads
+    second.last_name = "Durand"
+    asyncio.run(repository.update(second))
+    updated = asyncio.run(repository.get_by_id(patient.id))
+
+    # Assert
+    assert cached_unchanged and by_email == patient
+    assert exists == {"id": patient.id}
+    assert reads_before_update == 1
+    assert updated.last_name == "Durand" and inner.reads == 2
+    assert (repository.stats.hits, repository.stats.misses, repository.stats.invalidations) == (3, 2, 1)
+
+def test_email_entry_is_ignored_once_the_email_changed():
+    """Test qu'un ancien email ne résout plus le dossier après un changement d'email"""
+    # Arrange
+    inner = CountingPatientRepository()
+    repository = CachingPatientRepository(inner, InMemoryCacheBackend(ttl_seconds=60))
+    patient = make_patient()
+    asyncio.run(inner.create(patient))
+    asyncio.run(repository.get_by_email(patient.email))
+
+    # Act
+    patient.email = "jean.nouveau@example.com"
+    asyncio.run(repository.update(patient))
+    old_email = asyncio.run(repository.get_by_email("jean.dupont@example.com"))
+
+    # Assert
+    assert old_email is None
+
+def test_miss_interleaved_with_an_update_does_not_cache_the_old_record():
+    """Test qu'une lecture manquée terminée après une mise à jour ne remet pas l'ancienne version en cache"""
+    # Arrange
+    inner = CountingPatientRepository()
+    repository = CachingPatientRepository(inner, InMemoryCacheBackend(ttl_seconds=60))
+    patient = make_patient()
+    asyncio.run(inner.create(copy.deepcopy(patient)))
+
+    async def scenario():
+        read_done, release = asyncio.Event(), asyncio.Event()
+
+        class PausedReadRepository(CountingPatientRepository):
+            """Lecture de l'ancienne ligne, rendue après la mise à jour"""
+            async def get_by_id(self, patient_id):
+                row = copy.deepcopy(await inner.get_by_id(patient_id))
+                read_done.set()
+                await release.wait()
+                return row
+
+        reader = CachingPatientRepository(PausedReadRepository(), repository.backend, generations=repository.generations)
+        stale_read = asyncio.create_task(reader.get_by_id(patient.id))
+        await read_done.wait()
+        withdrawn = copy.deepcopy(patient)
+        withdrawn.has_consent = False
+        await repository.update(withdrawn)
+        release.set()
+        await stale_read
+        return await repository.get_projected_by_id(patient.id, ("has_consent",))
+
+    # Act
+    consent = asyncio.run(scenario())
+
+    # Assert
+    assert consent == {"has_consent": False}
+
+def test_lru_bound_counts_evictions():
+    """Test la taille bornée du cache et le compteur d'évictions"""
+    # Arrange
+    inner = CountingPatientRepository()
+    repository = CachingPatientRepository(inner, InMemoryCacheBackend(max_entries=2, ttl_seconds=60))
+    patients = [make_patient(email=None) for _ in range(3)]
+    for patient in patients:
+        asyncio.run(inner.create(patient))
+
+    # Act
+    for patient in patients:
+        asyncio.run(repository.get_by_id(patient.id))
+    asyncio.run(repository.get_by_id(patients[0].id))
+
+    # Assert
+    assert repository.stats.evictions == 2
+    assert (repository.stats.hits, repository.stats.misses) == (0, 4)
+
+def test_redis_backend_shares_entries_through_a_resp_server():
+    """Test le backend Redis contre un serveur local parlant le protocole RESP"""
+    # Arrange
+    server = RespStandIn()
+    inner = CountingPatientRepository()
+    patient = make_patient()
+
+    async def scenario():
+        listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        backend = RedisCacheBackend(f"redis://127.0.0.1:{port}/0")
+        await inner.create(patient)
+        first_worker = CachingPatientRepository(inner, backend)
+        second_worker = CachingPatientRepository(inner, backend)
+        await first_worker.get_by_id(patient.id)
+        cached = await second_worker.get_by_id(patient.id)
+        await first_worker.delete(patient.id)
+        deleted = await second_worker.get_by_id(patient.id)
+        await backend.close()
+        listener.close()
+        await listener.wait_closed()
+        return cached, deleted
+
+    # Act
+    cached, deleted = asyncio.run(scenario())
+
+    # Assert
+    assert cached == patient and deleted is None
+    assert inner.reads == 2
+    assert server.commands == [b"GET", b"SET", b"SET", b"GET", b"DEL", b"GET"]
+    assert b"medisecure:patient:email:jean.dupont@example.com" in server.data
+
+def test_unreachable_backend_falls_back_to_the_repository():
+    """Test qu'un backend indisponible est contourné sans faire échouer la lecture"""
+    # Arrange
+    inner = CountingPatientRepository()
+    repository = CachingPatientRepository(inner, RedisCacheBackend("redis://127.0.0.1:1/0", connect_timeout=0.2))
+    patient = make_patient()
+    asyncio.run(inner.create(patient))
+
+    # Act
+    found = asyncio.run(repository.get_by_id(patient.id))
+
+    # Assert
+    assert found == patient
+    assert repository.stats.errors == 2
+
+def test_interrupted_command_does_not_leave_its_reply_to_the_next_one():
+    """Test qu'une commande annulée ou expirée avant sa réponse ne décale pas les réponses suivantes"""
+    # Arrange
+    server = SlowRespStandIn()
+    server.data = {b"medisecure:slow": b"autre patient", b"medisecure:fast": b"bon patient"}
+
+    async def scenario():
+        listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        backend = RedisCacheBackend(f"redis://127.0.0.1:{port}/0", command_timeout=0.1)
+        cancelled = asyncio.create_task(backend.get("slow"))
+        await asyncio.sleep(0.05)
+        cancelled.cancel()
+        after_cancel = await backend.get("fast")
+        try:
+            await backend.get("slow")
+            timed_out = False
+        except asyncio.TimeoutError:
+            timed_out = True
+        after_timeout = await backend.get("fast")
+        await backend.close()
+        listener.close()
+        await listener.wait_closed()
+        return after_cancel, timed_out, after_timeout
+
+    # Act
+    after_cancel, timed_out, after_timeout = asyncio.run(scenario())
+
+    # Assert
+    assert after_cancel == b"bon patient"
+    assert timed_out
+    assert after_timeout == b"bon patient"
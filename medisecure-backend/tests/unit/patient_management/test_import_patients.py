@@ -0,0 +1,90 @@
+import asyncio
+from datetime import date
+from uuid import uuid4
+
+from patient_management.application.usecases.import_patients_usecase import ImportPatientsUseCase
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.services.patient_service import PatientService
+from patient_management.infrastructure.adapters.primary.patient_import_reader import iterate_bytes, read_patient_records
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from shared.adapters.primary.uuid_generator import UuidGenerator
+
+class CountingRepository(InMemoryPatientRepository):
+    """Repository en mémoire qui compte les requêtes de détection des doublons"""
+    def __init__(self):
+        super().__init__()
+        self.email_queries = 0
+
+    async def find_existing_emails(self, emails):
+        self.email_queries += 1
+        return await super().find_existing_emails(emails)
+
+async def collect(records):
+    return [record async for record in records]
+
+def run_import(repository, content: bytes, import_format: str, chunk_size: int, progress=None):
+    use_case = ImportPatientsUseCase(repository, PatientService(), UuidGenerator())
+    # Morceaux de 7 octets pour que les lignes soient coupées entre deux lectures
+    chunks = iterate_bytes(content[i:i + 7] for i in range(0, len(content), 7))
+    return asyncio.run(use_case.execute(read_patient_records(chunks, import_format), chunk_size, progress))
+
+def test_ndjson_import_reports_each_rejected_row():
+    """Test l'import par lots avec une erreur par ligne rejetée"""
+    # Arrange
+    repository = CountingRepository()
+    asyncio.run(repository.create(Patient(
+        id=uuid4(),
+        first_name="Marie",
+        last_name="Martin",
+        date_of_birth=date(1975, 3, 2),
+        gender="female",
+        email="marie.martin@example.com"
+    )))
+    content = "\n".join([
+        '{"first_name": "Jean", "last_name": "Dupont", "date_of_birth": "1980-01-01", "gender": "male", "email": "jean@example.com"}',
+        '{"first_name": "", "last_name": "Durand", "date_of_birth": "1990-01-01", "gender": "male"}',
+        '{"first_name": "Jean", "last_name": "Dupond", "date_of_birth": "1981-01-01", "gender": "male", "email": "jean@example.com"}',
+        '{"first_name": "Marie", "last_name": "Martin", "date_of_birth": "1975-03-02", "gender": "female", "email": "marie.martin@example.com"}',
+        f'{{"first_name": "Léa", "last_name": "Petit", "date_of_birth": "{date.today().year - 10}-01-01", "gender": "female"}}',
+        '{"first_name": "Paul", "last_name": ',
+        '',
+        '{"first_name": "Zoé", "last_name": "Bernard", "date_of_birth": "2000-06-15", "gender": "female", "allergies": {"pollen": "légère"}}',
+    ]).encode("utf-8")
+    progress = []
+
+    # Act
+    report = run_import(repository, content, "ndjson", 3, lambda r: progress.append(r.total))
+
+    # Assert
+    assert (report.total, report.imported, report.failed) == (7, 2, 5)
+    assert [error.row for error in report.errors] == [2, 3, 4, 5, 6]
+    assert report.errors[0].error.startswith("first_name:")
+    assert "en double" in report.errors[1].error
+    assert report.errors[2].email == "marie.martin@example.com"
+    assert report.errors[4].error.startswith("Ligne JSON invalide")
+    assert progress == [3, 6, 7]
+    assert repository.email_queries == 3
+    imported = asyncio.run(repository.get_by_email("jean@example.com"))
+    assert imported.last_name == "Dupont"
+
+def test_csv_reader_handles_bom_quoted_newlines_and_json_cells():
+    """Test la lecture CSV (BOM, champ sur plusieurs lignes, colonnes JSON, cellules vides)"""
+    # Arrange
+    content = (
+        "﻿first_name,last_name,date_of_birth,gender,email,allergies,notes\r\n"
+        'Jean,Dupont,1980-01-01,male,,"{""arachides"":""sévère""}","Suivi\r\ncardiologique, ""urgent"""\r\n'
+    ).encode("utf-8")
+    chunks = iterate_bytes(content[i:i + 5] for i in range(0, len(content), 5))
+
+    # Act
+    records = asyncio.run(collect(read_patient_records(chunks, "csv")))
+
+    # Assert
+    assert records == [{
+        "first_name": "Jean",
+        "last_name": "Dupont",
+        "date_of_birth": "1980-01-01",
+        "gender": "male",
+        "allergies": {"arachides": "sévère"},
+        "notes": 'Suivi\ncardiologique, "urgent"',
+    }]
@@ -0,0 +1,117 @@
+import asyncio
+from datetime import date
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from patient_management.application.dtos.patient_dtos import PatientSummaryListResponseDTO
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.entities.patient_summary import PatientSummary
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from patient_management.infrastructure.adapters.secondary.postgres_patient_repository import PostgresPatientRepository
+from tests.unit.fakes import RecordingSession
+
+def test_list_summaries_returns_summaries_without_medical_data():
+    """Test que les résumés ne contiennent pas les informations médicales"""
+    # Arrange
+    repository = InMemoryPatientRepository()
+    patient = Patient(
+        id=uuid4(),
+        first_name="Jean",
+        last_name="Dupont",
+        date_of_birth=date(1980, 1, 1),
+        gender="male",
+        allergies={"arachides": "sévère"},
+        notes="Suivi cardiologique"
+    )
+    asyncio.run(repository.create(patient))
+
+    # Act
+    summaries = asyncio.run(repository.list_summaries())
+    page = PatientSummaryListResponseDTO.from_summaries(summaries, 1, 0, 100)
+
+    # Assert
+    assert summaries == [PatientSummary(
+        id=patient.id,
+        first_name="Jean",
+        last_name="Dupont",
+        date_of_birth=date(1980, 1, 1),
+        gender="male",
+        updated_at=patient.updated_at
+    )]
+    assert "allergies" not in page.patients[0].__dict__
+
+def test_search_summaries_selects_only_summary_columns():
+    """Test que la recherche de résumés ne lit ni les colonnes JSONB ni les notes"""
+    # Arrange
+    session = RecordingSession()
+    repository = PostgresPatientRepository(session)
+
+    # Act
+    asyncio.run(repository.search_summaries(name="dup"))
+
+    # Assert
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "patients.last_name ILIKE" in sql
+    for column in ("allergies", "chronic_diseases", "current_medications", "notes"):
+        assert column not in sql
+
+class PastLastPageSession(RecordingSession):
+    """Session factice: page vide, puis résultat du COUNT séparé"""
+    class CountResult:
+        def scalar_one(self):
+            return 7
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return [] if len(self.statements) == 1 else self.CountResult()
+
+def test_search_summaries_counts_total_in_the_page_query():
+    """Test que le total de la recherche est calculé dans la même requête que la page"""
+    # Arrange
+    session = RecordingSession()
+    repository = PostgresPatientRepository(session)
+
+    # Act
+    page = asyncio.run(repository.search_summaries(name="dup", limit=20))
+
+    # Assert
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "count(*) OVER () AS _total" in sql
+    assert sql.index("OVER ()") < sql.index("LIMIT")
+    assert len(session.statements) == 1
+    assert (page.items, page.total) == ([], 0)
+
+def test_search_summaries_counts_separately_only_past_the_last_page():
+    """Test le COUNT séparé lorsque la page demandée est au-delà de la dernière page"""
+    # Arrange
+    session = PastLastPageSession()
+    repository = PostgresPatientRepository(session)
+
+    # Act
+    page = asyncio.run(repository.search_summaries(name="dup", skip=40, limit=20))
+
+    # Assert
+    count_sql = str(session.statements[1].compile(dialect=postgresql.dialect()))
+    assert count_sql.startswith("SELECT count(*) AS count_1")
+    assert "OFFSET" not in count_sql and "patients.last_name ILIKE" in count_sql
+    assert (page.items, page.total) == ([], 7)
+
+def test_in_memory_search_total_covers_all_matching_patients():
+    """Test que le total de la recherche porte sur tous les patients correspondants, pas sur la page"""
+    # Arrange
+    repository = InMemoryPatientRepository()
+    for index in range(5):
+        asyncio.run(repository.create(Patient(
+            id=uuid4(), first_name="Jean", last_name=f"Dupont {index}", date_of_birth=date(1980, 1, 1), gender="male"
+        )))
+    asyncio.run(repository.create(Patient(
+        id=uuid4(), first_name="Marie", last_name="Curie", date_of_birth=date(1967, 11, 7), gender="female"
+    )))
+
+    # Act
+    page = asyncio.run(repository.search_summaries(name="dupont", skip=2, limit=2))
+
+    # Assert
+    assert page.total == 5
+    assert [summary.last_name for summary in page.items] == ["Dupont 2", "Dupont 3"]
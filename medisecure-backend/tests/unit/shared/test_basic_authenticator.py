@@ -49,4 +49,49 @@ def test_jwt_token_creation(authenticator):
     
     assert payload["sub"] == "test@example.com"
     assert payload["role"] == "admin"
-    assert "exp" in payload
\ No newline at end of file
+    assert "exp" in payload
+
+def test_tokens_have_unique_jti_and_type(authenticator):
+    """Test que chaque token porte un jti unique et son type"""
+    # Arrange
+    data = {"sub": "test@example.com", "role": "admin"}
+    
+    # Act
+    access_payload = authenticator.decode_token(authenticator.create_access_token(data))
+    other_payload = authenticator.decode_token(authenticator.create_access_token(data))
+    refresh_payload = authenticator.decode_token(authenticator.create_refresh_token(data))
+    
+    # Assert
+    assert access_payload["type"] == "access"
+    assert refresh_payload["type"] == "refresh"
+    assert access_payload["jti"] != other_payload["jti"]
+    assert refresh_payload["exp"] > access_payload["exp"]
+
+def test_verify_and_update_rehashes_outdated_cost(monkeypatch):
+    """Test le rehachage d'un hash dont le coût diffère de BCRYPT_ROUNDS"""
+    # Arrange
+    monkeypatch.setenv("BCRYPT_ROUNDS", "4")
+    old_hash = BasicAuthenticator().get_password_hash("test_password")
+    monkeypatch.setenv("BCRYPT_ROUNDS", "5")
+    authenticator = BasicAuthenticator()
+    
+    # Act
+    valid, new_hash = authenticator.verify_and_update("test_password", old_hash)
+    invalid, no_hash = authenticator.verify_and_update("wrong_password", old_hash)
+    
+    # Assert
+    assert valid is True
+    assert new_hash is not None and "$05$" in new_hash
+    assert authenticator.verify_and_update("test_password", new_hash) == (True, None)
+    assert invalid is False and no_hash is None
+
+def test_calibrate_bcrypt_rounds_respects_bounds():
+    """Test que la calibration reste dans les bornes demandées"""
+    from shared.services.authenticator.bcrypt_calibration import calibrate_bcrypt_rounds
+    
+    # Act
+    result = calibrate_bcrypt_rounds(target_ms=0.0, min_rounds=4, max_rounds=5, samples=1)
+    
+    # Assert
+    assert result["rounds"] == 4
+    assert result["duration_ms"] > 0
@@ -0,0 +1,123 @@
+import asyncio
+from datetime import date, datetime
+from uuid import uuid4
+
+from starlette.requests import Request
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.services.patient_service import PatientService
+from patient_management.infrastructure.adapters.primary.controllers.patient_controller import get_patient, list_patients
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from shared.adapters.secondary.in_memory_collection_version_store import InMemoryCollectionVersionStore
+from shared.infrastructure.concurrency.single_flight import SingleFlight
+from shared.infrastructure.http.etags import ConditionalGet, etag_matches, weak_etag
+from shared.ports.secondary.collection_version_store_protocol import PATIENTS_COLLECTION
+
+ADMIN = {"sub": str(uuid4()), "role": "admin"}
+
+class CountingPatientRepository(InMemoryPatientRepository):
+    """Repository en mémoire qui compte les lectures complètes"""
+    def __init__(self):
+        super().__init__()
+        self.full_reads = 0
+
+    async def get_by_id(self, patient_id):
+        self.full_reads += 1
+        return await super().get_by_id(patient_id)
+
+    async def list_summaries(self, skip=0, limit=100):
+        self.full_reads += 1
+        return await super().list_summaries(skip, limit)
+
+class FakeContainer:
+    """Container fournissant les adaptateurs en mémoire aux contrôleurs"""
+    def __init__(self):
+        self.repository = CountingPatientRepository()
+        self.versions = InMemoryCollectionVersionStore()
+        self.flight = SingleFlight()
+
+    def patient_repository(self):
+        return self.repository
+
+    def patient_service(self):
+        return PatientService()
+
+    def collection_version_store(self):
+        return self.versions
+
+    def single_flight(self):
+        return self.flight
+
+def conditional(path, query="", if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return ConditionalGet(Request({"type": "http", "method": "GET", "path": path, "query_string": query.encode(), "headers": headers}))
+
+def test_etag_matching_uses_weak_comparison():
+    """Test la comparaison faible des ETags de If-None-Match"""
+    # Arrange
+    etag = weak_etag("/api/patients/", "patients:3")
+
+    # Assert
+    assert etag.startswith('W/"')
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag[2:]}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches(weak_etag("/api/patients/", "patients:4"), etag)
+
+def test_list_page_is_not_modified_until_the_collection_version_changes():
+    """Test la réponse 304 d'une page sans lecture des patients, puis 200 après une écriture"""
+    # Arrange
+    container = FakeContainer()
+    asyncio.run(container.repository.create(Patient(
+        id=uuid4(), first_name="Jean", last_name="Dupont", date_of_birth=date(1980, 1, 1), gender="male"
+    )))
+
+    def call(if_none_match=None):
+        return asyncio.run(list_patients(
+            skip=0, limit=10, fields=None,
+            conditional=conditional("/api/patients/", "skip=0&limit=10", if_none_match),
+            token_payload=ADMIN, container=container
+        ))
+
+    # Act
+    first = call()
+    etag = first.headers["etag"]
+    second = call(etag)
+    container.versions.bump(PATIENTS_COLLECTION)
+    third = call(etag)
+
+    # Assert
+    assert first.status_code == 200 and first.headers["cache-control"] == "private, no-cache"
+    assert second.status_code == 304 and second.headers["etag"] == etag and second.body == b""
+    assert third.status_code == 200 and third.headers["etag"] != etag
+    assert container.repository.full_reads == 2
+
+def test_patient_detail_etag_follows_updated_at():
+    """Test l'ETag d'un dossier dérivé de sa date de modification"""
+    # Arrange
+    container = FakeContainer()
+    patient = Patient(
+        id=uuid4(), first_name="Jean", last_name="Dupont", date_of_birth=date(1980, 1, 1), gender="male",
+        has_consent=True, updated_at=datetime(2024, 5, 1, 9)
+    )
+    asyncio.run(container.repository.create(patient))
+
+    def call(if_none_match=None):
+        return asyncio.run(get_patient(
+            patient_id=patient.id, fields=None,
+            conditional=conditional(f"/api/patients/{patient.id}", if_none_match=if_none_match),
+            token_payload=ADMIN, container=container
+        ))
+
+    # Act
+    first = call()
+    second = call(first.headers["etag"])
+    container.repository.patients[patient.id].updated_at = datetime(2024, 5, 2, 9)
+    third = call(first.headers["etag"])
+
+    # Assert
+    assert first.status_code == 200
+    assert second.status_code == 304
+    assert third.status_code == 200 and third.headers["etag"] != first.headers["etag"]
+    assert container.repository.full_reads == 2
@@ -0,0 +1,99 @@
+import asyncio
+import csv
+import io
+import json
+import os
+import resource
+from datetime import date, datetime
+from uuid import UUID
+
+import pytest
+
+from shared.infrastructure.http.streaming import export_response
+
+FIELDS = ("id", "first_name", "last_name", "date_of_birth", "email", "allergies", "is_active", "updated_at")
+
+async def fake_rows(count: int):
+    """Itérateur asynchrone simulant un curseur côté serveur (aucune ligne conservée)"""
+    for i in range(count):
+        yield {
+            "id": UUID(int=i),
+            "first_name": "Jean",
+            "last_name": f"Dupont {i}",
+            "date_of_birth": date(1980, 1, 1),
+            "email": f"jean.dupont{i}@example.com",
+            "allergies": {"arachides": "sévère"} if i % 2 else {},
+            "is_active": True,
+            "updated_at": datetime(2024, 5, 17, 9, 30),
+        }
+
+def current_rss() -> int:
+    """Mémoire résidente actuelle du processus en octets"""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * resource.getpagesize()
+
+def run(response, on_body):
+    """Exécute la réponse ASGI en transmettant chaque morceau du corps à on_body"""
+    messages = []
+
+    async def receive():
+        await asyncio.sleep(3600)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            on_body(message.get("body", b""))
+        else:
+            messages.append(message)
+
+    asyncio.run(response({"type": "http", "method": "GET", "path": "/export"}, receive, send))
+    return messages[0]
+
+def test_ndjson_export_encodes_one_object_per_line():
+    """Test l'encodage NDJSON et les en-têtes de l'export"""
+    # Arrange
+    chunks = []
+
+    # Act
+    start = run(export_response(fake_rows(3), FIELDS, "ndjson", "patients"), chunks.append)
+
+    # Assert
+    lines = b"".join(chunks).splitlines()
+    assert [json.loads(line)["last_name"] for line in lines] == ["Dupont 0", "Dupont 1", "Dupont 2"]
+    assert json.loads(lines[1])["id"] == str(UUID(int=1))
+    headers = dict(start["headers"])
+    assert headers[b"content-type"] == b"application/x-ndjson"
+    assert headers[b"content-disposition"] == b'attachment; filename="patients.ndjson"'
+
+def test_csv_export_writes_header_and_json_cells():
+    """Test l'encodage CSV (en-tête, dates ISO, booléens et dictionnaires en JSON)"""
+    # Arrange
+    chunks = []
+
+    # Act
+    run(export_response(fake_rows(2), FIELDS, "csv", "patients"), chunks.append)
+
+    # Assert
+    rows = list(csv.reader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+    assert rows[0] == list(FIELDS)
+    assert rows[2][3:] == ["1980-01-01", "jean.dupont1@example.com", '{"arachides":"sévère"}', "true", "2024-05-17T09:30:00"]
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="Mesure de la mémoire résidente disponible sous Linux uniquement")
+def test_export_of_one_million_rows_stays_under_rss_ceiling():
+    """Test que l'export d'un million de lignes se fait à mémoire constante"""
+    # Arrange
+    baseline = current_rss()
+    stats = {"bytes": 0, "chunks": 0, "peak": 0}
+
+    def on_body(body):
+        stats["bytes"] += len(body)
+        stats["chunks"] += 1
+        if stats["chunks"] % 100 == 0:
+            stats["peak"] = max(stats["peak"], current_rss() - baseline)
+
+    # Act
+    run(export_response(fake_rows(1_000_000), FIELDS, "ndjson", "patients"), on_body)
+
+    # Assert: plus de 150 Mo exportés, moins de 32 Mo de mémoire supplémentaire
+    assert stats["bytes"] > 150 * 1024 * 1024
+    assert stats["peak"] < 32 * 1024 * 1024
@@ -0,0 +1,119 @@
+import asyncio
+
+from shared.infrastructure.database.invalidation_listener import INVALIDATION_CHANNEL, ChangeEvent, InvalidationListener
+
+class FakeConnection:
+    """Connexion asyncpg factice: enregistre les callbacks pour simuler notifications et coupures"""
+    def __init__(self):
+        self.listeners = {}
+        self.on_terminate = None
+        self.closed = False
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    def add_termination_listener(self, callback):
+        self.on_terminate = callback
+
+    async def execute(self, query):
+        return "SELECT 1"
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+    def terminate(self):
+        self.closed = True
+
+    def notify(self, payload):
+        self.listeners[INVALIDATION_CHANNEL](self, 4242, INVALIDATION_CHANNEL, payload)
+
+    def drop(self):
+        self.closed = True
+        self.on_terminate(self)
+
+async def settle():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+def test_change_event_parses_compact_trigger_payload():
+    """Test le décodage des messages émis par les triggers"""
+    # Act
+    moved = ChangeEvent.parse('{"t":"appointments","op":"U","id":"a1","m":["2024-05","2024-06"]}')
+    truncated = ChangeEvent.parse('{"t":"patients","op":"T"}')
+    revoked = ChangeEvent.parse('{"t":"revoked_tokens","op":"I","id":"jti-1","exp":1717236000}')
+
+    # Assert
+    assert moved == ChangeEvent("appointments", "U", "a1", ("2024-05", "2024-06"))
+    assert truncated.id is None and truncated.months == ()
+    assert revoked.expires_at == 1717236000
+
+def test_notifications_are_dispatched_and_caches_flushed_after_a_gap():
+    """Test l'application des notifications, puis le vidage complet après une reconnexion"""
+    # Arrange
+    connections = []
+    received = []
+
+    async def connect(dsn):
+        connections.append(FakeConnection())
+        return connections[-1]
+
+    async def on_patient(event):
+        received.append(("patient", event.id))
+
+    async def on_flush():
+        received.append(("flush", None))
+
+    async def scenario():
+        listener = InvalidationListener(dsn="postgresql://test", connect=connect)
+        listener.subscribe(("patients",), on_patient, on_flush)
+        await listener.start()
+        await settle()
+        connections[0].notify('{"t":"patients","op":"U","id":"p1"}')
+        connections[0].notify('{"t":"appointments","op":"I","id":"a1","m":["2024-05"]}')
+        connections[0].notify("pas du json")
+        await settle()
+        connections[0].drop()
+        await settle()
+        connections[1].notify('{"t":"patients","op":"D","id":"p2"}')
+        await settle()
+        await listener.stop()
+        return listener
+
+    # Act
+    listener = asyncio.run(scenario())
+
+    # Assert
+    assert received == [("flush", None), ("patient", "p1"), ("flush", None), ("patient", "p2")]
+    assert (listener.stats.notifications, listener.stats.flushes, listener.stats.reconnects) == (4, 2, 1)
+    assert all(connection.closed for connection in connections)
+
+def test_listener_retries_until_the_database_is_reachable():
+    """Test les nouvelles tentatives de connexion lorsque la base est indisponible"""
+    # Arrange
+    attempts = []
+
+    async def connect(dsn):
+        attempts.append(dsn)
+        if len(attempts) < 3:
+            raise OSError("connection refused")
+        return FakeConnection()
+
+    async def scenario():
+        listener = InvalidationListener(dsn="postgresql://test", connect=connect, max_backoff_seconds=0.01)
+        await listener.start()
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if listener.connected:
+                break
+        connected = listener.connected
+        await listener.stop()
+        return connected
+
+    # Act
+    connected = asyncio.run(scenario())
+
+    # Assert
+    assert connected and len(attempts) == 3
@@ -0,0 +1,84 @@
+import asyncio
+
+from shared.container.warmup import open_pool_connections
+from shared.infrastructure.concurrency.single_flight import SingleFlight
+from shared.infrastructure.database.readiness import ReadinessProbe
+from tests.unit.fakes import FakeClock
+
+class FakeConnection:
+    """Connexion factice qui enregistre les requêtes exécutées"""
+    def __init__(self, engine):
+        self.engine = engine
+
+    async def __aenter__(self):
+        return await self.engine.open()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def __await__(self):
+        return self.engine.open().__await__()
+
+    async def execute(self, statement):
+        self.engine.statements += 1
+        await asyncio.sleep(0.01)
+        if self.engine.down:
+            raise OSError("connection refused")
+
+    async def close(self):
+        self.engine.open_connections -= 1
+
+class FakeEngine:
+    """Moteur factice dont on peut couper la base de données"""
+    def __init__(self):
+        self.down = False
+        self.statements = 0
+        self.open_connections = 0
+        self.max_open_connections = 0
+
+    async def open(self):
+        self.open_connections += 1
+        self.max_open_connections = max(self.max_open_connections, self.open_connections)
+        return FakeConnection(self)
+
+    def connect(self):
+        return FakeConnection(self)
+
+def test_readiness_result_is_cached_and_shared_by_concurrent_probes():
+    """Test que les sondes rapprochées ou simultanées ne font qu'une vérification par intervalle"""
+    # Arrange
+    engine, clock = FakeEngine(), FakeClock(100.0)
+    probe = ReadinessProbe(engine, ttl_seconds=5, timeout_seconds=1, single_flight=SingleFlight(), clock=clock)
+
+    async def scenario():
+        first = await asyncio.gather(*(probe.check() for _ in range(20)))
+        clock.now += 4
+        cached = await probe.check()
+        engine.down = True
+        clock.now += 2
+        expired = await probe.check()
+        return first, cached, expired
+
+    # Act
+    first, cached, expired = asyncio.run(scenario())
+
+    # Assert
+    assert all(status.ready for status in first)
+    assert cached.ready
+    assert not expired.ready and "connection refused" in expired.error
+    assert probe.checks == 2
+    assert engine.statements == 2
+
+def test_pool_warmup_opens_connections_concurrently_then_returns_them():
+    """Test que le préchauffage ouvre les connexions ensemble puis les rend au pool"""
+    # Arrange
+    engine = FakeEngine()
+
+    # Act
+    opened = asyncio.run(open_pool_connections(engine, 4))
+
+    # Assert
+    assert opened == 4
+    assert engine.max_open_connections == 4
+    assert engine.statements == 4
+    assert engine.open_connections == 0
@@ -0,0 +1,131 @@
+import asyncio
+from datetime import date, datetime
+from uuid import uuid4
+
+from patient_management.application.usecases.get_patient_usecase import GetPatientUseCase
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.services.patient_service import PatientService
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from shared.infrastructure.concurrency.single_flight import SingleFlight
+
+class SlowPatientRepository(InMemoryPatientRepository):
+    """Repository en mémoire dont les lectures attendent un signal"""
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+        self.release = None
+
+    async def get_by_id(self, patient_id):
+        self.reads += 1
+        await self.release.wait()
+        return await super().get_by_id(patient_id)
+
+def test_concurrent_calls_share_one_result_or_exception():
+    """Test que les appels concurrents de même clé partagent une exécution, résultat ou exception"""
+    # Arrange
+    flight = SingleFlight()
+    executions = []
+
+    async def read(value):
+        executions.append(value)
+        await asyncio.sleep(0.01)
+        if isinstance(value, Exception):
+            raise value
+        return [value]
+
+    async def scenario():
+        results = await asyncio.gather(*(flight.do("month", lambda: read(1)) for _ in range(5)))
+        errors = await asyncio.gather(*(flight.do("month", lambda: read(ValueError("db"))) for _ in range(3)), return_exceptions=True)
+        return results, errors
+
+    # Act
+    results, errors = asyncio.run(scenario())
+
+    # Assert
+    assert len(executions) == 2
+    assert results == [[1]] * 5 and all(result is results[0] for result in results)
+    assert all(isinstance(error, ValueError) and error is errors[0] for error in errors)
+    assert (flight.stats.executions, flight.stats.coalesced) == (2, 6)
+    assert len(flight) == 0
+
+def test_read_does_not_outlive_the_caller_that_started_it():
+    """Test qu'une lecture est annulée au départ de son appelant initial et relancée par ceux qui l'attendaient"""
+    # Arrange
+    flight = SingleFlight()
+    sessions = []
+
+    async def scenario():
+        release = asyncio.Event()
+
+        def read(session):
+            async def run():
+                sessions.append(session)
+                await release.wait()
+                return f"calendar ({session})"
+            return run
+
+        first = asyncio.create_task(flight.do("month", read("first")))
+        second = asyncio.create_task(flight.do("month", read("second")))
+        third = asyncio.create_task(flight.do("month", read("third")))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        third.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        shared = await second
+        return first.cancelled(), third.cancelled(), shared
+
+    # Act
+    first_cancelled, third_cancelled, shared = asyncio.run(scenario())
+
+    # Assert
+    assert first_cancelled and third_cancelled
+    assert sessions == ["first", "second"]
+    assert shared == "calendar (second)"
+    assert flight.stats.abandoned == 1
+    assert len(flight) == 0
+
+def test_get_patient_reads_a_popular_record_once():
+    """Test que les lectures concurrentes d'un même dossier ne font qu'une requête"""
+    # Arrange
+    repository = SlowPatientRepository()
+    patient = Patient(id=uuid4(), first_name="Jean", last_name="Dupont", date_of_birth=date(1980, 1, 1), gender="male", has_consent=True)
+    asyncio.run(InMemoryPatientRepository.create(repository, patient))
+    use_case = GetPatientUseCase(repository, PatientService(), SingleFlight())
+
+    async def scenario():
+        repository.release = asyncio.Event()
+        readers = [asyncio.create_task(use_case.execute(patient.id, uuid4())) for _ in range(10)]
+        await asyncio.sleep(0)
+        repository.release.set()
+        return await asyncio.gather(*readers)
+
+    # Act
+    results = asyncio.run(scenario())
+
+    # Assert
+    assert repository.reads == 1
+    assert {result.last_name for result in results} == {"Dupont"}
+
+def test_get_patient_does_not_share_a_read_of_an_older_version():
+    """Test qu'une lecture en cours d'une version antérieure du dossier n'est pas partagée"""
+    # Arrange
+    repository = SlowPatientRepository()
+    patient = Patient(id=uuid4(), first_name="Jean", last_name="Dupont", date_of_birth=date(1980, 1, 1), gender="male", has_consent=True)
+    asyncio.run(InMemoryPatientRepository.create(repository, patient))
+    use_case = GetPatientUseCase(repository, PatientService(), SingleFlight())
+
+    async def scenario():
+        repository.release = asyncio.Event()
+        before_update = asyncio.create_task(use_case.execute(patient.id, uuid4(), datetime(2024, 5, 1)))
+        after_update = asyncio.create_task(use_case.execute(patient.id, uuid4(), datetime(2024, 5, 2)))
+        await asyncio.sleep(0)
+        repository.release.set()
+        return await asyncio.gather(before_update, after_update)
+
+    # Act
+    asyncio.run(scenario())
+
+    # Assert
+    assert repository.reads == 2
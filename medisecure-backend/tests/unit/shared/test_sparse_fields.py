@@ -0,0 +1,60 @@
+import asyncio
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from patient_management.application.dtos.patient_dtos import PATIENT_RESPONSE_FIELDS
+from patient_management.application.usecases.get_patient_usecase import GetPatientUseCase
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.exceptions.patient_exceptions import MissingPatientConsentException
+from patient_management.domain.services.patient_service import PatientService
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from patient_management.infrastructure.adapters.secondary.postgres_patient_repository import PostgresPatientRepository
+from shared.infrastructure.http.sparse_fields import parse_fields
+from tests.unit.fakes import RecordingSession
+
+def test_parse_fields_adds_id_and_keeps_allowed_order():
+    """Test l'ordre des champs et l'ajout systématique de l'identifiant"""
+    assert parse_fields("email, last_name,first_name", PATIENT_RESPONSE_FIELDS) == ("id", "first_name", "last_name", "email")
+    assert parse_fields(None, PATIENT_RESPONSE_FIELDS) is None
+    assert parse_fields(" ", PATIENT_RESPONSE_FIELDS) is None
+
+def test_parse_fields_rejects_unknown_fields():
+    """Test le rejet des champs hors de la liste autorisée"""
+    with pytest.raises(ValueError):
+        parse_fields("first_name,user_id", PATIENT_RESPONSE_FIELDS)
+
+def test_postgres_projection_selects_only_requested_columns():
+    """Test que la projection est poussée dans le SELECT"""
+    # Arrange
+    session = RecordingSession()
+    repository = PostgresPatientRepository(session)
+
+    # Act
+    asyncio.run(repository.list_projected(("id", "first_name", "last_name"), skip=0, limit=10))
+
+    # Assert
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "patients.first_name" in sql
+    assert "allergies" not in sql
+    assert "notes" not in sql
+
+def test_get_patient_projected_checks_consent_without_returning_it():
+    """Test le contrôle du consentement sur une lecture partielle"""
+    # Arrange
+    repository = InMemoryPatientRepository()
+    use_case = GetPatientUseCase(repository, PatientService())
+    patient = Patient(id=uuid4(), first_name="Jean", last_name="Dupont", date_of_birth=date(1980, 1, 1), gender="male", has_consent=True)
+    refused = Patient(id=uuid4(), first_name="Marie", last_name="Martin", date_of_birth=date(1985, 1, 1), gender="female")
+    asyncio.run(repository.create(patient))
+    asyncio.run(repository.create(refused))
+
+    # Act
+    data = asyncio.run(use_case.execute_projected(patient.id, uuid4(), ("id", "last_name")))
+
+    # Assert
+    assert data == {"id": patient.id, "last_name": "Dupont"}
+    with pytest.raises(MissingPatientConsentException):
+        asyncio.run(use_case.execute_projected(refused.id, uuid4(), ("id", "last_name")))
@@ -0,0 +1,87 @@
+import asyncio
+import time
+from uuid import uuid4
+
+from shared.adapters.secondary.in_memory_revoked_token_repository import InMemoryRevokedTokenRepository
+from shared.services.authenticator.bloom_filter import BloomFilter
+from shared.services.authenticator.token_revocation_list import TokenRevocationList
+from shared.services.authenticator.token_revocation_service import TokenRevocationService
+
+def test_bloom_filter_has_no_false_negative():
+    """Test que le filtre de Bloom retrouve tous les éléments ajoutés"""
+    # Arrange
+    bloom = BloomFilter(expected_items=1000, false_positive_rate=0.01)
+    items = [uuid4().hex for _ in range(1000)]
+    
+    # Act
+    for item in items:
+        bloom.add(item)
+    false_positives = sum(1 for _ in range(1000) if uuid4().hex in bloom)
+    
+    # Assert
+    assert all(item in bloom for item in items)
+    assert false_positives < 50
+
+def test_revoked_token_is_rejected_until_expiry():
+    """Test qu'un token révoqué le reste jusqu'à son expiration"""
+    # Arrange
+    revocation_list = TokenRevocationList(expected_items=4)
+    now = time.time()
+    
+    # Act
+    revocation_list.revoke("jti-1", now + 60)
+    
+    # Assert
+    assert revocation_list.is_revoked("jti-1") is True
+    assert revocation_list.is_revoked("jti-2") is False
+    assert revocation_list.is_revoked(None) is False
+    assert revocation_list.is_revoked("jti-1", now=now + 61) is False
+    assert len(revocation_list) == 0
+
+def test_revocation_list_grows_beyond_expected_items():
+    """Test que la liste reste exacte au-delà de sa capacité initiale"""
+    # Arrange
+    revocation_list = TokenRevocationList(expected_items=2)
+    expires_at = time.time() + 60
+    
+    # Act
+    for i in range(10):
+        revocation_list.revoke(f"jti-{i}", expires_at)
+    
+    # Assert
+    assert all(revocation_list.is_revoked(f"jti-{i}") for i in range(10))
+    assert len(revocation_list) == 10
+
+def test_service_reload_rebuilds_list_from_repository():
+    """Test la reconstruction de la liste depuis le repository"""
+    # Arrange
+    repository = InMemoryRevokedTokenRepository()
+    service = TokenRevocationService(repository, TokenRevocationList())
+    exp = int(time.time()) + 60
+    asyncio.run(service.revoke({"jti": "jti-1", "exp": exp, "sub": str(uuid4())}))
+    asyncio.run(service.revoke({"jti": "jti-expired", "exp": int(time.time()) - 60}))
+    
+    # Act
+    fresh_list = TokenRevocationList()
+    loaded = asyncio.run(TokenRevocationService(repository, fresh_list).reload())
+    
+    # Assert
+    assert loaded == 1
+    assert fresh_list.is_revoked("jti-1") is True
+    assert "jti-expired" not in repository.revoked_tokens
+
+def test_concurrent_revocations_of_the_same_token_succeed_once():
+    """Test qu'un token de rafraîchissement présenté deux fois en même temps n'est révoqué qu'une fois"""
+    # Arrange
+    repository = InMemoryRevokedTokenRepository()
+    payload = {"jti": "jti-refresh", "exp": int(time.time()) + 60, "sub": str(uuid4())}
+
+    async def scenario():
+        services = [TokenRevocationService(repository, TokenRevocationList()) for _ in range(2)]
+        return await asyncio.gather(*(service.revoke(payload) for service in services))
+
+    # Act
+    results = asyncio.run(scenario())
+
+    # Assert
+    assert sorted(results) == [False, True]
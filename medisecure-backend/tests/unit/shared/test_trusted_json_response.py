@@ -0,0 +1,70 @@
+import json
+from datetime import date, datetime
+from uuid import uuid4
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from appointment_management.application.dtos.appointment_dtos import AppointmentListResponseDTO
+from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus
+from patient_management.application.dtos.patient_dtos import PatientListResponseDTO, PatientResponseDTO
+from patient_management.domain.entities.patient import Patient
+from shared.infrastructure.http.responses import TrustedJSONResponse
+
+@pytest.fixture
+def patients():
+    """Fixture pour des patients tels que retournés par un repository"""
+    return [
+        Patient(
+            id=uuid4(),
+            first_name="Jean",
+            last_name=f"Dupont {i}",
+            date_of_birth=date(1980, 1, 1),
+            gender="male",
+            email=f"jean.dupont{i}@example.com",
+            allergies={"arachides": "sévère"},
+            has_consent=True,
+            gdpr_consent=True,
+            consent_date=datetime(2024, 5, 17, 9, 30, 12, 345678)
+        )
+        for i in range(3)
+    ]
+
+def test_trusted_patient_page_matches_validated_serialization(patients):
+    """Test que le chemin de confiance produit le même JSON que la validation complète"""
+    # Arrange
+    validated = PatientListResponseDTO(
+        patients=[PatientResponseDTO(**{name: getattr(p, name) for name in PatientResponseDTO.__fields__}) for p in patients],
+        total=3,
+        skip=0,
+        limit=100
+    )
+
+    # Act
+    response = TrustedJSONResponse(PatientListResponseDTO.from_entities(patients, 3, 0, 100))
+
+    # Assert
+    assert json.loads(response.body) == jsonable_encoder(validated)
+    assert response.media_type == "application/json"
+
+def test_trusted_appointment_page_serializes_status_value():
+    """Test la sérialisation des rendez-vous (statut en valeur, UUID et dates ISO 8601)"""
+    # Arrange
+    appointment = Appointment(
+        id=uuid4(),
+        patient_id=uuid4(),
+        doctor_id=uuid4(),
+        start_time=datetime(2024, 6, 3, 14, 0),
+        end_time=datetime(2024, 6, 3, 14, 30),
+        status=AppointmentStatus.CONFIRMED
+    )
+
+    # Act
+    body = json.loads(TrustedJSONResponse(AppointmentListResponseDTO.from_entities([appointment], 1, 0, 1)).body)
+
+    # Assert
+    item = body["appointments"][0]
+    assert item["status"] == "confirmed"
+    assert item["patient_id"] == str(appointment.patient_id)
+    assert item["start_time"] == "2024-06-03T14:00:00"
+    assert body["total"] == 1
@@ -21,6 +21,9 @@ export const ENDPOINTS = {
     BY_DOCTOR: (doctorId: string) => `/appointments/doctor/${doctorId}`,
     CALENDAR: "/appointments/calendar",
   },
+  DASHBOARD: {
+    SUMMARY: "/dashboard/summary",
+  },
   MEDICAL_RECORDS: {
     BASE: "/medical-records",
     DETAIL: (id: string) => `/medical-records/${id}`,
@@ -13,6 +13,25 @@ export interface Appointment {
   notes?: string;
   createdAt: string;
   updatedAt: string;
+  // Relations intégrées par le back-end lorsque include=patient,doctor est demandé
+  patient?: AppointmentPatient | null;
+  doctor?: AppointmentDoctor | null;
+}
+
+export interface AppointmentPatient {
+  id: string;
+  firstName: string;
+  lastName: string;
+  dateOfBirth: string;
+  phoneNumber?: string;
+  email?: string;
+}
+
+export interface AppointmentDoctor {
+  id: string;
+  firstName: string;
+  lastName: string;
+  email: string;
 }
 
 export interface AppointmentCreateDto {
@@ -54,9 +73,31 @@ const adaptAppointmentFromApi = (backDto: any): Appointment => {
     notes: backDto.notes,
     createdAt: backDto.created_at,
     updatedAt: backDto.updated_at,
+    patient: backDto.patient && {
+      id: backDto.patient.id,
+      firstName: backDto.patient.first_name,
+      lastName: backDto.patient.last_name,
+      dateOfBirth: backDto.patient.date_of_birth,
+      phoneNumber: backDto.patient.phone_number,
+      email: backDto.patient.email,
+    },
+    doctor: backDto.doctor && {
+      id: backDto.doctor.id,
+      firstName: backDto.doctor.first_name,
+      lastName: backDto.doctor.last_name,
+      email: backDto.doctor.email,
+    },
   };
 };
 
+// Rôles autorisés à lire les données des patients (PATIENT_DATA_ROLES du backend)
+const PATIENT_DATA_ROLES = ["admin", "doctor", "nurse", "receptionist"];
+
+// Relations intégrées aux lectures de rendez-vous (une requête au lieu de 1 + N):
+// le patient n'est demandé que pour les rôles autorisés, sinon le backend répond 403
+const includeRelations = (role?: string): string =>
+  role && PATIENT_DATA_ROLES.includes(role) ? "patient,doctor" : "doctor";
+
 // Fonction pour adapter les DTO de création du front vers le back
 const adaptAppointmentCreateDto = (frontDto: AppointmentCreateDto): any => {
   try {
@@ -127,13 +168,28 @@ const appointmentService = {
     }
   },
 
-  getAppointmentById: async (id: string): Promise<Appointment | null> => {
+  getAppointmentById: async (
+    id: string,
+    role?: string
+  ): Promise<Appointment | null> => {
+    const include = includeRelations(role);
     try {
       const response = await apiClient.get<any>(
-        ENDPOINTS.APPOINTMENTS.DETAIL(id)
+        `${ENDPOINTS.APPOINTMENTS.DETAIL(id)}?include=${include}`
       );
       return adaptAppointmentFromApi(response);
-    } catch (error) {
+    } catch (error: any) {
+      // Sans le consentement du patient, le rendez-vous reste lisible sans le patient intégré
+      if (error?.response?.status === 403 && include !== includeRelations()) {
+        try {
+          const response = await apiClient.get<any>(
+            `${ENDPOINTS.APPOINTMENTS.DETAIL(id)}?include=${includeRelations()}`
+          );
+          return adaptAppointmentFromApi(response);
+        } catch (retryError) {
+          error = retryError;
+        }
+      }
       console.error(`Error fetching appointment ${id}:`, error);
       return null;
     }
@@ -173,13 +229,15 @@ const appointmentService = {
 
   getAppointmentsCalendar: async (
     year: number,
-    month: number
+    month: number,
+    role?: string
   ): Promise<Appointment[]> => {
     try {
       // Utilisation du format de requête avec paramètres pour éviter les erreurs 405
       const queryParams = new URLSearchParams({
         year: year.toString(),
         month: month.toString(),
+        include: includeRelations(role),
       });
 
       const url = `${
@@ -0,0 +1,77 @@
+// src/api/services/dashboardService.ts
+import apiClient from "../apiClient";
+import { ENDPOINTS } from "../endpoints";
+import { Patient } from "../../types/patient.types";
+import { Appointment } from "./appointmentService";
+
+export interface DashboardUpcomingAppointment {
+  id: string;
+  patientId: string;
+  doctorId: string;
+  startTime: string;
+  endTime: string;
+  status: Appointment["status"];
+  patientFirstName?: string;
+  patientLastName?: string;
+}
+
+export interface DashboardSummary {
+  generatedAt: string;
+  totalPatients: number;
+  newPatientsThisWeek: number;
+  todayAppointments: number;
+  todayAppointmentsByStatus: Record<string, number>;
+  upcomingAppointments: DashboardUpcomingAppointment[];
+  recentPatients: Patient[];
+}
+
+// Fonction pour adapter les statistiques du back-end vers le front-end
+const adaptDashboardSummaryFromApi = (backDto: any): DashboardSummary => {
+  return {
+    generatedAt: backDto.generated_at,
+    totalPatients: backDto.total_patients,
+    newPatientsThisWeek: backDto.new_patients_this_week,
+    todayAppointments: backDto.today_appointments,
+    todayAppointmentsByStatus: backDto.today_appointments_by_status,
+    upcomingAppointments: backDto.upcoming_appointments.map((item: any) => ({
+      id: item.id,
+      patientId: item.patient_id,
+      doctorId: item.doctor_id,
+      startTime: item.start_time,
+      endTime: item.end_time,
+      status: item.status,
+      patientFirstName: item.patient_first_name,
+      patientLastName: item.patient_last_name,
+    })),
+    // Résumés de patients: seuls les champs des écrans de liste sont renseignés
+    recentPatients: backDto.recent_patients.map((item: any) => ({
+      id: item.id,
+      firstName: item.first_name,
+      lastName: item.last_name,
+      dateOfBirth: item.date_of_birth,
+      gender: item.gender,
+      email: item.email,
+      phone: item.phone_number,
+      insuranceNumber: item.insurance_id,
+      createdAt: "",
+      updatedAt: item.updated_at,
+    })),
+  };
+};
+
+const dashboardService = {
+  // Statistiques calculées par le back-end en une requête (au lieu de charger tous les patients)
+  getSummary: async (upcoming: number = 4): Promise<DashboardSummary> => {
+    try {
+      const response = await apiClient.get<any>(
+        `${ENDPOINTS.DASHBOARD.SUMMARY}?upcoming=${upcoming}`
+      );
+      return adaptDashboardSummaryFromApi(response);
+    } catch (error) {
+      console.error("Erreur lors de la récupération du tableau de bord:", error);
+      throw error;
+    }
+  },
+};
+
+export default dashboardService;
@@ -5,14 +5,15 @@ import toast from "react-hot-toast";
 import appointmentService, {
   Appointment,
 } from "../../api/services/appointmentService";
-import patientService from "../../api/services/patientService";
 import Button from "../../components/common/Button/Button";
 import Alert from "../../components/common/Alert/Alert";
 import LoadingScreen from "../../components/common/LoadingScreen/LoadingScreen";
+import { useAuth } from "../../context/AuthContext";
 
 const AppointmentDetailsPage: React.FC = () => {
   const { id } = useParams<{ id: string }>();
   const navigate = useNavigate();
+  const { user } = useAuth();
   const [appointment, setAppointment] = useState<Appointment | null>(null);
   const [patientName, setPatientName] = useState<string>("Chargement...");
   const [doctorName, setDoctorName] = useState<string>("Chargement...");
@@ -29,7 +30,10 @@ const AppointmentDetailsPage: React.FC = () => {
       setError(null);
 
       // Récupérer les données du rendez-vous
-      const appointmentData = await appointmentService.getAppointmentById(id);
+      const appointmentData = await appointmentService.getAppointmentById(
+        id,
+        user?.role
+      );
 
       if (!appointmentData) {
         setError("Ce rendez-vous n'existe pas ou a été supprimé");
@@ -39,30 +43,25 @@ const AppointmentDetailsPage: React.FC = () => {
 
       setAppointment(appointmentData);
 
-      // Essayer de récupérer les détails du patient
-      try {
-        const patientData = await patientService.getPatientById(
-          appointmentData.patientId
-        );
-        if (patientData) {
-          setPatientName(`${patientData.firstName} ${patientData.lastName}`);
-        } else {
-          setPatientName(`Patient (ID: ${appointmentData.patientId})`);
-        }
-      } catch (error) {
-        console.error("Erreur lors de la récupération du patient:", error);
-        setPatientName(`Patient (ID: ${appointmentData.patientId})`);
-      }
-
-      // En pratique, il faudrait aussi récupérer les informations du médecin
-      setDoctorName(`Médecin (ID: ${appointmentData.doctorId})`);
+      // Le médecin est intégré à la réponse, et le patient si le rôle y donne accès (include=)
+      const { patient, doctor } = appointmentData;
+      setPatientName(
+        patient
+          ? `${patient.firstName} ${patient.lastName}`
+          : `Patient (ID: ${appointmentData.patientId})`
+      );
+      setDoctorName(
+        doctor
+          ? `Dr. ${doctor.firstName} ${doctor.lastName}`
+          : `Médecin (ID: ${appointmentData.doctorId})`
+      );
     } catch (error) {
       console.error("Erreur lors du chargement du rendez-vous:", error);
       setError("Erreur lors du chargement des détails du rendez-vous");
     } finally {
       setLoading(false);
     }
-  }, [id]);
+  }, [id, user?.role]);
 
   useEffect(() => {
     fetchAppointmentDetails();
@@ -6,6 +6,7 @@ import appointmentService, { Appointment } from "../../api/services/appointmentS
 import Button from "../../components/common/Button/Button";
 import LoadingScreen from "../../components/common/LoadingScreen/LoadingScreen";
 import Alert from "../../components/common/Alert/Alert";
+import { useAuth } from "../../context/AuthContext";
 
 // Types pour les jours du calendrier
 interface CalendarDay {
@@ -17,6 +18,7 @@ interface CalendarDay {
 
 const AppointmentsCalendarPage: React.FC = () => {
   const navigate = useNavigate();
+  const { user } = useAuth();
   const [currentMonth, setCurrentMonth] = useState(new Date());
   const [calendarDays, setCalendarDays] = useState<CalendarDay[]>([]);
   const [appointments, setAppointments] = useState<Appointment[]>([]);
@@ -43,7 +45,11 @@ const AppointmentsCalendarPage: React.FC = () => {
 
         console.log(`Fetching appointments for ${year}/${month}`);
         const fetchedAppointments =
-          await appointmentService.getAppointmentsCalendar(year, month);
+          await appointmentService.getAppointmentsCalendar(
+            year,
+            month,
+            user?.role
+          );
 
         console.log("Fetched appointments:", fetchedAppointments);
         setAppointments(fetchedAppointments);
@@ -56,7 +62,7 @@ const AppointmentsCalendarPage: React.FC = () => {
     };
 
     fetchAppointments();
-  }, [currentMonth, refreshTrigger]);
+  }, [currentMonth, refreshTrigger, user?.role]);
 
   // Générer les jours du calendrier
   useEffect(() => {
@@ -1,31 +1,33 @@
 // src/pages/dashboard/DashboardPage.tsx
 import React, { useEffect, useState, useCallback } from "react";
 import { Link } from "react-router-dom";
-import patientService from "../../api/services/patientService";
-import appointmentService from "../../api/services/appointmentService";
+import dashboardService, {
+  DashboardUpcomingAppointment,
+} from "../../api/services/dashboardService";
 import { Patient } from "../../types/patient.types";
-import { Appointment } from "../../api/services/appointmentService";
 import LoadingScreen from "../../components/common/LoadingScreen/LoadingScreen";
 import Alert from "../../components/common/Alert/Alert";
 
 // Types pour les statistiques
 interface DashboardStats {
   totalPatients: number;
+  newPatientsThisWeek: number;
   totalAppointmentsToday: number;
-  upcomingAppointments: number;
+  confirmedAppointmentsToday: number;
   pendingMedicalRecords: number;
 }
 
 const DashboardPage: React.FC = () => {
   const [stats, setStats] = useState<DashboardStats>({
     totalPatients: 0,
+    newPatientsThisWeek: 0,
     totalAppointmentsToday: 0,
-    upcomingAppointments: 0,
+    confirmedAppointmentsToday: 0,
     pendingMedicalRecords: 0,
   });
   const [recentPatients, setRecentPatients] = useState<Patient[]>([]);
   const [upcomingAppointments, setUpcomingAppointments] = useState<
-    Appointment[]
+    DashboardUpcomingAppointment[]
   >([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
@@ -36,55 +38,17 @@ const DashboardPage: React.FC = () => {
       setLoading(true);
       setError(null);
 
-      // Récupérer les patients
-      const patients = await patientService.getAllPatients();
-      setRecentPatients(patients.slice(0, 5)); // Les 5 plus récents
-
-      // Récupérer les rendez-vous
-      const today = new Date();
-      today.setHours(0, 0, 0, 0);
-
-      const todayStr = today.toISOString().split("T")[0];
-
-      // Calcul de la date dans 7 jours
-      const nextWeek = new Date(today);
-      nextWeek.setDate(nextWeek.getDate() + 7);
-      const nextWeekStr = nextWeek.toISOString().split("T")[0];
-
-      // Filtre pour aujourd'hui et la semaine à venir
-      const filter = {
-        startDate: todayStr,
-        endDate: nextWeekStr,
-      };
-
-      const appointments = await appointmentService.getAllAppointments(filter);
-
-      // Filtrer les rendez-vous d'aujourd'hui
-      const todayAppointments = appointments.filter((appointment) => {
-        const appointmentDate = new Date(appointment.startTime);
-        return appointmentDate.toDateString() === today.toDateString();
-      });
-
-      // Prendre les 4 prochains rendez-vous à venir pour l'affichage
-      const upcoming = appointments
-        .filter((appointment) => new Date(appointment.startTime) >= today)
-        .sort(
-          (a, b) =>
-            new Date(a.startTime).getTime() - new Date(b.startTime).getTime()
-        )
-        .slice(0, 4);
-
-      setUpcomingAppointments(upcoming);
+      // Statistiques calculées par le back-end en une seule requête
+      const summary = await dashboardService.getSummary(4);
+      setRecentPatients(summary.recentPatients);
+      setUpcomingAppointments(summary.upcomingAppointments);
 
       // Mettre à jour les statistiques
       setStats({
-        totalPatients: patients.length,
-        totalAppointmentsToday: todayAppointments.length,
-        upcomingAppointments: appointments.filter(
-          (apt) =>
-            new Date(apt.startTime) >= today &&
-            new Date(apt.startTime) <= nextWeek
-        ).length,
+        totalPatients: summary.totalPatients,
+        newPatientsThisWeek: summary.newPatientsThisWeek,
+        totalAppointmentsToday: summary.todayAppointments,
+        confirmedAppointmentsToday: summary.todayAppointmentsByStatus.confirmed,
         pendingMedicalRecords: 0, // Cette fonctionnalité n'est pas encore implémentée
       });
     } catch (error) {
@@ -164,7 +128,9 @@ const DashboardPage: React.FC = () => {
               {stats.totalPatients}
             </div>
             <div className="text-success-500 text-sm font-medium">
-              {stats.totalPatients > 0 ? "+1 cette semaine" : ""}
+              {stats.newPatientsThisWeek > 0
+                ? `+${stats.newPatientsThisWeek} cette semaine`
+                : ""}
             </div>
           </div>
         </div>
@@ -185,13 +151,15 @@ const DashboardPage: React.FC = () => {
 
         <div className="card">
           <div className="text-slate-500 text-sm font-medium mb-2">
-            Rendez-vous à venir
+            Rendez-vous confirmés
           </div>
           <div className="flex items-end justify-between">
             <div className="text-3xl font-bold text-slate-900">
-              {stats.upcomingAppointments}
+              {stats.confirmedAppointmentsToday}
+            </div>
+            <div className="text-slate-500 text-sm font-medium">
+              Aujourd'hui
             </div>
-            <div className="text-slate-500 text-sm font-medium">7 jours</div>
           </div>
         </div>
 
@@ -366,7 +334,9 @@ const DashboardPage: React.FC = () => {
                   <div className="flex-1 min-w-0">
                     <div className="flex justify-between items-start">
                       <p className="text-sm font-medium text-slate-900 truncate">
-                        Patient ID: {appointment.patientId}
+                        {appointment.patientFirstName
+                          ? `${appointment.patientFirstName} ${appointment.patientLastName}`
+                          : `Patient ID: ${appointment.patientId}`}
                       </p>
                       <span
                         className={`inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium ${